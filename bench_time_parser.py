@@ -0,0 +1,178 @@
+"""
+Module: bench_time_parser
+
+This module measures the throughput of :mod:`utils.time_parser` over
+generated task list columns and fails when it falls below the checked-in
+baselines.
+
+Dependencies:
+    - utils.time_parser
+
+Usage:
+    Every benchmark runs ``repeat`` times (default 7) over a column of
+    ``rows`` cells (default 10000). Each run is divided by the time of a
+    fixed pure-Python calibration loop run just before it, and the median
+    counts, so baselines recorded on one machine hold on another. A
+    benchmark more than ``tolerance`` (default 0.3) below its baseline in
+    ``bench_time_parser.json`` fails the run with exit code 1; ``update=1``
+    records the current scores as the new baselines.
+
+Example:
+    $ python bench_time_parser.py rows=20000 repeat=9
+    $ python bench_time_parser.py update=1
+"""
+
+import json
+import random
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, List
+from utils.arguments import parse_arguments
+from utils.time_parser import Duration, _parse_minutes, parse_time_string
+
+BASELINE_PATH: str = "bench_time_parser.json"
+
+
+def generate_duration_text(rng: random.Random) -> str:
+    """
+    Return a duration as Projektron shows it in a task list cell.
+
+    :param rng: The random source.
+    :return: One of ``"2d 01:30h"``, ``"03:15h"``, ``"1d"``, ``"-00:30h"``,
+        ``"03:15"`` or a blank cell, with the spacing variants of the page.
+    """
+    days: int = rng.choice([0, 0, 0, 1, 2, 5, 10, 46, 250])
+    hours: int = rng.randrange(0, 24)
+    minutes: int = rng.choice([0, 0, 15, 30, 45, rng.randrange(0, 60)])
+    kind: int = rng.randrange(10)
+    if kind == 0:
+        return rng.choice(["", " ", "\u00a0"])
+    if kind == 1:
+        return f"{days or 1}d"
+    if kind == 2:
+        return f"-{hours:02d}:{minutes:02d}h"
+    if kind == 3:
+        return f"{hours:02d}:{minutes:02d}"
+    space: str = rng.choice([" ", " ", "\u00a0", "  "])
+    text: str = f"{hours:02d}:{minutes:02d}h"
+    return f"{days}d{space}{text}" if days else text
+
+
+def generate_column(rows: int, seed: int = 0) -> List[str]:
+    """
+    Return the cells of a generated budget or duration column.
+
+    :param rows: The number of cells.
+    :param seed: The seed, the same seed gives the same column.
+    :return: The cell texts.
+    """
+    rng = random.Random(seed)
+    return [generate_duration_text(rng) for _ in range(rows)]
+
+
+def _calibration(rows: int) -> None:
+    values: Dict[str, int] = {}
+    for index in range(rows):
+        text = str(index % 1440)
+        values[text] = int(text) * 60 + values.get(text, 0)
+
+
+def benchmarks(column: List[str]) -> Dict[str, Callable[[], object]]:
+    """
+    Return the benchmarked workloads over a column.
+
+    :param column: The cell texts.
+    :return: The workloads by name.
+    """
+    unique: List[str] = [f"{index // 60:02d}:{index % 60:02d}h" for index in range(len(column))]
+
+    def parse_uncached() -> object:
+        _parse_minutes.cache_clear()
+        return [Duration.parse(text) for text in unique]
+
+    durations: List[Duration] = [Duration.parse(text) for text in column]
+    return {
+        "parse_column": lambda: [Duration.parse(text) for text in column],
+        "parse_uncached": parse_uncached,
+        "parse_time_string": lambda: [parse_time_string(text) for text in column],
+        "format_days": lambda: [duration.format(days=True) for duration in durations],
+        "sum_column": lambda: sum(durations, Duration()),
+    }
+
+
+def measure(rows: int = 10000, repeat: int = 7) -> Dict[str, float]:
+    """
+    Measure every benchmark relative to the calibration loop.
+
+    Each run times the calibration loop right before the workload, so both
+    see the same machine load; the median ratio of the runs counts.
+
+    :param rows: The number of cells of the generated column.
+    :param repeat: The number of runs.
+    :return: The scores by name, higher is faster.
+    """
+    scores: Dict[str, float] = {}
+    for name, workload in benchmarks(generate_column(rows)).items():
+        workload()
+        ratios: List[float] = []
+        for _ in range(repeat):
+            calibration: float = timeit.timeit(lambda: _calibration(rows), number=1)
+            ratios.append(calibration / timeit.timeit(workload, number=1))
+        scores[name] = statistics.median(ratios)
+    return scores
+
+
+def regressions(
+    scores: Dict[str, float], baselines: Dict[str, float], tolerance: float
+) -> List[str]:
+    """
+    Return the benchmarks scoring below their baseline by more than the tolerance.
+
+    :param scores: The measured scores.
+    :param baselines: The recorded scores.
+    :param tolerance: The accepted relative slowdown, e.g. 0.3.
+    :return: The names of the regressed benchmarks.
+    """
+    return [
+        name
+        for name, baseline in baselines.items()
+        if name in scores and scores[name] < baseline * (1 - tolerance)
+    ]
+
+
+def main() -> int:
+    """
+    Run the benchmarks, print them next to their baselines and compare.
+
+    :return: The exit status, 1 when a benchmark regressed.
+    """
+    arguments = parse_arguments({"rows": 10000, "repeat": 7, "tolerance": 0.3})
+    rows: int = int(arguments["rows"])
+    scores: Dict[str, float] = measure(rows, int(arguments["repeat"]))
+    if str(arguments.get("update", 0)) == "1":
+        with open(BASELINE_PATH, "w", encoding="utf-8") as baseline_file:
+            json.dump({name: round(score, 4) for name, score in scores.items()}, baseline_file,
+                      indent=2)
+            baseline_file.write("\n")
+        print(f"baselines written to {BASELINE_PATH}")
+        return 0
+    with open(BASELINE_PATH, encoding="utf-8") as baseline_file:
+        baselines: Dict[str, float] = json.load(baseline_file)
+    tolerance: float = float(arguments["tolerance"])
+    failed: List[str] = regressions(scores, baselines, tolerance)
+    calibration_rate: float = rows / min(
+        timeit.repeat(lambda: _calibration(rows), number=1, repeat=3)
+    )
+    for name, score in scores.items():
+        baseline: float = baselines.get(name, 0.0)
+        print(
+            f"{name:<18} {score * calibration_rate:>12,.0f} cells/s"
+            f"  score {score:.4f}  baseline {baseline:.4f}"
+            + ("  REGRESSED" if name in failed else "")
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
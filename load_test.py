@@ -0,0 +1,296 @@
+"""
+Module: load_test
+
+This module runs many concurrent booking flows through the page objects
+against a local stand-in daytimerecording server, to find out how many
+sessions one machine can drive and how response time degrades.
+
+Dependencies:
+    - selenium
+    - pages.login_page.LoginPage
+    - pages.main_page.MainPage
+    - utils.stub_server
+    - utils.tables
+
+Usage:
+    The number of concurrent sessions is ramped through the given steps; every
+    session books ``iterations`` days. ``driver=chrome`` drives headless Chrome
+    instances, ``driver=fake`` drives the in-memory fake driver over HTTP to
+    measure the Python side alone. ``latency_ms`` slows down every server
+    response. The table is printed as Markdown and ``report`` also writes it
+    as CSV.
+
+Example:
+    $ python load_test.py sessions=1,2,4,8 iterations=5 driver=chrome latency_ms=50
+"""
+
+import os
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+from selenium import webdriver
+from pages.login_page import LoginPage
+from pages.main_page import MainPage
+from utils.arguments import parse_arguments
+from utils.booking_planner import BookingJob, RowAssignment, execute_plan, plan_booking
+from utils.driver_manager import driver_pid
+from utils.fake_driver import FakeWebDriver
+from utils.process_stats import cpu_seconds, rss_bytes
+from utils.stub_server import start_stub_server
+from utils.tables import markdown_table, write_csv
+from utils.time_parser import Duration
+
+DriverFactory = Callable[[], webdriver.Remote]
+
+LOAD_TEST_PLAN = plan_booking(
+    BookingJob(
+        attendance=Duration(hours=8),
+        rows=(RowAssignment(description="load test", reference="TA", title="TA"),),
+        save=True,
+    )
+)
+
+
+@dataclass
+class SessionResult:
+    """
+    Outcome of one simulated booker.
+
+    :Attributes:
+        - **latencies** (*List[float]*): Seconds taken by every successful booking.
+        - **errors** (*int*): Number of failed bookings.
+        - **cpu_seconds** (*float*): CPU time of the browser processes.
+        - **rss_bytes** (*int*): Peak resident memory of the browser processes.
+    """
+
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    cpu_seconds: float = 0.0
+    rss_bytes: int = 0
+
+
+@dataclass
+class StepReport:
+    """
+    Aggregated results of one ramp step.
+
+    :Attributes:
+        - **sessions** (*int*): Number of concurrent sessions.
+        - **bookings** (*int*): Number of successful bookings.
+        - **errors** (*int*): Number of failed bookings.
+        - **wall_seconds** (*float*): Duration of the step.
+        - **latencies** (*List[float]*): Seconds taken by every successful booking.
+        - **cpu_seconds_per_session** (*float*): Mean CPU time per session.
+        - **rss_mb_per_session** (*float*): Mean peak memory per session.
+    """
+
+    sessions: int
+    bookings: int
+    errors: int
+    wall_seconds: float
+    latencies: List[float]
+    cpu_seconds_per_session: float
+    rss_mb_per_session: float
+
+    @property
+    def throughput(self) -> float:
+        """
+        Successful bookings per minute.
+        """
+        return 60 * self.bookings / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """
+        Share of failed bookings.
+        """
+        total = self.bookings + self.errors
+        return self.errors / total if total else 0.0
+
+    def percentile(self, percent: int) -> float:
+        """
+        Return a latency percentile in seconds.
+
+        :param percent: The percentile, between 1 and 99.
+        :return: The latency, 0 without successful bookings.
+        """
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[percent - 1]
+
+    def as_row(self) -> Dict[str, str]:
+        """
+        Return the report as a table row.
+        """
+        return {
+            "sessions": str(self.sessions),
+            "bookings/min": f"{self.throughput:.1f}",
+            "p50 s": f"{self.percentile(50):.3f}",
+            "p90 s": f"{self.percentile(90):.3f}",
+            "p99 s": f"{self.percentile(99):.3f}",
+            "errors %": f"{100 * self.error_rate:.1f}",
+            "cpu s/session": f"{self.cpu_seconds_per_session:.2f}",
+            "rss MB/session": f"{self.rss_mb_per_session:.1f}",
+        }
+
+
+def book_once(driver: webdriver.Remote, base_url: str) -> None:
+    """
+    Run one complete booking flow through the page objects.
+
+    :param driver: The driver of the session.
+    :param base_url: The base URL of the stand-in server.
+    """
+    login_page = LoginPage(driver, base_url=base_url)
+    login_page.open()
+    login_page.login(user="load", password="test")
+    execute_plan(LOAD_TEST_PLAN, MainPage(driver, base_url=base_url))
+
+
+def run_session(factory: DriverFactory, base_url: str, iterations: int) -> SessionResult:
+    """
+    Simulate one booker running several booking flows in a row.
+
+    :param factory: Creates the driver of the session.
+    :param base_url: The base URL of the stand-in server.
+    :param iterations: The number of bookings.
+    :return: The results of the session.
+    """
+    result = SessionResult()
+    try:
+        driver = factory()
+    except Exception:  # pylint: disable=broad-exception-caught
+        result.errors = iterations
+        return result
+    pid = driver_pid(driver)
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            try:
+                book_once(driver, base_url)
+            except Exception:  # pylint: disable=broad-exception-caught
+                result.errors += 1
+                continue
+            result.latencies.append(time.perf_counter() - start)
+            if pid:
+                result.rss_bytes = max(result.rss_bytes, rss_bytes(pid))
+        if pid:
+            result.cpu_seconds = cpu_seconds(pid)
+    finally:
+        driver.quit()
+    return result
+
+
+def run_step(
+    sessions: int, factory: DriverFactory, base_url: str, iterations: int
+) -> StepReport:
+    """
+    Run concurrent sessions and aggregate their results.
+
+    In-process drivers have no browser process, their CPU time and memory
+    growth are taken from this process instead.
+
+    :param sessions: The number of concurrent sessions.
+    :param factory: Creates the driver of each session.
+    :param base_url: The base URL of the stand-in server.
+    :param iterations: The number of bookings per session.
+    :return: The aggregated report.
+    """
+    results: List[SessionResult] = [SessionResult() for _ in range(sessions)]
+
+    def worker(index: int) -> None:
+        results[index] = run_session(factory, base_url, iterations)
+
+    cpu_before = cpu_seconds(os.getpid(), include_children=False)
+    rss_before = rss_bytes(os.getpid(), include_children=False)
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_seconds = time.perf_counter() - start
+    cpu_total = sum(result.cpu_seconds for result in results)
+    rss_total = sum(result.rss_bytes for result in results)
+    if not any(result.rss_bytes for result in results):
+        cpu_total = cpu_seconds(os.getpid(), include_children=False) - cpu_before
+        rss_total = max(0, rss_bytes(os.getpid(), include_children=False) - rss_before)
+    return StepReport(
+        sessions=sessions,
+        bookings=sum(len(result.latencies) for result in results),
+        errors=sum(result.errors for result in results),
+        wall_seconds=wall_seconds,
+        latencies=[latency for result in results for latency in result.latencies],
+        cpu_seconds_per_session=cpu_total / sessions,
+        rss_mb_per_session=rss_total / sessions / 2**20,
+    )
+
+
+def chrome_factory() -> webdriver.Chrome:
+    """
+    Create a headless Chrome driver.
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    return webdriver.Chrome(options=options)
+
+
+def ramp(
+    steps: List[int], factory: DriverFactory, iterations: int, latency: float = 0.0
+) -> List[StepReport]:
+    """
+    Ramp the number of concurrent sessions against a fresh stand-in server.
+
+    :param steps: The numbers of concurrent sessions, in order.
+    :param factory: Creates the driver of each session.
+    :param iterations: The number of bookings per session.
+    :param latency: Seconds the server waits before every response.
+    :return: One report per step.
+    """
+    server = start_stub_server(latency=latency)
+    try:
+        return [run_step(sessions, factory, server.base_url, iterations) for sessions in steps]
+    finally:
+        server.stop()
+
+
+def write_reports(reports: List[StepReport], path: str) -> bool:
+    """
+    Write the reports as CSV.
+
+    :param reports: The reports to write.
+    :param path: The CSV file.
+    :return: False if there were no reports and no file was written.
+    """
+    if not reports:
+        return False
+    write_csv([report.as_row() for report in reports], path)
+    return True
+
+
+def main() -> None:
+    """
+    Parse the arguments, ramp the sessions and print or write the report.
+    """
+    arguments = parse_arguments(
+        {"sessions": "1,2,4", "iterations": 3, "driver": "chrome", "latency_ms": 0}
+    )
+    factories: Dict[str, DriverFactory] = {
+        "chrome": chrome_factory,
+        "fake": lambda: FakeWebDriver(network=True),
+    }
+    reports = ramp(
+        steps=[int(step) for step in str(arguments["sessions"]).split(",")],
+        factory=factories[str(arguments["driver"])],
+        iterations=int(arguments["iterations"]),
+        latency=int(arguments["latency_ms"]) / 1000,
+    )
+    print(markdown_table([report.as_row() for report in reports]))
+    if "report" in arguments and not write_reports(reports, str(arguments["report"])):
+        print(f"No ramp steps ran, {arguments['report']} not written")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,12 +20,46 @@ Example:
         $ python web_automation.py
 """
 
+import atexit
+import json
+import logging
+import signal
 import sys
-from typing import Dict, Optional, Union
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from selenium import webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
 from pages.login_page import LoginPage
 from pages.main_page import MainPage
-from utils.time_parser import parse_hours, parse_minutes
+from utils.booking_planner import (
+    BookingJob,
+    BookingPlan,
+    RowAssignment,
+    execute_plan,
+    naive_command_count,
+    plan_booking,
+)
+from utils.arguments import parse_arguments
+from utils.artifacts import ArtifactWriter
+from utils.driver_manager import DriverManager
+from utils.grid import GridResult, GridScheduler, parse_nodes, remote_driver
+from utils.structured_log import log_context, setup_logging
+from utils.tab_booking import book_in_tabs
+from utils.task_cache import DEFAULT_PATH as DEFAULT_CACHE, TaskCache, TaskSnapshot
+from utils.time_parser import Duration
+from utils.session_recorder import SessionRecorder, record_session
+from utils.resource_blocker import apply_blocklist, compare_blocklist
+from utils.navigation_timing import NavigationReport
+from utils.credential_store import (
+    CredentialStore,
+    Credentials,
+    InvalidMasterKeyError,
+    read_master_key,
+)
+from utils.locator_fallback import DEFAULT_PATH as DEFAULT_LOCATOR_CACHE, LocatorResolver
+from utils.profiler import FlowProfiler
+from utils.tables import markdown_table
+from utils.rate_limiter import DEFAULT_PATH as DEFAULT_RATE_FILE, RateLimiter
 from utils.secret_manager import (
     MissingKeyError,
     SecretValues,
@@ -33,6 +67,8 @@ from utils.secret_manager import (
     EmptySecretsError,
 )
 
+logger: logging.Logger = logging.getLogger("projektron")
+
 def get_task_to_input(task_file: str="./task_text_to_imput.txt") -> str:
     """
     Retrieve the base URL from a secret manager.
@@ -46,116 +82,652 @@ def get_task_to_input(task_file: str="./task_text_to_imput.txt") -> str:
     return tasks
 
 
-def parse_arguments(
-    defaults: Optional[Dict[str, Union[int, str]]] = None
-) -> Dict[str, Union[int, str]]:
+def get_credentials() -> Tuple[str, str]:
     """
-    Parse command-line arguments into a dictionary.
+    Read the username and password from the '.env' file.
 
-    Args:
-        defaults (dict, optional): A dictionary containing default values for
-        the arguments.
-            If provided, these defaults will be used for any arguments not
-            specified on the command line.
-            Defaults to None.
+    Exits with an explanation when the file is missing or incomplete.
 
-    Returns:
-        dict: A dictionary containing the parsed command-line arguments.
+    :return: The username and the password.
+    :rtype: Tuple[str, str]
     """
-    arguments: Dict[str, Union[int, str]] = defaults if defaults else {}
-    for arg in sys.argv[1:]:
-        key, value = arg.split("=")
-        arguments[key] = value
-    return arguments
+    try:
+        password = get_secret_value(key=SecretValues.PASSWORD)
+        username = get_secret_value(key=SecretValues.USERNAME)
+    except MissingKeyError as e:
+        logger.error(".env file is not set up correctly", extra={"missing": e.args})
+        sys.exit(1)
+    except EmptySecretsError as e:
+        logger.error(
+            ".env not found, please create it by running: "
+            "echo PASSWORD=my_password >> .env; "
+            "echo USERNAME=my_username >> .env; "
+            "echo URL=www.example.com >> .env",
+            extra={"details": e.args},
+        )
+        sys.exit(1)
+    return username, password
 
 
-def main() -> None:
+def open_credential_store(path: str) -> CredentialStore:
     """
-    Main function that executes the web automation script.
+    Open an encrypted credential store.
 
-    Reads credentials from a '.env' file, initializes a Selenium WebDriver,
-    logs in to the specified web application,
-    and performs actions on the main page.
+    The master password is read from ``PROJEKTRON_MASTER_KEY`` or prompted
+    for. Exits with an explanation when the store cannot be opened.
 
-    Usage:
-        main()
+    :param path: The store file.
+    :return: The store.
+    :rtype: CredentialStore
+    """
+    try:
+        return CredentialStore(path, read_master_key())
+    except (OSError, InvalidMasterKeyError) as e:
+        logger.error("credential store cannot be opened", extra={"store": path,
+                                                                 "details": str(e)})
+        sys.exit(1)
 
-    Returns:
-        None
+
+def read_store_credentials(path: str, account: Optional[str] = None) -> Credentials:
     """
-    defaults: Dict[str, Union[int, str]] = {
-        "hours": 9,
-        "minutes": 0,
-        "title": "TA",
-        "reference": "TA",
-    }
-    task_description_import: Dict[str, str] = {"task_description": get_task_to_input()}
-    arguments: Dict[str, Union[int, str]] = {**parse_arguments(defaults), **task_description_import}
+    Read the credentials of one account from an encrypted credential store.
 
-    driver: webdriver.Chrome = webdriver.Chrome()
-    login_page: LoginPage = LoginPage(driver)
-    login_page.open()
+    Exits with an explanation when the store cannot be opened, see
+    :func:`open_credential_store`, or has no such account.
+
+    :param path: The store file.
+    :param account: The username, optional for a store of one account.
+    :return: The credentials.
+    :rtype: Credentials
+    """
+    store: CredentialStore = open_credential_store(path)
     try:
-        password = get_secret_value(key=SecretValues.PASSWORD)
-        username = get_secret_value(key=SecretValues.USERNAME)
-    except MissingKeyError as e:
-        print(".env file is not set up correctly")
-        print(e.args)
+        if account is None and len(store) == 1:
+            return next(iter(store))
+        if account is None:
+            logger.error("account=<username> is needed for a store of several accounts",
+                         extra={"store": path, "accounts": len(store)})
+            sys.exit(1)
+        return store.get(account)
+    except KeyError:
+        logger.error("account not in credential store", extra={"store": path,
+                                                               "account": account})
         sys.exit(1)
-    except EmptySecretsError as e:
-        print(".env not found, please create it by running")
-        print("echo PASSWORD=my_password >> .env")
-        print("echo USERNAME=my_username >> .env")
-        print("echo URL=www.example.com >> .env")
-        print(e.args)
-        sys.exit(1)
-    login_page.login(
-        user=username,
-        password=password,
-    )
-    main_page: MainPage = MainPage(driver)
-    main_page.validate_popup_button()
-    main_page.click_on_booking_tab()
-    main_page.validate_popup_button()
-    if not (
-        isinstance(arguments["hours"], int)
-        and isinstance(arguments["minutes"], int)
-    ):
-        print("arguments are incorrect")
+
+
+def build_jobs(arguments: Dict[str, Union[int, str]]) -> List[BookingJob]:
+    """
+    Build the booking jobs from the command-line arguments.
+
+    A ``job=<path>`` argument loads a JSON job spec, or a list of them to
+    book several days, instead, see
+    :meth:`utils.booking_planner.BookingJob.from_dict`.
+    Exits when the arguments are not valid.
+
+    :param arguments: The parsed command-line arguments.
+    :return: The jobs, by default one booking the unrecorded efforts on the
+        first task line with budget left.
+    :rtype: List[BookingJob]
+    """
+    if "job" in arguments:
+        with open(str(arguments["job"]), encoding="utf-8") as job_file:
+            spec = json.load(job_file)
+        return [BookingJob.from_dict(day) for day in (spec if isinstance(spec, list) else [spec])]
+    try:
+        attendance: Duration = Duration(
+            hours=int(arguments["hours"]), minutes=int(arguments["minutes"])
+        )
+    except ValueError:
+        logger.error("arguments are incorrect", extra={"hours": arguments.get("hours"),
+                                                       "minutes": arguments.get("minutes")})
         sys.exit(1)
-    main_page.type_attendance_duration(
-        hours=int(arguments["hours"]), minutes=int(arguments["minutes"])
-    )
-    main_page.type_break_duration(hours=0, minutes=45)
-    task_index_to_input: int = main_page.get_first_available_task()
-    unrecorded_effort_time: str = main_page.get_unrecorded_efforts()
-    unrecorded_effort_hours: int = parse_hours(unrecorded_effort_time)["hours"]
-    unrecorded_effort_minutes: int = parse_minutes(unrecorded_effort_time)[
-        "minutes"
-    ]
-    main_page.type_task_duration(
-        hours=unrecorded_effort_hours,
-        minutes=unrecorded_effort_minutes,
-        task_line=task_index_to_input,
-    )
     if not (
         isinstance(arguments["task_description"], str)
         and isinstance(arguments["reference"], str)
         and isinstance(arguments["title"], str)
     ):
-        print("arguments not valid")
+        logger.error("arguments not valid")
         sys.exit(1)
-    main_page.type_task_description(
-        task_line=task_index_to_input,
-        text=str(arguments["task_description"]),
+    return [BookingJob(
+        day=date.fromisoformat(str(arguments["day"])) if "day" in arguments else None,
+        attendance=attendance,
+        break_duration=Duration(minutes=45),
+        rows=(
+            RowAssignment(
+                description=str(arguments["task_description"]),
+                reference=str(arguments["reference"]),
+                title=str(arguments["title"]),
+            ),
+        ),
+    )]
+
+
+def measure_blocklist(driver: webdriver.Chrome) -> None:
+    """
+    Log the load of the booking view with and without the blocklist.
+
+    :param driver: The logged in driver.
+    """
+    main_page: MainPage = MainPage(driver)
+    main_page.open_day()
+    for variant, metrics in compare_blocklist(driver, main_page.get_url()).items():
+        logger.info(
+            "page load",
+            extra={
+                "variant": variant,
+                "load_ms": round(metrics.load_ms),
+                "transferred_bytes": metrics.transferred_bytes,
+                "resource_count": metrics.resource_count,
+            },
+        )
+
+
+def write_profile(profiler: FlowProfiler, path: str) -> None:
+    """
+    Write the cProfile dump of a profiled run and print the time per page method.
+
+    :param profiler: The stopped profiler.
+    :param path: The file of the cProfile dump.
+    """
+    profiler.dump(path)
+    print(f"cProfile dump written to {path}\n")
+    print(markdown_table([times.as_row() for times in profiler.rows()]))
+
+
+def record_bookings(cache: TaskCache, account: str, context: Dict[str, Any]) -> None:
+    """
+    Add the task lines a job booked and saved to the booking history of the cache.
+
+    Nothing is recorded for a job that did not save, or whose day is unknown.
+
+    :param cache: The task cache.
+    :param account: The account the job was booked with.
+    :param context: The context :func:`execute_plan` returned for the job.
+    """
+    day: Optional[date] = context.get("day")
+    if not context.get("saved") or day is None:
+        return
+    for row, line, duration in context.get("booked_rows", []):
+        cached: Optional[TaskSnapshot] = cache.task(account, day, line)
+        cache.record_booking(
+            account,
+            day,
+            TaskSnapshot(
+                line=line,
+                name=cached.name if cached else "",
+                project=cached.project if cached else "",
+                reference=row.reference if row.reference is not None else "",
+                title=row.title if row.title is not None else "",
+                budget=cached.budget if cached else Duration(),
+                duration=cached.duration if cached else Duration(),
+            ),
+            duration,
+        )
+
+
+def log_plan(job: BookingJob) -> BookingPlan:
+    """
+    Plan a booking job and log the plan.
+
+    :param job: The job to book.
+    :return: The plan.
+    """
+    plan: BookingPlan = plan_booking(job)
+    logger.info(
+        "booking plan",
+        extra={
+            "steps": [f"{step.commands} {step.name}" for step in plan.steps],
+            "estimated_commands": plan.estimated_commands,
+            "unplanned_commands": naive_command_count(job),
+        },
+    )
+    return plan
+
+
+def book_day(
+    manager: DriverManager,
+    job: BookingJob,
+    page_options: Dict[str, Any],
+    context: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Plan a booking job, log the plan and run it on the managed driver.
+
+    :param manager: The manager of the logged in driver.
+    :param job: The job to book.
+    :param page_options: Keyword arguments of the page objects, e.g. the
+        navigation report.
+    :param context: The initial plan context, e.g. the task cache.
+    :return: The context filled by the plan.
+    """
+    plan: BookingPlan = log_plan(job)
+    with manager.job() as driver:
+        context = execute_plan(plan, MainPage(driver, **page_options), context)
+        if context.get("stopped"):
+            logger.warning("booking stopped", extra={"reason": context["stopped"]})
+        elif context.get("done"):
+            logger.info("day already booked", extra={"day_state": context["day_state"].value})
+        else:
+            input("Please double check and validate manually")
+    return context
+
+
+def book_days_in_tabs(
+    manager: DriverManager,
+    jobs: List[BookingJob],
+    page_options: Dict[str, Any],
+    tabs: int,
+    context_factory: Optional[Callable[[BookingJob], Optional[Dict[str, Any]]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Plan the booking jobs, log the plans and run them in tabs of the managed
+    driver, see :func:`utils.tab_booking.book_in_tabs`.
+
+    :param manager: The manager of the logged in driver.
+    :param jobs: The jobs to book.
+    :param page_options: Keyword arguments of the page objects.
+    :param tabs: Days loading or waiting in a tab at most.
+    :param context_factory: Returns the initial plan context of a job.
+    :return: The context filled by every plan.
+    """
+    plans: List[BookingPlan] = [log_plan(job) for job in jobs]
+    with manager.job() as driver:
+        contexts = book_in_tabs(MainPage(driver, **page_options), plans, tabs, context_factory)
+        if any("tab" in context for context in contexts):
+            input("Please double check and validate manually in every open tab")
+    return contexts
+
+
+def book_on_grid(  # pylint: disable=too-many-arguments
+    scheduler: GridScheduler,
+    jobs: List[BookingJob],
+    page_options: Dict[str, Any],
+    account: str,
+    cache_path: Optional[str] = None,
+) -> List[GridResult[BookingJob, Dict[str, Any]]]:
+    """
+    Book the jobs in parallel on the nodes of a grid.
+
+    Nobody validates a remote browser by hand, so the jobs are not stopped
+    before saving; whether they save is up to their ``save`` flag.
+
+    :param scheduler: The scheduler of the grid nodes.
+    :param jobs: The jobs to book.
+    :param page_options: Keyword arguments of the page objects.
+    :param account: The account the jobs are booked with.
+    :param cache_path: The SQLite file of the task cache, None to disable it.
+        Every job opens its own connection, as they run in several threads.
+    :return: The result of every job.
+    """
+    def book(driver: WebDriver, job: BookingJob) -> Dict[str, Any]:
+        with log_context(account=account, day=job.day):
+            task_cache: Optional[TaskCache] = TaskCache(cache_path) if cache_path else None
+            try:
+                context: Optional[Dict[str, Any]] = (
+                    {"task_cache": task_cache, "account": account, "day": job.day}
+                    if task_cache
+                    else None
+                )
+                context = execute_plan(log_plan(job), MainPage(driver, **page_options), context)
+                if task_cache:
+                    record_bookings(task_cache, account, context)
+            finally:
+                if task_cache:
+                    task_cache.close()
+            return context
+
+    results = scheduler.run(jobs, book)
+    for result in results:
+        logger.log(
+            logging.ERROR if result.error else logging.INFO,
+            "grid job",
+            extra={
+                "day": result.job.day,
+                "node": result.node,
+                "attempts": result.attempts,
+                "error": repr(result.error) if result.error else None,
+            },
+        )
+    return results
+
+
+def read_arguments() -> Dict[str, Union[int, str]]:
+    """
+    Parse the command-line arguments and add the task description read from
+    ``task_text_to_imput.txt``.
+
+    :return: The arguments.
+    :rtype: Dict[str, Union[int, str]]
+    """
+    defaults: Dict[str, Union[int, str]] = {
+        "hours": 9,
+        "minutes": 0,
+        "title": "TA",
+        "reference": "TA",
+    }
+    return {**parse_arguments(defaults), "task_description": get_task_to_input()}
+
+
+def read_run_credentials(arguments: Dict[str, Union[int, str]]) -> Credentials:
+    """
+    Read the credentials to book with.
+
+    ``store=<path>`` reads the credentials and URL of ``account`` from an
+    encrypted credential store instead of the '.env' file, see
+    :class:`utils.credential_store.CredentialStore`.
+
+    :param arguments: The parsed command-line arguments.
+    :return: The credentials.
+    :rtype: Credentials
+    """
+    if "store" not in arguments:
+        return Credentials(*get_credentials())
+    return read_store_credentials(
+        str(arguments["store"]),
+        str(arguments["account"]) if "account" in arguments else None,
+    )
+
+
+def build_rate_limiter(arguments: Dict[str, Union[int, str]]) -> Optional[RateLimiter]:
+    """
+    Build the rate limiter of the run.
+
+    With ``rate`` (default 0, off), navigations and form submits of all runs
+    on the host share a token bucket of ``rate`` requests per second and
+    ``rate_burst`` tokens (default 4) in the SQLite file ``rate_file``; the
+    rate is halved while the server answers slower than ``rate_target``
+    seconds (default 3), see :class:`utils.rate_limiter.RateLimiter`.
+
+    :param arguments: The parsed command-line arguments.
+    :return: The rate limiter, None when rate limiting is off.
+    """
+    rate: float = float(arguments.get("rate", 0))
+    if rate <= 0:
+        return None
+    return RateLimiter(
+        rate=rate,
+        burst=float(arguments.get("rate_burst", 4)),
+        path=str(arguments.get("rate_file", DEFAULT_RATE_FILE)),
+        min_rate=min(0.2, rate),
+        target_seconds=float(arguments.get("rate_target", 3)),
+    )
+
+
+def build_page_options(
+    arguments: Dict[str, Union[int, str]], credentials: Credentials
+) -> Dict[str, Any]:
+    """
+    Build the keyword arguments shared by the page objects of the run.
+
+    ``timing=<path>`` collects the Navigation Timing of every page load and
+    tab switch for a JSON report. Failed lookups leave a screenshot, the DOM
+    and the console log in a run directory below ``artifacts`` (default
+    ``artifacts``, ``0`` disables). Elements with a locator fallback chain
+    are looked up through their candidates, the one that matched last first,
+    remembered in the JSON file ``locator_cache`` (default
+    ``.locator_cache.json``, ``0`` keeps it in memory), see
+    :class:`utils.locator_fallback.LocatorResolver`. ``working_hours`` sets
+    the length of the working day budgets count in (default 8). The rate
+    limiter is built by :func:`build_rate_limiter`.
+
+    :param arguments: The parsed command-line arguments.
+    :param credentials: The credentials, whose URL is the base URL if set.
+    :return: The page options.
+    :rtype: Dict[str, Any]
+    """
+    page_options: Dict[str, Any] = {
+        "navigation_report": NavigationReport() if "timing" in arguments else None,
+        "artifact_writer": (
+            ArtifactWriter(str(arguments.get("artifacts", "artifacts")))
+            if str(arguments.get("artifacts")) != "0"
+            else None
+        ),
+        "rate_limiter": build_rate_limiter(arguments),
+        "locator_resolver": LocatorResolver(
+            path=(
+                str(arguments.get("locator_cache", DEFAULT_LOCATOR_CACHE))
+                if str(arguments.get("locator_cache")) != "0"
+                else None
+            )
+        ),
+    }
+    if credentials.url:
+        page_options["base_url"] = credentials.url
+    if "working_hours" in arguments:
+        page_options["working_hours"] = float(arguments["working_hours"])
+    return page_options
+
+
+def open_task_cache(arguments: Dict[str, Union[int, str]]) -> Optional[TaskCache]:
+    """
+    Open the task cache of the run.
+
+    The task lines read from the page and the bookings made are kept in the
+    SQLite file ``cache`` (default ``.task_cache.sqlite``, ``0`` disables),
+    so later runs only re-read the task lines that changed.
+
+    :param arguments: The parsed command-line arguments.
+    :return: The task cache, None when it is disabled.
+    """
+    if str(arguments.get("cache")) == "0":
+        return None
+    return TaskCache(str(arguments.get("cache", DEFAULT_CACHE)))
+
+
+def driver_factory(
+    arguments: Dict[str, Union[int, str]], password: str, recorders: List[SessionRecorder]
+) -> Callable[[Optional[str]], WebDriver]:
+    """
+    Return the function creating the drivers of the run.
+
+    It creates a local Chrome, or a driver of the remote node at the URL it
+    is given. Static assets are blocked with ``block_resources=1``. With
+    ``record=<path>`` every WebDriver command is written to a session log
+    that :func:`utils.session_recorder.replay_driver` can replay; recycled
+    browsers are recorded to ``<path>.1``, ``<path>.2``...
+
+    :param arguments: The parsed command-line arguments.
+    :param password: The password, masked in the session logs.
+    :param recorders: The list the session recorders are added to.
+    :return: The driver factory.
+    """
+    def create_driver(url: Optional[str] = None) -> WebDriver:
+        driver: WebDriver = remote_driver(url) if url else webdriver.Chrome()
+        if str(arguments.get("block_resources", 0)) == "1":
+            apply_blocklist(driver)
+        if "record" in arguments:
+            path = str(arguments["record"]) + (f".{len(recorders)}" if recorders else "")
+            recorders.append(record_session(driver, path, secrets=[password]))
+        return driver
+
+    return create_driver
+
+
+def login_function(
+    credentials: Credentials, page_options: Dict[str, Any]
+) -> Callable[[WebDriver], None]:
+    """
+    Return the function logging a new driver in.
+
+    :param credentials: The credentials to log in with.
+    :param page_options: Keyword arguments of the page objects.
+    :return: The login function.
+    """
+    def login(driver: WebDriver) -> None:
+        login_page: LoginPage = LoginPage(driver, **page_options)
+        login_page.open()
+        login_page.login(
+            user=credentials.username,
+            password=credentials.password,
+        )
+
+    return login
+
+
+def build_scheduler(
+    arguments: Dict[str, Union[int, str]],
+    create_driver: Callable[[Optional[str]], WebDriver],
+    login: Callable[[WebDriver], None],
+) -> Optional[GridScheduler]:
+    """
+    Build the scheduler of the remote WebDriver nodes.
+
+    ``remote=<url>[,<url>...]`` books the days in parallel on remote
+    WebDriver nodes instead of a local Chrome, ``slots`` sessions per node
+    (default 1, ``<url>*<slots>`` sets it per node), see
+    :class:`utils.grid.GridScheduler`.
+
+    :param arguments: The parsed command-line arguments.
+    :param create_driver: Creates the driver of a node.
+    :param login: Logs a new driver in.
+    :return: The scheduler, None to book in the local browser.
+    """
+    if "remote" not in arguments:
+        return None
+    return GridScheduler(
+        parse_nodes(str(arguments["remote"]), int(arguments.get("slots", 1))),
+        create_driver,
+        login,
+        recycle_jobs=int(arguments.get("recycle_jobs", 25)),
     )
-    main_page.type_task_reference(
-        task_line=task_index_to_input, text=str(arguments["reference"])
+
+
+def book_locally(  # pylint: disable=too-many-arguments
+    manager: DriverManager,
+    jobs: List[BookingJob],
+    page_options: Dict[str, Any],
+    tabs: int,
+    task_cache: Optional[TaskCache],
+    account: str,
+) -> None:
+    """
+    Book the jobs in the managed browser, one day after the other, or up to
+    ``tabs`` days at once in its tabs, loading the next days while the
+    current one is filled in; record the bookings in the task cache.
+
+    :param manager: The manager of the logged in driver.
+    :param jobs: The jobs to book.
+    :param page_options: Keyword arguments of the page objects.
+    :param tabs: Days loading or waiting in a tab at most, 1 for no tabs.
+    :param task_cache: The task cache, None if it is disabled.
+    :param account: The account the jobs are booked with.
+    """
+    def plan_context(job: BookingJob) -> Optional[Dict[str, Any]]:
+        if task_cache is None:
+            return None
+        return {"task_cache": task_cache, "account": account, "day": job.day}
+
+    if tabs > 1:
+        with log_context(account=account):
+            for context in book_days_in_tabs(manager, jobs, page_options, tabs, plan_context):
+                if task_cache:
+                    record_bookings(task_cache, account, context)
+        return
+    for job in jobs:
+        with log_context(account=account, day=job.day):
+            context = book_day(manager, job, page_options, plan_context(job))
+            if task_cache:
+                record_bookings(task_cache, account, context)
+
+
+def close_run(
+    page_options: Dict[str, Any],
+    task_cache: Optional[TaskCache],
+    recorders: List[SessionRecorder],
+) -> None:
+    """
+    Close the task cache, the session recorders, the artifact writer and the
+    rate limiter of the run, logging the rate limiter status.
+
+    :param page_options: Keyword arguments of the page objects.
+    :param task_cache: The task cache, None if it is disabled.
+    :param recorders: The session recorders.
+    """
+    if task_cache:
+        task_cache.close()
+    for recorder in recorders:
+        recorder.stop()
+    if page_options["artifact_writer"]:
+        page_options["artifact_writer"].close()
+    rate_limiter: Optional[RateLimiter] = page_options["rate_limiter"]
+    if rate_limiter:
+        logger.info("rate limit", extra=rate_limiter.status().as_dict())
+        rate_limiter.close()
+
+
+def main() -> None:
+    """
+    Main function that executes the web automation script.
+
+    Reads the credentials, logs in to the web application and books the jobs
+    of :func:`build_jobs` in a local Chrome, see :func:`book_locally`, or on
+    remote WebDriver nodes, see :func:`build_scheduler`. The options of the
+    run are described by :func:`read_run_credentials`,
+    :func:`build_page_options`, :func:`open_task_cache` and
+    :func:`driver_factory`.
+    ``measure_blocklist=1`` only reports page loads with and without
+    blocking static assets.
+    The browser is restarted and logged in again after ``recycle_jobs`` days
+    or when it uses more than ``max_rss_mb`` megabytes, and is always quit
+    on exit.
+    Progress and problems are logged as JSON lines tagged with the run id,
+    account, day and plan step, to standard error or to ``log=<path>``, at
+    ``log_level`` (default ``INFO``).
+    ``profile=1`` runs the flow under cProfile, writes the dump to
+    ``profile_file`` (default ``projektron.prof``) and prints the time of
+    every page method split into CPU, WebDriver round trips and waiting,
+    see :class:`utils.profiler.FlowProfiler`.
+
+    Usage:
+        main()
+
+    Returns:
+        None
+    """
+    arguments: Dict[str, Union[int, str]] = read_arguments()
+    atexit.register(
+        setup_logging(
+            str(arguments.get("log_level", "INFO")),
+            str(arguments["log"]) if "log" in arguments else None,
+        ).stop
     )
-    main_page.type_task_title(
-        task_line=task_index_to_input, text=str(arguments["title"])
+    jobs: List[BookingJob] = build_jobs(arguments)
+    credentials: Credentials = read_run_credentials(arguments)
+    page_options: Dict[str, Any] = build_page_options(arguments, credentials)
+    task_cache: Optional[TaskCache] = open_task_cache(arguments)
+    recorders: List[SessionRecorder] = []
+    create_driver = driver_factory(arguments, credentials.password, recorders)
+    login = login_function(credentials, page_options)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    profiler: Optional[FlowProfiler] = (
+        FlowProfiler() if str(arguments.get("profile", 0)) == "1" else None
     )
-    input("Please double check and validate manually")
+    if profiler:
+        profiler.start()
+    with DriverManager(
+        create_driver,
+        login,
+        max_jobs=int(arguments.get("recycle_jobs", 25)),
+        max_rss_mb=float(arguments.get("max_rss_mb", 1024)),
+    ) as manager:
+        try:
+            if str(arguments.get("measure_blocklist", 0)) == "1":
+                measure_blocklist(manager.driver)
+                return
+            scheduler: Optional[GridScheduler] = build_scheduler(arguments, create_driver, login)
+            if scheduler:
+                book_on_grid(scheduler, jobs, page_options, credentials.username,
+                             task_cache.path if task_cache else None)
+            else:
+                book_locally(manager, jobs, page_options, int(arguments.get("tabs", 1)),
+                             task_cache, credentials.username)
+        finally:
+            if profiler:
+                profiler.stop()
+                write_profile(profiler, str(arguments.get("profile_file", "projektron.prof")))
+            close_run(page_options, task_cache, recorders)
+    if page_options["navigation_report"]:
+        page_options["navigation_report"].write(str(arguments["timing"]))
 
 
 if __name__ == "__main__":
@@ -18,33 +18,77 @@ Classes:
 
 Functions:
     - :func:`_get_base_url`: Retrieve the base URL from a secret manager.
+    - :func:`set_value`: Set the value of a text field in one round trip.
 
 Attributes:
     - **driver** (*WebDriver*): The Selenium WebDriver instance.
     - **base_url** (*str*): The base URL of the web application.
     - **timeout** (*int*): Timeout duration for waiting for elements to load, default is 30 seconds.
+    - **navigation_report** (*NavigationReport*): Optional report of every navigation's timing.
+    - **artifact_writer** (*ArtifactWriter*): Optional writer of failure artifacts.
+    - **window_handle** (*str*): Optional handle of the browser tab the page lives in.
+    - **rate_limiter** (*RateLimiter*): Optional limiter of navigations and form submits.
+    - **locator_resolver** (*LocatorResolver*): Optional resolver of locator fallback chains.
 
 Methods:
     - :meth:`BasePage.find_element`: Find a web element using a locator.
     - :meth:`BasePage.find_element_by_xpath`: Find a web element using an XPath locator.
     - :meth:`BasePage.find_elements`: Find multiple web elements using a locator.
     - :meth:`BasePage.find_elements_by_xpath`: Find multiple web elements using an XPath locator.
+    - :meth:`BasePage.activate`: Switch to the browser tab of the page.
+    - :meth:`BasePage.build_url`: Build the absolute URL of a path.
     - :meth:`BasePage.open`: Open a URL in the web browser.
+    - :meth:`BasePage.throttle`: Wait for the rate limiter before a request to the server.
+    - :meth:`BasePage.record_navigation`: Add the timing of a navigation to the report.
+    - :meth:`BasePage.capture_failure`: Capture screenshot, DOM and console log of a failure.
     - :meth:`BasePage.get_title`: Get the title of the current web page.
     - :meth:`BasePage.get_url`: Get the URL of the current web page.
     - :meth:`BasePage.wait_element`: Wait for an element to be located on the page.
 """
 
-from typing import List
+import logging
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from utils.artifacts import ArtifactWriter
+from utils.locator_fallback import LocatorResolver
+from utils.locators import LocatorChain
+from utils.navigation_timing import NavigationReport, NavigationTiming
+from utils.rate_limiter import RateLimiter
 from utils.secret_manager import (
     get_secret_value,
     SecretValues,
 )
+from utils.time_parser import TimeConstant
+
+LOOKUP_FAILURES = (NoSuchElementException, StaleElementReferenceException, TimeoutException)
+
+SET_VALUE_SCRIPT: str = """
+const [field, text] = arguments;
+if (field.readOnly || field.disabled) {
+    return null;
+}
+const prototype = Object.getPrototypeOf(field);
+Object.getOwnPropertyDescriptor(prototype, "value").set.call(field, text);
+field.dispatchEvent(new Event("input", {bubbles: true}));
+field.dispatchEvent(new Event("change", {bubbles: true}));
+field.dispatchEvent(new FocusEvent("blur"));
+field.dispatchEvent(new FocusEvent("focusout", {bubbles: true}));
+return field.value;
+"""
+
+logger: logging.Logger = logging.getLogger("projektron.pages")
 
 
 def _get_base_url() -> str:
@@ -58,7 +102,39 @@ def _get_base_url() -> str:
     return base_url
 
 
-class BasePage:
+def set_value(field: WebElement, text: str) -> bool:
+    """
+    Set the value of a text field or textarea in one round trip, instead of
+    typing it key by key.
+
+    A script sets the value through the native setter, so framework
+    listeners notice it, fires the ``input``, ``change`` and ``blur`` events
+    the form logic listens for and reads the value back. When the field is
+    read-only or disabled, the script fails, or the value read back differs,
+    e.g. because a ``maxlength`` or an input mask cut it, the field is
+    cleared and the text typed with keystrokes instead.
+
+    :param field: The input or textarea element.
+    :type field: WebElement
+    :param text: The new value.
+    :type text: str
+    :return: True if the value was set by the script, False if typed.
+    :rtype: bool
+    """
+    try:
+        value: Any = field.parent.execute_script(SET_VALUE_SCRIPT, field, text)
+    except JavascriptException:
+        value = None
+    expected: str = text.replace("\r\n", "\n").replace("\r", "\n")
+    if isinstance(value, str) and value.replace("\r\n", "\n") == expected:
+        return True
+    logger.debug("fast input rejected, typing instead", extra={"length": len(text)})
+    field.clear()
+    field.send_keys(text)
+    return False
+
+
+class BasePage:  # pylint: disable=too-many-instance-attributes
     """
     Base class for web pages using Selenium for automation.
 
@@ -70,28 +146,76 @@ class BasePage:
         - **base_url** (*str*): The base URL of the web application.
         - **timeout** (*int*): Timeout duration for waiting for elements
         to load, default is 30 seconds.
+        - **navigation_report** (*NavigationReport*): Optional report of
+        every navigation's timing.
+        - **artifact_writer** (*ArtifactWriter*): Optional writer of the
+        artifacts of failed lookups.
+        - **window_handle** (*str*): Optional handle of the browser tab the
+        page lives in, None for whichever tab is current.
+        - **rate_limiter** (*RateLimiter*): Optional limiter of the
+        navigations and form submits sent to the server.
+        - **locator_resolver** (*LocatorResolver*): Optional resolver looking
+        up locators with a fallback chain through their candidates.
+        - **working_hours** (*float*): The length of a working day in hours,
+        in which the budgets and durations shown in days are counted.
 
     :Methods:
         - :meth:`find_element`: Find a web element using a locator.
         - :meth:`find_element_by_xpath`: Find a web element using an XPath locator.
         - :meth:`find_elements`: Find multiple web elements using a locator.
         - :meth:`find_elements_by_xpath`: Find multiple web elements using an XPath locator.
+        - :meth:`activate`: Switch to the browser tab of the page.
+        - :meth:`build_url`: Build the absolute URL of a path.
         - :meth:`open`: Open a URL in the web browser.
+        - :meth:`throttle`: Wait for the rate limiter before a request to the server.
+        - :meth:`record_navigation`: Add the timing of a navigation to the report.
+        - :meth:`capture_failure`: Capture screenshot, DOM and console log of a failure.
         - :meth:`get_title`: Get the title of the current web page.
         - :meth:`get_url`: Get the URL of the current web page.
         - :meth:`wait_element`: Wait for an element to be located on the page.
     """
 
-    def __init__(self, driver: WebDriver) -> None:
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        driver: WebDriver,
+        base_url: Optional[str] = None,
+        navigation_report: Optional[NavigationReport] = None,
+        artifact_writer: Optional[ArtifactWriter] = None,
+        window_handle: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        locator_resolver: Optional[LocatorResolver] = None,
+        working_hours: float = TimeConstant.working_hours,
+    ) -> None:
         """
         Initialize the BasePage.
 
         :param driver: The Selenium WebDriver instance.
         :type driver: WebDriver
+        :param base_url: The base URL of the web application, read from the
+            secret manager when omitted.
+        :type base_url: str, optional
+        :param navigation_report: Report collecting the timing of every navigation.
+        :type navigation_report: NavigationReport, optional
+        :param artifact_writer: Writer of the artifacts of failed lookups.
+        :type artifact_writer: ArtifactWriter, optional
+        :param window_handle: The browser tab the page lives in.
+        :type window_handle: str, optional
+        :param rate_limiter: Limiter of the navigations and form submits.
+        :type rate_limiter: RateLimiter, optional
+        :param locator_resolver: Resolver of the locators with a fallback chain.
+        :type locator_resolver: LocatorResolver, optional
+        :param working_hours: The length of a working day in hours.
+        :type working_hours: float
         """
-        self.base_url: str = _get_base_url()
+        self.base_url: str = base_url if base_url is not None else _get_base_url()
         self.driver: WebDriver = driver
         self.timeout: int = 30
+        self.navigation_report: Optional[NavigationReport] = navigation_report
+        self.artifact_writer: Optional[ArtifactWriter] = artifact_writer
+        self.window_handle: Optional[str] = window_handle
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.locator_resolver: Optional[LocatorResolver] = locator_resolver
+        self.working_hours: float = working_hours
 
     def find_element(self, *locator: str) -> WebElement:
         """
@@ -102,7 +226,11 @@ class BasePage:
         :return: The web element found.
         :rtype: WebElement
         """
-        return self.driver.find_element(*locator)
+        try:
+            return self.driver.find_element(*locator)
+        except LOOKUP_FAILURES as error:
+            self.capture_failure("find element", error, locator[-1] if locator else None)
+            raise
 
     def find_element_by_xpath(self, locator: str) -> WebElement:
         """
@@ -113,7 +241,22 @@ class BasePage:
         :return: The web element found.
         :rtype: WebElement
         """
-        return self.driver.find_element(by=By.XPATH, value=locator)
+        chain: Optional[LocatorChain] = self._chain(locator)
+        try:
+            if chain is not None:
+                return self.locator_resolver.find(self.driver, chain)
+            return self.driver.find_element(by=By.XPATH, value=locator)
+        except LOOKUP_FAILURES as error:
+            self.capture_failure("find element", error, locator)
+            raise
+
+    def _chain(self, locator: str) -> Optional[LocatorChain]:
+        """
+        Return the fallback chain of a locator, None without a resolver or chain.
+        """
+        if self.locator_resolver is None:
+            return None
+        return self.locator_resolver.chain(locator)
 
     def find_elements(self, *locator: str) -> List[WebElement]:
         """
@@ -137,14 +280,91 @@ class BasePage:
         """
         return self.driver.find_elements(by=By.XPATH, value=locator)
 
-    def open(self, url: str = "") -> None:
+    def activate(self) -> None:
+        """
+        Switch the driver to the browser tab of the page, if it has one.
+        """
+        if self.window_handle is not None:
+            self.driver.switch_to.window(self.window_handle)
+
+    def build_url(self, url: str = "", params: Optional[Dict[str, str]] = None) -> str:
+        """
+        Build the absolute URL of a path below the base URL.
+
+        :param url: The path. Default is an empty string.
+        :type url: str, optional
+        :param params: Query parameters appended to the URL.
+        :type params: Dict[str, str], optional
+        :return: The absolute URL.
+        :rtype: str
+        """
+        if params:
+            url += ("&" if "?" in url else "?") + urlencode(params)
+        return self.base_url + url
+
+    def open(self, url: str = "", params: Optional[Dict[str, str]] = None) -> None:
         """
         Open a URL in the web browser.
 
         :param url: The URL to open. Default is an empty string.
         :type url: str, optional
+        :param params: Query parameters appended to the URL.
+        :type params: Dict[str, str], optional
+        """
+        self.throttle()
+        start: float = time.perf_counter()
+        self.driver.get(self.build_url(url, params))
+        self.record_navigation("open", start)
+
+    def throttle(self) -> None:
+        """
+        Wait until the rate limiter allows another request to the server.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def record_navigation(self, label: str, start: float) -> None:
+        """
+        Add the timing of the navigation that just happened to the report,
+        and its response time to the rate limiter.
+
+        The rate limiter gets the time to first byte of the navigation when
+        it is recorded, the wall time since ``start`` otherwise.
+
+        :param label: The action that navigated.
+        :type label: str
+        :param start: ``time.perf_counter()`` taken before the action.
+        :type start: float
+        """
+        seconds: float = time.perf_counter() - start
+        timing: Optional[NavigationTiming] = None
+        if self.navigation_report is not None:
+            timing = self.navigation_report.capture(
+                self.driver, label, start, self.window_handle
+            )
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(
+                timing.ttfb_ms / 1000 if timing is not None and timing.ttfb_ms else seconds
+            )
+
+    def capture_failure(
+        self, label: str, error: BaseException, locator: Optional[str] = None
+    ) -> None:
+        """
+        Capture screenshot, DOM and console log of a failure, if enabled.
+
+        Only the browser state is read here, the files are written by the
+        artifact writer's background thread.
+
+        :param label: The failing action.
+        :type label: str
+        :param error: The error of the failure.
+        :type error: BaseException
+        :param locator: The locator that failed.
+        :type locator: str, optional
         """
-        self.driver.get(self.base_url + url)
+        if self.artifact_writer is not None:
+            self.artifact_writer.capture(self.driver, label, error, locator)
 
     def get_title(self) -> str:
         """
@@ -179,6 +399,13 @@ class BasePage:
         :return: The web element found.
         :rtype: WebElement
         """
-        return WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((by_method, locator))
-        )
+        chain: Optional[LocatorChain] = self._chain(locator) if by_method == By.XPATH else None
+        try:
+            if chain is not None:
+                return self.locator_resolver.find(self.driver, chain, timeout=10)
+            return WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((by_method, locator))
+            )
+        except LOOKUP_FAILURES as error:
+            self.capture_failure("wait element", error, locator)
+            raise
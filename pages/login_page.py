@@ -8,6 +8,7 @@ for Selenium automation.
 Dependencies:
     - pages.base_page.BasePage
     - utils.locators.LoginPageLocators
+    - utils.structured_log.log_actions
 
 Usage:
     This module provides a class ``LoginPage`` representing
@@ -16,6 +17,7 @@ Usage:
     for interacting with the login page,
     such as entering email and password, clicking the login button,
     and performing login actions.
+    Every public method call is logged as an action with its duration.
 
 Classes:
     - :class:`LoginPage`: Page class representing the login page, providing
@@ -28,10 +30,14 @@ Methods:
     - :meth:`LoginPage.login`: Perform login with provided credentials.
 """
 
+import time
+from selenium.webdriver.remote.webelement import WebElement
 from utils.locators import LoginPageLocators
+from utils.structured_log import log_actions
 from pages.base_page import BasePage
 
 
+@log_actions
 class LoginPage(BasePage):
     """
     Page class representing the login page of a web application.
@@ -68,7 +74,11 @@ class LoginPage(BasePage):
         """
         Click the login button.
         """
-        self.find_element_by_xpath(LoginPageLocators.SUBMIT.value).click()
+        button: WebElement = self.find_element_by_xpath(LoginPageLocators.SUBMIT.value)
+        self.throttle()
+        start: float = time.perf_counter()
+        button.click()
+        self.record_navigation("login", start)
 
     def login(self, user: str, password: str) -> None:
         """
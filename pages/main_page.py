@@ -7,12 +7,15 @@ built for Selenium automation.
 
 Dependencies:
     - pages.base_page.BasePage
+    - pages.task_row.TaskRow
     - utils.locators.MainPageLocators
+    - utils.structured_log.log_actions
 
 Usage:
     This module provides a class ``MainPage`` representing the main page of a web application.
     It inherits from the ``BasePage`` class and includes methods for interacting with the main page,
     such as validating popup buttons and clicking on booking tabs.
+    Every public method call is logged as an action with its duration.
 
 Classes:
     - :class:`MainPage`: Page class representing the main page,
@@ -20,64 +23,284 @@ Classes:
 
 Methods:
     - :meth:`MainPage.validate_popup_button`: Validate and click on the popup button.
+    - :meth:`MainPage.dismiss_popup_if_present`: Click on the popup button if it is shown.
+    - :meth:`MainPage.is_on_booking_tab`: Check whether the day booking form is loaded.
+    - :meth:`MainPage.open_day`: Navigate straight to the day booking view of a day.
+    - :meth:`MainPage.day_url`: Build the URL of the day booking view of a day.
+    - :meth:`MainPage.open_day_in_tab`: Start loading a day in a new browser tab.
+    - :meth:`MainPage.wait_until_loaded`: Wait for the tab of the page to finish loading.
+    - :meth:`MainPage.close_tab`: Close the browser tab of the page.
     - :meth:`MainPage.click_on_booking_tab`: Click on the booking tab.
     - :meth:`MainPage.type_attendance_duration`: Type in the attendance duration.
     - :meth:`MainPage.type_break_duration`: Type in the break duration.
     - :meth:`MainPage.get_tasks_budget_list`: Get a list of elements representing tasks budgets.
     - :meth:`MainPage.get_tasks_duration_list`: Get a list of elements representing tasks durations.
+    - :meth:`MainPage.task_row`: Get a handle for one row of the task list.
+    - :meth:`MainPage.iter_task_rows`: Iterate over handles for the rows of the task list.
     - :meth:`MainPage.type_task_duration`: Type in the duration of a specific task.
     - :meth:`MainPage.type_task_description`: Type in the description of a specific task.
     - :meth:`MainPage.type_task_reference`: Type in the reference of a specific task.
     - :meth:`MainPage.type_task_title`: Type in the title of a specific task.
-    - :meth:`MainPage.get_unrecorded_efforts`: Get text string of unrecorded efforts.
+    - :meth:`MainPage.get_unrecorded_efforts`: Get the unrecorded efforts.
+    - :meth:`MainPage.read_day_state`: Read all duration fields of the day at once.
     - :meth:`MainPage.click_on_save_button`: Click on the save button.
     - :meth:`MainPage.get_first_available_task`: Return the index of the first available task line.
 """
 
-from typing import List, Tuple
+import time
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+from selenium.common.exceptions import (
+    NoSuchWindowException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.day_state import DaySnapshot
 from utils.locators import MainPageLocators
-from utils.time_parser import parse_time_string
+from utils.structured_log import log_actions
+from utils.time_parser import Duration
 from pages.base_page import BasePage
+from pages.task_row import TaskRow
+
+OPEN_TAB_SCRIPT: str = "window.open(arguments[0], '_blank');"
+
+LOADED_SCRIPT: str = (
+    "return document.readyState === 'complete' && location.href !== 'about:blank';"
+)
+
+FIELD_VALUES_SCRIPT: str = """
+const fields = document.evaluate(
+    arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+const values = [];
+for (let index = 0; index < fields.snapshotLength; index++) {
+    values.push(fields.snapshotItem(index).value);
+}
+return values;
+"""
 
 
-class MainPage(BasePage):
+@log_actions
+class MainPage(BasePage):  # pylint: disable=too-many-public-methods
     """
     Page class representing the main page of a web application.
 
     :Attributes:
         - **locator** (:class:`MainPageLocators`): Locators for elements on the main page.
+        - **DAY_BOOKING_PATH** (*str*): Path of the day booking view, relative
+          to the base URL.
+        - **DAY_PARAMETER** (*str*): Query parameter selecting the booked day.
+        - **DAY_FORMAT** (*str*): ``strftime`` format of the booked day.
 
     :Methods:
         - :meth:`validate_popup_button`: Validate and click on the popup button.
+        - :meth:`dismiss_popup_if_present`: Click on the popup button if it is shown.
+        - :meth:`is_on_booking_tab`: Check whether the day booking form is loaded.
+        - :meth:`open_day`: Navigate straight to the day booking view of a day.
+        - :meth:`day_url`: Build the URL of the day booking view of a day.
+        - :meth:`shown_day`: Return the day the current URL selects.
+        - :meth:`open_day_in_tab`: Start loading a day in a new browser tab.
+        - :meth:`wait_until_loaded`: Wait for the tab of the page to finish loading.
+        - :meth:`close_tab`: Close the browser tab of the page.
         - :meth:`click_on_booking_tab`: Click on the booking tab.
         - :meth:`type_attendance_duration`: Type in the attendance duration.
         - :meth:`type_break_duration`: Type in the break duration.
         - :meth:`get_tasks_budget_list`: Get a list of elements representing tasks budgets.
         - :meth:`get_tasks_duration_list`: Get a list of elements representing tasks durations.
+        - :meth:`task_row`: Get a handle for one row of the task list.
+        - :meth:`iter_task_rows`: Iterate over handles for the rows of the task list.
         - :meth:`type_task_duration`: Type in the duration of a specific task.
         - :meth:`type_task_description`: Type in the description of a specific task.
         - :meth:`type_task_reference`: Type in the reference of a specific task.
         - :meth:`type_task_title`: Type in the title of a specific task.
-        - :meth:`get_unrecorded_efforts`: Get text string of unrecorded efforts.
+        - :meth:`get_unrecorded_efforts`: Get the unrecorded efforts.
+        - :meth:`read_day_state`: Read all duration fields of the day at once.
         - :meth:`click_on_save_button`: Click on the save button.
         - :meth:`get_first_available_task`: Return the index of the first available task line.
     """
 
+    DAY_BOOKING_PATH: str = "/daytimerecording"
+    DAY_PARAMETER: str = "date"
+    DAY_FORMAT: str = "%Y-%m-%d"
+
     def validate_popup_button(self) -> None:
         """
         Validate and click on the popup button.
         """
         self.wait_element(MainPageLocators.POP_UP_YES_BUTTON).click()
 
+    def dismiss_popup_if_present(self) -> bool:
+        """
+        Click on the popup button if it is shown, without waiting for it.
+
+        :returns: True if the popup was dismissed.
+        :rtype: bool
+        """
+        buttons: List[WebElement] = self.find_elements_by_xpath(
+            MainPageLocators.POP_UP_YES_BUTTON
+        )
+        if not buttons:
+            return False
+        buttons[0].click()
+        return True
+
+    def is_on_booking_tab(self) -> bool:
+        """
+        Check whether the day booking form is loaded, without waiting.
+
+        :returns: True if the task table is present.
+        :rtype: bool
+        """
+        return bool(self.find_elements_by_xpath(MainPageLocators.TASKS_TABLE))
+
+    def open_day(self, day: Optional[date] = None) -> bool:
+        """
+        Navigate straight to the day booking view of a day through its URL.
+
+        Nothing is loaded when the booking form of that day is already shown.
+        The ``date`` parameter of the deep link is assumed from the URLs
+        Projektron shows. When the link is rejected, e.g. redirected to the
+        start page or to another day, nothing more is loaded for a specific
+        day, as the booking tab only shows the default day. For the default
+        day the booking tab is clicked instead, at the cost of another
+        navigation and the popup wait.
+
+        :param day: The day to book, None for the default day.
+        :type day: date, optional
+        :returns: True if the requested day is shown, False if its deep link
+            was rejected.
+        :rtype: bool
+        """
+        if self.is_on_booking_tab() and self._shows_day(day):
+            self.dismiss_popup_if_present()
+            return True
+        try:
+            self.open(self.DAY_BOOKING_PATH, params=self._day_params(day))
+            self.dismiss_popup_if_present()
+            if self.is_on_booking_tab() and self._shows_day(day):
+                return True
+        except WebDriverException:
+            pass
+        if day is not None:
+            return False
+        if not self.find_elements_by_xpath(MainPageLocators.DAY_BOOKING_TAB):
+            self.open()
+        self.validate_popup_button()
+        self.click_on_booking_tab()
+        self.dismiss_popup_if_present()
+        return True
+
+    def _day_params(self, day: Optional[date]) -> Dict[str, str]:
+        return {self.DAY_PARAMETER: day.strftime(self.DAY_FORMAT)} if day is not None else {}
+
+    def day_url(self, day: Optional[date] = None) -> str:
+        """
+        Build the URL of the day booking view of a day.
+
+        :param day: The day, None for the default day.
+        :type day: date, optional
+        :returns: The absolute URL.
+        :rtype: str
+        """
+        return self.build_url(self.DAY_BOOKING_PATH, self._day_params(day))
+
+    def open_day_in_tab(self, day: Optional[date] = None) -> "MainPage":
+        """
+        Start loading the day booking view of a day in a new browser tab.
+
+        The tab is opened by a script, so the call returns while the page
+        still loads and the driver stays on the current tab.
+
+        :param day: The day, None for the default day.
+        :type day: date, optional
+        :returns: A page bound to the new tab, see :meth:`activate`.
+        :rtype: MainPage
+        :raises NoSuchWindowException: If the browser opened no tab, e.g. a
+            popup blocker refused it.
+        """
+        self.throttle()
+        known: List[str] = self.driver.window_handles
+        url: str = self.day_url(day)
+        self.driver.execute_script(OPEN_TAB_SCRIPT, url)
+        opened: List[str] = [
+            handle for handle in self.driver.window_handles if handle not in known
+        ]
+        if not opened:
+            raise NoSuchWindowException(f"No tab was opened for {url}")
+        handle: str = opened[0]
+        return MainPage(
+            self.driver,
+            base_url=self.base_url,
+            navigation_report=self.navigation_report,
+            artifact_writer=self.artifact_writer,
+            window_handle=handle,
+            rate_limiter=self.rate_limiter,
+            locator_resolver=self.locator_resolver,
+            working_hours=self.working_hours,
+        )
+
+    def wait_until_loaded(self, timeout: float = 10) -> bool:
+        """
+        Wait for the current tab to leave ``about:blank`` and finish loading.
+
+        :param timeout: Seconds to wait at most.
+        :type timeout: float
+        :returns: False if the page was still loading after the timeout.
+        :rtype: bool
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda driver: driver.execute_script(LOADED_SCRIPT)
+            )
+        except TimeoutException:
+            return False
+        return True
+
+    def close_tab(self) -> None:
+        """
+        Close the browser tab of the page; switch to another before the next command.
+        """
+        self.activate()
+        self.driver.close()
+
+    def _shows_day(self, day: Optional[date]) -> bool:
+        """
+        Whether the current URL is the booking view of a day.
+
+        :param day: The day, None for any day.
+        :type day: date, optional
+        """
+        return day is None or self.shown_day() == day
+
+    def shown_day(self) -> Optional[date]:
+        """
+        Return the day the current URL selects with :attr:`DAY_PARAMETER`.
+
+        :returns: The day, None when the URL selects none, e.g. for the
+            default day.
+        :rtype: date, optional
+        """
+        query: Dict[str, List[str]] = parse_qs(urlparse(self.get_url()).query)
+        try:
+            return datetime.strptime(query[self.DAY_PARAMETER][0], self.DAY_FORMAT).date()
+        except (KeyError, ValueError):
+            return None
+
     def click_on_booking_tab(self) -> None:
         """
         Click on the booking tab.
         """
-        self.wait_element(MainPageLocators.DAY_BOOKING_TAB).click()
+        tab: WebElement = self.wait_element(MainPageLocators.DAY_BOOKING_TAB)
+        self.throttle()
+        start: float = time.perf_counter()
+        tab.click()
+        self.record_navigation("booking tab", start)
 
     def type_attendance_duration(
-        self, hours: int = 8, minutes: int = 0
+        self, hours: int = 8, minutes: int = 0, duration: Optional[Duration] = None
     ) -> None:
         """
         Type in the attendance duration in hours and minutes.
@@ -86,17 +309,18 @@ class MainPage(BasePage):
         :type hours: int
         :param minutes: The number of minutes.
         :type minutes: int
+        :param duration: The duration, replaces hours and minutes.
+        :type duration: Duration, optional
         """
-        self.wait_element(MainPageLocators.ATTANDENCE_HOUR).clear()
-        self.wait_element(MainPageLocators.ATTANDENCE_HOUR).send_keys(
-            str(hours)
-        )
-        self.wait_element(MainPageLocators.ATTANDENCE_MINUTE).clear()
-        self.wait_element(MainPageLocators.ATTANDENCE_MINUTE).send_keys(
-            str(minutes)
-        )
-
-    def type_break_duration(self, hours: int = 1, minutes: int = 0) -> None:
+        hours, minutes = (
+            duration if duration is not None else Duration(hours=hours, minutes=minutes)
+        ).split()
+        self._replace_text(MainPageLocators.ATTANDENCE_HOUR, str(hours))
+        self._replace_text(MainPageLocators.ATTANDENCE_MINUTE, str(minutes))
+
+    def type_break_duration(
+        self, hours: int = 1, minutes: int = 0, duration: Optional[Duration] = None
+    ) -> None:
         """
         Type in the break duration in hours and minutes.
 
@@ -104,13 +328,27 @@ class MainPage(BasePage):
         :type hours: int
         :param minutes: The number of minutes.
         :type minutes: int
+        :param duration: The duration, replaces hours and minutes.
+        :type duration: Duration, optional
         """
-        self.wait_element(MainPageLocators.BREAK_HOUR).clear()
-        self.wait_element(MainPageLocators.BREAK_HOUR).send_keys(str(hours))
-        self.wait_element(MainPageLocators.BREAK_MINUTE).clear()
-        self.wait_element(MainPageLocators.BREAK_MINUTE).send_keys(
-            str(minutes)
-        )
+        hours, minutes = (
+            duration if duration is not None else Duration(hours=hours, minutes=minutes)
+        ).split()
+        self._replace_text(MainPageLocators.BREAK_HOUR, str(hours))
+        self._replace_text(MainPageLocators.BREAK_MINUTE, str(minutes))
+
+    def _replace_text(self, locator: str, text: str) -> None:
+        """
+        Replace the value of a field, locating it once.
+
+        :param locator: The XPath locator of the field.
+        :type locator: str
+        :param text: The text to type.
+        :type text: str
+        """
+        field: WebElement = self.wait_element(locator)
+        field.clear()
+        field.send_keys(text)
 
     def get_tasks_budget_list(self) -> List[str]:
         """
@@ -140,8 +378,44 @@ class MainPage(BasePage):
             )
         ]
 
+    def task_row(self, task_line: int = 0) -> TaskRow:
+        """
+        Get a handle for one row of the task list.
+
+        :param task_line: The line number of the task, from 0.
+        :type task_line: int
+        :returns: The handle of the row.
+        :rtype: TaskRow
+        :raises ValueError: If the line number is negative, e.g. the -1 of
+            :meth:`get_first_available_task` when no line has budget left.
+        """
+        if task_line < 0:
+            raise ValueError(f"Task line {task_line} does not exist")
+        return TaskRow(
+            self.find_element_by_xpath(f"{MainPageLocators.TASKS_ROWS.value}[{task_line + 1}]"),
+            task_line,
+            self.working_hours,
+        )
+
+    def iter_task_rows(self) -> Iterator[TaskRow]:
+        """
+        Iterate over handles for the rows of the task list.
+
+        The rows are located with one query; the fields of a row are only
+        located when its handle is used.
+
+        :returns: An iterator of row handles, in line order.
+        :rtype: Iterator[TaskRow]
+        """
+        for index, row in enumerate(self.find_elements_by_xpath(MainPageLocators.TASKS_ROWS)):
+            yield TaskRow(row, index, self.working_hours)
+
     def type_task_duration(
-        self, task_line: int = 0, hours: int = 1, minutes: int = 0
+        self,
+        task_line: int = 0,
+        hours: int = 1,
+        minutes: int = 0,
+        duration: Optional[Duration] = None,
     ) -> None:
         """
         Type in the duration of a specific task in hours and minutes.
@@ -152,17 +426,10 @@ class MainPage(BasePage):
         :type hours: int
         :param minutes: The number of minutes.
         :type minutes: int
+        :param duration: The duration, replaces hours and minutes.
+        :type duration: Duration, optional
         """
-        tasks_hours: List[WebElement] = self.find_elements_by_xpath(
-            MainPageLocators.TASKS_DURATION_INPUT_HOURS
-        )
-        tasks_minutes: List[WebElement] = self.find_elements_by_xpath(
-            MainPageLocators.TASKS_DURATION_INPUT_MINUTES
-        )
-        tasks_minutes[task_line].clear()
-        tasks_hours[task_line].clear()
-        tasks_minutes[task_line].send_keys(str(minutes))
-        tasks_hours[task_line].send_keys(str(hours))
+        self.task_row(task_line).set_duration(hours=hours, minutes=minutes, duration=duration)
 
     def type_task_description(
         self, task_line: int = 0, text: str = "test"
@@ -175,11 +442,7 @@ class MainPage(BasePage):
         :param text: The description text.
         :type text: str
         """
-        tasks: List[WebElement] = self.find_elements_by_xpath(
-            MainPageLocators.TASKS_DESCRIPTION_INPUT
-        )
-        tasks[task_line].clear()
-        tasks[task_line].send_keys(text)
+        self.task_row(task_line).set_description(text)
 
     def type_task_reference(
         self, task_line: int = 0, text: str = "test"
@@ -192,11 +455,7 @@ class MainPage(BasePage):
         :param text: The reference text.
         :type text: str
         """
-        tasks: List[WebElement] = self.find_elements_by_xpath(
-            MainPageLocators.TASKS_REFERENCE_INPUT
-        )
-        tasks[task_line].clear()
-        tasks[task_line].send_keys(text)
+        self.task_row(task_line).set_reference(text)
 
     def type_task_title(self, task_line: int = 0, text: str = "test") -> None:
         """
@@ -207,40 +466,57 @@ class MainPage(BasePage):
         :param text: The title text.
         :type text: str
         """
-        tasks: List[WebElement] = self.find_elements_by_xpath(
-            MainPageLocators.TASKS_TITLE_INPUT
-        )
-        tasks[task_line].clear()
-        tasks[task_line].send_keys(text)
+        self.task_row(task_line).set_title(text)
 
-    def get_unrecorded_efforts(self) -> str:
+    def get_unrecorded_efforts(self) -> Duration:
         """
-        Get text string of unrecorded efforts.
+        Get the unrecorded efforts.
 
-        :returns: A string of unrecorded time efforts.
-        :rtype: str
+        :returns: The unrecorded efforts, zero for empty fields.
+        :rtype: Duration
         """
         unrecorded_minutes: str = (
             self.find_element_by_xpath(
                 MainPageLocators.UNRECORDED_EFFORTS_MINUTE
             ).get_attribute("value")
-            or "00"
+            or "0"
         )
         unrecorded_hours: str = (
             self.find_element_by_xpath(
                 MainPageLocators.UNRECORDED_EFFORTS_HOUR
             ).get_attribute("value")
-            or "00"
+            or "0"
         )
-        return f"{unrecorded_hours}:{unrecorded_minutes}h"
+        return Duration(hours=int(unrecorded_hours), minutes=int(unrecorded_minutes))
+
+    def read_day_state(self) -> DaySnapshot:
+        """
+        Read attendance, break, recorded and unrecorded efforts and the
+        durations typed into the task lines, in one round trip.
+
+        The values are collected by a script evaluating one XPath union.
+
+        :returns: The snapshot of the day, see :attr:`DaySnapshot.state`.
+        :rtype: DaySnapshot
+        """
+        values: List[Optional[str]] = self.driver.execute_script(
+            FIELD_VALUES_SCRIPT, MainPageLocators.DAY_STATE.value
+        )
+        return DaySnapshot.from_values(values)
 
     def click_on_save_button(self) -> None:
         """
         Click on the save button.
         """
-        self.find_element_by_xpath(MainPageLocators.SAVE_BUTTON).click()
-
-    def get_first_available_task(self) -> int:
+        button: WebElement = self.find_element_by_xpath(MainPageLocators.SAVE_BUTTON)
+        self.throttle()
+        start: float = time.perf_counter()
+        button.click()
+        self.record_navigation("save", start)
+
+    def get_first_available_task(
+        self, unrecorded_time: Optional[Union[str, Duration]] = None
+    ) -> int:
         """
         Return the index of the first available task line.
 
@@ -252,21 +528,27 @@ class MainPage(BasePage):
         unrecorded time for a task,
         it returns the index of task line in the main page.
 
+        :param unrecorded_time: The unrecorded efforts if already read,
+            read from the page otherwise.
+        :type unrecorded_time: Duration or str, optional
         :returns: Index of the line or -1 if no budget is available.
         :rtype: int
         """
         task_budget_list: List[str] = self.get_tasks_budget_list()
         task_duration_list: List[str] = self.get_tasks_duration_list()
-        unrecorded_time: str = self.get_unrecorded_efforts()
-        unrecorded_time_seconds: int = parse_time_string(unrecorded_time)
+        unrecorded: Duration = Duration.parse(
+            unrecorded_time if unrecorded_time is not None else self.get_unrecorded_efforts(),
+            self.working_hours,
+        )
         task_index: int = -1
 
-        merge_list: List[Tuple[int, int]] = [
-            (parse_time_string(budget), parse_time_string(duration))
+        merge_list: List[Tuple[Duration, Duration]] = [
+            (Duration.parse(budget, self.working_hours),
+             Duration.parse(duration, self.working_hours))
             for budget, duration in zip(task_budget_list, task_duration_list)
         ]
         for index, tasks_values in enumerate(merge_list, start=0):
-            if tasks_values[0] <= tasks_values[1] + unrecorded_time_seconds:
+            if tasks_values[0] <= tasks_values[1] + unrecorded:
                 continue
             task_index = index
             break
@@ -0,0 +1,267 @@
+"""
+Module: task_row
+
+This module contains a handle class for one row of the task list on the
+main page, built for Selenium automation.
+
+Dependencies:
+    - selenium
+    - pages.base_page.set_value
+    - utils.locators.TaskRowLocators
+    - utils.structured_log.log_actions
+    - utils.time_parser.Duration
+
+Usage:
+    Get handles from :meth:`MainPage.task_row` or :meth:`MainPage.iter_task_rows`.
+    A handle resolves the fields of its row the first time one is used, with a
+    single script evaluating the field locators of
+    :class:`utils.locators.TaskRowLocators` in the row's ``<tr>`` element, and
+    reuses them for every later read and write. Free text is set in one round trip instead of
+    being typed key by key::
+
+        row = main_page.task_row(1)
+        row.set_duration(hours=3, minutes=15)
+        row.set_title("TA")
+
+Classes:
+    - :class:`TaskRow`: Handle for one row of the task list.
+"""
+
+from typing import Dict, Optional, Tuple
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.webelement import WebElement
+from pages.base_page import set_value
+from utils.locators import TaskRowLocators
+from utils.structured_log import log_actions
+from utils.time_parser import Duration, TimeConstant
+
+_FIELD_LOCATORS: Dict[str, Tuple[TaskRowLocators, int]] = {
+    "name": (TaskRowLocators.NAME, 0),
+    "project": (TaskRowLocators.PROJECT, 0),
+    "reference": (TaskRowLocators.REFERENCE_INPUT, 0),
+    "title": (TaskRowLocators.TITLE_INPUT, 0),
+    "duration_hour": (TaskRowLocators.DURATION_INPUTS, 0),
+    "duration_minute": (TaskRowLocators.DURATION_INPUTS, 1),
+    "description": (TaskRowLocators.DESCRIPTION_INPUT, 0),
+    "budget": (TaskRowLocators.BUDGET, 0),
+    "duration": (TaskRowLocators.DURATION, 0),
+}
+
+ROW_FIELDS_SCRIPT: str = """
+const [row, locators] = arguments;
+const fields = {};
+for (const [name, xpath, position] of locators) {
+    const found = document.evaluate(
+        xpath, row, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    if (found.snapshotLength > position) {
+        fields[name] = found.snapshotItem(position);
+    }
+}
+return fields;
+"""
+
+
+@log_actions
+class TaskRow:
+    """
+    Handle for one row of the task list.
+
+    :Attributes:
+        - **element** (*WebElement*): The ``<tr>`` element of the row.
+        - **index** (*int*): The line number of the row in the task list.
+        - **working_hours** (*float*): The length of a working day in hours.
+
+    :Methods:
+        - :meth:`set_duration`: Type in the duration in hours and minutes.
+        - :meth:`set_description`: Set the description.
+        - :meth:`set_reference`: Set the reference.
+        - :meth:`set_title`: Set the title.
+        - :meth:`get_duration_input`: Get the typed duration.
+        - :meth:`get_description`: Get the description.
+        - :meth:`get_reference`: Get the reference.
+        - :meth:`get_title`: Get the title.
+        - :meth:`get_name`: Get the name of the task.
+        - :meth:`get_project`: Get the project of the task.
+        - :meth:`get_budget`: Get the budget of the task.
+        - :meth:`get_duration`: Get the duration already booked on the task.
+    """
+
+    def __init__(
+        self, element: WebElement, index: int, working_hours: float = TimeConstant.working_hours
+    ) -> None:
+        """
+        Initialize the TaskRow.
+
+        :param element: The ``<tr>`` element of the row.
+        :type element: WebElement
+        :param index: The line number of the row in the task list.
+        :type index: int
+        :param working_hours: The length of a working day in hours, in which
+            the budget and duration cells count their days.
+        :type working_hours: float
+        """
+        self.element: WebElement = element
+        self.index: int = index
+        self.working_hours: float = working_hours
+        self._fields: Optional[Dict[str, WebElement]] = None
+
+    def __repr__(self) -> str:
+        return f"TaskRow(index={self.index})"
+
+    def _resolve(self) -> Dict[str, WebElement]:
+        """
+        Locate all fields of the row by their locators with one script, then
+        reuse them.
+
+        Fields missing from the row, e.g. the inputs of read-only tasks, are
+        left out.
+        """
+        if self._fields is None:
+            self._fields = self.element.parent.execute_script(
+                ROW_FIELDS_SCRIPT,
+                self.element,
+                [[name, locator.value, position]
+                 for name, (locator, position) in _FIELD_LOCATORS.items()],
+            )
+        return self._fields
+
+    def _field(self, name: str) -> WebElement:
+        """
+        Return a field of the row.
+
+        :raises NoSuchElementException: If the row has no such field.
+        """
+        field: Optional[WebElement] = self._resolve().get(name)
+        if field is None:
+            raise NoSuchElementException(f"Task line {self.index} has no {name} field")
+        return field
+
+    def _replace_text(self, name: str, text: str) -> None:
+        field: WebElement = self._field(name)
+        field.clear()
+        field.send_keys(text)
+
+    def _set_text(self, name: str, text: str) -> None:
+        set_value(self._field(name), text)
+
+    def set_duration(
+        self, hours: int = 1, minutes: int = 0, duration: Optional[Duration] = None
+    ) -> None:
+        """
+        Type in the duration in hours and minutes.
+
+        :param hours: The number of hours.
+        :type hours: int
+        :param minutes: The number of minutes.
+        :type minutes: int
+        :param duration: The duration, replaces hours and minutes.
+        :type duration: Duration, optional
+        """
+        hours, minutes = (
+            duration if duration is not None else Duration(hours=hours, minutes=minutes)
+        ).split()
+        self._replace_text("duration_minute", str(minutes))
+        self._replace_text("duration_hour", str(hours))
+
+    def set_description(self, text: str) -> None:
+        """
+        Set the description, see :func:`pages.base_page.set_value`.
+
+        :param text: The description text.
+        :type text: str
+        """
+        self._set_text("description", text)
+
+    def set_reference(self, text: str) -> None:
+        """
+        Set the reference, see :func:`pages.base_page.set_value`.
+
+        :param text: The reference text.
+        :type text: str
+        """
+        self._set_text("reference", text)
+
+    def set_title(self, text: str) -> None:
+        """
+        Set the title, see :func:`pages.base_page.set_value`.
+
+        :param text: The title text.
+        :type text: str
+        """
+        self._set_text("title", text)
+
+    def get_duration_input(self) -> Duration:
+        """
+        Get the typed duration.
+
+        :returns: The duration in the hours and minutes fields, zero when empty.
+        :rtype: Duration
+        """
+        return Duration(
+            hours=int(self._field("duration_hour").get_attribute("value") or 0),
+            minutes=int(self._field("duration_minute").get_attribute("value") or 0),
+        )
+
+    def get_description(self) -> str:
+        """
+        Get the description.
+
+        :returns: The description text.
+        :rtype: str
+        """
+        return self._field("description").get_attribute("value") or ""
+
+    def get_reference(self) -> str:
+        """
+        Get the reference.
+
+        :returns: The reference text.
+        :rtype: str
+        """
+        return self._field("reference").get_attribute("value") or ""
+
+    def get_title(self) -> str:
+        """
+        Get the title.
+
+        :returns: The title text.
+        :rtype: str
+        """
+        return self._field("title").get_attribute("value") or ""
+
+    def get_name(self) -> str:
+        """
+        Get the name of the task.
+
+        :returns: The task name.
+        :rtype: str
+        """
+        return self._field("name").text.strip()
+
+    def get_project(self) -> str:
+        """
+        Get the project of the task.
+
+        :returns: The project name.
+        :rtype: str
+        """
+        return self._field("project").text.strip()
+
+    def get_budget(self) -> Duration:
+        """
+        Get the budget of the task.
+
+        :returns: The budget, shown as e.g. ``1d 00:00h``.
+        :rtype: Duration
+        """
+        return Duration.parse(self._field("budget").text, self.working_hours)
+
+    def get_duration(self) -> Duration:
+        """
+        Get the duration already booked on the task.
+
+        :returns: The booked duration, shown as e.g. ``08:00h``.
+        :rtype: Duration
+        """
+        return Duration.parse(self._field("duration").text, self.working_hours)
@@ -0,0 +1,126 @@
+"""
+Module: report
+
+This module writes a budget burn-down report per task and per person for a
+date range, scraping only the days that are not in the task cache yet.
+
+Dependencies:
+    - selenium
+    - utils.burndown
+    - utils.tables
+
+Usage:
+    The range defaults to the current month up to today. Without
+    ``accounts`` the account of the '.env' file is used; ``accounts=<path>``
+    reads a JSON list of ``{"username": ..., "password": ...}`` objects and
+    collects them in parallel, one browser each; ``store=<path>`` reads every
+    account of an encrypted credential store instead, each opened at the
+    URL stored with it. The tables are printed as Markdown, or written to
+    ``<prefix>_tasks`` and ``<prefix>_people`` files with ``output=<prefix>``,
+    as ``format=md`` (default) or ``format=csv``.
+    ``collect=0`` reports from the cache alone, ``weekends=1`` includes
+    Saturdays and Sundays.
+
+Example:
+    $ python report.py start=2024-06-01 end=2024-06-30 accounts=team.json output=june
+"""
+
+import json
+from datetime import date
+from typing import Dict, List, Tuple
+from selenium import webdriver
+from main import get_credentials, open_credential_store
+from utils.arguments import parse_arguments
+from utils.burndown import (
+    burndown_points,
+    collect_accounts,
+    date_range,
+    summarize_people,
+    summarize_tasks,
+)
+from utils.tables import markdown_table, write_csv
+from utils.task_cache import DEFAULT_PATH, TaskCache
+
+
+def read_accounts(path: str) -> List[Tuple[str, str]]:
+    """
+    Read the usernames and passwords of the accounts to report on.
+
+    :param path: A JSON file with a list of ``username``/``password`` objects.
+    :return: The usernames and passwords.
+    :rtype: List[Tuple[str, str]]
+    """
+    with open(path, encoding="utf-8") as accounts_file:
+        return [(account["username"], account["password"]) for account in json.load(accounts_file)]
+
+
+def chrome_factory() -> webdriver.Chrome:
+    """
+    Create a headless Chrome driver.
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    return webdriver.Chrome(options=options)
+
+
+def main() -> None:
+    """
+    Parse the arguments, collect the missing days and write the report.
+    """
+    today: date = date.today()
+    arguments = parse_arguments(
+        {
+            "start": today.replace(day=1).isoformat(),
+            "end": today.isoformat(),
+            "format": "md",
+            "cache": DEFAULT_PATH,
+        }
+    )
+    days: List[date] = date_range(
+        date.fromisoformat(str(arguments["start"])),
+        date.fromisoformat(str(arguments["end"])),
+        weekends=str(arguments.get("weekends", 0)) == "1",
+    )
+    accounts: List[Tuple[str, str]]
+    base_urls: Dict[str, str] = {}
+    if "accounts" in arguments:
+        accounts = read_accounts(str(arguments["accounts"]))
+    elif "store" in arguments:
+        store = list(open_credential_store(str(arguments["store"])))
+        accounts = [(credentials.username, credentials.password) for credentials in store]
+        base_urls = {credentials.username: credentials.url for credentials in store
+                     if credentials.url}
+    else:
+        accounts = [get_credentials()]
+    cache_path: str = str(arguments["cache"])
+    if str(arguments.get("collect", 1)) != "0":
+        for result in collect_accounts(
+            accounts, chrome_factory, cache_path, days, base_urls=base_urls
+        ):
+            print(
+                f"{result.account}: {len(result.scraped)} days scraped, "
+                f"{len(result.cached)} cached, {len(result.skipped)} skipped"
+                + (f", stopped by {result.error}" if result.error else "")
+            )
+    cache = TaskCache(cache_path)
+    try:
+        tasks = summarize_tasks(burndown_points(cache, [user for user, _ in accounts], days))
+    finally:
+        cache.close()
+    tables: Dict[str, List[Dict[str, str]]] = {
+        "tasks": [summary.as_row() for summary in tasks],
+        "people": [summary.as_row() for summary in summarize_people(tasks)],
+    }
+    for name, rows in tables.items():
+        if "output" in arguments and arguments["format"] == "csv":
+            write_csv(rows, f"{arguments['output']}_{name}.csv")
+        elif "output" in arguments:
+            with open(f"{arguments['output']}_{name}.md", "w", encoding="utf-8") as md_file:
+                md_file.write(markdown_table(rows) + "\n")
+        else:
+            print(f"\n## Burn-down per {'task' if name == 'tasks' else 'person'}\n")
+            print(markdown_table(rows))
+
+
+if __name__ == "__main__":
+    main()
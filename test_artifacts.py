@@ -0,0 +1,147 @@
+"""
+Module: test_artifacts
+
+This module contains unit tests for the module 'artifacts.py'.
+
+Dependencies:
+    - unittest
+    - artifacts (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_artifacts.py
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from typing import Any, List
+from selenium.common.exceptions import NoSuchElementException
+from pages.main_page import MainPage
+from utils.artifacts import OUTER_HTML_SCRIPT, ArtifactWriter
+from utils.booking_planner import BookingJob, RowAssignment, execute_plan, plan_booking
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.locators import MainPageLocators
+from utils.time_parser import Duration
+
+BASE_URL: str = "https://projektron.local/bcw"
+
+
+class EvidenceDriver(FakeWebDriver):
+    """
+    Fake driver answering screenshots, outerHTML and console logs.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.dumped: List[Any] = []
+
+    def get_screenshot_as_png(self) -> bytes:
+        """
+        Return a fake screenshot.
+        """
+        return b"\x89PNG fake"
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        if script != OUTER_HTML_SCRIPT:
+            return super().execute_script(script, *args)
+        self.dumped.append(args[0] if args else None)
+        return "<table>dumped</table>"
+
+    def get_log(self, log_type: str) -> List[dict]:
+        """
+        Return a fake console log.
+        """
+        return [{"level": "SEVERE", "message": f"{log_type} error"}]
+
+
+class TestArtifactWriter(unittest.TestCase):
+    """
+    Test cases for the ArtifactWriter class.
+    """
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = os.path.join(self.tmp.name, "artifacts")
+        self.driver = EvidenceDriver(fixture_pages(BASE_URL))
+        self.writer = ArtifactWriter(self.directory)
+        self.page = MainPage(self.driver, base_url=BASE_URL, artifact_writer=self.writer)
+        self.page.open("/daytimerecording")
+
+    def _files(self) -> List[str]:
+        return sorted(os.listdir(self.writer.run_dir))
+
+    def test_failed_lookup_captured(self):
+        """
+        Test a failed lookup leaves screenshot, table, console log and summary.
+        """
+        locator = MainPageLocators.TASKS_TABLE.value + "/tbody/tr[9]//input"
+        with self.assertRaises(NoSuchElementException):
+            self.page.find_element_by_xpath(locator)
+        self.writer.close()
+        self.assertEqual(
+            self._files(),
+            [
+                "001-find-element.console.json.gz",
+                "001-find-element.html.gz",
+                "001-find-element.json.gz",
+                "001-find-element.png",
+            ],
+        )
+        self.assertEqual(self.driver.dumped, [MainPageLocators.TASKS_TABLE.value])
+        with gzip.open(os.path.join(self.writer.run_dir, "001-find-element.json.gz")) as summary:
+            data = json.load(summary)
+        self.assertEqual(data["locator"], locator)
+        self.assertEqual(data["url"], BASE_URL + "/daytimerecording")
+        self.assertTrue(data["error"].startswith("NoSuchElementException"))
+
+    def test_failed_step_captured_once(self):
+        """
+        Test a plan step failing in a lookup is captured once.
+        """
+        job = BookingJob(attendance=None, break_duration=None,
+                         rows=(RowAssignment(task_line=7, duration=Duration(hours=1)),))
+        with self.assertRaises(NoSuchElementException):
+            execute_plan(plan_booking(job), self.page)
+        self.writer.close()
+        self.assertEqual(self.writer.failures, 1)
+        self.assertEqual(len(self._files()), 4)
+
+    def test_happy_path_writes_nothing(self):
+        """
+        Test no thread runs and no directory is created without failures.
+        """
+        self.page.find_element_by_xpath(MainPageLocators.SAVE_BUTTON)
+        self.writer.close()
+        self.assertFalse(os.path.exists(self.directory))
+
+    def test_retention(self):
+        """
+        Test the oldest runs are deleted beyond max_runs and the byte budget.
+        """
+        for name, size in (("20240101-000000-a", 600), ("20240102-000000-b", 100),
+                           ("20240103-000000-c", 100), ("20240104-000000-d", 100)):
+            os.makedirs(os.path.join(self.directory, name))
+            with open(os.path.join(self.directory, name, "old.png"), "wb") as old:
+                old.write(b"x" * size)
+        writer = ArtifactWriter(self.directory, max_bytes=1000, max_runs=3)
+        self.assertEqual(writer.enforce_retention(), 200)
+        self.assertEqual(
+            sorted(os.listdir(self.directory)), ["20240103-000000-c", "20240104-000000-d"]
+        )
+
+    def test_run_stops_at_budget(self):
+        """
+        Test a run writes no more than its share of the byte budget.
+        """
+        writer = ArtifactWriter(self.directory, max_bytes=40)
+        writer.capture(self.driver, "too big", RuntimeError("x"))
+        writer.close()
+        self.assertEqual(os.listdir(writer.run_dir), ["001-too-big.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
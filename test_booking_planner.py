@@ -0,0 +1,244 @@
+"""
+Module: test_booking_planner
+
+This module contains unit tests for the module 'booking_planner.py'.
+Plans are executed against the daytimerecording fixture through the fake driver.
+
+Dependencies:
+    - unittest
+    - booking_planner (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_booking_planner.py
+"""
+
+import unittest
+from datetime import date
+from typing import Optional
+from selenium.webdriver.common.by import By
+from pages.main_page import MainPage
+from utils.booking_planner import (
+    BookingJob,
+    RowAssignment,
+    execute_plan,
+    naive_command_count,
+    plan_booking,
+)
+from utils.day_state import DayState
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.locators import MainPageLocators
+from utils.time_parser import Duration
+
+BASE_URL: str = "https://projektron.local/bcw"
+
+
+class RecalculatingPage(MainPage):
+    """
+    Main page whose unrecorded efforts follow the attendance, as Projektron's do.
+    """
+
+    def type_attendance_duration(
+        self, hours: int = 8, minutes: int = 0, duration: Optional[Duration] = None
+    ) -> None:
+        super().type_attendance_duration(hours, minutes, duration)
+        for locator, value in ((MainPageLocators.UNRECORDED_EFFORTS_HOUR, "4"),
+                               (MainPageLocators.UNRECORDED_EFFORTS_MINUTE, "0")):
+            field = self.driver.find_element(By.XPATH, locator)
+            field.clear()
+            field.send_keys(value)
+
+
+class TestBookingPlanner(unittest.TestCase):
+    """
+    Test cases for planning and executing booking jobs.
+    """
+
+    def setUp(self) -> None:
+        self.driver = FakeWebDriver(fixture_pages(BASE_URL))
+        self.page = MainPage(self.driver, base_url=BASE_URL)
+        self.page.open("/daytimerecording")
+
+    def _value(self, locator: str, index: int = 0) -> str:
+        return self.driver.find_elements(By.XPATH, locator)[index].get_attribute("value")
+
+    def test_default_job(self):
+        """
+        Test the unrecorded efforts are booked on the first line with budget left.
+        """
+        job = BookingJob(
+            attendance=Duration(hours=9),
+            rows=(RowAssignment(description="text", reference="REF", title="TA"),),
+            save=True,
+        )
+        context = execute_plan(plan_booking(job), self.page)
+        self.assertEqual(context["first_available_line"], 1)
+        self.assertEqual(self._value(MainPageLocators.ATTANDENCE_HOUR), "9")
+        self.assertEqual(self._value(MainPageLocators.BREAK_MINUTE), "45")
+        self.assertEqual(self._value(MainPageLocators.TASKS_DURATION_INPUT_HOURS, 1), "3")
+        self.assertEqual(self._value(MainPageLocators.TASKS_DURATION_INPUT_MINUTES, 1), "15")
+        self.assertEqual(self._value(MainPageLocators.TASKS_REFERENCE_INPUT, 1), "REF")
+        self.assertEqual(len(self.driver.submissions), 1)
+        self.assertTrue(context["saved"])
+
+    def test_tab_click_skipped_on_booking_form(self):
+        """
+        Test only the popup is clicked when the booking form is already loaded.
+        """
+        execute_plan(plan_booking(BookingJob()), self.page)
+        self.assertEqual([node.tag for node in self.driver.clicks], ["input"])
+
+    def _fill(self, locator: str, text: str) -> None:
+        field = self.driver.find_elements(By.XPATH, locator)[0]
+        field.clear()
+        field.send_keys(text)
+
+    def test_complete_day_stops_after_one_read(self):
+        """
+        Test nothing is typed on a day with attendance and no unrecorded efforts.
+        """
+        self._fill(MainPageLocators.ATTANDENCE_HOUR, "9")
+        self._fill(MainPageLocators.UNRECORDED_EFFORTS_HOUR, "0")
+        self._fill(MainPageLocators.UNRECORDED_EFFORTS_MINUTE, "0")
+        context = execute_plan(plan_booking(BookingJob(rows=(RowAssignment(),), save=True)),
+                               self.page)
+        self.assertEqual(context["day_state"], DayState.COMPLETE)
+        self.assertNotIn("first_available_line", context)
+        self.assertEqual(self._value(MainPageLocators.BREAK_MINUTE), "")
+        self.assertEqual(self.driver.submissions, [])
+        self.assertNotIn("saved", context)
+
+    def test_partial_day_is_trimmed(self):
+        """
+        Test fields holding the job's values and zero bookings are left out.
+        """
+        self._fill(MainPageLocators.ATTANDENCE_HOUR, "8")
+        self._fill(MainPageLocators.BREAK_MINUTE, "45")
+        self._fill(MainPageLocators.UNRECORDED_EFFORTS_HOUR, "0")
+        self._fill(MainPageLocators.UNRECORDED_EFFORTS_MINUTE, "0")
+        job = BookingJob(rows=(RowAssignment(), RowAssignment(task_line=2,
+                                                             duration=Duration(hours=1))))
+        self.page.type_task_duration(task_line=0, hours=2)
+        context = execute_plan(plan_booking(job), self.page)
+        self.assertEqual(context["day_state"], DayState.PARTIAL)
+        self.assertEqual(self._value(MainPageLocators.ATTANDENCE_MINUTE), "")
+        self.assertEqual([line for _, line, _ in context["booked_rows"]], [2])
+
+    def test_unrecorded_read_after_typing_attendance(self):
+        """
+        Test the row books the unrecorded efforts as updated by typing attendance.
+        """
+        page = RecalculatingPage(self.driver, base_url=BASE_URL)
+        context = execute_plan(plan_booking(BookingJob(attendance=Duration(hours=9),
+                                                       rows=(RowAssignment(),))), page)
+        self.assertEqual([duration for _, _, duration in context["booked_rows"]],
+                         [Duration(hours=4)])
+
+    def test_no_line_with_budget_stops(self):
+        """
+        Test the plan stops unsaved when no task line has budget left.
+        """
+        self._fill(MainPageLocators.UNRECORDED_EFFORTS_HOUR, "900")
+        with self.assertLogs("projektron.planner", "WARNING"):
+            context = execute_plan(
+                plan_booking(BookingJob(rows=(RowAssignment(),), save=True)), self.page
+            )
+        self.assertIn("no task line", context["stopped"])
+        self.assertNotIn("booked_rows", context)
+        self.assertEqual(self.driver.submissions, [])
+
+    def test_zero_duration_row_is_not_saved(self):
+        """
+        Test a day whose only row has nothing to book is logged and not saved.
+        """
+        self._fill(MainPageLocators.UNRECORDED_EFFORTS_HOUR, "0")
+        self._fill(MainPageLocators.UNRECORDED_EFFORTS_MINUTE, "0")
+        job = BookingJob(attendance=Duration(hours=9), rows=(RowAssignment(),), save=True)
+        with self.assertLogs("projektron.planner", "WARNING") as logs:
+            context = execute_plan(plan_booking(job), self.page)
+        self.assertEqual(context["skipped_rows"], [0])
+        self.assertIn("not saved", context["stopped"])
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(self.driver.submissions, [])
+
+    def test_negative_duration_row_is_skipped(self):
+        """
+        Test a row with a negative duration, an overbooked day, is skipped.
+        """
+        job = BookingJob(attendance=None, break_duration=None, rows=(
+            RowAssignment(task_line=0, duration=-Duration(minutes=30)),
+        ))
+        with self.assertLogs("projektron.planner", "WARNING"):
+            context = execute_plan(plan_booking(job), self.page)
+        self.assertEqual(context["skipped_rows"], [0])
+        self.assertNotIn("booked_rows", context)
+
+    def test_rejected_day_stops(self):
+        """
+        Test nothing is typed when the deep link of the day is rejected.
+        """
+        self.driver.pages[BASE_URL + "/daytimerecording?date=2024-06-03"] = (
+            self.driver.pages[BASE_URL]
+        )
+        job = BookingJob(day=date(2024, 6, 3), rows=(RowAssignment(),), save=True)
+        with self.assertLogs("projektron.planner", "WARNING"):
+            context = execute_plan(plan_booking(job), self.page)
+        self.assertIn("2024-06-03", context["stopped"])
+        self.assertNotIn("day_state", context)
+        self.assertEqual(self.driver.submissions, [])
+
+    def test_one_row_per_first_available_line(self):
+        """
+        Test a job with two rows on the first available line is rejected.
+        """
+        with self.assertRaises(ValueError):
+            BookingJob(rows=(RowAssignment(), RowAssignment(duration=Duration(hours=1))))
+
+    def test_explicit_rows_skip_reads(self):
+        """
+        Test rows with a line and a duration need no read step.
+        """
+        job = BookingJob(
+            attendance=None,
+            break_duration=None,
+            rows=(RowAssignment(task_line=2, duration=Duration(hours=1, minutes=30), title="T"),),
+        )
+        plan = plan_booking(job)
+        self.assertFalse(any("unrecorded" in step.name for step in plan.steps))
+        execute_plan(plan, self.page)
+        self.assertEqual(self._value(MainPageLocators.TASKS_DURATION_INPUT_MINUTES, 2), "30")
+        self.assertEqual(self._value(MainPageLocators.TASKS_TITLE_INPUT, 2), "T")
+        self.assertEqual(self._value(MainPageLocators.ATTANDENCE_HOUR), "")
+
+    def test_estimate_below_naive_script(self):
+        """
+        Test the plan issues fewer commands than the unplanned script.
+        """
+        job = BookingJob(rows=(RowAssignment(description="d", reference="r", title="t"),))
+        plan = plan_booking(job)
+        self.assertLess(plan.estimated_commands, naive_command_count(job))
+        self.assertIn("WebDriver commands estimated", plan.describe())
+
+    def test_from_dict(self):
+        """
+        Test a JSON job spec is converted to a job.
+        """
+        job = BookingJob.from_dict(
+            {
+                "day": "2024-06-03",
+                "attendance": [8, 30],
+                "break": [0, 30],
+                "rows": [{"task_line": 0, "hours": 2, "minutes": 0}, {"duration": "01:30h"}],
+                "save": True,
+            }
+        )
+        self.assertEqual(job.day, date(2024, 6, 3))
+        self.assertEqual(job.attendance, Duration(hours=8, minutes=30))
+        self.assertEqual(job.rows[0].task_line, 0)
+        self.assertEqual(job.rows[0].duration, Duration(hours=2))
+        self.assertEqual(job.rows[1].duration, Duration(hours=1, minutes=30))
+        self.assertTrue(job.save)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Module: test_burndown
+
+This module contains unit tests for the module 'burndown.py'.
+Days are collected from the daytimerecording fixture through the fake driver.
+
+Dependencies:
+    - unittest
+    - burndown (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_burndown.py
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import date
+from pages.main_page import MainPage
+from utils.burndown import (
+    BurndownPoint,
+    burndown_points,
+    collect_accounts,
+    collect_days,
+    date_range,
+    summarize_people,
+    summarize_tasks,
+)
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.tables import markdown_table
+from utils.task_cache import TaskCache
+from utils.time_parser import Duration
+
+BASE_URL: str = "https://projektron.local/bcw"
+DAYS = [date(2024, 6, 3), date(2024, 6, 4)]
+
+
+class TestBurndown(unittest.TestCase):
+    """
+    Test cases for collecting and summarizing burn-down data.
+    """
+
+    def setUp(self) -> None:
+        self.driver = FakeWebDriver(fixture_pages(BASE_URL))
+        self.page = MainPage(self.driver, base_url=BASE_URL)
+        self.cache = TaskCache(":memory:")
+
+    def tearDown(self) -> None:
+        self.cache.close()
+
+    def test_date_range(self):
+        """
+        Test weekends are left out unless asked for.
+        """
+        self.assertEqual(len(date_range(date(2024, 6, 1), date(2024, 6, 30))), 20)
+        self.assertEqual(len(date_range(date(2024, 6, 1), date(2024, 6, 30), weekends=True)), 30)
+
+    def test_cached_days_are_not_scraped_again(self):
+        """
+        Test a second collection of past days reads them from the cache.
+        """
+        first = collect_days(self.page, self.cache, "jdoe", DAYS)
+        self.assertEqual(first.scraped, DAYS)
+        self.assertTrue(all(self.cache.is_cached("jdoe", day) for day in DAYS))
+        second = collect_days(self.page, self.cache, "jdoe", DAYS)
+        self.assertEqual((second.scraped, second.cached), ([], DAYS))
+
+    def test_collect_accounts(self):
+        """
+        Test every account is collected in its own session into one cache.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            results = collect_accounts(
+                [("ann", "a"), ("bob", "b")],
+                lambda: FakeWebDriver(fixture_pages(BASE_URL)),
+                path,
+                DAYS,
+                {"base_url": BASE_URL},
+            )
+            self.assertEqual([result.scraped for result in results], [DAYS, DAYS])
+            self.assertEqual([result.error for result in results], [None, None])
+            cache = TaskCache(path)
+            self.assertEqual(len(burndown_points(cache, ["ann", "bob"], DAYS)), 12)
+            cache.close()
+
+    def test_collect_accounts_base_urls(self):
+        """
+        Test an account with its own base URL is opened there instead of
+        at the base URL of the page options.
+        """
+        other: str = "https://other.local/bcw"
+        with tempfile.TemporaryDirectory() as directory:
+            results = collect_accounts(
+                [("bob", "b")],
+                lambda: FakeWebDriver(fixture_pages(other)),
+                os.path.join(directory, "cache.sqlite"),
+                DAYS,
+                {"base_url": BASE_URL},
+                base_urls={"bob": other},
+            )
+        self.assertEqual(results[0].error, None)
+        self.assertEqual(results[0].scraped, DAYS)
+
+    def test_failing_account_is_reported(self):
+        """
+        Test an account failing with a cache error reports it instead of
+        ending its thread silently.
+        """
+
+        def locked():
+            raise sqlite3.OperationalError("database is locked")
+
+        with tempfile.TemporaryDirectory() as directory:
+            results = collect_accounts(
+                [("ann", "a")], locked, os.path.join(directory, "cache.sqlite"), DAYS,
+                {"base_url": BASE_URL},
+            )
+        self.assertEqual(results[0].error, "OperationalError: database is locked")
+        self.assertEqual(results[0].scraped, [])
+
+    def test_summaries(self):
+        """
+        Test the booked duration within the range and the budget left.
+        """
+        budget = Duration(hours=10)
+        points = [
+            BurndownPoint("ann", DAYS[1], "Dev", "P", budget, Duration(hours=6)),
+            BurndownPoint("ann", DAYS[0], "Dev", "P", budget, Duration(hours=2)),
+            BurndownPoint("ann", DAYS[0], "Ops", "P", budget, Duration(hours=1)),
+        ]
+        tasks = summarize_tasks(points)
+        self.assertEqual([task.consumed for task in tasks], [Duration(hours=4), Duration()])
+        self.assertEqual(tasks[0].left, Duration(hours=4))
+        self.assertEqual(tasks[0].as_row()["used_%"], "60")
+        people = summarize_people(tasks)
+        self.assertEqual(len(people), 1)
+        self.assertEqual(people[0].consumed, Duration(hours=4))
+        self.assertEqual(people[0].left, Duration(hours=13))
+        table = markdown_table([task.as_row() for task in tasks])
+        self.assertEqual(len(table.splitlines()), 4)
+        self.assertTrue(table.startswith("| person | project | task |"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Module: test_credential_store
+
+This module contains unit tests for the module 'credential_store.py'.
+
+Dependencies:
+    - unittest
+    - credential_store (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_credential_store.py
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from utils.credential_store import (
+    CorruptEntryError,
+    CredentialStore,
+    Credentials,
+    InvalidMasterKeyError,
+    main,
+)
+from utils.secret_manager import MissingKeyError, SecretValues
+
+
+class TestCredentialStore(unittest.TestCase):
+    """
+    Test cases for the CredentialStore class.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path: str = os.path.join(self.directory.name, "team.credentials")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _store(self, count: int = 3) -> None:
+        store = CredentialStore(self.path, "master", create=True)
+        for number in range(count):
+            store.set(Credentials(f"user{number}", f"secret {number}", "https://bcs.example.test"))
+        store.save()
+
+    def test_round_trip(self):
+        """
+        Test accounts saved are read back by username.
+        """
+        self._store()
+        store = CredentialStore(self.path, "master")
+        self.assertEqual(len(store), 3)
+        self.assertIn("user1", store)
+        self.assertNotIn("nobody", store)
+        self.assertEqual(store.get("user1"),
+                         Credentials("user1", "secret 1", "https://bcs.example.test"))
+        self.assertEqual(sorted(credentials.username for credentials in store),
+                         ["user0", "user1", "user2"])
+        with self.assertRaises(KeyError):
+            store.get("nobody")
+
+    def test_file_holds_no_plaintext(self):
+        """
+        Test neither usernames nor passwords are readable in the file.
+        """
+        self._store()
+        with open(self.path, encoding="utf-8") as store_file:
+            content = store_file.read()
+        self.assertNotIn("user1", content)
+        self.assertNotIn("secret", content)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+    def test_wrong_master_key(self):
+        """
+        Test a wrong master password is rejected when opening.
+        """
+        self._store()
+        with self.assertRaises(InvalidMasterKeyError):
+            CredentialStore(self.path, "guess")
+
+    def test_tampered_entry(self):
+        """
+        Test a modified entry fails its integrity check instead of decrypting.
+        """
+        self._store()
+        with open(self.path, encoding="utf-8") as store_file:
+            data = json.load(store_file)
+        entries = data["entries"]
+        first, second = list(entries)[:2]
+        entries[first] = entries[second]
+        with open(self.path, "w", encoding="utf-8") as store_file:
+            json.dump(data, store_file)
+        store = CredentialStore(self.path, "master")
+        with self.assertRaises(CorruptEntryError):
+            list(store)
+
+    def test_remove(self):
+        """
+        Test a removed account is gone after saving.
+        """
+        self._store()
+        store = CredentialStore(self.path, "master")
+        store.remove("user0")
+        store.save()
+        self.assertNotIn("user0", CredentialStore(self.path, "master"))
+
+    def test_large_roster_opens_lazily(self):
+        """
+        Test opening a 500 account store decrypts nothing and takes little time.
+        """
+        self._store(500)
+        start = time.perf_counter()
+        with patch.object(CredentialStore, "_decrypt") as decrypt:
+            store = CredentialStore(self.path, "master")
+            self.assertIn("user499", store)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        decrypt.assert_not_called()
+        self.assertEqual(store.get("user499").password, "secret 499")
+
+    def test_secret_values_keys(self):
+        """
+        Test credentials answer the '.env' keys.
+        """
+        credentials = Credentials("jdoe", "pw")
+        self.assertEqual(credentials[SecretValues.USERNAME], "jdoe")
+        self.assertEqual(credentials[SecretValues.PASSWORD], "pw")
+        self.assertNotIn("pw", repr(credentials))
+        with self.assertRaises(MissingKeyError):
+            credentials[SecretValues.URL]  # pylint: disable=pointless-statement
+
+    @patch.dict(os.environ, {"PROJEKTRON_MASTER_KEY": "master"})
+    def test_command_line_import_and_list(self):
+        """
+        Test importing a team JSON file and listing it from the command line.
+        """
+        accounts_path = os.path.join(self.directory.name, "team.json")
+        with open(accounts_path, "w", encoding="utf-8") as accounts_file:
+            json.dump([{"username": "jdoe", "password": "pw"}], accounts_file)
+        with patch("builtins.print") as printed:
+            self.assertEqual(main(["import", self.path, accounts_path, "url=https://x.test"]), 0)
+            self.assertEqual(main(["list", self.path]), 0)
+        printed.assert_called_with("jdoe  https://x.test")
+
+    @patch.dict(os.environ, {"PROJEKTRON_MASTER_KEY": "master"})
+    def test_command_line_missing_argument(self):
+        """
+        Test a missing or unknown username, a missing file and malformed
+        arguments print an error instead of raising.
+        """
+        with patch("builtins.print") as printed:
+            for command in ("add", "import", "remove"):
+                self.assertEqual(main([command, self.path, "url=https://x.test"]), 2)
+        self.assertIn("usage error", printed.call_args.args[0])
+        self.assertFalse(os.path.exists(self.path))
+        self._store(1)
+        with patch("builtins.print") as printed:
+            self.assertEqual(main(["remove", self.path, "nobody"]), 2)
+            self.assertEqual(main(["list", self.path, "verbose"]), 2)
+            self.assertEqual(main(["list", os.path.join(self.directory.name, "missing")]), 1)
+        self.assertEqual(
+            [call.args[0] for call in printed.call_args_list[:2]],
+            [f"usage error: nobody is not in {self.path}",
+             "usage error: Expected key=value, got 'verbose'"],
+        )
+        self.assertIn("user0", CredentialStore(self.path, "master"))
+
+
+if __name__ == "__main__":
+    unittest.main()
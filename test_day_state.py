@@ -0,0 +1,62 @@
+"""
+Module: test_day_state
+
+This module contains unit tests for the module 'day_state.py'.
+
+Dependencies:
+    - unittest
+    - day_state (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_day_state.py
+"""
+
+import unittest
+from utils.day_state import DaySnapshot, DayState
+from utils.time_parser import Duration
+
+
+class TestDaySnapshot(unittest.TestCase):
+    """
+    Test cases for reading and classifying the duration fields of a day.
+    """
+
+    def test_from_values(self):
+        """
+        Test the field values are read in document order, empty as zero.
+        """
+        snapshot = DaySnapshot.from_values(
+            ["08", "30", "", "45", "05", "45", "02", "00", "", "", "1", "15"]
+        )
+        self.assertEqual(snapshot.attendance, Duration(hours=8, minutes=30))
+        self.assertEqual(snapshot.break_duration, Duration(minutes=45))
+        self.assertEqual(snapshot.unrecorded, Duration(hours=2))
+        self.assertEqual(snapshot.typed, (Duration(), Duration(hours=1, minutes=15)))
+
+    def test_missing_fields(self):
+        """
+        Test a page without the attendance fields, or with a field that has
+        no pair, is rejected.
+        """
+        with self.assertRaises(ValueError):
+            DaySnapshot.from_values(["08", "30"])
+        with self.assertRaises(ValueError):
+            DaySnapshot.from_values(["8", "0", "0", "45", "7", "15", "0", "0", "on", "1", "0"])
+
+    def test_state(self):
+        """
+        Test empty, partial and complete days are told apart.
+        """
+        empty = DaySnapshot.from_values([""] * 8 + ["", ""])
+        partial = DaySnapshot.from_values(["8", "0", "0", "45", "5", "0", "2", "15"])
+        typed = DaySnapshot.from_values(["8", "0", "0", "45", "7", "15", "0", "0", "1", "0"])
+        complete = DaySnapshot.from_values(["8", "0", "0", "45", "7", "15", "0", "0", "", ""])
+        self.assertEqual(empty.state, DayState.EMPTY)
+        self.assertEqual(partial.state, DayState.PARTIAL)
+        self.assertEqual(typed.state, DayState.PARTIAL)
+        self.assertEqual(complete.state, DayState.COMPLETE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Module: test_driver_manager
+
+This module contains unit tests for the module 'driver_manager.py'.
+
+Dependencies:
+    - unittest
+    - driver_manager (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_driver_manager.py
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import patch
+from selenium.common.exceptions import WebDriverException
+from utils import process_stats
+from utils.driver_manager import DriverManager, driver_pid
+from utils.fake_driver import FakeWebDriver
+
+
+class QuitCountingDriver(FakeWebDriver):
+    """
+    Fake driver remembering whether it was quit.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.quit_calls: int = 0
+        self.service: Any = None
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+
+
+class TestDriverManager(unittest.TestCase):
+    """
+    Test cases for the DriverManager class.
+    """
+
+    def setUp(self) -> None:
+        self.created: List[QuitCountingDriver] = []
+        self.logins: List[QuitCountingDriver] = []
+
+    def _factory(self) -> QuitCountingDriver:
+        driver = QuitCountingDriver()
+        self.created.append(driver)
+        return driver
+
+    def test_recycles_after_max_jobs(self):
+        """
+        Test a fresh driver is created and logged in after max_jobs jobs.
+        """
+        with DriverManager(self._factory, self.logins.append, max_jobs=2, max_rss_mb=0) as manager:
+            for _ in range(5):
+                with manager.job():
+                    pass
+        self.assertEqual(len(self.created), 3)
+        self.assertEqual(self.logins, self.created)
+        self.assertEqual(manager.recycles, 2)
+        self.assertTrue(all(driver.quit_calls == 1 for driver in self.created))
+
+    def test_recycles_on_memory_budget(self):
+        """
+        Test the driver is recycled once its memory crosses the budget.
+        """
+        usage = iter([100 * 2**20, 300 * 2**20, 100 * 2**20])
+        manager = DriverManager(
+            self._factory, max_jobs=0, max_rss_mb=200, memory_probe=lambda driver: next(usage)
+        )
+        with manager:
+            for _ in range(3):
+                with manager.job():
+                    pass
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(manager.peak_rss_bytes, 300 * 2**20)
+
+    def test_quits_on_error(self):
+        """
+        Test a WebDriver error recycles the driver and any error still quits it.
+        """
+        with self.assertRaises(RuntimeError):
+            with DriverManager(self._factory) as manager:
+                with self.assertRaises(WebDriverException):
+                    with manager.job():
+                        raise WebDriverException("browser crashed")
+                with manager.job():
+                    raise RuntimeError("booking failed")
+        self.assertEqual(len(self.created), 2)
+        self.assertTrue(all(driver.quit_calls == 1 for driver in self.created))
+
+    def test_failed_login_quits_driver(self):
+        """
+        Test a driver whose login fails is not left running.
+        """
+
+        def login(driver):
+            raise WebDriverException("login page not reachable")
+
+        with DriverManager(self._factory, login) as manager:
+            with self.assertRaises(WebDriverException):
+                manager.driver  # pylint: disable=pointless-statement
+        self.assertEqual(self.created[0].quit_calls, 1)
+
+    @unittest.skipUnless(os.name == "posix", "needs POSIX signals")
+    def test_kills_orphaned_processes(self):
+        """
+        Test service processes surviving quit are terminated.
+        """
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable, "-c", "import time; time.sleep(30)"]
+        )
+
+        def factory():
+            driver = QuitCountingDriver()
+            driver.service = SimpleNamespace(process=process)
+            return driver
+
+        manager = DriverManager(factory)
+        self.assertEqual(driver_pid(manager.driver), process.pid)
+        manager.close()
+        self.assertIsNotNone(process.wait(timeout=5))
+
+    @unittest.skipUnless(os.name == "posix", "needs POSIX signals")
+    def test_reused_process_id_not_killed(self):
+        """
+        Test a process id taken over by another process during quit is left alone.
+        """
+        service, other = (
+            subprocess.Popen(  # pylint: disable=consider-using-with
+                [sys.executable, "-c", "import time; time.sleep(30)"]
+            )
+            for _ in range(2)
+        )
+        self.addCleanup(other.wait)
+        self.addCleanup(other.kill)
+        started: Dict[int, int] = {service.pid: 1, other.pid: 1}
+
+        class ReusingDriver(QuitCountingDriver):
+            """
+            Driver whose child exits on quit and has its id reused.
+            """
+
+            def quit(self) -> None:
+                super().quit()
+                started[other.pid] = 2
+
+        def factory():
+            driver = ReusingDriver()
+            driver.service = SimpleNamespace(process=service)
+            return driver
+
+        with patch("utils.driver_manager.process_tree", return_value=[service.pid, other.pid]), \
+                patch("utils.driver_manager.start_time", side_effect=started.get):
+            manager = DriverManager(factory)
+            manager.driver  # pylint: disable=pointless-statement
+            manager.close()
+        self.assertIsNotNone(service.wait(timeout=5))
+        self.assertIsNone(other.poll())
+
+    def test_memory_budget_unsupported(self):
+        """
+        Test a memory budget without /proc to read it from logs a warning.
+        """
+        with patch.object(process_stats, "SUPPORTED", False):
+            with self.assertLogs("projektron.driver", "WARNING") as logs:
+                DriverManager(self._factory, max_rss_mb=512).close()
+        self.assertIn("memory budget unsupported", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+Module: test_fake_driver
+
+This module contains unit tests for the module 'fake_driver.py'.
+It tests the HTML parsing and the XPath subset used by the locators.
+
+Dependencies:
+    - unittest
+    - fake_driver (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_fake_driver.py
+"""
+
+import unittest
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from pages.base_page import SET_VALUE_SCRIPT
+from pages.main_page import FIELD_VALUES_SCRIPT, OPEN_TAB_SCRIPT
+from utils.artifacts import OUTER_HTML_SCRIPT
+from utils.fake_driver import FakeWebDriver, evaluate_xpath, parse_html
+
+DOCUMENT: str = """
+<html><body>
+<table id="t"><tbody>
+<tr><td>a</td><td><input name="x_hour" value="1"><input name="x_minute" value="2"></td></tr>
+<tr><td> b  c </td><td><input name="y_hour"><br><input name="y_minute"></td></tr>
+</tbody></table>
+<form action="/save"><textarea name="text">hello</textarea>
+<input type="submit" value="Save"></form>
+<a href="/next" id="link">next</a>
+</body></html>
+"""
+
+
+class TestEvaluateXpath(unittest.TestCase):
+    """
+    Test cases for the evaluate_xpath function.
+    """
+
+    def setUp(self) -> None:
+        self.root = parse_html(DOCUMENT)
+
+    def _names(self, expression: str):
+        return [node.attrs.get("name") for node in evaluate_xpath(expression, self.root)]
+
+    def test_positions_are_evaluated_per_parent(self):
+        """
+        Test td[2]//input[1] selects the first input of every row.
+        """
+        self.assertEqual(
+            self._names("//table[@id='t']/tbody/tr/td[2]//input[1]"),
+            ["x_hour", "y_hour"],
+        )
+
+    def test_functions_and_boolean_operators(self):
+        """
+        Test contains(), and, or and normalize-space().
+        """
+        self.assertEqual(
+            self._names("//tr[2]//input[contains(@name, 'minute')]"), ["y_minute"]
+        )
+        self.assertEqual(
+            self._names("//input[@name='x_hour' or @name='y_hour' and not(@value)]"),
+            ["x_hour", "y_hour"],
+        )
+        self.assertEqual(
+            [n.tag for n in evaluate_xpath("//td[normalize-space()='b c']", self.root)],
+            ["td"],
+        )
+
+    def test_union_keeps_document_order(self):
+        """
+        Test a union returns nodes once, in document order.
+        """
+        self.assertEqual(
+            self._names("//input[@name='y_hour'] | //input[@name='x_hour'] | //textarea"),
+            ["x_hour", "y_hour", "text"],
+        )
+
+    def test_relative_path_from_element(self):
+        """
+        Test ./ and .. are evaluated from the context node.
+        """
+        row = evaluate_xpath("//tr[2]", self.root)[0]
+        self.assertEqual(
+            [n.attrs["name"] for n in evaluate_xpath("./td[2]/input", row)],
+            ["y_hour", "y_minute"],
+        )
+        self.assertEqual(evaluate_xpath("..", row)[0].tag, "tbody")
+
+    def test_invalid_expression(self):
+        """
+        Test unsupported syntax raises InvalidSelectorException.
+        """
+        with self.assertRaises(InvalidSelectorException):
+            evaluate_xpath("//tr[", self.root)
+
+
+class TestFakeWebDriver(unittest.TestCase):
+    """
+    Test cases for the FakeWebDriver class.
+    """
+
+    def setUp(self) -> None:
+        self.driver = FakeWebDriver(
+            {"https://p.local/": DOCUMENT, "https://p.local/next": "<title>Next</title>"}
+        )
+        self.driver.get("https://p.local/")
+
+    def test_form_controls(self):
+        """
+        Test clear, send_keys and get_attribute on inputs and textareas.
+        """
+        text = self.driver.find_element(By.NAME, "text")
+        self.assertEqual(text.get_attribute("value"), "hello")
+        text.clear()
+        text.send_keys("new", " text")
+        self.assertEqual(text.get_attribute("value"), "new text")
+        self.assertEqual(self.driver.find_element(By.XPATH, "//tr[2]/td[1]").text, "b c")
+
+    def test_click_submits_and_navigates(self):
+        """
+        Test clicks submit forms and follow registered links.
+        """
+        self.driver.find_element(By.XPATH, "//input[@value='Save']").click()
+        self.assertEqual(self.driver.submissions, [("https://p.local/save", {"text": "hello"})])
+        self.driver.find_element(By.ID, "link").click()
+        self.assertEqual(self.driver.current_url, "https://p.local/next")
+        self.assertEqual(self.driver.title, "Next")
+
+    def test_missing_element_and_page(self):
+        """
+        Test missing elements and pages raise Selenium exceptions.
+        """
+        with self.assertRaises(NoSuchElementException):
+            self.driver.find_element(By.ID, "missing")
+        with self.assertRaises(WebDriverException):
+            self.driver.get("https://p.local/missing")
+
+    def test_tabs_keep_their_documents(self):
+        """
+        Test every tab keeps its URL and document across switches.
+        """
+        self.driver.switch_to.new_window("tab")
+        self.driver.get("https://p.local/next")
+        tab = self.driver.current_window_handle
+        self.assertEqual(self.driver.window_handles, ["window-0", tab])
+        self.driver.switch_to.window("window-0")
+        self.assertEqual(self.driver.find_element(By.NAME, "text").get_attribute("value"), "hello")
+        self.driver.switch_to.window(tab)
+        self.assertEqual(self.driver.title, "Next")
+        self.driver.close()
+        self.assertEqual(self.driver.window_handles, ["window-0"])
+        with self.assertRaises(NoSuchWindowException):
+            self.driver.switch_to.window(tab)
+
+    def test_page_scripts(self):
+        """
+        Test the scripts of the page objects are answered like a browser would.
+        """
+        text = self.driver.find_element(By.NAME, "text")
+        self.assertEqual(self.driver.execute_script(SET_VALUE_SCRIPT, text, "set"), "set")
+        self.assertEqual(
+            self.driver.execute_script(FIELD_VALUES_SCRIPT, "//input[@name='x_hour'] | //textarea"),
+            ["1", "set"],
+        )
+        self.assertEqual(
+            self.driver.execute_script(OUTER_HTML_SCRIPT, "//tr[1]/td[1]"), "<td>a</td>"
+        )
+        self.driver.execute_script(OPEN_TAB_SCRIPT, "https://p.local/next")
+        self.assertEqual(self.driver.current_url, "https://p.local/")
+        self.driver.switch_to.window(self.driver.window_handles[1])
+        self.assertEqual(self.driver.title, "Next")
+        with self.assertRaises(JavascriptException):
+            self.driver.execute_script("return 1;")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+"""
+Module: test_grid
+
+This module contains unit tests for the module 'grid.py'.
+The remote tests drive local fake WebDriver servers through
+``webdriver.Remote`` against the stand-in Projektron server.
+
+Dependencies:
+    - unittest
+    - grid (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_grid.py
+"""
+
+import threading
+import unittest
+from typing import List
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    NoSuchElementException,
+    SessionNotCreatedException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+from main import book_on_grid
+from pages.login_page import LoginPage
+from utils.booking_planner import BookingJob, RowAssignment
+from utils.driver_server import start_driver_server
+from utils.fake_driver import FakeWebDriver
+from utils.grid import GridNode, GridScheduler, parse_nodes, remote_driver
+from utils.stub_server import start_stub_server
+from utils.time_parser import Duration
+
+
+class TestGridScheduler(unittest.TestCase):
+    """
+    Test cases for scheduling jobs on the nodes with fake drivers.
+    """
+
+    def setUp(self) -> None:
+        self.created: List[str] = []
+        self.lock = threading.Lock()
+
+    def _factory(self, url: str) -> FakeWebDriver:
+        if url.startswith("dead"):
+            raise SessionNotCreatedException("session not created")
+        with self.lock:
+            self.created.append(url)
+        return FakeWebDriver()
+
+    def test_parse_nodes(self):
+        """
+        Test node URLs with and without a slot count.
+        """
+        nodes = parse_nodes("http://a:4444*3, http://b:4444", slots=2)
+        self.assertEqual([(node.url, node.slots) for node in nodes],
+                         [("http://a:4444", 3), ("http://b:4444", 2)])
+        with self.assertRaises(ValueError):
+            parse_nodes("http://a:4444*0")
+
+    def test_pick_prefers_unmeasured_then_fast_nodes(self):
+        """
+        Test nodes without jobs go first, then the lowest expected duration.
+        """
+        slow, fast, new = GridNode("slow", 2), GridNode("fast", 2), GridNode("new", 1)
+        slow.observe(2.0, 0.3)
+        fast.observe(1.0, 0.3)
+        scheduler = GridScheduler([slow, fast, new], self._factory)
+        self.assertIs(scheduler.pick(), new)
+        new.busy = 1
+        self.assertIs(scheduler.pick(), fast)
+        fast.busy = 2
+        self.assertIs(scheduler.pick(), slow)
+        slow.alive = False
+        self.assertIsNone(scheduler.pick())
+
+    def test_jobs_run_on_every_slot(self):
+        """
+        Test every job runs once and each slot keeps its driver.
+        """
+        scheduler = GridScheduler([GridNode("a", 2), GridNode("b", 1)], self._factory)
+        results = scheduler.run(list(range(12)), lambda driver, job: job * 2)
+        self.assertEqual([result.value for result in results], [job * 2 for job in range(12)])
+        self.assertEqual({result.attempts for result in results}, {1})
+        self.assertLessEqual(len(self.created), 3)
+        self.assertEqual(sum(node.jobs for node in scheduler.nodes), 12)
+
+    def test_jobs_of_dead_node_are_requeued(self):
+        """
+        Test jobs failing with node errors move to the live node.
+        """
+        scheduler = GridScheduler(
+            [GridNode("dead", 2), GridNode("b", 1)], self._factory, max_failures=1
+        )
+        with self.assertLogs("projektron.grid", "WARNING") as logs:
+            results = scheduler.run(list(range(4)), lambda driver, job: job)
+        self.assertEqual([record.getMessage() for record in logs.records], ["grid node dead"])
+        self.assertEqual([result.value for result in results], [0, 1, 2, 3])
+        self.assertEqual({result.node for result in results}, {"b"})
+        self.assertFalse(scheduler.nodes[0].alive)
+        self.assertEqual(sum(result.attempts for result in results), 6)
+
+    def test_job_errors_are_not_requeued(self):
+        """
+        Test failed lookups, other page errors and other errors fail the job
+        only, as running it again could book it twice.
+        """
+        def work(driver: WebDriver, job: int) -> int:  # pylint: disable=unused-argument
+            if job == 1:
+                raise NoSuchElementException("no task table")
+            if job == 2:
+                raise ValueError("bad job")
+            if job == 3:
+                raise ElementNotInteractableException("save button covered")
+            return job
+
+        scheduler = GridScheduler([GridNode("a", 1)], self._factory, max_failures=1)
+        results = scheduler.run([0, 1, 2, 3], work)
+        self.assertEqual([type(result.error) for result in results],
+                         [type(None), NoSuchElementException, ValueError,
+                          ElementNotInteractableException])
+        self.assertEqual([result.attempts for result in results], [1, 1, 1, 1])
+        self.assertTrue(scheduler.nodes[0].alive)
+
+    def test_all_nodes_dead(self):
+        """
+        Test jobs fail once no node is left.
+        """
+        scheduler = GridScheduler([GridNode("dead", 1)], self._factory, max_failures=1)
+        with self.assertLogs("projektron.grid", "WARNING"):
+            results = scheduler.run([0, 1], lambda driver, job: job)
+        self.assertTrue(all(isinstance(result.error, WebDriverException) for result in results))
+        self.assertEqual(results[0].attempts, 1)
+
+
+class TestRemoteGrid(unittest.TestCase):
+    """
+    Test cases for booking through webdriver.Remote on local driver servers.
+    """
+
+    def setUp(self) -> None:
+        self.stub = start_stub_server()
+        self.servers = [start_driver_server(), start_driver_server()]
+
+    def tearDown(self) -> None:
+        self.stub.stop()
+        for server in self.servers:
+            server.stop()
+
+    def _login(self, driver: WebDriver) -> None:
+        login_page = LoginPage(driver, base_url=self.stub.base_url)
+        login_page.open()
+        login_page.login(user="grid", password="test")
+
+    def test_book_on_grid_survives_node_loss(self):
+        """
+        Test the first job is booked on the second node after its node went down.
+        """
+        jobs = [
+            BookingJob(
+                attendance=Duration(hours=8),
+                rows=(RowAssignment(description="grid", reference="TA", title="TA"),),
+                save=True,
+            )
+            for _ in range(4)
+        ]
+        first_node: threading.Event = threading.Event()
+
+        def factory(url: str) -> WebDriver:
+            if url == self.servers[0].url and not first_node.is_set():
+                first_node.set()
+                driver = remote_driver(url)
+                self.servers[0].stop()
+                return driver
+            return remote_driver(url)
+
+        scheduler = GridScheduler(
+            [GridNode(server.url) for server in self.servers], factory, self._login,
+            max_failures=1,
+        )
+        with self.assertLogs("projektron.grid", "WARNING") as logs:
+            results = book_on_grid(scheduler, jobs, {"base_url": self.stub.base_url}, "grid")
+        self.assertIn("grid node dead", [record.getMessage() for record in logs.records])
+        self.assertEqual([result.error for result in results], [None] * 4)
+        self.assertEqual({result.node for result in results}, {self.servers[1].url})
+        self.assertEqual(results[0].attempts, 2)
+        self.assertFalse(scheduler.nodes[0].alive)
+        self.assertEqual(self.stub.requests["POST /daytimerecording/save"], 4)
+        self.assertEqual(self.servers[1].sessions, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Module: test_load_test
+
+This module contains unit tests for the module 'load_test.py'.
+It ramps a few sessions of the fake driver against the stand-in server.
+
+Dependencies:
+    - unittest
+    - load_test (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_load_test.py
+"""
+
+import os
+import tempfile
+import unittest
+from load_test import book_once, ramp, write_reports
+from utils.fake_driver import FakeWebDriver
+from utils.stub_server import start_stub_server
+
+
+class TestRamp(unittest.TestCase):
+    """
+    Test cases for the ramp function.
+    """
+
+    def test_ramp_books_against_stub_server(self):
+        """
+        Test every session books through the page objects without errors.
+        """
+        reports = ramp([1, 3], lambda: FakeWebDriver(network=True), iterations=2)
+        self.assertEqual([report.sessions for report in reports], [1, 3])
+        self.assertEqual([report.bookings for report in reports], [2, 6])
+        self.assertEqual([report.errors for report in reports], [0, 0])
+        self.assertGreater(reports[1].throughput, 0)
+        self.assertLessEqual(reports[1].percentile(50), reports[1].percentile(99))
+
+    def test_failing_driver_counts_errors(self):
+        """
+        Test sessions whose driver cannot start count as failed bookings.
+        """
+
+        def broken_factory():
+            raise OSError("chromedriver not found")
+
+        report = ramp([2], broken_factory, iterations=3)[0]
+        self.assertEqual(report.bookings, 0)
+        self.assertEqual(report.error_rate, 1.0)
+
+    def test_stub_server_counts_saves(self):
+        """
+        Test the stand-in server receives the login and save posts.
+        """
+        server = start_stub_server()
+        try:
+            book_once(FakeWebDriver(network=True), server.base_url)
+        finally:
+            server.stop()
+        self.assertEqual(server.requests["POST /daytimerecording"], 1)
+        self.assertEqual(server.requests["POST /daytimerecording/save"], 1)
+
+    def test_write_reports(self):
+        """
+        Test the CSV has one row per step and no steps write no file.
+        """
+        reports = ramp([1], lambda: FakeWebDriver(network=True), iterations=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ramp.csv")
+            self.assertFalse(write_reports([], path))
+            self.assertFalse(os.path.exists(path))
+            self.assertTrue(write_reports(reports, path))
+            with open(path, encoding="utf-8") as csv_file:
+                self.assertEqual(len(csv_file.readlines()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Module: test_locator_fallback
+
+This module contains unit tests for the module 'locator_fallback.py'.
+
+Dependencies:
+    - unittest
+    - locator_fallback (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_locator_fallback.py
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from typing import Dict
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from pages.login_page import LoginPage
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.locator_fallback import LocatorResolver
+from utils.locators import LOCATOR_CHAINS, LocatorChain, LoginPageLocators, MainPageLocators
+
+BASE_URL = "https://projektron.example.test"
+
+
+class TestLocatorResolver(unittest.TestCase):
+    """
+    Test cases for the LocatorResolver class.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path: str = os.path.join(self.directory.name, "locators.json")
+        self.pages: Dict[str, str] = fixture_pages(BASE_URL)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _renamed_login_ids(self) -> FakeWebDriver:
+        self.pages[BASE_URL] = self.pages[BASE_URL].replace('"label_user"', '"login_user"')
+        driver = FakeWebDriver(self.pages)
+        driver.get(BASE_URL)
+        return driver
+
+    def test_every_candidate_matches_the_fixtures(self):
+        """
+        Test every candidate of every chain finds one element on the fixtures.
+        """
+        driver = FakeWebDriver(self.pages)
+        for url in (BASE_URL, f"{BASE_URL}/daytimerecording"):
+            driver.get(url)
+            for chain in LOCATOR_CHAINS.values():
+                counts = [len(driver.find_elements(*candidate)) for candidate in chain.candidates]
+                if any(counts):
+                    self.assertEqual(counts, [1] * len(counts), chain.name)
+
+    def test_duration_chains_start_with_their_locator(self):
+        """
+        Test the duration fields try their known-good locator before the others.
+        """
+        for locator in (MainPageLocators.ATTANDENCE_HOUR, MainPageLocators.BREAK_MINUTE,
+                        MainPageLocators.UNRECORDED_EFFORTS_HOUR):
+            self.assertEqual(LOCATOR_CHAINS[locator.value].candidates[0],
+                             (By.XPATH, locator.value))
+
+    def test_fallback_is_reported_and_remembered(self):
+        """
+        Test a broken id falls back to the name, which is tried first afterwards.
+        """
+        driver = self._renamed_login_ids()
+        resolver = LocatorResolver(path=self.path)
+        chain: LocatorChain = resolver.chain(LoginPageLocators.EMAIL)
+        with self.assertLogs("projektron.locators", "WARNING") as logs:
+            element = resolver.find(driver, chain)
+        self.assertEqual(element.get_attribute("name"), "user")
+        self.assertEqual(len(resolver.fallbacks), 1)
+        self.assertEqual(resolver.fallbacks[0].failed, ("id=label_user",))
+        self.assertEqual(resolver.fallbacks[0].used, "xpath=//input[@name='user']")
+        self.assertIn("locator fallback", logs.output[0])
+        with open(self.path, encoding="utf-8") as file:
+            self.assertEqual(json.load(file)[chain.name], [By.XPATH, "//input[@name='user']"])
+
+        reloaded = LocatorResolver(path=self.path)
+        self.assertEqual(reloaded.ranked(chain)[0], (By.XPATH, "//input[@name='user']"))
+        reloaded.find(driver, chain)
+        self.assertEqual(reloaded.fallbacks, [])
+
+    def test_page_falls_back_without_waiting(self):
+        """
+        Test the login page logs in within milliseconds despite the broken id.
+        """
+        driver = self._renamed_login_ids()
+        page = LoginPage(driver, base_url=BASE_URL, locator_resolver=LocatorResolver(path=None))
+        start = time.perf_counter()
+        with self.assertLogs("projektron.locators", "WARNING"):
+            page.login(user="user", password="secret")
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertTrue(driver.current_url.endswith("/daytimerecording"))
+
+    def test_no_candidate_matches(self):
+        """
+        Test a chain without a match fails at once, or after the timeout.
+        """
+        driver = FakeWebDriver(self.pages)
+        driver.get(BASE_URL)
+        chain = LocatorChain("missing", ((By.ID, "missing"), (By.XPATH, "//missing")))
+        resolver = LocatorResolver(path=None, poll=0.05)
+        with self.assertRaises(NoSuchElementException):
+            resolver.find(driver, chain)
+        with self.assertRaises(TimeoutException):
+            resolver.find(driver, chain, timeout=0.1)
+        self.assertEqual(resolver.fallbacks, [])
+
+    def test_unreadable_cache_is_ignored(self):
+        """
+        Test a corrupt cache file starts from the chain order.
+        """
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("{not json")
+        with self.assertLogs("projektron.locators", "WARNING"):
+            resolver = LocatorResolver(path=self.path)
+        chain = resolver.chain(LoginPageLocators.EMAIL.value)
+        self.assertEqual(resolver.ranked(chain), list(chain.candidates))
+
+
+if __name__ == "__main__":
+    unittest.main()
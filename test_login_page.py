@@ -0,0 +1,54 @@
+"""
+Module: test_login_page
+
+This module contains unit tests for the module 'login_page.py'.
+It runs the page object against the HTML fixtures through the fake driver.
+
+Dependencies:
+    - unittest
+    - login_page (the module under test)
+    - fake_driver
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_login_page.py
+"""
+
+import unittest
+from pages.login_page import LoginPage
+from utils.fake_driver import FakeWebDriver, fixture_pages
+
+BASE_URL: str = "https://projektron.local/bcw"
+
+
+class TestLoginPage(unittest.TestCase):
+    """
+    Test cases for the LoginPage class.
+    """
+
+    def setUp(self) -> None:
+        self.driver = FakeWebDriver(fixture_pages(BASE_URL))
+        self.page = LoginPage(self.driver, base_url=BASE_URL)
+        self.page.open()
+
+    def test_open(self):
+        """
+        Test open loads the base URL.
+        """
+        self.assertEqual(self.page.get_url(), BASE_URL)
+        self.assertEqual(self.page.get_title(), "Projektron BCS - Login")
+
+    def test_login(self):
+        """
+        Test login fills the credentials and submits the form.
+        """
+        self.page.login(user="Superman", password="qwerty")
+        self.assertEqual(
+            self.driver.submissions,
+            [(BASE_URL + "/daytimerecording", {"user": "Superman", "pwd": "qwerty"})],
+        )
+        self.assertEqual(self.page.get_url(), BASE_URL + "/daytimerecording")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+"""
+Module: test_main_page
+
+This module contains unit tests for the module 'main_page.py'.
+It runs the page object against the daytimerecording HTML fixture through
+the fake driver, so no browser is needed.
+
+Dependencies:
+    - unittest
+    - main_page (the module under test)
+    - fake_driver
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_main_page.py
+"""
+
+import unittest
+from datetime import date
+from unittest.mock import patch
+from selenium.webdriver.common.by import By
+from pages.main_page import MainPage
+from utils.day_state import DayState
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.locators import MainPageLocators
+from utils.time_parser import Duration
+
+BASE_URL: str = "https://projektron.local/bcw"
+
+
+class TestMainPage(unittest.TestCase):
+    """
+    Test cases for the MainPage class.
+    """
+
+    def setUp(self) -> None:
+        self.driver = FakeWebDriver(fixture_pages(BASE_URL))
+        self.page = MainPage(self.driver, base_url=BASE_URL)
+        self.page.open("/daytimerecording")
+
+    def _value(self, locator: str, index: int = 0) -> str:
+        return self.driver.find_elements(By.XPATH, locator)[index].get_attribute("value")
+
+    def test_popup_and_booking_tab(self):
+        """
+        Test the popup is confirmed and the booking tab is followed.
+        """
+        self.page.validate_popup_button()
+        self.page.click_on_booking_tab()
+        self.assertEqual(
+            [node.attrs.get("value", node.tag) for node in self.driver.clicks],
+            ["Yes", "a"],
+        )
+        self.assertEqual(self.page.get_url(), BASE_URL + "/daytimerecording")
+
+    def test_type_attendance_and_break(self):
+        """
+        Test attendance and break durations replace the field values.
+        """
+        self.page.type_attendance_duration(hours=9, minutes=30)
+        self.page.type_break_duration(hours=0, minutes=45)
+        self.assertEqual(self._value(MainPageLocators.ATTANDENCE_HOUR), "9")
+        self.assertEqual(self._value(MainPageLocators.ATTANDENCE_MINUTE), "30")
+        self.assertEqual(self._value(MainPageLocators.BREAK_HOUR), "0")
+        self.assertEqual(self._value(MainPageLocators.BREAK_MINUTE), "45")
+
+    def test_task_lists(self):
+        """
+        Test budgets and durations are read from the task table.
+        """
+        self.assertEqual(
+            self.page.get_tasks_budget_list(), ["1d 00:00h", "5d 00:00h", "10:00h"]
+        )
+        self.assertEqual(
+            self.page.get_tasks_duration_list(), ["08:00h", "2d 01:30h", "00:00h"]
+        )
+
+    def test_unrecorded_efforts(self):
+        """
+        Test unrecorded efforts are read as a duration.
+        """
+        self.assertEqual(self.page.get_unrecorded_efforts(), Duration(hours=3, minutes=15))
+
+    def test_read_day_state(self):
+        """
+        Test all duration fields of the day are read in one script, without lookups.
+        """
+        self.page.type_task_duration(task_line=2, hours=1, minutes=0)
+        lookups = []
+        locate_all = self.driver.locate_all
+        self.driver.locate_all = lambda *args: lookups.append(args) or locate_all(*args)
+        scripts = len(self.driver.scripts)
+        snapshot = self.page.read_day_state()
+        self.assertEqual(lookups, [])
+        self.assertEqual(len(self.driver.scripts), scripts + 1)
+        self.assertEqual(snapshot.recorded, Duration(hours=5, minutes=45))
+        self.assertEqual(snapshot.unrecorded, Duration(hours=3, minutes=15))
+        self.assertEqual(snapshot.typed, (Duration(), Duration(), Duration(hours=1)))
+        self.assertEqual(snapshot.state, DayState.PARTIAL)
+
+    def test_day_state_ignores_other_inputs(self):
+        """
+        Test hidden or checkbox inputs in the duration rows do not shift the values.
+        """
+        pages = fixture_pages(BASE_URL)
+        url = BASE_URL + "/daytimerecording"
+        pages[url] = pages[url].replace(
+            '<input type="text" size="2" name="daytimerecording,Content,effortExpense_hour_0"',
+            '<input type="checkbox" name="done_0" value="on">'
+            '<input type="text" size="2" name="daytimerecording,Content,effortExpense_hour_0"',
+        ).replace(
+            '<input type="text" size="2" name="daytimerecording,Content,attandenceDuration_hour_1"',
+            '<input type="hidden" name="row_1" value="7">'
+            '<input type="text" size="2" name="daytimerecording,Content,attandenceDuration_hour_1"',
+        )
+        driver = FakeWebDriver(pages)
+        MainPage(driver, base_url=BASE_URL).open("/daytimerecording")
+        self.assertEqual(
+            len(driver.find_elements(By.XPATH, "//input[@name='done_0' or @name='row_1']")), 2
+        )
+        self.assertEqual(MainPage(driver, base_url=BASE_URL).read_day_state(),
+                         self.page.read_day_state())
+
+    def test_first_available_task(self):
+        """
+        Test the first row with budget left for the unrecorded time is chosen.
+        """
+        self.assertEqual(self.page.get_first_available_task(), 1)
+
+    def test_type_task_fields(self):
+        """
+        Test every task field of a line is written.
+        """
+        self.page.type_task_duration(task_line=1, hours=3, minutes=15)
+        self.page.type_task_description(task_line=1, text="Line one\nLine two")
+        self.page.type_task_reference(task_line=1, text="REF")
+        self.page.type_task_title(task_line=1, text="TA")
+        self.assertEqual(self._value(MainPageLocators.TASKS_DURATION_INPUT_HOURS, 1), "3")
+        self.assertEqual(self._value(MainPageLocators.TASKS_DURATION_INPUT_MINUTES, 1), "15")
+        self.assertEqual(
+            self._value(MainPageLocators.TASKS_DESCRIPTION_INPUT, 1), "Line one\nLine two"
+        )
+        self.assertEqual(self._value(MainPageLocators.TASKS_REFERENCE_INPUT, 1), "REF")
+        self.assertEqual(self._value(MainPageLocators.TASKS_TITLE_INPUT, 1), "TA")
+        self.assertEqual(self._value(MainPageLocators.TASKS_TITLE_INPUT, 0), "")
+
+    def test_save(self):
+        """
+        Test the save button submits the booking form.
+        """
+        self.page.type_attendance_duration(hours=8, minutes=0)
+        self.page.click_on_save_button()
+        action, fields = self.driver.submissions[-1]
+        self.assertEqual(action, BASE_URL + "/daytimerecording/save")
+        self.assertEqual(fields["daytimerecording,Content,attandenceDuration_hour_1"], "8")
+
+    def test_open_day_deep_link(self):
+        """
+        Test a day is opened through its URL without clicking on the tab.
+        """
+        self.page.open()
+        self.assertTrue(self.page.open_day(date(2024, 6, 3)))
+        self.assertEqual(self.page.get_url(), BASE_URL + "/daytimerecording?date=2024-06-03")
+        self.assertEqual([node.attrs.get("value") for node in self.driver.clicks], ["Yes"])
+
+    def test_open_day_already_there(self):
+        """
+        Test nothing is loaded when the booking form of the day is shown.
+        """
+        self.page.open("/daytimerecording", params={"date": "2024-06-03"})
+        self.driver.document.element_children()[0].attrs["data-loaded"] = "once"
+        self.assertTrue(self.page.open_day(date(2024, 6, 3)))
+        self.assertEqual(self.driver.document.element_children()[0].attrs["data-loaded"], "once")
+        self.assertTrue(self.page.open_day())
+
+    def test_open_day_rejected(self):
+        """
+        Test a rejected deep link of a day loads nothing more, as the booking
+        tab would show the default day.
+        """
+        pages = fixture_pages(BASE_URL)
+        pages[BASE_URL + "/daytimerecording?date=2024-06-03"] = pages[BASE_URL]
+        self.driver.pages = pages
+        self.assertFalse(self.page.open_day(date(2024, 6, 3)))
+        self.assertNotIn("a", [node.tag for node in self.driver.clicks])
+
+    def test_open_day_other_day_shown(self):
+        """
+        Test a deep link answered with the booking form of another day is rejected.
+        """
+        self.page.open("/daytimerecording", params={"date": "2024-06-04"})
+        with patch.object(self.driver, "get"):
+            self.assertFalse(self.page.open_day(date(2024, 6, 3)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Module: test_navigation_timing
+
+This module contains unit tests for the module 'navigation_timing.py'.
+
+Dependencies:
+    - unittest
+    - navigation_timing (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_navigation_timing.py
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock
+from pages.main_page import MainPage
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.navigation_timing import NavigationReport
+from utils.structured_log import RUN_ID
+
+NAVIGATION = {
+    "startTime": 0,
+    "domainLookupStart": 2,
+    "domainLookupEnd": 12,
+    "connectStart": 12,
+    "connectEnd": 40,
+    "responseStart": 180,
+    "domContentLoadedEventEnd": 420,
+    "loadEventEnd": 650,
+}
+
+
+class TestNavigationReport(unittest.TestCase):
+    """
+    Test cases for the NavigationReport class.
+    """
+
+    def test_capture_full_navigation(self):
+        """
+        Test the navigation entry is converted to durations.
+        """
+        driver = MagicMock(current_url="https://p.local/bcw")
+        driver.execute_script.return_value = {
+            "complete": True,
+            "time_origin": 1000.0,
+            "now": 700.0,
+            "navigation": NAVIGATION,
+            "resources": [{"name": "app.js", "duration_ms": 120.0}],
+        }
+        report = NavigationReport(run_id="run")
+        timing = report.capture(driver, "open", time.perf_counter() - 1)
+        self.assertEqual(timing.dns_ms, 10)
+        self.assertEqual(timing.connect_ms, 28)
+        self.assertEqual(timing.ttfb_ms, 180)
+        self.assertEqual(timing.dom_content_loaded_ms, 420)
+        self.assertEqual(timing.load_ms, 650)
+        self.assertGreater(timing.overhead_ms, 300)
+        self.assertEqual(report.to_dict()["navigations"][0]["slowest_resources"][0]["name"],
+                         "app.js")
+
+    def test_same_document_switch(self):
+        """
+        Test a tab switch without a new document reports no load time.
+        """
+        driver = MagicMock(current_url="https://p.local/bcw")
+        data = {"complete": True, "time_origin": 1000.0, "now": 700.0,
+                "navigation": NAVIGATION, "resources": []}
+        driver.execute_script.return_value = data
+        report = NavigationReport()
+        report.capture(driver, "open", time.perf_counter())
+        timing = report.capture(driver, "booking tab", time.perf_counter())
+        self.assertEqual(timing.load_ms, 0)
+        self.assertEqual(driver.execute_script.call_args[0][1], 700.0)
+
+    def test_waits_for_load_event(self):
+        """
+        Test the capture polls until the load event fired, outside the wall time.
+        """
+        driver = MagicMock(current_url="https://p.local/bcw")
+        driver.execute_script.side_effect = [
+            {"complete": False},
+            {"complete": True, "time_origin": 1.0, "now": 1.0,
+             "navigation": NAVIGATION, "resources": []},
+        ]
+        start = time.perf_counter()
+        timing = NavigationReport().capture(driver, "open", start)
+        self.assertEqual(timing.load_ms, 650)
+        self.assertLess(timing.wall_ms, (time.perf_counter() - start) * 1000 - 400)
+
+    def test_tabs_are_tracked_apart(self):
+        """
+        Test a switch in one tab does not hide the navigation of another.
+        """
+        driver = MagicMock(current_url="https://p.local/bcw")
+        driver.execute_script.return_value = {"complete": True, "time_origin": 1000.0,
+                                              "now": 700.0, "navigation": NAVIGATION,
+                                              "resources": []}
+        report = NavigationReport()
+        self.assertEqual(report.run_id, RUN_ID)
+        report.capture(driver, "open", time.perf_counter(), "tab-1")
+        self.assertEqual(report.capture(driver, "open", time.perf_counter(), "tab-2").load_ms, 650)
+        self.assertEqual(report.capture(driver, "switch", time.perf_counter(), "tab-1").load_ms, 0)
+        self.assertEqual(
+            [call[0][1] for call in driver.execute_script.call_args_list], [0.0, 0.0, 700.0]
+        )
+
+    def test_sessions_are_tracked_apart(self):
+        """
+        Test a new session does not inherit the document of an earlier one.
+        """
+        driver = MagicMock(current_url="https://p.local/bcw", session_id="first")
+        driver.execute_script.return_value = {"complete": True, "time_origin": 1000.0,
+                                              "now": 700.0, "navigation": NAVIGATION,
+                                              "resources": []}
+        report = NavigationReport()
+        report.capture(driver, "open", time.perf_counter())
+        driver.session_id = "second"
+        self.assertEqual(report.capture(driver, "open", time.perf_counter()).load_ms, 650)
+
+    def test_pages_record_navigations(self):
+        """
+        Test open and the booking tab are recorded, one script each.
+        """
+        report = NavigationReport()
+        driver = FakeWebDriver(fixture_pages("https://p.local"))
+        page = MainPage(driver, base_url="https://p.local", navigation_report=report)
+        page.open("/daytimerecording")
+        page.click_on_booking_tab()
+        self.assertEqual([entry.label for entry in report.entries], ["open", "booking tab"])
+        self.assertEqual(report.entries[0].url, "https://p.local/daytimerecording")
+        self.assertEqual(len(driver.scripts), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+Module: test_profiler
+
+This module contains unit tests for the module 'profiler.py'.
+The round trips are measured through ``webdriver.Remote`` on a local fake
+WebDriver server against the stand-in Projektron server.
+
+Dependencies:
+    - unittest
+    - profiler (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_profiler.py
+"""
+
+import os
+import pstats
+import tempfile
+import threading
+import unittest
+from typing import Dict
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils.driver_server import start_driver_server
+from utils.fake_driver import FakeWebDriver
+from utils.grid import remote_driver
+from utils.profiler import OUTSIDE, FlowProfiler, MethodTime
+from utils.stub_server import start_stub_server
+
+
+class WaitingPage(BasePage):
+    """
+    Page waiting for an element that never shows.
+    """
+
+    def wait_for_missing(self) -> bool:
+        """
+        Poll for a missing element until the wait times out.
+        """
+        try:
+            WebDriverWait(self.driver, 0.3, poll_frequency=0.1).until(
+                lambda driver: driver.find_elements(By.ID, "missing")
+            )
+        except TimeoutException:
+            return False
+        return True
+
+
+class TestFlowProfiler(unittest.TestCase):
+    """
+    Test cases for the FlowProfiler class.
+    """
+
+    def setUp(self) -> None:
+        self.stub = start_stub_server()
+        self.node = start_driver_server(latency=0.01)
+        self.driver: WebDriver = remote_driver(self.node.url)
+
+    def tearDown(self) -> None:
+        self.driver.quit()
+        self.node.stop()
+        self.stub.stop()
+
+    def test_login_time_is_split_per_method(self):
+        """
+        Test the login is attributed to the page methods with its round trips.
+        """
+        with FlowProfiler() as profiler:
+            login_page = LoginPage(self.driver, base_url=self.stub.base_url)
+            login_page.open()
+            login_page.login(user="profile", password="test")
+        times: Dict[str, MethodTime] = {row.method: row for row in profiler.rows()}
+        self.assertEqual(times["LoginPage.login"].calls, 1)
+        self.assertGreaterEqual(times["LoginPage.login"].total,
+                                times["LoginPage.click_login_button"].total)
+        self.assertGreaterEqual(times["LoginPage.click_login_button"].driver, 0.01)
+        self.assertGreaterEqual(times["BasePage.open"].driver, 0.01)
+        self.assertIn(OUTSIDE, times)
+        total: MethodTime = times["total"]
+        self.assertAlmostEqual(total.total, total.cpu + total.driver + total.wait)
+        self.assertIs(LoginPage.login, vars(LoginPage)["login"])
+
+    def test_wait_excludes_polling_round_trips(self):
+        """
+        Test the sleeps of a wait count as waiting, its polls as round trips.
+        """
+        page = WaitingPage(self.driver, base_url=self.stub.base_url)
+        page.open()
+        with FlowProfiler(classes=(WaitingPage,)) as profiler:
+            self.assertFalse(page.wait_for_missing())
+        times = {row.method: row for row in profiler.rows()}
+        self.assertGreater(times["WaitingPage.wait_for_missing"].wait, 0.1)
+        self.assertGreater(times["WaitingPage.wait_for_missing"].driver, 0.02)
+        self.assertLess(times["WaitingPage.wait_for_missing"].cpu, 0.1)
+
+    def test_dump_is_readable(self):
+        """
+        Test the cProfile dump loads with pstats.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.prof")
+            with FlowProfiler() as profiler:
+                LoginPage(FakeWebDriver(), base_url=self.stub.base_url).get_url()
+            profiler.dump(path)
+            self.assertGreater(pstats.Stats(path).total_calls, 0)
+        self.assertEqual(profiler.rows()[0].driver, 0.0)
+
+    def test_dump_covers_worker_threads(self):
+        """
+        Test page methods run in another thread are in the dump and the table.
+        """
+        page = LoginPage(FakeWebDriver(), base_url=self.stub.base_url)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.prof")
+            with FlowProfiler() as profiler:
+                worker = threading.Thread(target=page.get_url)
+                worker.start()
+                worker.join()
+            profiler.dump(path)
+            functions = {name for _, _, name in pstats.Stats(path).stats}
+        self.assertIn("get_url", functions)
+        self.assertEqual({row.method: row for row in profiler.rows()}["BasePage.get_url"].calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
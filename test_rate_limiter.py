@@ -0,0 +1,165 @@
+"""
+Module: test_rate_limiter
+
+This module contains unit tests for the module 'rate_limiter.py'.
+
+Dependencies:
+    - unittest
+    - rate_limiter (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_rate_limiter.py
+"""
+
+import os
+import tempfile
+import unittest
+from typing import List
+from pages.login_page import LoginPage
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.rate_limiter import RateLimiter
+
+BASE_URL = "https://projektron.example.test"
+
+
+class FakeClock:
+    """
+    Clock whose sleeps only move the time forward.
+    """
+
+    def __init__(self) -> None:
+        self.now: float = 1000.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Record the sleep and advance the clock.
+        """
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Test cases for the RateLimiter class.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path: str = os.path.join(self.directory.name, "rate.sqlite")
+        self.clock = FakeClock()
+        self.limiters: List[RateLimiter] = []
+
+    def tearDown(self) -> None:
+        for limiter in self.limiters:
+            limiter.close()
+        self.directory.cleanup()
+
+    def _limiter(self, **kwargs) -> RateLimiter:
+        limiter = RateLimiter(path=self.path, clock=self.clock, sleep=self.clock.sleep, **kwargs)
+        self.limiters.append(limiter)
+        return limiter
+
+    def test_burst_then_wait(self):
+        """
+        Test the burst is served at once and later requests wait for refill.
+        """
+        limiter = self._limiter(rate=2.0, burst=3)
+        self.assertEqual([limiter.acquire() for _ in range(5)], [0.0, 0.0, 0.0, 0.5, 0.5])
+        self.assertEqual(limiter.throttled_seconds, 1.0)
+        status = limiter.status()
+        self.assertEqual(status.requests, 5)
+        self.assertEqual(status.throttled_seconds, 1.0)
+        self.clock.now += 10
+        self.assertEqual(limiter.status().tokens, 3)
+
+    def test_instances_share_the_bucket(self):
+        """
+        Test two limiters on the same file draw from one budget.
+        """
+        first, second = self._limiter(rate=1.0, burst=2), self._limiter(rate=1.0, burst=2)
+        self.assertEqual(first.acquire(), 0.0)
+        self.assertEqual(second.acquire(), 0.0)
+        self.assertEqual(first.acquire(), 1.0)
+        self.assertEqual(second.status().requests, 3)
+
+    def test_slow_responses_halve_the_rate(self):
+        """
+        Test slow responses halve the rate once per target time, not below the minimum.
+        """
+        limiter = self._limiter(rate=2.0, min_rate=0.5, target_seconds=3.0, weight=1.0)
+        limiter.observe(5.0)
+        self.assertEqual(limiter.status().rate, 1.0)
+        limiter.observe(5.0)
+        self.assertEqual(limiter.status().rate, 1.0)
+        self.clock.now += 3
+        limiter.observe(5.0)
+        self.clock.now += 3
+        limiter.observe(5.0)
+        self.assertEqual(limiter.status().rate, 0.5)
+        self.assertEqual(limiter.status().latency, 5.0)
+
+    def test_fast_responses_restore_the_rate(self):
+        """
+        Test fast responses add a tenth of the configured rate up to the configured rate.
+        """
+        limiter = self._limiter(rate=2.0, target_seconds=3.0, weight=1.0)
+        limiter.observe(10.0)
+        self.assertEqual(limiter.status().rate, 1.0)
+        for _ in range(4):
+            limiter.observe(0.1)
+        self.assertAlmostEqual(limiter.status().rate, 1.8)
+        for _ in range(4):
+            limiter.observe(0.1)
+        self.assertEqual(limiter.status().rate, 2.0)
+
+    def test_lower_configured_rate_caps_the_shared_rate(self):
+        """
+        Test a limiter configured slower lowers the rate of the shared bucket.
+        """
+        self._limiter(rate=4.0)
+        self.assertEqual(self._limiter(rate=1.0).status().rate, 1.0)
+
+    def test_idle_bucket_is_reset(self):
+        """
+        Test the backoff of an earlier run expires, while an overlapping run shares it.
+        """
+        first = self._limiter(rate=2.0, target_seconds=3.0, weight=1.0)
+        first.acquire()
+        first.observe(10.0)
+        self.clock.now += 30
+        self.assertEqual(self._limiter(rate=2.0).status().rate, 1.0)
+        self.clock.now += 61
+        status = self._limiter(rate=2.0).status()
+        self.assertEqual((status.rate, status.latency, status.requests), (2.0, None, 0))
+
+    def test_invalid_configuration(self):
+        """
+        Test rates and bursts that cannot work are rejected.
+        """
+        for kwargs in ({"rate": 0}, {"burst": 0.5}, {"rate": 1.0, "min_rate": 2.0}):
+            with self.assertRaises(ValueError):
+                self._limiter(**kwargs)
+
+    def test_page_requests_take_tokens(self):
+        """
+        Test opening the login page and submitting it each take a token and
+        report a response time.
+        """
+        limiter = self._limiter(rate=1.0, burst=1)
+        page = LoginPage(
+            FakeWebDriver(fixture_pages(BASE_URL)), base_url=BASE_URL, rate_limiter=limiter
+        )
+        page.open()
+        page.login(user="user", password="secret")
+        self.assertEqual(limiter.status().requests, 2)
+        self.assertEqual(self.clock.sleeps, [1.0])
+        self.assertIsNotNone(limiter.status().latency)
+
+
+if __name__ == "__main__":
+    unittest.main()
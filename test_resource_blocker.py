@@ -0,0 +1,120 @@
+"""
+Module: test_resource_blocker
+
+This module contains unit tests for the module 'resource_blocker.py'.
+
+Dependencies:
+    - unittest
+    - resource_blocker (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_resource_blocker.py
+"""
+
+import os
+import unittest
+from unittest.mock import MagicMock, call, patch
+from utils.resource_blocker import (
+    ResourceBlocklist,
+    apply_blocklist,
+    compare_blocklist,
+)
+
+
+class TestResourceBlocklist(unittest.TestCase):
+    """
+    Test cases for the ResourceBlocklist class.
+    """
+
+    def setUp(self) -> None:
+        self.blocklist = ResourceBlocklist(
+            url_patterns=("*notification*.js", "*daytimerecording*.png"),
+            resource_types=("Image", "Font"),
+        )
+
+    def test_is_blocked(self):
+        """
+        Test static assets are blocked by URL the way the browser blocks them.
+        """
+        self.assertTrue(self.blocklist.is_blocked("https://p.local/img/logo.png"))
+        self.assertTrue(self.blocklist.is_blocked("https://p.local/fonts/a.woff2"))
+        self.assertTrue(self.blocklist.is_blocked("https://p.local/js/notification.min.js"))
+        self.assertFalse(self.blocklist.is_blocked("https://p.local/bcw/app.js"))
+        self.assertFalse(self.blocklist.is_blocked("https://p.local/bcw/daytimerecording"))
+
+    def test_limits_of_url_blocking(self):
+        """
+        Test images without an extension pass and allowed paths are not exempt.
+        """
+        self.assertFalse(self.blocklist.is_blocked("https://p.local/avatar"))
+        self.assertTrue(self.blocklist.is_blocked("https://p.local/daytimerecording/chart.png"))
+
+    def test_browser_patterns_skip_allowed(self):
+        """
+        Test patterns overlapping an allowed pattern are not sent to the browser.
+        """
+        patterns = self.blocklist.browser_patterns()
+        self.assertIn("*notification*.js", patterns)
+        self.assertIn("*.woff2", patterns)
+        self.assertNotIn("*daytimerecording*.png", patterns)
+
+
+class TestApplyBlocklist(unittest.TestCase):
+    """
+    Test cases for installing and measuring the blocklist.
+    """
+
+    def test_apply(self):
+        """
+        Test the blocklist is installed through the DevTools protocol.
+        """
+        driver = MagicMock()
+        self.assertTrue(apply_blocklist(driver, ResourceBlocklist(resource_types=())))
+        driver.execute_cdp_cmd.assert_called_with(
+            "Network.setBlockedURLs",
+            {"urls": list(ResourceBlocklist().url_patterns)},
+        )
+
+    @patch.dict(os.environ, {"PROJEKTRON_BLOCKLIST": "off"})
+    def test_apply_disabled(self):
+        """
+        Test PROJEKTRON_BLOCKLIST=off leaves the browser untouched.
+        """
+        driver = MagicMock()
+        self.assertFalse(apply_blocklist(driver))
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_compare(self):
+        """
+        Test both variants are measured and reported as medians.
+        """
+        driver = MagicMock()
+        driver.execute_script.side_effect = [
+            {"load_ms": 900, "transferred_bytes": 500_000, "resource_count": 40},
+            {"load_ms": 1100, "transferred_bytes": 500_000, "resource_count": 40},
+            {"load_ms": 300, "transferred_bytes": 90_000, "resource_count": 12},
+            {"load_ms": 350, "transferred_bytes": 90_000, "resource_count": 12},
+        ]
+        results = compare_blocklist(driver, "https://p.local/", runs=2)
+        self.assertEqual(results["unblocked"].load_ms, 1000)
+        self.assertEqual(results["blocked"].transferred_bytes, 90_000)
+        self.assertEqual(driver.get.call_count, 4)
+        self.assertIn(
+            call("Network.setBlockedURLs", {"urls": []}), driver.execute_cdp_cmd.call_args_list[-2:]
+        )
+
+    def test_remote_drivers_warn(self):
+        """
+        Test drivers without network interception are left untouched with a warning.
+        """
+        driver = MagicMock(spec=["get", "execute_script"])
+        with self.assertLogs("projektron.resources", "WARNING") as logs:
+            self.assertFalse(apply_blocklist(driver))
+            self.assertEqual(compare_blocklist(driver, "https://p.local/"), {})
+        self.assertEqual(len(logs.records), 2)
+        driver.get.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Module: test_session_recorder
+
+This module contains unit tests for the module 'session_recorder.py'.
+It records the commands the page objects issue against a canned command
+executor and replays them without any browser.
+
+Dependencies:
+    - unittest
+    - session_recorder (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_session_recorder.py
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from typing import Any, Dict, Optional
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+from pages.login_page import LoginPage
+from utils.session_recorder import (
+    REDACTED,
+    ReplayMismatchError,
+    read_session_log,
+    record_session,
+    replay_driver,
+)
+
+ELEMENT_KEY: str = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class CannedCommandExecutor:  # pylint: disable=too-few-public-methods
+    """
+    Command executor answering like a browser holding the login page.
+    """
+
+    def execute(self, command: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return a canned response for a command.
+        """
+        if command == Command.NEW_SESSION:
+            return {"value": {"sessionId": "live", "capabilities": {}}}
+        if command == Command.FIND_ELEMENT:
+            if "missing" in (params or {}).get("value", ""):
+                return {
+                    "status": 404,
+                    "value": json.dumps(
+                        {"value": {"error": "no such element", "message": "missing"}}
+                    ),
+                }
+            return {"value": {ELEMENT_KEY: (params or {}).get("value")}}
+        if command == Command.GET_TITLE:
+            return {"value": "Projektron BCS"}
+        return {"value": None}
+
+
+class TestSessionRecorder(unittest.TestCase):
+    """
+    Test cases for recording and replaying WebDriver sessions.
+    """
+
+    def setUp(self) -> None:
+        handle, self.log_path = tempfile.mkstemp(suffix=".jsonl.gz")
+        os.close(handle)
+        self.live = webdriver.Remote(
+            command_executor=CannedCommandExecutor(),
+            options=webdriver.ChromeOptions(),
+        )
+
+    def tearDown(self) -> None:
+        os.remove(self.log_path)
+
+    def _record_login(self, password: str = "qwerty") -> None:
+        with record_session(self.live, self.log_path, secrets=[password]):
+            page = LoginPage(self.live, base_url="https://projektron.local")
+            page.open()
+            page.login(user="Superman", password=password)
+            self.assertEqual(page.get_title(), "Projektron BCS")
+
+    def test_replay_matches_recording(self):
+        """
+        Test a recorded login replays without the live executor.
+        """
+        self._record_login()
+        driver = replay_driver(self.log_path)
+        page = LoginPage(driver, base_url="https://projektron.local")
+        page.open()
+        page.login(user="Superman", password="anything")
+        self.assertEqual(page.get_title(), "Projektron BCS")
+        self.assertTrue(driver.command_executor.exhausted)
+
+    def test_password_is_redacted(self):
+        """
+        Test the password never reaches the log.
+        """
+        self._record_login(password="s3cr3t-value")
+        records = read_session_log(self.log_path)
+        self.assertNotIn("s3cr3t-value", repr(records))
+        send_keys = [r for r in records if r["cmd"] == Command.SEND_KEYS_TO_ELEMENT]
+        self.assertEqual(send_keys[1]["params"]["text"], REDACTED)
+        self.assertEqual(send_keys[1]["params"]["value"], REDACTED)
+
+    def test_replay_detects_divergence(self):
+        """
+        Test replay raises ReplayMismatchError when the code issues other commands.
+        """
+        self._record_login()
+        driver = replay_driver(self.log_path)
+        page = LoginPage(driver, base_url="https://projektron.local")
+        page.open()
+        with self.assertRaises(ReplayMismatchError):
+            page.login(user="Batman", password="anything")
+
+    def test_errors_are_replayed(self):
+        """
+        Test a recorded error response raises the same exception on replay.
+        """
+        with record_session(self.live, self.log_path):
+            with self.assertRaises(NoSuchElementException):
+                self.live.find_element(by="xpath", value="//missing")
+        driver = replay_driver(self.log_path)
+        with self.assertRaises(NoSuchElementException):
+            driver.find_element(by="xpath", value="//missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
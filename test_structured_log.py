@@ -0,0 +1,137 @@
+"""
+Module: test_structured_log
+
+This module contains unit tests for the module 'structured_log.py'.
+
+Dependencies:
+    - unittest
+    - structured_log (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_structured_log.py
+"""
+
+import json
+import logging
+import os
+import tempfile
+import unittest
+from typing import Iterator, List
+from pages.main_page import MainPage
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.structured_log import (
+    RUN_ID,
+    log_action,
+    log_actions,
+    log_context,
+    setup_logging,
+)
+
+BASE_URL: str = "https://projektron.local/bcw"
+
+
+class TestStructuredLog(unittest.TestCase):
+    """
+    Test cases for the JSON log records and the action timing.
+    """
+
+    def setUp(self) -> None:
+        root = logging.getLogger()
+        self.saved = (root.handlers[:], root.level)
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, "run.log")
+
+    def tearDown(self) -> None:
+        root = logging.getLogger()
+        root.handlers[:], level = self.saved
+        root.setLevel(level)
+        self.directory.cleanup()
+
+    def _records(self, level: str = "INFO", action: object = None) -> List[dict]:
+        listener = setup_logging(level, self.path)
+        try:
+            action()
+        finally:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        with open(self.path, encoding="utf-8") as log_file:
+            return [json.loads(line) for line in log_file]
+
+    def test_records_carry_context(self):
+        """
+        Test records hold the run id, the context and the extra fields.
+        """
+        def action() -> None:
+            with log_context(account="jdoe", day="2024-06-03"):
+                with log_context(step="save", day=None):
+                    logging.getLogger("test").info("saved %s", "day", extra={"lines": 2})
+            logging.getLogger("test").info("outside")
+
+        records = self._records(action=action)
+        self.assertEqual(records[0]["message"], "saved day")
+        self.assertEqual(records[0]["run_id"], RUN_ID)
+        self.assertEqual(
+            (records[0]["account"], records[0]["day"], records[0]["step"], records[0]["lines"]),
+            ("jdoe", "2024-06-03", "save", 2),
+        )
+        self.assertNotIn("account", records[1])
+
+    def test_log_action(self):
+        """
+        Test an action logs its duration and outcome, nested ones at DEBUG.
+        """
+        @log_action
+        def inner() -> None:
+            raise ValueError("boom")
+
+        @log_action
+        def outer() -> None:
+            try:
+                inner()
+            except ValueError:
+                pass
+
+        info = self._records(action=outer)
+        self.assertEqual([record["action"] for record in info], [outer.__qualname__])
+        self.assertEqual(info[0]["outcome"], "ok")
+        self.assertGreaterEqual(info[0]["duration_ms"], 0)
+        os.remove(self.path)
+        debug = self._records("DEBUG", outer)
+        self.assertEqual([record["outcome"] for record in debug], ["ValueError", "ok"])
+        self.assertEqual(debug[0]["level"], "DEBUG")
+
+    def test_log_actions_skips_private_and_generators(self):
+        """
+        Test only public, non generator methods are wrapped.
+        """
+        @log_actions
+        class Page:  # pylint: disable=missing-class-docstring
+            def act(self) -> int:  # pylint: disable=missing-function-docstring
+                return 1
+
+            def _helper(self) -> int:
+                return 2
+
+            def rows(self) -> Iterator[int]:  # pylint: disable=missing-function-docstring
+                yield 3
+
+        self.assertTrue(hasattr(Page.act, "__wrapped__"))
+        self.assertFalse(hasattr(Page._helper, "__wrapped__"))  # pylint: disable=protected-access
+        self.assertFalse(hasattr(Page.rows, "__wrapped__"))
+        self.assertEqual(Page().act(), 1)
+
+    def test_page_actions_are_logged(self):
+        """
+        Test page object calls are logged with their names.
+        """
+        driver = FakeWebDriver(fixture_pages(BASE_URL))
+        page = MainPage(driver, base_url=BASE_URL)
+        page.open("/daytimerecording")
+        records = self._records(action=page.get_unrecorded_efforts)
+        self.assertEqual(records[0]["action"], "MainPage.get_unrecorded_efforts")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Module: test_tab_booking
+
+This module contains unit tests for the module 'tab_booking.py'.
+Days are booked in tabs of the fake driver, and of a local fake WebDriver
+server through ``webdriver.Remote``.
+
+Dependencies:
+    - unittest
+    - tab_booking (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_tab_booking.py
+"""
+
+import unittest
+from datetime import date, timedelta
+from typing import Any, List
+from pages.login_page import LoginPage
+from pages.main_page import MainPage
+from utils.booking_planner import BookingJob, RowAssignment, plan_booking
+from utils.driver_server import start_driver_server
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.grid import remote_driver
+from utils.locator_fallback import LocatorResolver
+from utils.stub_server import start_stub_server
+from utils.tab_booking import book_in_tabs
+from utils.time_parser import Duration
+
+BASE_URL: str = "https://projektron.local/bcw"
+
+
+def _plans(days: int, save: bool = True) -> List[Any]:
+    return [
+        plan_booking(
+            BookingJob(
+                day=date(2024, 6, 3) + timedelta(days=offset),
+                attendance=Duration(hours=8),
+                rows=(RowAssignment(description="tabs", reference="TA", title="TA"),),
+                save=save,
+            )
+        )
+        for offset in range(days)
+    ]
+
+
+class TabCountingDriver(FakeWebDriver):
+    """
+    Fake driver remembering the loaded URLs and the most tabs open at once.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.loaded: List[str] = []
+        self.most_tabs: int = 1
+
+    def get(self, url: str) -> None:
+        self.loaded.append(url)
+        self.most_tabs = max(self.most_tabs, len(self.tabs))
+        super().get(url)
+
+
+class TestBookInTabs(unittest.TestCase):
+    """
+    Test cases for the book_in_tabs function.
+    """
+
+    def setUp(self) -> None:
+        self.driver = TabCountingDriver(fixture_pages(BASE_URL))
+        self.page = MainPage(self.driver, base_url=BASE_URL)
+
+    def test_days_are_booked_in_tabs(self):
+        """
+        Test every day loads once in its own tab, and saved tabs are closed.
+        """
+        contexts = book_in_tabs(self.page, _plans(5), tabs=2)
+        self.assertEqual([context["written"] for context in contexts], [True] * 5)
+        self.assertEqual(
+            self.driver.loaded,
+            [self.page.day_url(date(2024, 6, 3) + timedelta(days=offset)) for offset in range(5)],
+        )
+        # the first tab, the one being booked and two loading the next days
+        self.assertEqual(self.driver.most_tabs, 4)
+        self.assertEqual(self.driver.window_handles, ["window-0"])
+        self.assertEqual(self.driver.current_window_handle, "window-0")
+        self.assertEqual(len(self.driver.submissions), 5)
+
+    def test_unsaved_days_stay_open(self):
+        """
+        Test tabs of days left for manual validation are kept.
+        """
+        contexts = book_in_tabs(self.page, _plans(2, save=False), tabs=4)
+        self.assertEqual(
+            [context["tab"].window_handle for context in contexts], ["window-1", "window-2"]
+        )
+        self.assertEqual(len(self.driver.window_handles), 3)
+        with self.assertRaises(ValueError):
+            book_in_tabs(self.page, _plans(1), tabs=0)
+
+    def test_tabs_keep_the_page_options(self):
+        """
+        Test the page of a tab looks up locators and counts days like its opener.
+        """
+        resolver = LocatorResolver(path=None)
+        page = MainPage(self.driver, base_url=BASE_URL, locator_resolver=resolver,
+                        working_hours=7.5)
+        contexts = book_in_tabs(page, _plans(1, save=False), tabs=1)
+        self.assertIs(contexts[0]["tab"].locator_resolver, resolver)
+        self.assertEqual(contexts[0]["tab"].working_hours, 7.5)
+
+
+class TestRemoteTabs(unittest.TestCase):
+    """
+    Test cases for booking in tabs of a remote session.
+    """
+
+    def test_remote_tabs(self):
+        """
+        Test the tab commands of the remote protocol book every day.
+        """
+        stub = start_stub_server()
+        node = start_driver_server()
+        driver = remote_driver(node.url)
+        try:
+            login_page = LoginPage(driver, base_url=stub.base_url)
+            login_page.open()
+            login_page.login(user="tabs", password="test")
+            contexts = book_in_tabs(MainPage(driver, base_url=stub.base_url), _plans(3), tabs=2)
+            self.assertEqual([len(context["booked_rows"]) for context in contexts], [1, 1, 1])
+            self.assertEqual(len(driver.window_handles), 1)
+            self.assertEqual(stub.requests["POST /daytimerecording/save"], 3)
+        finally:
+            driver.quit()
+            node.stop()
+            stub.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Module: test_tables
+
+This module contains unit tests for the module 'tables.py'.
+
+Dependencies:
+    - unittest
+    - tables (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_tables.py
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+from utils.tables import markdown_table, write_csv
+
+ROWS = [{"task": "Dev", "left": "04:00h"}, {"task": "a|b", "left": "00:30h"}]
+
+
+class TestTables(unittest.TestCase):
+    """
+    Test cases for the table writers.
+    """
+
+    def test_markdown_table(self):
+        """
+        Test the header, separator and escaped cells of a Markdown table.
+        """
+        self.assertEqual(
+            markdown_table(ROWS).splitlines(),
+            ["| task | left |", "|---|---|", "| Dev | 04:00h |", "| a\\|b | 00:30h |"],
+        )
+        self.assertEqual(markdown_table([]), "")
+
+    def test_write_csv(self):
+        """
+        Test the rows read back from the CSV file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rows.csv")
+            write_csv(ROWS, path)
+            with open(path, newline="", encoding="utf-8") as csv_file:
+                self.assertEqual(list(csv.DictReader(csv_file)), ROWS)
+
+
+if __name__ == "__main__":
+    unittest.main()
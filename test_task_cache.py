@@ -0,0 +1,177 @@
+"""
+Module: test_task_cache
+
+This module contains unit tests for the module 'task_cache.py'.
+The cache is refreshed from the daytimerecording fixture through the fake driver.
+
+Dependencies:
+    - unittest
+    - task_cache (the module under test)
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_task_cache.py
+"""
+
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import date
+from selenium.webdriver.common.by import By
+from pages.main_page import MainPage
+from utils.booking_planner import BookingJob, RowAssignment, execute_plan, plan_booking
+from utils.fake_driver import FakeWebDriver, fixture_pages
+from utils.locators import MainPageLocators
+from utils.task_cache import TaskCache, main
+from utils.time_parser import Duration
+
+BASE_URL: str = "https://projektron.local/bcw"
+DAY: date = date(2024, 6, 3)
+
+
+class TestTaskCache(unittest.TestCase):
+    """
+    Test cases for refreshing and querying the task cache.
+    """
+
+    def setUp(self) -> None:
+        self.driver = FakeWebDriver(fixture_pages(BASE_URL))
+        self.page = MainPage(self.driver, base_url=BASE_URL)
+        self.page.open("/daytimerecording")
+        self.cache = TaskCache(":memory:")
+
+    def tearDown(self) -> None:
+        self.cache.close()
+
+    def test_refresh_reads_only_changed_rows(self):
+        """
+        Test a second refresh reads nothing and a changed row is read again.
+        """
+        self.assertEqual(self.cache.refresh(self.page, "jdoe", DAY), 3)
+        self.assertEqual(self.cache.refresh(self.page, "jdoe", DAY), 0)
+        duration = self.driver.find_elements(By.XPATH, MainPageLocators.TASKS_DURATION)[2]
+        duration.node.children[:] = ["04:00h"]
+        self.assertEqual(self.cache.refresh(self.page, "jdoe", DAY), 1)
+        self.assertEqual(self.cache.task("jdoe", DAY, 2).duration, Duration(hours=4))
+
+    def test_snapshots(self):
+        """
+        Test the cached task lines hold the values shown on the page.
+        """
+        self.cache.refresh(self.page, "jdoe", DAY)
+        tasks = self.cache.tasks("jdoe", DAY)
+        self.assertEqual([task.line for task in tasks], [0, 1, 2])
+        self.assertEqual(tasks[1].budget, Duration(days=5))
+        self.assertEqual(tasks[1].duration, Duration(days=2, hours=1, minutes=30))
+        self.assertTrue(tasks[0].name)
+        self.assertEqual(self.cache.tasks("other", DAY), [])
+        self.assertTrue(self.cache.is_cached("jdoe", DAY))
+        self.assertFalse(self.cache.is_cached("jdoe", date(2024, 6, 4)))
+
+    def test_first_available_line_matches_page(self):
+        """
+        Test the cache picks the same task line as the page.
+        """
+        self.cache.refresh(self.page, "jdoe", DAY)
+        unrecorded = self.page.get_unrecorded_efforts()
+        self.assertEqual(
+            self.cache.first_available_line("jdoe", DAY, unrecorded),
+            self.page.get_first_available_task(unrecorded),
+        )
+        self.assertEqual(self.cache.first_available_line("jdoe", DAY, Duration(days=9)), -1)
+
+    def test_recent_references(self):
+        """
+        Test the booking history returns distinct references, latest first.
+        """
+        self.cache.refresh(self.page, "jdoe", DAY)
+        task = self.cache.task("jdoe", DAY, 1)
+        for reference in ("OLD", "NEW", "NEW"):
+            self.cache.record_booking(
+                "jdoe", DAY, replace(task, reference=reference), Duration(hours=1)
+            )
+        self.assertEqual(
+            [reference for reference, _ in self.cache.recent_references("jdoe")], ["NEW", "OLD"]
+        )
+
+    def test_planner_uses_cache(self):
+        """
+        Test a plan with a cache in its context picks the line from the cache.
+        """
+        job = BookingJob(rows=(RowAssignment(),))
+        context = execute_plan(
+            plan_booking(job), self.page, {"task_cache": self.cache, "account": "jdoe", "day": DAY}
+        )
+        self.assertEqual(context["first_available_line"], 1)
+        self.assertEqual(len(self.cache.tasks("jdoe", DAY)), 3)
+
+    def test_planner_keys_cache_by_shown_day(self):
+        """
+        Test a job for the default day uses the day the page URL shows.
+        """
+        url = f"{BASE_URL}/daytimerecording?date={DAY.isoformat()}"
+        self.driver.pages[url] = self.driver.pages[BASE_URL + "/daytimerecording"]
+        self.driver.get(url)
+        context = execute_plan(plan_booking(BookingJob(rows=(RowAssignment(),))), self.page,
+                               {"task_cache": self.cache, "account": "jdoe", "day": None})
+        self.assertEqual(context["day"], DAY)
+        self.assertEqual(len(self.cache.tasks("jdoe", DAY)), 3)
+
+    def test_planner_skips_cache_for_unknown_day(self):
+        """
+        Test the cache is not used when the shown day is unknown.
+        """
+        with self.assertLogs("projektron.planner", "WARNING") as logs:
+            context = execute_plan(plan_booking(BookingJob(rows=(RowAssignment(),))), self.page,
+                                   {"task_cache": self.cache, "account": "jdoe", "day": None})
+        self.assertIn("task cache skipped", logs.output[0])
+        self.assertNotIn("task_cache", context)
+        self.assertEqual(context["first_available_line"], 1)
+        self.assertEqual(self.cache.days("jdoe"), [])
+
+    def test_locked_file_times_out(self):
+        """
+        Test a write waits for another connection's transaction, then fails.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            holder = TaskCache(path)
+            holder.connection.execute("BEGIN EXCLUSIVE")
+            try:
+                with self.assertRaises(sqlite3.OperationalError):
+                    TaskCache(path, timeout=0.1)
+            finally:
+                holder.close()
+
+    def test_cli(self):
+        """
+        Test the command line lists the cached days and tasks.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            cache = TaskCache(path)
+            cache.refresh(self.page, "jdoe", DAY)
+            cache.close()
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(main(["days", "account=jdoe", f"db={path}"]), 0)
+                self.assertEqual(
+                    main(["available", "account=jdoe", "day=2024-06-03",
+                          "unrecorded=03:15h", f"db={path}"]),
+                    0,
+                )
+            self.assertIn("2024-06-03  3 task lines", output.getvalue())
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(main(["unknown"]), 2)
+                self.assertEqual(main(["days", "jdoe", f"db={path}"]), 2)
+                self.assertEqual(main(["show", "day=June", f"db={path}"]), 2)
+            self.assertIn("usage error: Expected key=value, got 'jdoe'", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+Module: test_task_row
+
+This module contains unit tests for the module 'task_row.py'.
+It runs the row handles against the daytimerecording HTML fixture through
+the fake driver, so no browser is needed.
+
+Dependencies:
+    - unittest
+    - task_row (the module under test)
+    - fake_driver
+
+Usage:
+    This module can be executed directly to run all unit tests:
+        $ python test_task_row.py
+"""
+
+import unittest
+from typing import Any, List
+from unittest.mock import patch
+from selenium.common.exceptions import JavascriptException, NoSuchElementException
+from pages.base_page import SET_VALUE_SCRIPT, set_value
+from pages.main_page import MainPage
+from pages.task_row import ROW_FIELDS_SCRIPT
+from utils.fake_driver import FakeWebDriver, FakeWebElement, fixture_pages, parse_html
+from utils.time_parser import Duration
+
+BASE_URL: str = "https://projektron.local/bcw"
+
+
+class CountingWebDriver(FakeWebDriver):
+    """
+    Fake driver counting the element queries it answers.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.queries: List[str] = []
+
+    def locate_all(self, by_method: str, value: str, context: Any = None) -> List[Any]:
+        self.queries.append(value)
+        return super().locate_all(by_method, value, context)
+
+
+class TestTaskRow(unittest.TestCase):
+    """
+    Test cases for the TaskRow class.
+    """
+
+    def setUp(self) -> None:
+        self.driver = CountingWebDriver(fixture_pages(BASE_URL))
+        self.page = MainPage(self.driver, base_url=BASE_URL)
+        self.page.open("/daytimerecording")
+
+    def test_row_fields_located_once(self):
+        """
+        Test writing and reading a whole row costs one query and one script
+        locating the fields.
+        """
+        row = self.page.task_row(1)
+        row.set_duration(hours=3, minutes=15)
+        row.set_description("text")
+        row.set_reference("REF")
+        row.set_title("TA")
+        self.assertEqual(row.get_duration_input(), Duration(hours=3, minutes=15))
+        self.assertEqual(row.get_description(), "text")
+        self.assertEqual(row.get_reference(), "REF")
+        self.assertEqual(row.get_title(), "TA")
+        self.assertEqual(row.get_budget(), Duration(days=5))
+        self.assertEqual(row.get_duration(), Duration(days=2, hours=1, minutes=30))
+        self.assertEqual(len(self.driver.queries), 1)
+        self.assertEqual(self.driver.scripts.count(ROW_FIELDS_SCRIPT), 1)
+
+    def test_working_day_length(self):
+        """
+        Test the budget and duration cells count days of the page's working hours.
+        """
+        page = MainPage(self.driver, base_url=BASE_URL, working_hours=7.5)
+        row = page.task_row(1)
+        self.assertEqual(row.get_budget(), Duration(days=5, working_hours=7.5))
+        self.assertEqual(row.get_duration(), Duration(hours=16, minutes=30))
+
+    def test_iter_task_rows_is_lazy(self):
+        """
+        Test the iterator locates the rows once and no fields up front.
+        """
+        rows = self.page.iter_task_rows()
+        self.assertEqual(self.driver.queries, [])
+        handles = list(rows)
+        self.assertEqual([row.index for row in handles], [0, 1, 2])
+        self.assertEqual(len(self.driver.queries), 1)
+        self.assertEqual(handles[2].get_budget(), Duration(hours=10))
+        self.assertEqual(len(self.driver.queries), 1)
+        self.assertEqual(self.driver.scripts.count(ROW_FIELDS_SCRIPT), 1)
+
+    def test_negative_line_rejected(self):
+        """
+        Test line -1, no line with budget left, does not book the last line.
+        """
+        with self.assertRaises(ValueError):
+            self.page.task_row(-1)
+
+    def test_fields_mapped_by_locator(self):
+        """
+        Test a missing field does not shift the others, even when another
+        cell holds an extra field.
+        """
+        self.driver.document = parse_html(
+            "<table id='daytimerecording,Content,daytimerecordingTaskList_table'><tbody><tr>"
+            "<td></td><td>1</td><td>Task</td><td>P</td><td></td>"
+            "<td><input name='title' value='T'><input name='extra' value='X'></td>"
+            + "<td></td>" * 5
+            + "<td>1d 00:00h</td><td>00:00h</td></tr></tbody></table>"
+        )
+        row = self.page.task_row(0)
+        self.assertEqual(row.get_title(), "T")
+        self.assertEqual(row.get_budget(), Duration(days=1))
+        with self.assertRaises(NoSuchElementException):
+            row.get_reference()
+
+    def test_incomplete_row_resolved_per_field(self):
+        """
+        Test a row without inputs still reads and reports missing fields.
+        """
+        self.driver.document = parse_html(
+            "<table id='daytimerecording,Content,daytimerecordingTaskList_table'><tbody><tr>"
+            + "<td></td>" * 11
+            + "<td>1d 00:00h</td><td>00:00h</td></tr></tbody></table>"
+        )
+        row = self.page.task_row(0)
+        self.assertEqual(row.get_budget(), Duration(days=1))
+        with self.assertRaises(NoSuchElementException):
+            row.set_title("TA")
+
+
+class TestSetValue(unittest.TestCase):
+    """
+    Test cases for setting free text without keystrokes.
+    """
+
+    def setUp(self) -> None:
+        self.driver = CountingWebDriver(fixture_pages(BASE_URL))
+        self.page = MainPage(self.driver, base_url=BASE_URL)
+        self.page.open("/daytimerecording")
+
+    def _typed(self) -> List[str]:
+        return [action for action, _ in self.driver.log if action in ("clear", "send_keys")]
+
+    def test_long_description_set_in_one_script(self):
+        """
+        Test a multi-line description of a few KB is set without keystrokes.
+        """
+        text = "\r\n".join(f"line {index} " + "x" * 60 for index in range(64))
+        row = self.page.task_row(1)
+        row.set_description(text)
+        self.assertEqual(row.get_description(), text)
+        self.assertEqual(self._typed(), [])
+        self.assertEqual(self.driver.scripts.count(SET_VALUE_SCRIPT), 1)
+
+    def test_rejected_value_is_typed(self):
+        """
+        Test fields cutting or refusing the value fall back to keystrokes.
+        """
+        row = self.page.task_row(1)
+        field: FakeWebElement = row._field("title")  # pylint: disable=protected-access
+        field.node.attrs["maxlength"] = "2"
+        self.assertFalse(set_value(field, "TAX"))
+        self.assertEqual(self._typed(), ["clear", "send_keys"])
+        field.node.attrs["readonly"] = ""
+        self.assertFalse(set_value(field, "TA"))
+        self.assertTrue(set_value(row._field("reference"), "REF"))  # pylint: disable=protected-access
+        self.assertEqual(len(self._typed()), 4)
+
+    def test_failing_script_types(self):
+        """
+        Test a value script the browser refuses types the text as before.
+        """
+        row = self.page.task_row(0)
+        row.get_title()
+        with patch.object(self.driver, "execute_script",
+                          side_effect=JavascriptException("blocked")):
+            row.set_title("TA")
+        self.assertEqual(row.get_title(), "TA")
+        self.assertEqual(self._typed(), ["clear", "send_keys"])
+
+if __name__ == "__main__":
+    unittest.main()
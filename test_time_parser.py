@@ -14,9 +14,20 @@ Usage:
         $ python test_time_parser.py
 """
 
+import operator
+import random
 import unittest
 
-from utils.time_parser import parse_time_string
+from bench_time_parser import generate_column, regressions
+from utils.time_parser import (
+    Duration,
+    parse_days,
+    parse_hours,
+    parse_minutes,
+    parse_time_string,
+)
+
+FUZZ_CASES: int = 3000
 
 
 class TestParseTimeString(unittest.TestCase):
@@ -47,5 +58,150 @@ class TestParseTimeString(unittest.TestCase):
         )  # 2 days and 4 hours in seconds
 
 
+class TestDuration(unittest.TestCase):
+    """
+    Test cases for the Duration class.
+    """
+
+    def test_parse_projektron_formats(self):
+        """
+        Test the formats Projektron shows are parsed.
+        """
+        self.assertEqual(Duration.parse("2d 01:30h"), Duration(days=2, hours=1, minutes=30))
+        self.assertEqual(Duration.parse("03:15h").total_minutes, 195)
+        self.assertEqual(Duration.parse("03:15"), Duration(hours=3, minutes=15))
+        self.assertEqual(Duration.parse("1d"), Duration(hours=8))
+        self.assertEqual(Duration.parse("-00:30h"), -Duration(minutes=30))
+        self.assertEqual(Duration.parse(""), Duration())
+        with self.assertRaises(ValueError):
+            Duration.parse("three hours")
+
+    def test_format(self):
+        """
+        Test durations are formatted as Projektron shows them.
+        """
+        duration = Duration(days=2, hours=1, minutes=30)
+        self.assertEqual(str(duration), "17:30h")
+        self.assertEqual(duration.format(days=True), "2d 01:30h")
+        self.assertEqual(Duration(minutes=-5).format(), "-00:05h")
+        self.assertEqual(Duration(hours=3, minutes=15).split(), (3, 15))
+        with self.assertRaises(ValueError):
+            Duration(minutes=-5).split()
+
+    def test_arithmetic_and_comparison(self):
+        """
+        Test durations add, subtract, multiply and compare.
+        """
+        self.assertEqual(Duration(hours=1) + Duration(minutes=45), Duration(minutes=105))
+        self.assertEqual(Duration(hours=1) - Duration(minutes=45), Duration(minutes=15))
+        self.assertEqual(Duration(hours=1) * 1.5, Duration(minutes=90))
+        self.assertEqual(2 * Duration(hours=1), Duration(hours=2))
+        self.assertRaises(TypeError, operator.mul, Duration(hours=1), Duration(hours=1))
+        self.assertRaises(TypeError, operator.mul, Duration(hours=1), "2")
+        self.assertEqual(sum([Duration(hours=1), Duration(hours=2)]), Duration(hours=3))
+        self.assertLess(Duration(hours=1), Duration(minutes=61))
+        self.assertGreaterEqual(Duration(hours=1), Duration(minutes=60))
+        self.assertFalse(Duration())
+        self.assertEqual(len({Duration(hours=1), Duration(minutes=60)}), 1)
+
+    def test_immutable(self):
+        """
+        Test a duration cannot be changed.
+        """
+        with self.assertRaises(AttributeError):
+            Duration(hours=1).total_minutes = 5  # type: ignore[misc]
+        with self.assertRaises(AttributeError):
+            setattr(Duration(hours=1), "_minutes", 5)
+
+    def test_working_day_length(self):
+        """
+        Test the working day length is configurable.
+        """
+        self.assertEqual(Duration.parse("1d 00:30h", working_hours=7.5), Duration(hours=8))
+        self.assertEqual(Duration(hours=8).format(days=True, working_hours=7.5), "1d 00:30h")
+        self.assertEqual(Duration(days=1, working_hours=7.5), Duration(hours=7, minutes=30))
+        self.assertEqual(parse_days("1d", working_hours=7.5)["equivalent_seconds"], 27000)
+        self.assertEqual(Duration.parse("1d"), Duration(hours=8))
+        self.assertEqual(parse_time_string("1d 00:00h"), 28800)
+
+
+class TestParserFuzz(unittest.TestCase):
+    """
+    Property tests over generated Projektron cells and random text.
+    """
+
+    def test_generated_cells(self):
+        """
+        Test every generated cell parses, consistently across the functions.
+        """
+        for text in generate_column(FUZZ_CASES, seed=1):
+            duration = Duration.parse(text)
+            self.assertEqual(parse_time_string(text), duration.total_seconds, text)
+            self.assertEqual(
+                parse_days(text)["equivalent_seconds"]
+                + parse_hours(text)["equivalent_seconds"]
+                + parse_minutes(text)["equivalent_seconds"],
+                abs(duration.total_seconds),
+                text,
+            )
+
+    def test_blank_cells(self):
+        """
+        Test blank cells parse to a zero duration instead of an error.
+        """
+        for text in ("", " ", "\u00a0"):
+            self.assertEqual(Duration.parse(text), Duration())
+            self.assertEqual(parse_hours(text)["hours"], 0)
+            self.assertEqual(parse_minutes(text)["minutes"], 0)
+            self.assertEqual(parse_days(text)["days"], 0)
+
+    def test_rejects_incomplete_and_overflowing_durations(self):
+        """
+        Test a bare unit or sign and minutes above 59 are not durations.
+        """
+        for text in ("h", " h ", "-", "d", "1", "1:99h", "1:60", "00:75h"):
+            with self.assertRaises(ValueError, msg=text):
+                Duration.parse(text)
+            with self.assertRaises(ValueError, msg=text):
+                parse_hours(text)
+        self.assertEqual(Duration.parse("1:59h"), Duration(hours=1, minutes=59))
+
+    def test_format_round_trip(self):
+        """
+        Test formatted durations parse back to themselves for any day length.
+        """
+        rng = random.Random(2)
+        for _ in range(FUZZ_CASES):
+            hours = rng.choice([8, 7.5, 6, 10])
+            duration = Duration.from_minutes(rng.randrange(-200000, 200000))
+            self.assertEqual(Duration.parse(duration.format(), hours), duration)
+            self.assertEqual(
+                Duration.parse(duration.format(days=True, working_hours=hours), hours), duration
+            )
+
+    def test_random_text(self):
+        """
+        Test arbitrary text is either a duration or a ValueError, nothing else.
+        """
+        rng = random.Random(3)
+        alphabet = "0123456789:dh -.x\u00a0"
+        for _ in range(FUZZ_CASES):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randrange(12)))
+            for parse in (Duration.parse, parse_time_string, parse_hours, parse_minutes):
+                try:
+                    parse(text)
+                except ValueError:
+                    continue
+
+    def test_regressions(self):
+        """
+        Test only benchmarks slower than the tolerance are reported.
+        """
+        self.assertEqual(
+            regressions({"a": 0.8, "b": 0.6, "c": 2.0}, {"a": 1.0, "b": 1.0, "d": 1.0}, 0.3),
+            ["b"],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
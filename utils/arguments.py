@@ -0,0 +1,48 @@
+"""
+Module: arguments
+
+This module parses the ``key=value`` command-line arguments shared by the
+scripts of this repository, so they do not import each other for it.
+
+Usage:
+    Pass the defaults of the script; arguments given on the command line
+    override them::
+
+        arguments = parse_arguments({"sessions": "1,2,4", "iterations": 3})
+
+Functions:
+    - :func:`parse_arguments`: Parse command-line arguments into a dictionary.
+"""
+
+import sys
+from typing import Dict, List, Optional, Union
+
+
+def parse_arguments(
+    defaults: Optional[Dict[str, Union[int, str]]] = None, argv: Optional[List[str]] = None
+) -> Dict[str, Union[int, str]]:
+    """
+    Parse command-line arguments into a dictionary.
+
+    Args:
+        defaults (dict, optional): A dictionary containing default values for
+        the arguments.
+            If provided, these defaults will be used for any arguments not
+            specified on the command line.
+            Defaults to None.
+        argv (list, optional): The ``key=value`` arguments to parse.
+            Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        dict: A dictionary containing the parsed command-line arguments.
+
+    Raises:
+        ValueError: If an argument has no ``=``.
+    """
+    arguments: Dict[str, Union[int, str]] = defaults if defaults else {}
+    for arg in sys.argv[1:] if argv is None else argv:
+        key, separator, value = arg.partition("=")
+        if not separator:
+            raise ValueError(f"Expected key=value, got {arg!r}")
+        arguments[key] = value
+    return arguments
@@ -0,0 +1,233 @@
+"""
+Module: artifacts
+
+This module captures evidence when a page interaction fails: a screenshot,
+the ``outerHTML`` of the table the failing locator points into and the
+browser console log, and writes it to a run directory in the background.
+
+Usage:
+    Give an :class:`ArtifactWriter` to the page objects; their lookups then
+    call :meth:`ArtifactWriter.capture` when an element is missing, stale or
+    times out::
+
+        writer = ArtifactWriter("artifacts")
+        main_page = MainPage(driver, artifact_writer=writer)
+        ...
+        writer.close()
+
+    Reading the browser state has to happen at once, before the page moves
+    on, but compressing and writing the files is left to a background
+    thread. Nothing is done and no directory is created until a failure.
+
+    Every failure gets a numbered set of files in the run directory:
+    ``.png`` (already compressed), ``.html.gz``, ``.console.json.gz`` and
+    ``.json.gz`` holding the error, traceback, URL and locator.
+
+    When a run starts writing, the oldest runs are deleted until at most
+    ``max_runs`` runs are kept and the older ones use at most half of
+    ``max_bytes``. The run itself stops writing when all runs together
+    would use more than ``max_bytes``.
+
+Classes:
+    - :class:`ArtifactWriter`: Capture failure artifacts and write them in the background.
+"""
+
+import gzip
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+import traceback
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+OUTER_HTML_SCRIPT: str = """
+const node = arguments[0] ? document.evaluate(
+    arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue : null;
+return (node || document.documentElement).outerHTML;
+"""
+
+_TABLE_PATTERN = re.compile(r"^(//table\[[^\]]*\])")
+
+_Artifact = Tuple[str, bytes, bool]
+
+
+def _relevant_xpath(locator: Optional[str]) -> Optional[str]:
+    """
+    Return the XPath of the table a locator points into, if any.
+    """
+    match = _TABLE_PATTERN.match(str(getattr(locator, "value", locator) or ""))
+    return match.group(1) if match else None
+
+
+def _slug(label: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", label).strip("-")[:40] or "failure"
+
+
+def _directory_size(path: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+class ArtifactWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Capture failure artifacts and write them in the background.
+
+    :Attributes:
+        - **directory** (*str*): The directory holding one directory per run.
+        - **run_dir** (*str*): The directory of this run.
+        - **max_bytes** (*int*): Disk usage kept across all runs.
+        - **max_runs** (*int*): Number of runs kept.
+        - **failures** (*int*): Failures captured so far.
+    """
+
+    def __init__(
+        self, directory: str, max_bytes: int = 50 * 2**20, max_runs: int = 20
+    ) -> None:
+        """
+        Initialize the ArtifactWriter.
+
+        :param directory: The directory holding one directory per run.
+        :param max_bytes: Disk usage kept across all runs.
+        :param max_runs: Number of runs kept, this one included.
+        """
+        self.directory: str = directory
+        self.run_dir: str = os.path.join(
+            directory, time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:6]
+        )
+        self.max_bytes: int = max_bytes
+        self.max_runs: int = max_runs
+        self.failures: int = 0
+        self._written: int = 0
+        self._queue: "queue.Queue[Optional[_Artifact]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def capture(
+        self, driver: Any, label: str, error: BaseException, locator: Optional[str] = None
+    ) -> None:
+        """
+        Read the failure evidence from the browser and queue it for writing.
+
+        Every capture is best effort: a browser that cannot answer, or a
+        driver without screenshots or logs, only leaves out that artifact.
+        An error is captured once even if several hooks see it.
+
+        :param driver: The Selenium WebDriver instance.
+        :param label: The failing action, used in the file names.
+        :param error: The error of the failure.
+        :param locator: The locator that failed, to pick the table to dump.
+        """
+        if getattr(error, "artifacts_captured", False):
+            return
+        try:
+            setattr(error, "artifacts_captured", True)
+        except AttributeError:
+            pass
+        with self._lock:
+            self.failures += 1
+            prefix: str = f"{self.failures:03d}-{_slug(label)}"
+        artifacts: List[_Artifact] = []
+        screenshot: Optional[bytes] = self._safely(driver, "get_screenshot_as_png")
+        if screenshot:
+            artifacts.append((prefix + ".png", screenshot, False))
+        html: Optional[str] = self._safely(
+            driver, "execute_script", OUTER_HTML_SCRIPT, _relevant_xpath(locator)
+        )
+        if html:
+            artifacts.append((prefix + ".html.gz", html.encode("utf-8"), True))
+        console: Optional[List[Dict[str, Any]]] = self._safely(driver, "get_log", "browser")
+        if console:
+            artifacts.append((prefix + ".console.json.gz", json.dumps(console).encode(), True))
+        summary: Dict[str, Any] = {
+            "label": label,
+            "error": f"{type(error).__name__}: {error}",
+            "traceback": traceback.format_exception(type(error), error, error.__traceback__),
+            "url": self._safely(driver, "current_url"),
+            "locator": getattr(locator, "value", locator),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        artifacts.append((prefix + ".json.gz", json.dumps(summary, indent=2).encode(), True))
+        self._start()
+        for artifact in artifacts:
+            self._queue.put(artifact)
+
+    @staticmethod
+    def _safely(driver: Any, name: str, *args: Any) -> Any:
+        """
+        Call a driver method or read a driver property, None on any error.
+        """
+        try:
+            value = getattr(driver, name)
+            return value(*args) if callable(value) else value
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+    def _start(self) -> None:
+        """
+        Start the writer thread on the first failure.
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, daemon=True)
+                self._thread.start()
+
+    def _write_loop(self) -> None:
+        """
+        Compress and write queued artifacts until the writer is closed.
+        """
+        os.makedirs(self.run_dir, exist_ok=True)
+        budget: int = self.max_bytes - self.enforce_retention()
+        while True:
+            artifact: Optional[_Artifact] = self._queue.get()
+            if artifact is None:
+                return
+            name, data, compress = artifact
+            payload: bytes = gzip.compress(data) if compress else data
+            if self._written + len(payload) > budget:
+                continue
+            with open(os.path.join(self.run_dir, name), "wb") as artifact_file:
+                artifact_file.write(payload)
+            self._written += len(payload)
+
+    def enforce_retention(self) -> int:
+        """
+        Delete the oldest runs beyond ``max_runs`` or half of ``max_bytes``.
+
+        :return: Bytes used by the older runs that were kept.
+        :rtype: int
+        """
+        if not os.path.isdir(self.directory):
+            return 0
+        current: str = os.path.basename(self.run_dir)
+        runs: List[str] = sorted(
+            name
+            for name in os.listdir(self.directory)
+            if name != current and os.path.isdir(os.path.join(self.directory, name))
+        )
+        sizes: Dict[str, int] = {
+            name: _directory_size(os.path.join(self.directory, name)) for name in runs
+        }
+        while runs and (
+            len(runs) + 1 > self.max_runs
+            or sum(sizes[name] for name in runs) > self.max_bytes // 2
+        ):
+            shutil.rmtree(os.path.join(self.directory, runs.pop(0)), ignore_errors=True)
+        return sum(sizes[name] for name in runs)
+
+    def close(self) -> None:
+        """
+        Wait until every queued artifact is written.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
@@ -0,0 +1,457 @@
+"""
+Module: booking_planner
+
+This module compiles a declarative booking job into an ordered plan of page
+object calls with as few WebDriver commands as possible.
+
+Usage:
+    Describe the day with a :class:`BookingJob`, compile it with
+    :func:`plan_booking`, print :meth:`BookingPlan.describe` to see the
+    estimated command count, then run it with :func:`execute_plan`::
+
+        plan = plan_booking(BookingJob(attendance=(9, 0), rows=(RowAssignment(),)))
+        print(plan.describe())
+        execute_plan(plan, main_page)
+
+    The plan stops without saving when the booking view of the day cannot
+    be opened, when no task line has budget left for the unrecorded efforts,
+    or when every row of the job had nothing to book;
+    the reason is left in the context as ``stopped``. Rows skipped for a
+    zero duration are logged and listed in ``skipped_rows``.
+
+    Compared to calling the page methods one after the other, the planner
+
+    - opens the booking view of the day through its URL instead of waiting
+      for the popup and clicking on the booking tab, and skips even that
+      when the booking form of the day is already loaded,
+    - reads attendance, break, recorded and unrecorded efforts and the typed
+      task durations in one query right after navigating, stops there when
+      the day is already complete, and leaves out attendance and break
+      fields that already hold the job's values and rows that would book
+      zero unrecorded efforts,
+    - reuses the unrecorded efforts of that read to pick the task line, and
+      reads them again only when typing attendance or break changed them,
+    - with a :class:`utils.task_cache.TaskCache` in the context, re-reads only
+      the task lines that changed since the last run and picks the line from
+      the cache,
+    - locates every attendance field once for both clear and send_keys,
+    - locates the fields of a booked task row once, through one row handle,
+      and sets its free text fields with one script each instead of typing,
+    - writes only the fields a row assignment sets.
+
+Classes:
+    - :class:`RowAssignment`: What to book on one task line.
+    - :class:`BookingJob`: Everything to book on one day.
+    - :class:`PlanStep`: One step of a plan.
+    - :class:`BookingPlan`: The ordered steps of a job.
+
+Functions:
+    - :func:`plan_booking`: Compile a job into a plan.
+    - :func:`execute_plan`: Run a plan against the main page.
+    - :func:`naive_command_count`: Commands the unplanned script issues for a job.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from selenium.common.exceptions import WebDriverException
+from pages.main_page import MainPage
+from utils.day_state import DayState, DaySnapshot
+from utils.structured_log import log_context
+from utils.time_parser import Duration
+
+Context = Dict[str, Any]
+
+logger: logging.Logger = logging.getLogger("projektron.planner")
+
+
+def _duration_spec(value: Any) -> Optional[Duration]:
+    """
+    Read a duration given as ``[hours, minutes]`` or as text, None if empty.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        return Duration.parse(value)
+    hours, minutes = value
+    return Duration(hours=hours, minutes=minutes)
+
+
+@dataclass(frozen=True)
+class RowAssignment:
+    """
+    What to book on one task line.
+
+    :Attributes:
+        - **task_line** (*int*): Index of the task line, None for the first
+          line with budget left.
+        - **duration** (*Duration*): Booked duration, None for the
+          unrecorded efforts of the day.
+        - **description** (*str*): Description, None to leave it untouched.
+        - **reference** (*str*): Reference, None to leave it untouched.
+        - **title** (*str*): Title, None to leave it untouched.
+    """
+
+    task_line: Optional[int] = None
+    duration: Optional[Duration] = None
+    description: Optional[str] = None
+    reference: Optional[str] = None
+    title: Optional[str] = None
+
+    @property
+    def books_unrecorded_efforts(self) -> bool:
+        """
+        Whether the booked duration is the unrecorded efforts of the day.
+        """
+        return self.duration is None
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "RowAssignment":
+        """
+        Build a row assignment from a JSON like dictionary.
+
+        :param spec: :class:`RowAssignment` fields, the duration either as
+            ``duration`` text such as ``"01:30h"`` or as ``hours`` and ``minutes``.
+        :return: The row assignment.
+        """
+        fields: Dict[str, Any] = dict(spec)
+        hours, minutes = fields.pop("hours", None), fields.pop("minutes", None)
+        if "duration" in fields:
+            fields["duration"] = Duration.parse(fields["duration"])
+        elif hours is not None or minutes is not None:
+            fields["duration"] = Duration(hours=hours or 0, minutes=minutes or 0)
+        return cls(**fields)
+
+
+@dataclass(frozen=True)
+class BookingJob:
+    """
+    Everything to book on one day.
+
+    :Attributes:
+        - **day** (*date*): The day to book, None for the day Projektron shows.
+        - **attendance** (*Duration*): Attendance, None to skip.
+        - **break_duration** (*Duration*): Break, None to skip.
+        - **rows** (*Tuple[RowAssignment, ...]*): The task lines to book.
+        - **save** (*bool*): Whether to click on the save button at the end.
+    """
+
+    day: Optional[date] = None
+    attendance: Optional[Duration] = Duration(hours=8)
+    break_duration: Optional[Duration] = Duration(minutes=45)
+    rows: Tuple[RowAssignment, ...] = ()
+    save: bool = False
+
+    def __post_init__(self) -> None:
+        """
+        Reject jobs that would book the first available line twice.
+
+        :raises ValueError: If more than one row has no task line.
+        """
+        if sum(row.task_line is None for row in self.rows) > 1:
+            raise ValueError("Only one row can book the first available task line")
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "BookingJob":
+        """
+        Build a job from a JSON like dictionary.
+
+        :param spec: Keys ``day`` (ISO date), ``attendance`` and ``break`` as
+            ``[hours, minutes]`` or duration text such as ``"08:30h"``,
+            ``rows`` as a list of :meth:`RowAssignment.from_dict` specs and
+            ``save``.
+        :return: The job.
+        """
+        return cls(
+            day=date.fromisoformat(spec["day"]) if spec.get("day") else None,
+            attendance=_duration_spec(spec.get("attendance")),
+            break_duration=_duration_spec(spec.get("break")),
+            rows=tuple(RowAssignment.from_dict(row) for row in spec.get("rows", [])),
+            save=bool(spec.get("save", False)),
+        )
+
+
+@dataclass
+class PlanStep:
+    """
+    One step of a plan.
+
+    :Attributes:
+        - **name** (*str*): Human readable description of the step.
+        - **commands** (*int*): Estimated number of WebDriver commands.
+        - **action** (*Callable*): Runs the step against the main page and
+          the context shared by all steps.
+    """
+
+    name: str
+    commands: int
+    action: Callable[[MainPage, Context], None]
+
+
+@dataclass
+class BookingPlan:
+    """
+    The ordered steps of a job.
+
+    :Attributes:
+        - **job** (:class:`BookingJob`): The compiled job.
+        - **steps** (*List[PlanStep]*): The steps in execution order.
+    """
+
+    job: BookingJob
+    steps: List[PlanStep] = field(default_factory=list)
+
+    @property
+    def estimated_commands(self) -> int:
+        """
+        Estimated number of WebDriver commands of the whole plan.
+        """
+        return sum(step.commands for step in self.steps)
+
+    def describe(self) -> str:
+        """
+        Return the plan as readable text, one step per line.
+        """
+        lines = [f"{step.commands:>4}  {step.name}" for step in self.steps]
+        lines.append(f"{self.estimated_commands:>4}  WebDriver commands estimated")
+        return "\n".join(lines)
+
+
+# Estimated WebDriver commands of the page object primitives
+SCRIPT = 1
+FIND = 1
+CLICK = 1
+NAVIGATE = 1
+TYPE_FIELD = FIND + 2  # find, clear, send_keys
+READ_FIELD = FIND + 1  # find, get_attribute or text
+SET_TEXT = SCRIPT  # set the value, fire the events and read it back
+ROW_HANDLE = 2 * FIND  # the row, then all of its fields at once
+
+
+def _stop(context: Context, reason: str) -> None:
+    """
+    Stop the plan after the current step, leaving the reason in the context.
+    """
+    context["stopped"] = reason
+    context["done"] = True
+
+
+def _open_day(day: Optional[date], day_name: str) -> PlanStep:
+    def action(main_page: MainPage, context: Context) -> None:
+        if not main_page.open_day(day):
+            _stop(context, f"the booking view of {day_name} could not be opened")
+            return
+        if context.get("task_cache") is not None and context.get("day") is None:
+            context["day"] = main_page.shown_day()
+            if context["day"] is None:
+                logger.warning("task cache skipped, the shown day is unknown")
+                del context["task_cache"]
+
+    return PlanStep(
+        f"open the booking view of {day_name} unless already there",
+        FIND + NAVIGATE + FIND + CLICK + FIND,
+        action,
+    )
+
+
+def _check_day() -> PlanStep:
+    def action(main_page: MainPage, context: Context) -> None:
+        snapshot: DaySnapshot = main_page.read_day_state()
+        context["day_snapshot"] = snapshot
+        context["day_state"] = snapshot.state
+        context["unrecorded"] = snapshot.unrecorded
+        context["done"] = snapshot.state is DayState.COMPLETE
+
+    return PlanStep("check whether the day is already booked", SCRIPT, action)
+
+
+def _read_state(expected_rows: int) -> PlanStep:
+    def action(main_page: MainPage, context: Context) -> None:
+        unrecorded: Duration = context["unrecorded"]
+        cache = context.get("task_cache")
+        if cache is not None:
+            account, day = context["account"], context["day"]
+            cache.refresh(main_page, account, day)
+            context["first_available_line"] = cache.first_available_line(
+                account, day, unrecorded
+            )
+        else:
+            context["first_available_line"] = main_page.get_first_available_task(
+                unrecorded_time=unrecorded
+            )
+        if context["first_available_line"] < 0:
+            _stop(context, f"no task line has budget left for {unrecorded}")
+
+    return PlanStep("read task budgets once", 2 * (FIND + expected_rows), action)
+
+
+def _reread_unrecorded() -> PlanStep:
+    def action(main_page: MainPage, context: Context) -> None:
+        if not context.get("written"):
+            return
+        snapshot: DaySnapshot = main_page.read_day_state()
+        context["day_snapshot"] = snapshot
+        context["unrecorded"] = snapshot.unrecorded
+
+    return PlanStep("read the unrecorded efforts again if attendance or break were typed",
+                    SCRIPT, action)
+
+
+def _type_duration(
+    name: str, method: Callable[[MainPage], Callable[..., None]], duration: Duration
+) -> PlanStep:
+    def action(main_page: MainPage, context: Context) -> None:
+        if getattr(context["day_snapshot"], name) == duration:
+            return
+        method(main_page)(duration=duration)
+        context["written"] = True
+
+    return PlanStep(f"type {name} {duration} unless already there", 2 * TYPE_FIELD, action)
+
+
+def _book_row(index: int, row: RowAssignment) -> PlanStep:
+    fields: List[str] = ["duration"] + [
+        name
+        for name in ("description", "reference", "title")
+        if getattr(row, name) is not None
+    ]
+
+    def action(main_page: MainPage, context: Context) -> None:
+        duration: Duration = context["unrecorded"] if row.duration is None else row.duration
+        line: int = (
+            row.task_line if row.task_line is not None else context["first_available_line"]
+        )
+        if duration <= Duration():
+            logger.warning("row skipped, nothing to book", extra={"row": index, "line": line})
+            context.setdefault("skipped_rows", []).append(index)
+            return
+        task_row = main_page.task_row(line)
+        task_row.set_duration(duration=duration)
+        if row.description is not None:
+            task_row.set_description(row.description)
+        if row.reference is not None:
+            task_row.set_reference(row.reference)
+        if row.title is not None:
+            task_row.set_title(row.title)
+        context.setdefault("booked_rows", []).append((row, line, duration))
+        context["written"] = True
+
+    line_name = "first available line" if row.task_line is None else f"line {row.task_line}"
+    return PlanStep(
+        f"book row {index} on {line_name}: {', '.join(fields)}",
+        ROW_HANDLE + 4 + SET_TEXT * (len(fields) - 1),
+        action,
+    )
+
+
+def _save(books_rows: bool) -> PlanStep:
+    def action(main_page: MainPage, context: Context) -> None:
+        if books_rows and not context.get("booked_rows"):
+            _stop(context, "no task row was booked, the day is not saved")
+        elif context.get("written"):
+            main_page.click_on_save_button()
+            context["saved"] = True
+
+    return PlanStep("save if anything was typed and a row was booked", FIND + CLICK, action)
+
+
+def plan_booking(job: BookingJob, expected_rows: int = 10) -> BookingPlan:
+    """
+    Compile a job into an ordered plan.
+
+    :param job: The job to compile.
+    :param expected_rows: Task lines assumed for the command estimate.
+    :return: The plan.
+    :rtype: BookingPlan
+    """
+    plan = BookingPlan(job)
+    day_name: str = job.day.isoformat() if job.day else "the default day"
+    plan.steps.append(_open_day(job.day, day_name))
+    plan.steps.append(_check_day())
+    if job.attendance is not None:
+        plan.steps.append(
+            _type_duration("attendance", lambda page: page.type_attendance_duration,
+                           job.attendance)
+        )
+    if job.break_duration is not None:
+        plan.steps.append(
+            _type_duration("break_duration", lambda page: page.type_break_duration,
+                           job.break_duration)
+        )
+    if any(row.task_line is None or row.books_unrecorded_efforts for row in job.rows) and (
+        job.attendance is not None or job.break_duration is not None
+    ):
+        plan.steps.append(_reread_unrecorded())
+    if any(row.task_line is None for row in job.rows):
+        plan.steps.append(_read_state(expected_rows))
+    for index, row in enumerate(job.rows):
+        plan.steps.append(_book_row(index, row))
+    if job.save:
+        plan.steps.append(_save(bool(job.rows)))
+    return plan
+
+
+def execute_plan(
+    plan: BookingPlan, main_page: MainPage, context: Optional[Context] = None
+) -> Context:
+    """
+    Run a plan against the main page.
+
+    A step failing with a WebDriver error has its failure artifacts captured
+    by the page, unless a lookup inside the step already did. Records logged
+    during a step carry its name as ``step``. The plan stops early once a
+    step sets ``done`` in the context, e.g. on a day that is already booked,
+    or when it cannot go on, with the reason in ``stopped``.
+
+    :param plan: The plan to run.
+    :param main_page: The main page, logged in.
+    :param context: The initial context, e.g. ``task_cache`` with the
+        ``account`` and ``day`` it is keyed by; a ``day`` of None is the day
+        the opened page shows, and without one the cache is not used.
+    :return: The context filled by the steps, e.g. ``day_state``,
+        ``first_available_line``, ``stopped``, ``saved`` and ``booked_rows``
+        holding the assignment, task line and duration of every booked row.
+    :rtype: Dict[str, Any]
+    """
+    context = {} if context is None else context
+    for step in plan.steps:
+        with log_context(step=step.name):
+            try:
+                step.action(main_page, context)
+            except WebDriverException as error:
+                main_page.capture_failure(step.name, error)
+                raise
+        if context.get("stopped"):
+            logger.warning("plan stopped, remaining steps skipped",
+                           extra={"reason": context["stopped"]})
+            break
+        if context.get("done"):
+            logger.info("day already booked, remaining steps skipped")
+            break
+    return context
+
+
+def naive_command_count(job: BookingJob, expected_rows: int = 10) -> int:
+    """
+    Estimate the WebDriver commands of calling the page methods one by one,
+    as the unplanned script does: two popup waits, a tab click, two lookups
+    per attendance field, a second read of the unrecorded efforts and a new
+    row handle for every task field.
+
+    :param job: The job to estimate.
+    :param expected_rows: Task lines assumed for the estimate.
+    :return: The estimated command count.
+    :rtype: int
+    """
+    commands = 3 * (FIND + CLICK)
+    commands += 2 * 4 * (job.attendance is not None) + 2 * 4 * (job.break_duration is not None)
+    for row in job.rows:
+        if row.task_line is None:
+            commands += 2 * (FIND + expected_rows) + 2 * READ_FIELD
+        if row.books_unrecorded_efforts:
+            commands += 2 * READ_FIELD
+        commands += (ROW_HANDLE + 4) + (ROW_HANDLE + 2) * sum(
+            getattr(row, name) is not None for name in ("description", "reference", "title")
+        )
+    return commands + (FIND + CLICK) * job.save
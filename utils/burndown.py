@@ -0,0 +1,376 @@
+"""
+Module: burndown
+
+This module collects the task budgets and booked durations of a date range
+into the task cache and turns them into burn-down summaries per task and per
+person.
+
+Usage:
+    Collect the days of every account in parallel, one logged in browser
+    session per account, then summarize from the cache::
+
+        results = collect_accounts(accounts, chrome_factory, ".task_cache.sqlite", days)
+        points = burndown_points(TaskCache(".task_cache.sqlite"), ["jdoe"], days)
+        print(markdown_table([summary.as_row() for summary in summarize_tasks(points)]))
+
+    :func:`utils.tables.markdown_table` and :func:`utils.tables.write_csv`
+    write the summaries.
+
+    Days already in the cache are not scraped again, except today and later
+    days whose bookings may still change. A day Projektron does not open
+    through its URL is skipped rather than cached with the default day.
+
+Classes:
+    - :class:`CollectResult`: Outcome of collecting the days of one account.
+    - :class:`BurndownPoint`: Budget and booked duration of a task on one day.
+    - :class:`TaskSummary`: Burn-down of one task over the range.
+    - :class:`PersonSummary`: Burn-down of all tasks of one person.
+
+Functions:
+    - :func:`date_range`: The days of a range, weekends left out by default.
+    - :func:`collect_days`: Scrape the missing days of one logged in session.
+    - :func:`collect_accounts`: Scrape the missing days of several accounts in parallel.
+    - :func:`burndown_points`: Read the cached points of a range.
+    - :func:`summarize_tasks`: Summarize the points per task.
+    - :func:`summarize_people`: Summarize the task summaries per person.
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from pages.login_page import LoginPage
+from pages.main_page import MainPage
+from utils.driver_manager import DriverManager
+from utils.secret_manager import EmptySecretsError, MissingKeyError
+from utils.task_cache import TaskCache
+from utils.time_parser import Duration
+
+DriverFactory = Callable[[], WebDriver]
+
+COLLECT_FAILURES = (WebDriverException, sqlite3.Error, EmptySecretsError, MissingKeyError)
+
+
+def date_range(start: date, end: date, weekends: bool = False) -> List[date]:
+    """
+    Return the days from start to end, both included.
+
+    :param start: The first day.
+    :param end: The last day.
+    :param weekends: Whether Saturdays and Sundays are included.
+    :return: The days in order.
+    :rtype: List[date]
+    """
+    return [
+        start + timedelta(days=offset)
+        for offset in range((end - start).days + 1)
+        if weekends or (start + timedelta(days=offset)).weekday() < 5
+    ]
+
+
+@dataclass
+class CollectResult:
+    """
+    Outcome of collecting the days of one account.
+
+    :Attributes:
+        - **account** (*str*): The account.
+        - **scraped** (*List[date]*): Days read from Projektron.
+        - **cached** (*List[date]*): Days already in the cache.
+        - **skipped** (*List[date]*): Days Projektron did not open.
+        - **error** (*str*): The error that stopped the collection, if any.
+    """
+
+    account: str
+    scraped: List[date] = field(default_factory=list)
+    cached: List[date] = field(default_factory=list)
+    skipped: List[date] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def collect_days(
+    main_page: MainPage, cache: TaskCache, account: str, days: List[date],
+    result: Optional[CollectResult] = None,
+) -> CollectResult:
+    """
+    Scrape the days of a range that are missing from the cache.
+
+    :param main_page: The main page of a logged in session.
+    :param cache: The task cache.
+    :param account: The account of the session.
+    :param days: The days to collect.
+    :param result: The result to fill, a new one when omitted.
+    :return: The days scraped, found in the cache and skipped.
+    :rtype: CollectResult
+    """
+    result = result if result is not None else CollectResult(account)
+    today: date = date.today()
+    for day in days:
+        if day < today and cache.is_cached(account, day):
+            result.cached.append(day)
+        elif main_page.open_day(day):
+            cache.refresh(main_page, account, day)
+            result.scraped.append(day)
+        else:
+            result.skipped.append(day)
+    return result
+
+
+def _collect_account(  # pylint: disable=too-many-arguments
+    factory: DriverFactory,
+    credentials: Tuple[str, str],
+    cache_path: str,
+    days: List[date],
+    page_options: Dict[str, Any],
+    result: CollectResult,
+) -> None:
+    """
+    Log in once with an account and collect its missing days.
+    """
+    username, password = credentials
+
+    def login(driver: WebDriver) -> None:
+        login_page = LoginPage(driver, **page_options)
+        login_page.open()
+        login_page.login(user=username, password=password)
+
+    cache: Optional[TaskCache] = None
+    try:
+        cache = TaskCache(cache_path)
+        with DriverManager(factory, login, max_jobs=0) as manager:
+            with manager.job() as driver:
+                collect_days(MainPage(driver, **page_options), cache, username, days, result)
+    except COLLECT_FAILURES as error:
+        result.error = f"{type(error).__name__}: {error}"
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def _base_url(base_urls: Optional[Dict[str, str]], username: str) -> Dict[str, str]:
+    url: Optional[str] = (base_urls or {}).get(username)
+    return {"base_url": url} if url else {}
+
+
+def collect_accounts(  # pylint: disable=too-many-arguments
+    accounts: List[Tuple[str, str]],
+    factory: DriverFactory,
+    cache_path: str,
+    days: List[date],
+    page_options: Optional[Dict[str, Any]] = None,
+    base_urls: Optional[Dict[str, str]] = None,
+) -> List[CollectResult]:
+    """
+    Collect the missing days of several accounts, one thread and browser
+    session per account.
+
+    :param accounts: The usernames and passwords.
+    :param factory: Creates the driver of each session.
+    :param cache_path: The task cache file, shared by all sessions through
+        a connection each.
+    :param days: The days to collect.
+    :param page_options: Keyword arguments of the page objects, e.g. ``base_url``.
+    :param base_urls: The base URL per username, for accounts of other
+        Projektron instances than the one of ``page_options``.
+    :return: One result per account, in the order of the accounts; an
+        account failing with one of :data:`COLLECT_FAILURES` has it in its
+        ``error`` and does not stop the others.
+    :rtype: List[CollectResult]
+    """
+    TaskCache(cache_path).close()
+    results: List[CollectResult] = [CollectResult(username) for username, _ in accounts]
+    threads = [
+        threading.Thread(
+            target=_collect_account,
+            args=(
+                factory, credentials, cache_path, days,
+                {**(page_options or {}), **_base_url(base_urls, credentials[0])}, result,
+            ),
+        )
+        for credentials, result in zip(accounts, results)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@dataclass(frozen=True)
+class BurndownPoint:
+    """
+    Budget and booked duration of a task on one day.
+
+    :Attributes:
+        - **account** (*str*): The person the task list belongs to.
+        - **day** (*date*): The day.
+        - **task** (*str*): The task name.
+        - **project** (*str*): The project name.
+        - **budget** (*Duration*): The budget of the task.
+        - **duration** (*Duration*): The duration booked on the task so far.
+    """
+
+    account: str
+    day: date
+    task: str
+    project: str
+    budget: Duration
+    duration: Duration
+
+
+def burndown_points(cache: TaskCache, accounts: List[str], days: List[date]) -> List[BurndownPoint]:
+    """
+    Read the cached task lines of a range as burn-down points.
+
+    :param cache: The task cache.
+    :param accounts: The accounts.
+    :param days: The days.
+    :return: The points by account, day and task line.
+    :rtype: List[BurndownPoint]
+    """
+    return [
+        BurndownPoint(account, day, task.name, task.project, task.budget, task.duration)
+        for account in accounts
+        for day in days
+        for task in cache.tasks(account, day)
+    ]
+
+
+@dataclass
+class TaskSummary:
+    """
+    Burn-down of one task of one person over the range.
+
+    :Attributes:
+        - **account** (*str*): The person.
+        - **task** (*str*): The task name.
+        - **project** (*str*): The project name.
+        - **budget** (*Duration*): The budget on the last day.
+        - **start** (*Duration*): The duration booked on the first day.
+        - **end** (*Duration*): The duration booked on the last day.
+        - **days** (*int*): Days the task was seen on.
+    """
+
+    account: str
+    task: str
+    project: str
+    budget: Duration
+    start: Duration
+    end: Duration
+    days: int = 1
+
+    @property
+    def consumed(self) -> Duration:
+        """
+        The duration booked within the range.
+        """
+        return self.end - self.start
+
+    @property
+    def left(self) -> Duration:
+        """
+        The budget left at the end of the range.
+        """
+        return self.budget - self.end
+
+    @property
+    def used_percent(self) -> float:
+        """
+        The share of the budget booked at the end of the range.
+        """
+        if not self.budget:
+            return 0.0
+        return 100 * self.end.total_minutes / self.budget.total_minutes
+
+    def as_row(self) -> Dict[str, str]:
+        """
+        Return the summary as a table row.
+        """
+        return {
+            "person": self.account,
+            "project": self.project,
+            "task": self.task,
+            "budget": self.budget.format(days=True),
+            "booked_in_range": self.consumed.format(days=True),
+            "booked_total": self.end.format(days=True),
+            "left": self.left.format(days=True),
+            "used_%": f"{self.used_percent:.0f}",
+            "days": str(self.days),
+        }
+
+
+def summarize_tasks(points: List[BurndownPoint]) -> List[TaskSummary]:
+    """
+    Summarize burn-down points per person and task.
+
+    :param points: The points, in day order per person.
+    :return: The summaries, in the order the tasks first appear.
+    :rtype: List[TaskSummary]
+    """
+    summaries: Dict[Tuple[str, str, str], TaskSummary] = {}
+    for point in sorted(points, key=lambda point: point.day):
+        key = (point.account, point.project, point.task)
+        summary: Optional[TaskSummary] = summaries.get(key)
+        if summary is None:
+            summaries[key] = TaskSummary(
+                point.account, point.task, point.project,
+                point.budget, point.duration, point.duration,
+            )
+            continue
+        summary.budget = point.budget
+        summary.end = point.duration
+        summary.days += 1
+    return sorted(summaries.values(), key=lambda summary: (summary.account, summary.project))
+
+
+@dataclass
+class PersonSummary:
+    """
+    Burn-down of all tasks of one person over the range.
+
+    :Attributes:
+        - **account** (*str*): The person.
+        - **tasks** (*int*): Number of tasks.
+        - **budget** (*Duration*): Sum of the task budgets.
+        - **consumed** (*Duration*): Duration booked within the range.
+        - **left** (*Duration*): Budget left at the end of the range.
+    """
+
+    account: str
+    tasks: int = 0
+    budget: Duration = Duration()
+    consumed: Duration = Duration()
+    left: Duration = Duration()
+
+    def as_row(self) -> Dict[str, str]:
+        """
+        Return the summary as a table row.
+        """
+        return {
+            "person": self.account,
+            "tasks": str(self.tasks),
+            "budget": self.budget.format(days=True),
+            "booked_in_range": self.consumed.format(days=True),
+            "left": self.left.format(days=True),
+        }
+
+
+def summarize_people(summaries: List[TaskSummary]) -> List[PersonSummary]:
+    """
+    Summarize task summaries per person.
+
+    :param summaries: The task summaries.
+    :return: One summary per person, by name.
+    :rtype: List[PersonSummary]
+    """
+    people: Dict[str, PersonSummary] = {}
+    for summary in summaries:
+        person: PersonSummary = people.setdefault(summary.account, PersonSummary(summary.account))
+        person.tasks += 1
+        person.budget += summary.budget
+        person.consumed += summary.consumed
+        person.left += summary.left
+    return [people[account] for account in sorted(people)]
@@ -0,0 +1,308 @@
+"""
+Module: credential_store
+
+This module keeps the credentials of many Projektron accounts in one local
+file, encrypted with a key derived from a master password, for team-wide
+and pooled bookings where one '.env' triple is not enough.
+
+Usage:
+    Open the store once with the master password, then fetch the accounts
+    the workers need::
+
+        store = CredentialStore("team.credentials", master_key)
+        credentials = store.get("jdoe")
+        login_page.login(user=credentials.username, password=credentials.password)
+
+    The master password is stretched with scrypt once per opening, so
+    guessing it costs as much. Every account is encrypted on its own and
+    only decrypted by :meth:`CredentialStore.get`; opening a store only reads
+    the index, so a roster of hundreds of accounts opens in the time of the
+    key derivation. The index maps a keyed hash of the username to the
+    entry, so usernames are not readable in the file either.
+
+    Entries are encrypted with AES-256-GCM from the ``cryptography``
+    package under a random nonce, with the index of the entry as associated
+    data, so an entry edited or moved to another account fails its
+    authentication tag instead of decrypting. A wrong master password is
+    rejected when opening, by a keyed check value stored next to the index.
+
+    ``Credentials`` answers the :class:`utils.secret_manager.SecretValues`
+    keys like the '.env' file, so code written for one account keeps
+    working: ``credentials[SecretValues.PASSWORD]``.
+
+    The store is managed from the command line; passwords are prompted
+    for, the master password is read from ``PROJEKTRON_MASTER_KEY`` or
+    prompted for::
+
+        $ python -m utils.credential_store add team.credentials jdoe url=https://bcs.example.com
+        $ python -m utils.credential_store import team.credentials team.json
+        $ python -m utils.credential_store list team.credentials
+        $ python -m utils.credential_store remove team.credentials jdoe
+
+Classes:
+    - :class:`InvalidMasterKeyError`: Raised when the master password does not open the store.
+    - :class:`CorruptEntryError`: Raised when an entry fails its integrity check.
+    - :class:`Credentials`: The credentials of one account.
+    - :class:`CredentialStore`: The encrypted multi-account store.
+
+Functions:
+    - :func:`read_master_key`: Read the master password from the environment or a prompt.
+"""
+
+import base64
+import getpass
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Union
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from utils.arguments import parse_arguments
+from utils.secret_manager import MissingKeyError, SecretValues
+
+MASTER_KEY_VARIABLE: str = "PROJEKTRON_MASTER_KEY"
+VERSION: int = 2
+NONCE_SIZE: int = 12
+SCRYPT_PARAMETERS: Dict[str, int] = {"n": 2**14, "r": 8, "p": 1}
+_CHECK: bytes = b"projektron credential store"
+
+
+class InvalidMasterKeyError(Exception):
+    """Custom exception for a master password that does not open the store."""
+
+
+class CorruptEntryError(Exception):
+    """Custom exception for an entry failing its integrity check."""
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """
+    The credentials of one account.
+
+    :Attributes:
+        - **username** (*str*): The username/email.
+        - **password** (*str*): The password, left out of ``repr``.
+        - **url** (*str, optional*): The base URL of the Projektron instance.
+    """
+
+    username: str
+    password: str = field(repr=False)
+    url: Optional[str] = None
+
+    def __getitem__(self, key: str) -> str:
+        """
+        Return a value by its '.env' key.
+
+        :param key: One of :class:`utils.secret_manager.SecretValues`.
+        :return: The value.
+        :raises MissingKeyError: If the account has no value for the key.
+        """
+        value: Optional[str] = {
+            SecretValues.USERNAME.value: self.username,
+            SecretValues.PASSWORD.value: self.password,
+            SecretValues.URL.value: self.url,
+        }.get(getattr(key, "value", key))
+        if not value:
+            raise MissingKeyError(f"{key} not set for {self.username}")
+        return value
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def read_master_key(prompt: str = "Master password: ") -> str:
+    """
+    Read the master password from ``PROJEKTRON_MASTER_KEY``, or prompt for it.
+
+    :param prompt: The prompt shown when the variable is not set.
+    :return: The master password.
+    :rtype: str
+    """
+    return os.environ.get(MASTER_KEY_VARIABLE) or getpass.getpass(prompt)
+
+
+class CredentialStore:
+    """
+    Encrypted store of the credentials of many accounts.
+
+    :Attributes:
+        - **path** (*str*): The store file.
+    """
+
+    def __init__(self, path: str, master_key: str, create: bool = False) -> None:
+        """
+        Open the store, or start a new one.
+
+        :param path: The store file.
+        :param master_key: The master password.
+        :param create: Start an empty store when the file does not exist.
+        :raises FileNotFoundError: If the file does not exist and ``create`` is False.
+        :raises InvalidMasterKeyError: If the master password does not open the store.
+        """
+        self.path: str = path
+        if create and not os.path.exists(path):
+            data: Dict[str, Any] = {
+                "version": VERSION,
+                "kdf": {"name": "scrypt", "salt": _b64(secrets.token_bytes(16)),
+                        **SCRYPT_PARAMETERS},
+                "entries": {},
+            }
+        else:
+            with open(path, encoding="utf-8") as store_file:
+                data = json.load(store_file)
+        kdf: Dict[str, Any] = data["kdf"]
+        key: bytes = hashlib.scrypt(
+            master_key.encode("utf-8"), salt=base64.b64decode(kdf["salt"]),
+            n=kdf["n"], r=kdf["r"], p=kdf["p"], maxmem=2**26, dklen=96,
+        )
+        self._cipher: AESGCM = AESGCM(key[:32])
+        self._mac_key, self._index_key = key[32:64], key[64:]
+        check: str = _b64(hmac.digest(self._mac_key, _CHECK, "sha256"))
+        if "check" in data and not hmac.compare_digest(check, data["check"]):
+            raise InvalidMasterKeyError(f"The master password does not open {path}")
+        data["check"] = check
+        self._data: Dict[str, Any] = data
+        self._entries: Dict[str, str] = data["entries"]
+
+    def _index(self, username: str) -> str:
+        return hmac.digest(self._index_key, username.encode("utf-8"), "sha256").hex()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, username: object) -> bool:
+        return isinstance(username, str) and self._index(username) in self._entries
+
+    def get(self, username: str) -> Credentials:
+        """
+        Decrypt the credentials of one account.
+
+        :param username: The username of the account.
+        :return: The credentials.
+        :raises KeyError: If the account is not in the store.
+        :raises CorruptEntryError: If the entry fails its integrity check.
+        """
+        index: str = self._index(username)
+        if index not in self._entries:
+            raise KeyError(username)
+        return self._decrypt(index)
+
+    def _decrypt(self, index: str) -> Credentials:
+        sealed: bytes = base64.b64decode(self._entries[index])
+        try:
+            plaintext: bytes = self._cipher.decrypt(
+                sealed[:NONCE_SIZE], sealed[NONCE_SIZE:], index.encode("ascii")
+            )
+        except InvalidTag as error:
+            raise CorruptEntryError(f"Entry {index[:12]} of {self.path} was modified") from error
+        return Credentials(**json.loads(plaintext))
+
+    def __iter__(self) -> Iterator[Credentials]:
+        """
+        Decrypt the credentials of every account, one at a time.
+        """
+        for index in list(self._entries):
+            yield self._decrypt(index)
+
+    def set(self, credentials: Credentials) -> None:
+        """
+        Add or replace the credentials of an account; call :meth:`save` to keep them.
+
+        :param credentials: The credentials.
+        """
+        index: str = self._index(credentials.username)
+        plaintext: bytes = json.dumps(asdict(credentials)).encode("utf-8")
+        nonce: bytes = secrets.token_bytes(NONCE_SIZE)
+        sealed: bytes = self._cipher.encrypt(nonce, plaintext, index.encode("ascii"))
+        self._entries[index] = _b64(nonce + sealed)
+
+    def remove(self, username: str) -> None:
+        """
+        Remove an account; call :meth:`save` to keep the change.
+
+        :param username: The username of the account.
+        :raises KeyError: If the account is not in the store.
+        """
+        index: str = self._index(username)
+        if index not in self._entries:
+            raise KeyError(username)
+        del self._entries[index]
+
+    def save(self) -> None:
+        """
+        Write the store, readable by the current user only.
+        """
+        temporary: str = f"{self.path}.{os.getpid()}.tmp"
+        descriptor: int = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as store_file:
+            json.dump(self._data, store_file)
+        os.replace(temporary, self.path)
+
+
+def main(argv: List[str]) -> int:
+    """
+    Manage a store from the command line.
+
+    :param argv: The command (``add``, ``import``, ``list`` or ``remove``),
+        the store file and the username or accounts JSON file, followed by
+        ``key=value`` arguments: ``url``.
+    :return: The exit status.
+    :rtype: int
+    """
+    if len(argv) < 2 or argv[0] not in ("add", "import", "list", "remove"):
+        print(__doc__)
+        return 2
+    command, path = argv[:2]
+    options: List[str] = argv[2:]
+    operand: str = ""
+    if command != "list":
+        if not options or "=" in options[0]:
+            what: str = "an accounts JSON file" if command == "import" else "a username"
+            print(f"usage error: {command} needs {what} after the store file")
+            return 2
+        operand, options = options[0], options[1:]
+    try:
+        arguments: Dict[str, Union[int, str]] = parse_arguments({}, options)
+    except ValueError as error:
+        print(f"usage error: {error}")
+        return 2
+    url: Optional[str] = str(arguments["url"]) if "url" in arguments else None
+    try:
+        store = CredentialStore(path, read_master_key(), create=command in ("add", "import"))
+    except (OSError, InvalidMasterKeyError) as error:
+        print(error)
+        return 1
+    if command == "list":
+        for credentials in store:
+            print(f"{credentials.username}  {credentials.url or ''}")
+        return 0
+    try:
+        if command == "add":
+            store.set(Credentials(operand, getpass.getpass(f"Password of {operand}: "), url))
+        elif command == "import":
+            with open(operand, encoding="utf-8") as accounts_file:
+                for account in json.load(accounts_file):
+                    store.set(Credentials(account["username"], account["password"],
+                                          account.get("url", url)))
+        else:
+            store.remove(operand)
+    except KeyError:
+        print(
+            f"usage error: {operand} is not in {path}"
+            if command == "remove"
+            else f"usage error: every account in {operand} needs a username and a password"
+        )
+        return 2
+    store.save()
+    print(f"{len(store)} accounts in {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,106 @@
+"""
+Module: day_state
+
+This module classifies the booking state of a day from the values of its
+duration fields, so work on days that are already booked can be skipped.
+
+Usage:
+    :meth:`MainPage.read_day_state` reads all duration fields of the day at
+    once and returns a :class:`DaySnapshot`::
+
+        snapshot = main_page.read_day_state()
+        if snapshot.state is DayState.COMPLETE:
+            return
+
+Classes:
+    - :class:`DayState`: Booking state of a day.
+    - :class:`DaySnapshot`: Duration fields of a day.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Tuple
+from utils.time_parser import Duration
+
+ATTENDANCE_FIELDS: int = 8  # hours and minutes of attendance, break, recorded, unrecorded
+
+
+class DayState(Enum):
+    """
+    Booking state of a day.
+
+    - ``EMPTY``: No attendance and no efforts recorded yet.
+    - ``PARTIAL``: Some efforts are recorded or typed, some are not.
+    - ``COMPLETE``: Attendance is recorded and no efforts are left unrecorded.
+    """
+
+    EMPTY = "empty"
+    PARTIAL = "partial"
+    COMPLETE = "complete"
+
+
+def _number(value: Optional[str]) -> int:
+    text: str = (value or "").strip()
+    return int(text) if text.isdigit() else 0
+
+
+def _durations(values: List[Optional[str]]) -> List[Duration]:
+    return [
+        Duration(hours=_number(hours), minutes=_number(minutes))
+        for hours, minutes in zip(values[::2], values[1::2])
+    ]
+
+
+@dataclass(frozen=True)
+class DaySnapshot:
+    """
+    Duration fields of a day.
+
+    :Attributes:
+        - **attendance** (*Duration*): The attendance.
+        - **break_duration** (*Duration*): The break.
+        - **recorded** (*Duration*): The efforts already recorded.
+        - **unrecorded** (*Duration*): The attendance not recorded as efforts.
+        - **typed** (*Tuple[Duration, ...]*): The durations typed into the
+          task lines and not saved yet, one per line.
+    """
+
+    attendance: Duration
+    break_duration: Duration
+    recorded: Duration
+    unrecorded: Duration
+    typed: Tuple[Duration, ...] = ()
+
+    @classmethod
+    def from_values(cls, values: List[Optional[str]]) -> "DaySnapshot":
+        """
+        Build a snapshot from the field values in document order.
+
+        :param values: The hours and minutes of attendance, break, recorded
+            and unrecorded efforts, then of every task line.
+        :return: The snapshot, zero for empty or missing fields.
+        :raises ValueError: If the attendance fields are missing, or a field
+            is missing or left over so the values do not pair up.
+        """
+        if len(values) < ATTENDANCE_FIELDS:
+            raise ValueError(f"Expected {ATTENDANCE_FIELDS} attendance fields, got {len(values)}")
+        if len(values) % 2:
+            raise ValueError(f"Expected hour and minute pairs, got {len(values)} fields")
+        attendance, break_duration, recorded, unrecorded = _durations(
+            values[:ATTENDANCE_FIELDS]
+        )
+        return cls(
+            attendance, break_duration, recorded, unrecorded,
+            tuple(_durations(values[ATTENDANCE_FIELDS:])),
+        )
+
+    @property
+    def state(self) -> DayState:
+        """
+        The booking state of the day.
+        """
+        if not self.attendance and not self.recorded and not any(self.typed):
+            return DayState.EMPTY
+        if self.attendance and not self.unrecorded and not any(self.typed):
+            return DayState.COMPLETE
+        return DayState.PARTIAL
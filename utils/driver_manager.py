@@ -0,0 +1,225 @@
+"""
+Module: driver_manager
+
+This module manages the lifetime of the WebDriver of a long session: it
+recycles the browser after a number of jobs or when its memory grows past a
+budget, logs in again on the fresh browser, and always quits it on exit.
+
+Usage:
+    Give a :class:`DriverManager` a factory creating a driver and a login
+    function, then run every job inside :meth:`DriverManager.job`::
+
+        with DriverManager(webdriver.Chrome, login, max_jobs=25, max_rss_mb=1024) as manager:
+            for job in jobs:
+                with manager.job() as driver:
+                    book(driver, job)
+
+    The resident memory of the whole browser process tree (driver service,
+    browser, renderers) is checked after every job. A job failing with a
+    WebDriver error also recycles the browser, as it may have crashed.
+
+    On close, leftover processes of the tree, e.g. a chromedriver whose
+    browser hung, are killed, and an ``atexit`` hook closes managers that
+    were never closed. A process is only killed while it is still the one
+    seen before quitting: the service while its ``Popen`` has not exited,
+    the others while their start time is unchanged, so an id reused by an
+    unrelated process in the meantime is left alone.
+
+    The memory is read from ``/proc``; where there is none (Windows, macOS)
+    the memory budget cannot work and a ``memory budget unsupported``
+    warning is logged on the ``projektron.driver`` logger.
+
+Classes:
+    - :class:`DriverManager`: Create, recycle and quit the driver of a session.
+
+Functions:
+    - :func:`driver_pid`: Process id of the driver service.
+    - :func:`driver_rss_bytes`: Resident memory of the driver process tree.
+"""
+
+import atexit
+import logging
+import os
+import signal
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils import process_stats
+from utils.process_stats import process_tree, rss_bytes, start_time
+
+logger: logging.Logger = logging.getLogger("projektron.driver")
+
+
+def driver_pid(driver: WebDriver) -> Optional[int]:
+    """
+    Return the id of the driver service process, None for in-process drivers.
+
+    :param driver: The Selenium WebDriver instance.
+    :return: The process id, if any.
+    :rtype: int, optional
+    """
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    return getattr(process, "pid", None)
+
+
+def driver_rss_bytes(driver: WebDriver) -> int:
+    """
+    Return the resident memory of the driver service and all its children.
+
+    :param driver: The Selenium WebDriver instance.
+    :return: The resident set size in bytes, 0 when unknown.
+    :rtype: int
+    """
+    pid: Optional[int] = driver_pid(driver)
+    return rss_bytes(pid) if pid else 0
+
+
+class DriverManager:  # pylint: disable=too-many-instance-attributes
+    """
+    Create, recycle and quit the driver of a long session.
+
+    :Attributes:
+        - **factory** (*Callable[[], WebDriver]*): Creates a new driver.
+        - **login** (*Callable[[WebDriver], None]*): Logs in on a new driver.
+        - **max_jobs** (*int*): Jobs after which the driver is recycled.
+        - **max_rss_mb** (*float*): Memory of the process tree after which
+          the driver is recycled.
+        - **memory_probe** (*Callable[[WebDriver], int]*): Returns the memory
+          of a driver in bytes.
+        - **jobs** (*int*): Jobs run on the current driver.
+        - **recycles** (*int*): Drivers recycled so far.
+        - **peak_rss_bytes** (*int*): Highest memory seen after a job.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        factory: Callable[[], WebDriver],
+        login: Optional[Callable[[WebDriver], None]] = None,
+        max_jobs: int = 25,
+        max_rss_mb: float = 1024.0,
+        memory_probe: Callable[[WebDriver], int] = driver_rss_bytes,
+    ) -> None:
+        """
+        Initialize the DriverManager, the driver is created on first use.
+
+        :param factory: Creates a new driver.
+        :param login: Logs in on a new driver, restoring the session state.
+        :param max_jobs: Jobs after which the driver is recycled, 0 for never.
+        :param max_rss_mb: Memory after which the driver is recycled, 0 for
+            no budget. Without ``/proc`` the default probe reads 0 and a
+            warning is logged.
+        :param memory_probe: Returns the memory of a driver in bytes.
+        """
+        self.factory: Callable[[], WebDriver] = factory
+        self.login: Optional[Callable[[WebDriver], None]] = login
+        self.max_jobs: int = max_jobs
+        self.max_rss_mb: float = max_rss_mb
+        self.memory_probe: Callable[[WebDriver], int] = memory_probe
+        self.jobs: int = 0
+        self.recycles: int = 0
+        self.peak_rss_bytes: int = 0
+        self._driver: Optional[WebDriver] = None
+        if max_rss_mb and memory_probe is driver_rss_bytes and not process_stats.SUPPORTED:
+            logger.warning("memory budget unsupported", extra={"max_rss_mb": max_rss_mb})
+        atexit.register(self.close)
+
+    @property
+    def driver(self) -> WebDriver:
+        """
+        The current driver, created and logged in on first use.
+        """
+        if self._driver is None:
+            driver: WebDriver = self.factory()
+            self._driver = driver
+            self.jobs = 0
+            if self.login is not None:
+                try:
+                    self.login(driver)
+                except BaseException:
+                    self._quit()
+                    raise
+        return self._driver
+
+    @contextmanager
+    def job(self) -> Iterator[WebDriver]:
+        """
+        Run one job on the current driver and recycle it afterwards if due.
+
+        :return: A context manager yielding the driver.
+        :raises WebDriverException: Re-raised from the job after the driver
+            was recycled.
+        """
+        try:
+            yield self.driver
+        except WebDriverException:
+            self.recycle()
+            raise
+        self.jobs += 1
+        if self.needs_recycle():
+            self.recycle()
+
+    def needs_recycle(self) -> bool:
+        """
+        Whether the current driver ran its jobs or crossed the memory budget.
+
+        :return: True when the driver should be recycled.
+        :rtype: bool
+        """
+        if self._driver is None:
+            return False
+        if self.max_jobs and self.jobs >= self.max_jobs:
+            return True
+        used: int = self.memory_probe(self._driver)
+        self.peak_rss_bytes = max(self.peak_rss_bytes, used)
+        return bool(self.max_rss_mb) and used > self.max_rss_mb * 2**20
+
+    def recycle(self) -> None:
+        """
+        Quit the current driver, the next job gets a fresh, logged in one.
+        """
+        if self._driver is not None:
+            self._quit()
+            self.recycles += 1
+
+    def close(self) -> None:
+        """
+        Quit the current driver for good.
+        """
+        self._quit()
+        atexit.unregister(self.close)
+
+    def _quit(self) -> None:
+        """
+        Quit the driver and kill whatever is left of its process tree.
+        """
+        driver, self._driver = self._driver, None
+        if driver is None:
+            return
+        pid: Optional[int] = driver_pid(driver)
+        started: Dict[int, Optional[int]] = {
+            member: start_time(member) for member in (process_tree(pid) if pid else [])
+        }
+        try:
+            driver.quit()
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+        service: Any = getattr(getattr(driver, "service", None), "process", None)
+        for member, begun in started.items():
+            if member == pid and hasattr(service, "poll"):
+                alive: bool = service.poll() is None
+            else:
+                alive = begun is not None and start_time(member) == begun
+            if not alive:
+                continue
+            try:
+                os.kill(member, signal.SIGTERM)
+            except OSError:
+                continue
+
+    def __enter__(self) -> "DriverManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
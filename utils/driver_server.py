@@ -0,0 +1,373 @@
+"""
+Module: driver_server
+
+This module runs a local standalone WebDriver server speaking the W3C
+WebDriver protocol, backed by :class:`utils.fake_driver.FakeWebDriver`, so
+``webdriver.Remote`` and the grid scheduler can be tested without browsers
+or a Selenium Grid.
+
+Usage:
+    Start a server with :func:`start_driver_server` and connect to its
+    ``url`` like to a Selenium standalone node; the sessions load pages over
+    the network, e.g. from :func:`utils.stub_server.start_stub_server`::
+
+        node = start_driver_server(latency=0.01)
+        driver = webdriver.Remote(command_executor=node.url, options=webdriver.ChromeOptions())
+        LoginPage(driver, base_url=stub.base_url).open()
+        node.stop()
+
+    Stopping a server while its sessions are in use behaves like a grid
+    node going down: the clients get connection errors.
+
+    The commands the page objects use are supported: sessions, navigation,
+    element lookup by XPath (CSS selectors only in the ``[id="..."]``,
+    ``[name="..."]`` and ``.class`` forms Selenium sends for ``By.ID``,
+    ``By.NAME`` and ``By.CLASS_NAME``), text, attributes, click, clear,
+    send keys and tabs. Scripts are not evaluated, except for the
+    ``getAttribute`` and ``isDisplayed`` atoms Selenium sends for
+    ``get_attribute`` and ``is_displayed``.
+
+Classes:
+    - :class:`FakeDriverServer`: Threaded HTTP server hosting fake sessions.
+
+Functions:
+    - :func:`start_driver_server`: Start a server on a free local port.
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoSuchWindowException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from utils.fake_driver import FakeNode, FakeWebDriver, FakeWebElement
+
+ELEMENT_KEY: str = "element-6066-11e4-a52e-4f735466cecf"
+
+_CSS_LOCATORS = (
+    (re.compile(r'^\[id="(.*)"\]$'), By.ID),
+    (re.compile(r'^\[name="(.*)"\]$'), By.NAME),
+    (re.compile(r"^\.([\w-]+)$"), By.CLASS_NAME),
+)
+
+
+class _CommandError(Exception):
+    """
+    A W3C error answered to the client.
+    """
+
+    def __init__(self, status: int, error: str, message: str) -> None:
+        super().__init__(message)
+        self.status: int = status
+        self.error: str = error
+
+
+class _Session:
+    """
+    A fake driver and the elements handed out to the client.
+    """
+
+    def __init__(self) -> None:
+        self.driver: FakeWebDriver = FakeWebDriver(network=True)
+        self.elements: Dict[str, FakeNode] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def reference(self, element: FakeWebElement) -> Dict[str, str]:
+        """
+        Return the W3C reference to an element.
+        """
+        element_id: str = f"{id(self.driver.document):x}-{element.node.order}"
+        self.elements[element_id] = element.node
+        return {ELEMENT_KEY: element_id}
+
+    def element(self, element_id: str) -> FakeWebElement:
+        """
+        Return a referenced element of the loaded document.
+        """
+        node: Optional[FakeNode] = self.elements.get(element_id)
+        root: Optional[FakeNode] = node
+        while root is not None and root.parent is not None:
+            root = root.parent
+        if node is None or root is not self.driver.document:
+            raise _CommandError(404, "stale element reference", f"Stale element {element_id}")
+        return FakeWebElement(self.driver, node)
+
+    def result(self, value: Any) -> Any:
+        """
+        Replace elements in a script result by their W3C references.
+        """
+        if isinstance(value, FakeWebElement):
+            return self.reference(value)
+        if isinstance(value, dict):
+            return {key: self.result(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.result(item) for item in value]
+        return value
+
+    def argument(self, value: Any) -> Any:
+        """
+        Resolve element references among script arguments.
+        """
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return self.element(value[ELEMENT_KEY])
+        return value
+
+
+def _locator(body: Dict[str, Any]) -> Tuple[str, str]:
+    using: str = body.get("using", "")
+    value: str = body.get("value", "")
+    if using == By.CSS_SELECTOR:
+        for pattern, strategy in _CSS_LOCATORS:
+            match = pattern.match(value)
+            if match:
+                return strategy, match.group(1)
+        raise _CommandError(400, "invalid selector", f"Unsupported CSS selector {value}")
+    return using, value
+
+
+def _find(
+    session: _Session,
+    finder: Callable[[str, str], List[FakeWebElement]],
+    command: str,
+    body: Dict[str, Any],
+) -> Any:
+    strategy, value = _locator(body)
+    found: List[FakeWebElement] = finder(strategy, value)
+    if command == "elements":
+        return [session.reference(item) for item in found]
+    if not found:
+        raise NoSuchElementException(f"Unable to locate element: {value}")
+    return session.reference(found[0])
+
+
+def _execute(session: _Session, body: Dict[str, Any]) -> Any:
+    script: str = body.get("script", "")
+    args = [session.argument(arg) for arg in body.get("args", [])]
+    if script.startswith("/* getAttribute */"):
+        return args[0].get_attribute(args[1])
+    if script.startswith("/* isDisplayed */"):
+        return args[0].is_displayed()
+    return session.result(session.driver.execute_script(script, *args))
+
+
+def _element_command(session: _Session, method: str, parts: Tuple[str, ...], body: Dict) -> Any:
+    """
+    Run a command below ``/element/<id>``.
+    """
+    element: FakeWebElement = session.element(parts[0])
+    command: str = "/".join(parts[1:2])
+    if method == "POST" and command in ("element", "elements"):
+        return _find(session, element.find_elements, command, body)
+    if method == "GET":
+        answers = {
+            "text": lambda: element.text,
+            "name": lambda: element.tag_name,
+            "enabled": element.is_enabled,
+            "displayed": element.is_displayed,
+            "attribute": lambda: element.get_attribute(parts[2]),
+            "property": lambda: element.get_attribute(parts[2]),
+        }
+        if command in answers:
+            return answers[command]()
+    if method == "POST" and command == "click":
+        return element.click()
+    if method == "POST" and command == "clear":
+        return element.clear()
+    if method == "POST" and command == "value":
+        return element.send_keys(body.get("text", "".join(body.get("value", []))))
+    raise _CommandError(404, "unknown command", f"{method} element/{'/'.join(parts[1:])}")
+
+
+def _window_command(
+    driver: FakeWebDriver, method: str, parts: Tuple[str, ...], body: Dict[str, Any]
+) -> Any:
+    """
+    Run a command below ``/window``.
+    """
+    if parts == ("handles",):
+        return driver.window_handles
+    if parts == ("new",) and method == "POST":
+        driver.switch_to.new_window(body.get("type"))
+        return {"handle": driver.current_window_handle, "type": "tab"}
+    if method == "POST":
+        try:
+            return driver.switch_to.window(body.get("handle", ""))
+        except NoSuchWindowException as error:
+            raise _CommandError(404, "no such window", error.msg) from error
+    if method == "DELETE":
+        driver.close()
+        return driver.window_handles
+    return driver.current_window_handle
+
+
+def _session_command(  # pylint: disable=too-many-return-statements
+    session: _Session, method: str, parts: Tuple[str, ...], body: Dict
+) -> Any:
+    """
+    Run a command below ``/session/<id>``.
+    """
+    driver: FakeWebDriver = session.driver
+    command: str = "/".join(parts[:2]) if parts[:1] == ("execute",) else "/".join(parts[:1])
+    if command == "url":
+        if method == "POST":
+            return driver.get(body["url"])
+        return driver.current_url
+    if command == "title":
+        return driver.title
+    if command in ("element", "elements") and method == "POST" and len(parts) == 1:
+        return _find(session, driver.find_elements, command, body)
+    if command == "element":
+        return _element_command(session, method, parts[1:], body)
+    if command in ("execute/sync", "execute/async"):
+        return _execute(session, body)
+    if command == "window":
+        return _window_command(driver, method, parts[1:], body)
+    if command == "timeouts":
+        return None
+    raise _CommandError(404, "unknown command", f"{method} {'/'.join(parts)}")
+
+
+class _DriverHandler(BaseHTTPRequestHandler):
+    """
+    Request handler dispatching W3C WebDriver commands.
+    """
+
+    server: "FakeDriverServer"
+
+    def _answer(self, status: int, value: Any) -> None:
+        body: bytes = json.dumps({"value": value}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str) -> None:
+        length: int = int(self.headers.get("Content-Length") or 0)
+        body: Dict[str, Any] = json.loads(self.rfile.read(length) or b"{}") if length else {}
+        time.sleep(self.server.latency)
+        parts: Tuple[str, ...] = tuple(part for part in self.path.split("/") if part)
+        try:
+            self._answer(200, self.server.command(method, parts, body))
+        except _CommandError as error:
+            self._answer(error.status, {"error": error.error, "message": str(error),
+                                        "stacktrace": ""})
+        except NoSuchElementException as error:
+            self._answer(404, {"error": "no such element", "message": error.msg,
+                               "stacktrace": ""})
+        except WebDriverException as error:
+            self._answer(500, {"error": "unknown error", "message": error.msg, "stacktrace": ""})
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Answer a GET command.
+        """
+        self._handle("GET")
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """
+        Answer a POST command.
+        """
+        self._handle("POST")
+
+    def do_DELETE(self) -> None:  # pylint: disable=invalid-name
+        """
+        Answer a DELETE command.
+        """
+        self._handle("DELETE")
+
+    def log_message(self, format: str, *args) -> None:  # pylint: disable=redefined-builtin
+        """
+        Keep the test output free of access logs.
+        """
+
+
+class FakeDriverServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server hosting fake WebDriver sessions.
+
+    :Attributes:
+        - **latency** (*float*): Seconds waited before every command.
+        - **sessions** (*Dict[str, _Session]*): The open sessions by id.
+        - **created** (*int*): Number of sessions created so far.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], latency: float = 0.0) -> None:
+        """
+        Initialize the FakeDriverServer.
+
+        :param address: The host and port to listen on, port 0 picks a free one.
+        :param latency: Seconds waited before every command.
+        """
+        super().__init__(address, _DriverHandler)
+        self.latency: float = latency
+        self.sessions: Dict[str, _Session] = {}
+        self.created: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """
+        The URL to give ``webdriver.Remote`` as command executor.
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def command(self, method: str, parts: Tuple[str, ...], body: Dict[str, Any]) -> Any:
+        """
+        Run a command and return its value.
+
+        :param method: The HTTP method.
+        :param parts: The path segments, e.g. ``("session", "<id>", "url")``.
+        :param body: The JSON parameters.
+        :return: The value answered to the client.
+        """
+        if parts == ("status",):
+            return {"ready": True, "message": "fake driver server ready"}
+        if parts == ("session",) and method == "POST":
+            session_id: str = uuid.uuid4().hex
+            with self._lock:
+                self.sessions[session_id] = _Session()
+                self.created += 1
+            return {"sessionId": session_id, "capabilities": {"browserName": "fake"}}
+        if parts[:1] != ("session",) or len(parts) < 2 or parts[1] not in self.sessions:
+            raise _CommandError(404, "invalid session id", f"No session at {'/'.join(parts)}")
+        if len(parts) == 2 and method == "DELETE":
+            with self._lock:
+                del self.sessions[parts[1]]
+            return None
+        session: _Session = self.sessions[parts[1]]
+        with session.lock:
+            return _session_command(session, method, parts[2:], body)
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the socket.
+        """
+        self.shutdown()
+        self.server_close()
+
+
+def start_driver_server(latency: float = 0.0, port: int = 0) -> FakeDriverServer:
+    """
+    Start a fake standalone WebDriver server on a local port in a background thread.
+
+    :param latency: Seconds waited before every command.
+    :param port: The port to listen on, a free port by default.
+    :return: The running server.
+    :rtype: FakeDriverServer
+    """
+    server = FakeDriverServer(("127.0.0.1", port), latency=latency)
+    threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    ).start()
+    return server
@@ -0,0 +1,971 @@
+"""
+Module: fake_driver
+
+This module provides an in-memory stand-in for the Selenium WebDriver, backed by
+HTML fixtures, so the page objects can be tested without a browser.
+
+Usage:
+    Build a :class:`FakeWebDriver` from a mapping of URLs to HTML documents (see
+    :func:`fixture_pages` for the checked-in login and daytimerecording pages)
+    and pass it to ``LoginPage`` / ``MainPage`` like a real driver.
+
+    XPath locators are evaluated by a small in-process engine supporting the
+    subset the locators use: absolute and relative paths, ``//``, ``..``, ``*``,
+    positional predicates, ``@attribute`` comparisons, ``and`` / ``or``, ``|``
+    unions and the ``contains``, ``starts-with``, ``normalize-space``, ``text``
+    and ``not`` functions.
+
+    Tabs are supported through ``switch_to.new_window``, ``switch_to.window``,
+    ``window_handles`` and ``close``; every tab keeps its own URL and document.
+
+    JavaScript is not interpreted, but ``execute_script`` answers the scripts
+    of the page objects the way a browser would: the field value, row field
+    and tab scripts of the pages, the timing scripts of
+    :mod:`utils.navigation_timing` and :mod:`utils.resource_blocker` (an
+    instant load without resources) and the HTML dump of
+    :mod:`utils.artifacts`. Any other script raises ``JavascriptException``.
+
+Classes:
+    - :class:`FakeNode`: An element of a parsed HTML document.
+    - :class:`FakeWebElement`: WebElement look-alike wrapping a node.
+    - :class:`FakeSwitchTo`: ``driver.switch_to`` look-alike switching tabs.
+    - :class:`FakeWebDriver`: WebDriver look-alike serving HTML fixtures.
+
+Functions:
+    - :func:`parse_html`: Parse an HTML document into a tree of nodes.
+    - :func:`evaluate_xpath`: Evaluate an XPath expression against a node.
+    - :func:`outer_html`: Serialize a node back to HTML.
+    - :func:`fixture_pages`: Map the checked-in HTML fixtures to URLs.
+"""
+
+import html
+import os
+import re
+import time
+import uuid
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode, urljoin
+from urllib.request import Request, urlopen
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from pages.base_page import SET_VALUE_SCRIPT
+from pages.main_page import FIELD_VALUES_SCRIPT, LOADED_SCRIPT, OPEN_TAB_SCRIPT
+from pages.task_row import ROW_FIELDS_SCRIPT
+from utils.artifacts import OUTER_HTML_SCRIPT
+from utils.navigation_timing import TIMING_SCRIPT
+from utils.resource_blocker import PAGE_LOAD_SCRIPT
+
+FIXTURE_DIR: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures"
+)
+
+NAVIGATION_MARKS: Tuple[str, ...] = (
+    "startTime", "domainLookupStart", "domainLookupEnd", "connectStart", "connectEnd",
+    "responseStart", "domContentLoadedEventEnd", "loadEventEnd",
+)
+
+VOID_ELEMENTS = frozenset(
+    ("area", "base", "br", "col", "embed", "hr", "img", "input",
+     "link", "meta", "param", "source", "track", "wbr")
+)
+
+
+class FakeNode:
+    """
+    An element of a parsed HTML document.
+
+    :Attributes:
+        - **tag** (*str*): The lower case tag name, ``#document`` for the root.
+        - **attrs** (*Dict[str, str]*): The element attributes.
+        - **children** (*list*): Child nodes and text strings in document order.
+        - **parent** (*FakeNode*): The parent node, None for the root.
+        - **order** (*int*): The position of the node in document order.
+        - **value** (*str*): The current value of form controls.
+        - **time_origin** (*float*): When the document was parsed, in
+          milliseconds since the epoch, on the root only.
+    """
+
+    __slots__ = ("tag", "attrs", "children", "parent", "order", "value", "time_origin")
+
+    def __init__(
+        self, tag: str, attrs: Dict[str, str], parent: Optional["FakeNode"], order: int
+    ) -> None:
+        self.tag: str = tag
+        self.attrs: Dict[str, str] = attrs
+        self.children: List[Union["FakeNode", str]] = []
+        self.parent: Optional["FakeNode"] = parent
+        self.order: int = order
+        self.value: str = attrs.get("value", "")
+        self.time_origin: float = 0.0
+
+    def element_children(self) -> List["FakeNode"]:
+        """
+        Return the child elements of the node.
+
+        :return: The child nodes without text.
+        :rtype: List[FakeNode]
+        """
+        return [child for child in self.children if isinstance(child, FakeNode)]
+
+    def descendants_or_self(self) -> List["FakeNode"]:
+        """
+        Return the node and all its descendant elements in document order.
+
+        :return: The node followed by its descendants.
+        :rtype: List[FakeNode]
+        """
+        nodes: List[FakeNode] = []
+        stack: List[FakeNode] = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node.element_children()))
+        return nodes
+
+    def own_text(self) -> str:
+        """
+        Return the text directly inside the node.
+
+        :return: The concatenated text children.
+        :rtype: str
+        """
+        return "".join(child for child in self.children if isinstance(child, str))
+
+    def string_value(self) -> str:
+        """
+        Return the XPath string value of the node, all descendant text.
+
+        :return: The concatenated text of the subtree.
+        :rtype: str
+        """
+        if self.tag == "textarea":
+            return self.value
+        return "".join(
+            child if isinstance(child, str) else child.string_value()
+            for child in self.children
+        )
+
+
+class _TreeBuilder(HTMLParser):
+    """
+    HTML parser building a tree of :class:`FakeNode`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root: FakeNode = FakeNode("#document", {}, None, 0)
+        self.stack: List[FakeNode] = [self.root]
+        self.count: int = 1
+
+    def _append(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> FakeNode:
+        parent = self.stack[-1]
+        node = FakeNode(
+            tag, {name: value or "" for name, value in attrs}, parent, self.count
+        )
+        self.count += 1
+        parent.children.append(node)
+        return node
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        node = self._append(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self._append(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                if tag == "textarea":
+                    self.stack[index].value = self.stack[index].own_text()
+                del self.stack[index:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        self.stack[-1].children.append(data)
+
+
+def parse_html(document: str) -> FakeNode:
+    """
+    Parse an HTML document into a tree of nodes.
+
+    :param document: The HTML document.
+    :type document: str
+    :return: The document root node.
+    :rtype: FakeNode
+    """
+    builder = _TreeBuilder()
+    builder.feed(document)
+    builder.close()
+    builder.root.time_origin = time.time() * 1000
+    return builder.root
+
+
+def outer_html(node: FakeNode) -> str:
+    """
+    Serialize a node and its subtree back to HTML.
+
+    :param node: The node, the root for the whole document.
+    :type node: FakeNode
+    :return: The HTML of the node.
+    :rtype: str
+    """
+    inner: str = "".join(
+        outer_html(child) if isinstance(child, FakeNode) else html.escape(child, quote=False)
+        for child in node.children
+    )
+    if node.tag == "#document":
+        return inner
+    attrs: str = "".join(
+        f' {name}="{html.escape(value)}"' for name, value in node.attrs.items()
+    )
+    if node.tag in VOID_ELEMENTS:
+        return f"<{node.tag}{attrs}>"
+    return f"<{node.tag}{attrs}>{inner}</{node.tag}>"
+
+
+_TOKEN_PATTERN = re.compile(
+    r"\s*(?:(//|/|\.\.|\.|\[|\]|\(|\)|@|,|\||!=|=|\*)"
+    r"|('[^']*'|\"[^\"]*\")"
+    r"|(\d+)"
+    r"|([A-Za-z_][\w\-]*))"
+)
+
+
+def _tokenize(expression: str) -> List[str]:
+    """
+    Split an XPath expression into tokens.
+
+    :param expression: The XPath expression.
+    :return: The list of tokens.
+    :raises InvalidSelectorException: If the expression contains unknown characters.
+    """
+    tokens: List[str] = []
+    position: int = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _TOKEN_PATTERN.match(expression, position)
+        if not match or match.end() == position:
+            raise InvalidSelectorException(f"Unsupported XPath: {expression}")
+        tokens.append(next(group for group in match.groups() if group is not None))
+        position = match.end()
+    return tokens
+
+
+_Predicate = Callable[[FakeNode, int, int], Any]
+_Step = Tuple[str, str, List[_Predicate]]
+
+
+def _constant(value: Any) -> _Predicate:
+    return lambda node, position, size: value
+
+
+def _attribute(name: str) -> _Predicate:
+    return lambda node, position, size: node.attrs.get(name)
+
+
+def _string_value(node: FakeNode, position: int, size: int) -> str:  # pylint: disable=unused-argument
+    return node.string_value()
+
+
+def _either(left: _Predicate, right: _Predicate) -> _Predicate:
+    return lambda n, p, s: bool(left(n, p, s)) or bool(right(n, p, s))
+
+
+def _both(left: _Predicate, right: _Predicate) -> _Predicate:
+    return lambda n, p, s: bool(left(n, p, s)) and bool(right(n, p, s))
+
+
+class _XPathParser:  # pylint: disable=too-few-public-methods
+    """
+    Recursive descent parser compiling the supported XPath subset.
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression: str = expression
+        self.tokens: List[str] = _tokenize(expression)
+        self.position: int = 0
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise InvalidSelectorException(f"Unexpected end of XPath: {self.expression}")
+        self.position += 1
+        return token
+
+    def _expect(self, token: str) -> None:
+        if self._next() != token:
+            raise InvalidSelectorException(f"Expected {token!r} in XPath: {self.expression}")
+
+    def parse(self) -> List[Tuple[bool, List[_Step]]]:
+        """
+        Parse a union of location paths.
+
+        :return: A list of (absolute, steps) paths.
+        """
+        paths = [self._path()]
+        while self._peek() == "|":
+            self._next()
+            paths.append(self._path())
+        if self._peek() is not None:
+            raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+        return paths
+
+    def _path(self) -> Tuple[bool, List[_Step]]:
+        absolute: bool = self._peek() in ("/", "//")
+        steps: List[_Step] = []
+        axis: str = "child"
+        while True:
+            token = self._peek()
+            if token == "/":
+                self._next()
+                axis = "child"
+            elif token == "//":
+                self._next()
+                axis = "descendant"
+            elif steps:
+                break
+            steps.append(self._step(axis))
+            axis = "child"
+        return absolute, steps
+
+    def _step(self, axis: str) -> _Step:
+        token = self._next()
+        if token == ".":
+            return ("self" if axis == "child" else "descendant-or-self", "*", [])
+        if token == "..":
+            return ("parent", "*", [])
+        if token != "*" and not re.match(r"[A-Za-z_]", token):
+            raise InvalidSelectorException(f"Unsupported XPath step {token!r}")
+        predicates: List[_Predicate] = []
+        while self._peek() == "[":
+            self._next()
+            predicates.append(self._predicate())
+            self._expect("]")
+        return (axis, token.lower(), predicates)
+
+    def _predicate(self) -> _Predicate:
+        start: int = self.position
+        expression = self._or()
+        if self.position == start + 1 and self.tokens[start].isdigit():
+            index = int(self.tokens[start])
+            return lambda node, position, size: position == index
+        return expression
+
+    def _or(self) -> _Predicate:
+        left = self._and()
+        while self._peek() == "or":
+            self._next()
+            right = self._and()
+            left = _either(left, right)
+        return left
+
+    def _and(self) -> _Predicate:
+        left = self._comparison()
+        while self._peek() == "and":
+            self._next()
+            right = self._comparison()
+            left = _both(left, right)
+        return left
+
+    def _comparison(self) -> _Predicate:
+        left = self._primary()
+        operator = self._peek()
+        if operator not in ("=", "!="):
+            return left
+        self._next()
+        right = self._primary()
+        if operator == "=":
+            return lambda n, p, s: _compare(left(n, p, s), right(n, p, s))
+        return lambda n, p, s: not _compare(left(n, p, s), right(n, p, s))
+
+    def _primary(self) -> _Predicate:
+        token = self._next()
+        result: _Predicate
+        if token[0] in "'\"":
+            result = _constant(token[1:-1])
+        elif token.isdigit():
+            result = _constant(int(token))
+        elif token == "@":
+            result = _attribute(self._next().lower())
+        elif token == ".":
+            result = _string_value
+        elif token == "(":
+            result = self._or()
+            self._expect(")")
+        elif self._peek() == "(":
+            result = self._function(token)
+        else:
+            raise InvalidSelectorException(f"Unsupported XPath predicate {token!r}")
+        return result
+
+    def _function(self, name: str) -> _Predicate:
+        self._expect("(")
+        args: List[_Predicate] = []
+        while self._peek() != ")":
+            args.append(self._or())
+            if self._peek() == ",":
+                self._next()
+        self._expect(")")
+        functions: Dict[str, _Predicate] = {
+            "text": lambda n, p, s: n.own_text(),
+            "position": lambda n, p, s: p,
+            "last": lambda n, p, s: s,
+            "contains": lambda n, p, s: _string(args[1](n, p, s)) in _string(args[0](n, p, s)),
+            "starts-with": lambda n, p, s: _string(args[0](n, p, s)).startswith(
+                _string(args[1](n, p, s))
+            ),
+            "normalize-space": lambda n, p, s: " ".join(
+                _string(args[0](n, p, s) if args else n.string_value()).split()
+            ),
+            "not": lambda n, p, s: not args[0](n, p, s),
+            "concat": lambda n, p, s: "".join(_string(arg(n, p, s)) for arg in args),
+        }
+        if name not in functions:
+            raise InvalidSelectorException(f"Unsupported XPath function {name}()")
+        return functions[name]
+
+
+@lru_cache(maxsize=256)
+def _compile(expression: str) -> List[Tuple[bool, List[_Step]]]:
+    """
+    Compile an XPath expression once, locators are evaluated many times.
+    """
+    return _XPathParser(expression).parse()
+
+
+def _string(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _compare(left: Any, right: Any) -> bool:
+    if left is None or right is None:
+        return False
+    if isinstance(left, int) or isinstance(right, int):
+        try:
+            return float(left) == float(right)
+        except ValueError:
+            return False
+    return str(left) == str(right)
+
+
+def _apply_step(context: List[FakeNode], step: _Step) -> List[FakeNode]:
+    """
+    Apply one location step to a list of context nodes.
+
+    Positional predicates are evaluated per parent, as XPath does for
+    ``//input[1]``.
+    """
+    axis, name, predicates = step
+    if axis == "self":
+        return context
+    if axis == "parent":
+        return [node.parent for node in context if node.parent is not None]
+    if axis == "descendant-or-self":
+        return [nested for node in context for nested in node.descendants_or_self()]
+    parents: List[FakeNode] = (
+        context
+        if axis == "child"
+        else [nested for node in context for nested in node.descendants_or_self()]
+    )
+    result: List[FakeNode] = []
+    for parent in parents:
+        group = [
+            child for child in parent.element_children() if name in ("*", child.tag)
+        ]
+        for predicate in predicates:
+            size = len(group)
+            group = [
+                node
+                for position, node in enumerate(group, start=1)
+                if predicate(node, position, size)
+            ]
+        result.extend(group)
+    return result
+
+
+def evaluate_xpath(expression: str, context: FakeNode) -> List[FakeNode]:
+    """
+    Evaluate an XPath expression against a node.
+
+    :param expression: The XPath expression.
+    :type expression: str
+    :param context: The context node for relative paths.
+    :type context: FakeNode
+    :return: The matching nodes, deduplicated and in document order.
+    :rtype: List[FakeNode]
+    """
+    root: FakeNode = context
+    while root.parent is not None:
+        root = root.parent
+    matches: Dict[int, FakeNode] = {}
+    for absolute, steps in _compile(expression):
+        nodes: List[FakeNode] = [root if absolute else context]
+        for step in steps:
+            nodes = _apply_step(nodes, step)
+        for node in nodes:
+            matches[node.order] = node
+    return [matches[order] for order in sorted(matches)]
+
+
+def _to_xpath(by_method: str, value: str) -> str:
+    """
+    Translate a Selenium locator strategy to an XPath expression.
+    """
+    if by_method == By.XPATH:
+        return value
+    if by_method == By.ID:
+        return f"//*[@id='{value}']"
+    if by_method == By.NAME:
+        return f"//*[@name='{value}']"
+    if by_method == By.TAG_NAME:
+        return f"//{value}"
+    if by_method == By.CLASS_NAME:
+        return f"//*[contains(concat(' ', @class, ' '), ' {value} ')]"
+    raise InvalidSelectorException(f"Unsupported locator strategy {by_method}")
+
+
+class FakeWebElement:
+    """
+    WebElement look-alike wrapping a :class:`FakeNode`.
+
+    :Attributes:
+        - **parent** (:class:`FakeWebDriver`): The driver owning the element.
+        - **node** (:class:`FakeNode`): The wrapped document node.
+    """
+
+    def __init__(self, parent: "FakeWebDriver", node: FakeNode) -> None:
+        self.parent: "FakeWebDriver" = parent
+        self.node: FakeNode = node
+
+    @property
+    def id(self) -> str:  # pylint: disable=invalid-name
+        """
+        The element id, unique within the loaded document.
+        """
+        return f"fake-{self.node.order}"
+
+    @property
+    def tag_name(self) -> str:
+        """
+        The tag name of the element.
+        """
+        return self.node.tag
+
+    @property
+    def text(self) -> str:
+        """
+        The visible text of the element, with whitespace collapsed.
+        """
+        if self.node.tag == "input":
+            return ""
+        return " ".join(self.node.string_value().split())
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Get the value property of form controls or an attribute.
+
+        :param name: The attribute or property name.
+        :return: The value or None when the attribute does not exist.
+        """
+        if name == "value" and self.node.tag in ("input", "textarea"):
+            return self.node.value
+        return self.node.attrs.get(name)
+
+    def is_displayed(self) -> bool:
+        """
+        Whether the element is displayed, hidden inputs are not.
+        """
+        return self.node.attrs.get("type") != "hidden"
+
+    def is_enabled(self) -> bool:
+        """
+        Whether the element is enabled.
+        """
+        return "disabled" not in self.node.attrs
+
+    def clear(self) -> None:
+        """
+        Clear the value of a form control.
+        """
+        self.parent.log.append(("clear", self.node))
+        self.node.value = ""
+
+    def send_keys(self, *value: Any) -> None:
+        """
+        Append text to the value of a form control.
+        """
+        text = "".join(str(item) for item in value)
+        self.parent.log.append(("send_keys", self.node))
+        self.node.value += "".join(char for char in text if ord(char) < 0xE000)
+
+    def click(self) -> None:
+        """
+        Click the element, following links and submitting forms.
+        """
+        self.parent.log.append(("click", self.node))
+        self.parent.clicks.append(self.node)
+        if self.node.tag == "a" and "href" in self.node.attrs:
+            self.parent.navigate(self.node.attrs["href"])
+        elif self.node.attrs.get("type") == "submit":
+            self.parent.submit(self.node)
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> "FakeWebElement":
+        """
+        Find the first element matching a locator, relative to this element.
+        """
+        return self.parent.locate(by, value or "", self.node)
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> List["FakeWebElement"]:
+        """
+        Find all elements matching a locator, relative to this element.
+        """
+        return self.parent.locate_all(by, value or "", self.node)
+
+
+class FakeSwitchTo:
+    """
+    ``driver.switch_to`` look-alike switching between the tabs of a
+    :class:`FakeWebDriver`.
+    """
+
+    def __init__(self, driver: "FakeWebDriver") -> None:
+        self._driver: "FakeWebDriver" = driver
+
+    def window(self, window_name: str) -> None:
+        """
+        Switch to a tab.
+
+        :param window_name: The handle of the tab.
+        :raises NoSuchWindowException: If no tab has that handle.
+        """
+        driver = self._driver
+        if window_name not in driver.tabs:
+            raise NoSuchWindowException(f"No window {window_name}")
+        if driver.current_window_handle in driver.tabs:
+            driver.tabs[driver.current_window_handle] = (driver.current_url, driver.document)
+        driver.current_window_handle = window_name
+        driver.current_url, driver.document = driver.tabs[window_name]
+
+    def new_window(self, type_hint: Optional[str] = None) -> None:  # pylint: disable=unused-argument
+        """
+        Open a blank tab and switch to it.
+        """
+        driver = self._driver
+        driver.opened_tabs += 1
+        handle: str = f"window-{driver.opened_tabs}"
+        driver.tabs[handle] = ("about:blank", parse_html(""))
+        self.window(handle)
+
+
+class FakeWebDriver:  # pylint: disable=too-many-instance-attributes
+    """
+    WebDriver look-alike serving HTML documents from memory.
+
+    :Attributes:
+        - **pages** (*Dict[str, str]*): HTML documents by URL.
+        - **current_url** (*str*): The URL of the loaded document.
+        - **document** (:class:`FakeNode`): The loaded document.
+        - **clicks** (*List[FakeNode]*): Every clicked node.
+        - **submissions** (*List[Tuple[str, Dict[str, str]]]*): Submitted forms.
+        - **log** (*List[Tuple[str, FakeNode]]*): Element interactions in order.
+        - **scripts** (*List[str]*): Scripts passed to :meth:`execute_script`.
+        - **current_window_handle** (*str*): The handle of the current tab.
+        - **tabs** (*Dict[str, Tuple[str, FakeNode]]*): The URL and document
+          of every open tab by handle, as of when it was left.
+        - **opened_tabs** (*int*): Tabs opened so far, besides the first.
+        - **switch_to** (:class:`FakeSwitchTo`): Switches between the tabs.
+        - **session_id** (*str*): A unique id, like the WebDriver session id.
+    """
+
+    def __init__(self, pages: Optional[Dict[str, str]] = None, network: bool = False) -> None:
+        """
+        Initialize the FakeWebDriver.
+
+        :param pages: HTML documents keyed by absolute URL.
+        :type pages: Dict[str, str], optional
+        :param network: Fetch unregistered http(s) URLs and post forms over
+            the network, e.g. from a local stand-in server.
+        :type network: bool
+        """
+        self.pages: Dict[str, str] = pages or {}
+        self.network: bool = network
+        self.current_url: str = "about:blank"
+        self.document: FakeNode = parse_html("")
+        self.clicks: List[FakeNode] = []
+        self.submissions: List[Tuple[str, Dict[str, str]]] = []
+        self.log: List[Tuple[str, FakeNode]] = []
+        self.scripts: List[str] = []
+        self.current_window_handle: str = "window-0"
+        self.tabs: Dict[str, Tuple[str, FakeNode]] = {"window-0": ("about:blank", self.document)}
+        self.opened_tabs: int = 0
+        self.switch_to: FakeSwitchTo = FakeSwitchTo(self)
+        self.session_id: str = uuid.uuid4().hex
+
+    @property
+    def window_handles(self) -> List[str]:
+        """
+        The handles of the open tabs, in the order they were opened.
+        """
+        return list(self.tabs)
+
+    def close(self) -> None:
+        """
+        Close the current tab, switch to another one before the next command.
+        """
+        self.tabs.pop(self.current_window_handle, None)
+        self.document = parse_html("")
+        self.current_url = "about:blank"
+
+    def get(self, url: str) -> None:
+        """
+        Load the document registered for a URL.
+
+        A URL with a query string falls back to the document registered
+        for the URL without it.
+
+        :param url: The absolute URL to load.
+        :raises WebDriverException: If no document is registered for the URL.
+        """
+        page: Optional[str] = self.pages.get(url, self.pages.get(url.split("?", 1)[0]))
+        if page is not None:
+            self.current_url = url
+            self.document = parse_html(page)
+        elif self.network and url.startswith(("http://", "https://")):
+            self._fetch(Request(url))
+        else:
+            raise WebDriverException(f"net::ERR_NAME_NOT_RESOLVED {url}")
+
+    def _fetch(self, request: Request) -> None:
+        """
+        Load a document over the network.
+        """
+        try:
+            with urlopen(request, timeout=30) as response:
+                page = response.read().decode("utf-8")
+                self.current_url = response.geturl()
+        except OSError as error:
+            raise WebDriverException(f"net::ERR_FAILED {request.full_url}: {error}") from error
+        self.document = parse_html(page)
+
+    def navigate(self, href: str) -> None:
+        """
+        Follow a link relative to the current URL.
+
+        :param href: The link target.
+        """
+        self.get(urljoin(self.current_url, href))
+
+    def submit(self, button: FakeNode) -> None:
+        """
+        Submit the form enclosing a button and load its action if registered,
+        or post it over the network in network mode.
+
+        :param button: The clicked submit button.
+        """
+        form: Optional[FakeNode] = button.parent
+        while form is not None and form.tag != "form":
+            form = form.parent
+        if form is None:
+            return
+        fields: Dict[str, str] = {
+            node.attrs["name"]: node.value
+            for node in form.descendants_or_self()
+            if node.tag in ("input", "textarea", "select") and "name" in node.attrs
+        }
+        action: str = urljoin(self.current_url, form.attrs.get("action", ""))
+        self.submissions.append((action, fields))
+        if action in self.pages and action != self.current_url:
+            self.get(action)
+        elif self.network and action not in self.pages:
+            self._fetch(Request(action, data=urlencode(fields).encode("utf-8")))
+
+    @property
+    def title(self) -> str:
+        """
+        The title of the loaded document.
+        """
+        titles = evaluate_xpath("//title", self.document)
+        return " ".join(titles[0].string_value().split()) if titles else ""
+
+    def locate_all(
+        self, by_method: str, value: str, context: Optional[FakeNode] = None
+    ) -> List[FakeWebElement]:
+        """
+        Find all elements matching a locator.
+
+        :param by_method: The locator strategy.
+        :param value: The locator value.
+        :param context: The context node for relative XPaths.
+        :return: The matching elements.
+        """
+        nodes = evaluate_xpath(_to_xpath(by_method, value), context or self.document)
+        return [FakeWebElement(self, node) for node in nodes]
+
+    def locate(
+        self, by_method: str, value: str, context: Optional[FakeNode] = None
+    ) -> FakeWebElement:
+        """
+        Find the first element matching a locator.
+
+        :raises NoSuchElementException: If no element matches.
+        """
+        elements = self.locate_all(by_method, value, context)
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {value}")
+        return elements[0]
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> FakeWebElement:
+        """
+        Find the first element matching a locator in the loaded document.
+        """
+        return self.locate(by, value or "")
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> List[FakeWebElement]:
+        """
+        Find all elements matching a locator in the loaded document.
+        """
+        return self.locate_all(by, value or "")
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        """
+        Record a script and answer it like a browser would.
+
+        :param script: One of the scripts of the page objects, see the module
+            documentation.
+        :param args: The script arguments.
+        :return: The value the script returns in a browser.
+        :raises JavascriptException: If the script is not one the fake knows.
+        """
+        self.scripts.append(script)
+        answers: Dict[str, Callable[..., Any]] = {
+            SET_VALUE_SCRIPT: self._set_value,
+            FIELD_VALUES_SCRIPT: self._field_values,
+            ROW_FIELDS_SCRIPT: self._row_fields,
+            OPEN_TAB_SCRIPT: self._open_tab,
+            LOADED_SCRIPT: lambda: self.current_url != "about:blank",
+            OUTER_HTML_SCRIPT: self._outer_html,
+            TIMING_SCRIPT: self._timing,
+            PAGE_LOAD_SCRIPT: self._page_load,
+        }
+        if script not in answers:
+            raise JavascriptException(f"The fake driver cannot run {script.strip()[:40]!r}")
+        return answers[script](*args)
+
+    @staticmethod
+    def _set_value(field: FakeWebElement, text: str) -> Optional[str]:
+        """
+        Set the value of a field unless it is read-only or disabled, cut to its ``maxlength``.
+        """
+        node: FakeNode = field.node
+        if "readonly" in node.attrs or "disabled" in node.attrs:
+            return None
+        node.value = text[: int(node.attrs.get("maxlength", len(text)))]
+        return node.value
+
+    def _field_values(self, xpath: str) -> List[Optional[str]]:
+        """
+        Read the values of all nodes matching an XPath.
+        """
+        return [
+            FakeWebElement(self, node).get_attribute("value")
+            for node in evaluate_xpath(xpath, self.document)
+        ]
+
+    def _row_fields(
+        self, row: FakeWebElement, locators: List[Tuple[str, str, int]]
+    ) -> Dict[str, FakeWebElement]:
+        """
+        Locate the named fields of a row, leaving out the missing ones.
+        """
+        fields: Dict[str, FakeWebElement] = {}
+        for name, xpath, position in locators:
+            found: List[FakeNode] = evaluate_xpath(xpath, row.node)
+            if len(found) > position:
+                fields[name] = FakeWebElement(self, found[position])
+        return fields
+
+    def _open_tab(self, url: str) -> None:
+        """
+        Load a URL in a new tab and stay on the current one.
+        """
+        current: str = self.current_window_handle
+        self.switch_to.new_window("tab")
+        try:
+            self.get(url)
+        finally:
+            self.switch_to.window(current)
+
+    def _outer_html(self, xpath: Optional[str]) -> str:
+        """
+        Serialize the first node matching an XPath, or the whole document.
+        """
+        nodes: List[FakeNode] = evaluate_xpath(xpath, self.document) if xpath else []
+        return outer_html(nodes[0] if nodes else self.document)
+
+    def _timing(self, since: float, limit: int) -> Dict[str, Any]:  # pylint: disable=unused-argument
+        """
+        Answer the timing script for a document loaded at once, without resources.
+        """
+        origin: float = self.document.time_origin
+        return {
+            "complete": True,
+            "time_origin": origin,
+            "now": time.time() * 1000 - origin,
+            "navigation": (
+                None if self.current_url == "about:blank"
+                else dict.fromkeys(NAVIGATION_MARKS, 0.0)
+            ),
+            "resources": [],
+        }
+
+    def _page_load(self) -> Dict[str, Any]:
+        """
+        Answer the page load script for a document loaded at once, without resources.
+        """
+        return {
+            "load_ms": 0.0,
+            "transferred_bytes": len(outer_html(self.document).encode("utf-8")),
+            "resource_count": 0,
+        }
+
+    def quit(self) -> None:
+        """
+        Unload the document and close all tabs but the first.
+        """
+        self.document = parse_html("")
+        self.current_url = "about:blank"
+        self.current_window_handle = "window-0"
+        self.tabs = {"window-0": (self.current_url, self.document)}
+
+
+def fixture_pages(base_url: str, fixture_dir: str = FIXTURE_DIR) -> Dict[str, str]:
+    """
+    Map the checked-in HTML fixtures to the URLs the page objects open.
+
+    The login page is served at ``base_url`` and the daytimerecording page at
+    ``base_url + "/daytimerecording"``. ``{{base_url}}`` placeholders in the
+    fixtures are replaced, so links and form actions resolve to those URLs.
+
+    :param base_url: The base URL given to the page objects.
+    :param fixture_dir: The directory holding the fixtures.
+    :return: HTML documents keyed by URL.
+    """
+    pages: Dict[str, str] = {}
+    for url, name in ((base_url, "login.html"), (base_url + "/daytimerecording",
+                                                "daytimerecording.html")):
+        with open(os.path.join(fixture_dir, name), encoding="utf-8") as fixture:
+            pages[url] = fixture.read().replace("{{base_url}}", base_url)
+    return pages
@@ -0,0 +1,341 @@
+"""
+Module: grid
+
+This module runs booking jobs on remote WebDriver endpoints, e.g. Selenium
+Grid or standalone nodes on several machines, spreading them by the free
+slots and the observed latency of every node.
+
+Usage:
+    Describe the nodes, then run the jobs with a function booking one job on
+    a logged in driver::
+
+        scheduler = GridScheduler(
+            [GridNode("http://node-1:4444", slots=4), GridNode("http://node-2:4444", slots=2)],
+            login=login,
+        )
+        results = scheduler.run(jobs, lambda driver, job: book(driver, job))
+
+    Every slot keeps its browser between jobs in a
+    :class:`utils.driver_manager.DriverManager`. A job goes to the live node
+    with a free slot that is expected to finish it first: the node with the
+    lowest moving average of job durations, weighted by how busy it is.
+    Nodes no job ran on yet go first, so every node gets measured.
+
+    Errors of the session or the connection to the node, see
+    :data:`NODE_ERRORS`, count against the node; after ``max_failures`` in
+    a row the node is marked dead and its browsers are dropped. The job is
+    put back in the queue and retried on another slot, up to
+    ``max_attempts`` times. Any other error, including WebDriver errors of
+    the page such as a failed lookup or an element that cannot be typed
+    into, fails the job only: the page may already hold a part of the
+    booking, and running the job again could book it twice.
+
+Classes:
+    - :class:`GridNode`: A remote WebDriver endpoint and its statistics.
+    - :class:`GridResult`: Outcome of one job.
+    - :class:`GridScheduler`: Run jobs on the slots of several nodes.
+
+Functions:
+    - :func:`remote_driver`: Create a headless Chrome session on a remote endpoint.
+    - :func:`parse_nodes`: Read node URLs from a command-line argument.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Generic, List, Optional, TypeVar
+from selenium import webdriver
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    SessionNotCreatedException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+from urllib3.exceptions import HTTPError
+from utils.driver_manager import DriverManager
+
+NODE_ERRORS = (SessionNotCreatedException, InvalidSessionIdException, OSError, HTTPError)
+
+_Job = TypeVar("_Job")
+_Result = TypeVar("_Result")
+
+logger: logging.Logger = logging.getLogger("projektron.grid")
+
+
+def remote_driver(url: str) -> WebDriver:
+    """
+    Create a headless Chrome session on a remote WebDriver endpoint.
+
+    :param url: The URL of the node or grid, e.g. ``http://node-1:4444``.
+    :return: The remote driver.
+    :rtype: WebDriver
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    return webdriver.Remote(command_executor=url, options=options)
+
+
+def parse_nodes(value: str, slots: int = 1) -> List["GridNode"]:
+    """
+    Read node URLs from a command-line argument.
+
+    :param value: Comma separated node URLs, each optionally followed by
+        ``*<slots>``, e.g. ``http://node-1:4444*4,http://node-2:4444``.
+    :param slots: The slots of nodes given without a count.
+    :return: The nodes.
+    :raises ValueError: If a slot count is not a positive number.
+    """
+    nodes: List[GridNode] = []
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        url, _, count = entry.partition("*")
+        nodes.append(GridNode(url, int(count) if count else slots))
+    return nodes
+
+
+@dataclass
+class GridNode:  # pylint: disable=too-many-instance-attributes
+    """
+    A remote WebDriver endpoint and its statistics.
+
+    :Attributes:
+        - **url** (*str*): The URL of the endpoint.
+        - **slots** (*int*): The number of sessions run at once.
+        - **busy** (*int*): The sessions running a job.
+        - **latency** (*float, optional*): Moving average of the job
+          durations in seconds, None before the first job.
+        - **jobs** (*int*): Jobs finished on the node.
+        - **failures** (*int*): Node errors in a row.
+        - **alive** (*bool*): False once the node is given up.
+        - **idle** (*List[DriverManager]*): The browsers of the free slots.
+    """
+
+    url: str
+    slots: int = 1
+    busy: int = 0
+    latency: Optional[float] = None
+    jobs: int = 0
+    failures: int = 0
+    alive: bool = True
+    idle: List[DriverManager] = field(default_factory=list, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.slots < 1:
+            raise ValueError(f"A node needs at least one slot, got {self.slots} for {self.url}")
+
+    @property
+    def free(self) -> int:
+        """
+        The slots not running a job.
+        """
+        return self.slots - self.busy if self.alive else 0
+
+    @property
+    def expected_seconds(self) -> float:
+        """
+        The expected duration of one more job, 0 before the first job.
+        """
+        return (self.latency or 0.0) * (1 + self.busy / self.slots)
+
+    def observe(self, seconds: float, weight: float) -> None:
+        """
+        Add the duration of a finished job to the moving average.
+
+        :param seconds: The duration of the job.
+        :param weight: The weight of the new duration, between 0 and 1.
+        """
+        self.latency = seconds if self.latency is None else (
+            weight * seconds + (1 - weight) * self.latency
+        )
+        self.jobs += 1
+        self.failures = 0
+
+
+@dataclass
+class GridResult(Generic[_Job, _Result]):
+    """
+    Outcome of one job.
+
+    :Attributes:
+        - **job**: The job.
+        - **value**: What the work function returned, None if it failed.
+        - **node** (*str, optional*): The URL of the node that ran the last attempt.
+        - **attempts** (*int*): Attempts made, more than one after node errors.
+        - **error** (*BaseException, optional*): Why the job failed, None on success.
+    """
+
+    job: _Job
+    value: Optional[_Result] = None
+    node: Optional[str] = None
+    attempts: int = 0
+    error: Optional[BaseException] = None
+
+
+class GridScheduler:  # pylint: disable=too-many-instance-attributes
+    """
+    Run jobs on the slots of several remote WebDriver nodes.
+
+    :Attributes:
+        - **nodes** (*List[GridNode]*): The nodes.
+        - **factory** (*Callable[[str], WebDriver]*): Creates a driver on a node URL.
+        - **login** (*Callable[[WebDriver], None], optional*): Logs in on a new driver.
+        - **max_attempts** (*int*): Attempts per job.
+        - **max_failures** (*int*): Node errors in a row after which a node is dead.
+        - **weight** (*float*): Weight of the latest job in the latency average.
+        - **recycle_jobs** (*int*): Jobs after which a slot restarts its browser.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        nodes: List[GridNode],
+        factory: Callable[[str], WebDriver] = remote_driver,
+        login: Optional[Callable[[WebDriver], None]] = None,
+        max_attempts: int = 3,
+        max_failures: int = 2,
+        weight: float = 0.3,
+        recycle_jobs: int = 25,
+    ) -> None:
+        """
+        Initialize the GridScheduler.
+
+        :param nodes: The nodes.
+        :param factory: Creates a driver on a node URL.
+        :param login: Logs in on a new driver.
+        :param max_attempts: Attempts per job before it fails.
+        :param max_failures: Node errors in a row after which a node is dead.
+        :param weight: Weight of the latest job in the latency average.
+        :param recycle_jobs: Jobs after which a slot restarts its browser,
+            0 for never.
+        """
+        self.nodes: List[GridNode] = nodes
+        self.factory: Callable[[str], WebDriver] = factory
+        self.login: Optional[Callable[[WebDriver], None]] = login
+        self.max_attempts: int = max_attempts
+        self.max_failures: int = max_failures
+        self.weight: float = weight
+        self.recycle_jobs: int = recycle_jobs
+        self._changed: threading.Condition = threading.Condition()
+
+    def pick(self) -> Optional[GridNode]:
+        """
+        Return the live node with a free slot expected to finish a job first.
+
+        :return: The node, None when no slot is free.
+        """
+        candidates: List[GridNode] = [node for node in self.nodes if node.free]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda node: (node.expected_seconds, -node.free))
+
+    def run(
+        self, jobs: List[_Job], work: Callable[[WebDriver, _Job], _Result]
+    ) -> List[GridResult[_Job, _Result]]:
+        """
+        Run every job on a slot of a live node.
+
+        :param jobs: The jobs.
+        :param work: Runs one job on a logged in driver.
+        :return: The results, in the order of the jobs.
+        """
+        results: List[GridResult[_Job, _Result]] = [GridResult(job) for job in jobs]
+        pending: Deque[GridResult[_Job, _Result]] = deque(results)
+        slots: int = sum(node.slots for node in self.nodes) or 1
+        with ThreadPoolExecutor(max_workers=slots, thread_name_prefix="grid") as executor:
+            with self._changed:
+                while True:
+                    node: Optional[GridNode] = self.pick() if pending else None
+                    if node is not None:
+                        node.busy += 1
+                        executor.submit(self._attempt, node, pending.popleft(), work, pending)
+                    elif any(node.busy for node in self.nodes):
+                        self._changed.wait()
+                    else:
+                        break
+        for result in pending:
+            result.error = WebDriverException("No live grid node left")
+        self.close()
+        return results
+
+    def _manager(self, node: GridNode) -> DriverManager:
+        with self._changed:
+            if node.idle:
+                return node.idle.pop()
+        return DriverManager(
+            lambda: self.factory(node.url), self.login, max_jobs=self.recycle_jobs, max_rss_mb=0
+        )
+
+    def _attempt(
+        self,
+        node: GridNode,
+        result: GridResult[_Job, _Result],
+        work: Callable[[WebDriver, _Job], _Result],
+        pending: Deque[GridResult[_Job, _Result]],
+    ) -> None:
+        """
+        Run one attempt of a job on a node and book the outcome.
+        """
+        result.node = node.url
+        result.attempts += 1
+        manager: DriverManager = self._manager(node)
+        start: float = time.perf_counter()
+        node_error: bool = False
+        try:
+            with manager.job() as driver:
+                result.value = work(driver, result.job)
+            result.error = None
+        except NODE_ERRORS as error:
+            result.error = error
+            node_error = True
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            result.error = error
+        finally:
+            self._finish(node, manager, result, pending, node_error, time.perf_counter() - start)
+
+    def _finish(  # pylint: disable=too-many-arguments
+        self,
+        node: GridNode,
+        manager: DriverManager,
+        result: GridResult[_Job, _Result],
+        pending: Deque[GridResult[_Job, _Result]],
+        node_error: bool,
+        seconds: float,
+    ) -> None:
+        """
+        Free the slot, update the node statistics and re-queue the job after
+        a node error.
+        """
+        dropped: List[DriverManager] = []
+        with self._changed:
+            node.busy -= 1
+            if not node_error:
+                node.observe(seconds, self.weight)
+            else:
+                node.failures += 1
+                if node.alive and node.failures >= self.max_failures:
+                    node.alive = False
+                    dropped, node.idle = node.idle, []
+                    logger.warning("grid node dead", extra={"node": node.url,
+                                                            "error": str(result.error)})
+                if result.attempts < self.max_attempts:
+                    pending.append(result)
+                    logger.info("job re-queued", extra={"node": node.url,
+                                                        "attempts": result.attempts})
+            if node.alive:
+                node.idle.append(manager)
+            else:
+                dropped.append(manager)
+            self._changed.notify_all()
+        for dead in dropped:
+            dead.close()
+
+    def close(self) -> None:
+        """
+        Quit the browsers kept by the slots of every node.
+        """
+        for node in self.nodes:
+            with self._changed:
+                managers, node.idle = node.idle, []
+            for manager in managers:
+                manager.close()
@@ -0,0 +1,207 @@
+"""
+Module: locator_fallback
+
+This module looks up elements through chains of candidate locators, so a
+Projektron markup change that breaks one locator costs a few milliseconds
+instead of a failed lookup after the full wait timeout.
+
+Usage:
+    Give the page objects a :class:`LocatorResolver`; ``BasePage`` then
+    looks up every locator that has a chain in
+    :data:`utils.locators.LOCATOR_CHAINS` through it::
+
+        resolver = LocatorResolver(path=".locator_cache.json")
+        login_page = LoginPage(driver, locator_resolver=resolver)
+
+    Each poll tries the candidates of the chain in turn with
+    ``find_elements``, which answers at once when nothing matches, so a
+    broken candidate is passed over in one round trip and the wait only
+    lasts while no candidate matches at all. The candidate that matched
+    last is remembered per chain in a JSON file and tried first on the
+    next lookup and the next run.
+
+    When the candidate ranked first does not match and another one does,
+    the fallback is logged as a ``locator fallback`` warning on the
+    ``projektron.locators`` logger and added to :attr:`LocatorResolver.fallbacks`,
+    so the broken locator can be fixed.
+
+Classes:
+    - :class:`Fallback`: A lookup that needed a later candidate.
+    - :class:`LocatorResolver`: Look up elements through candidate chains.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional, Tuple, Union
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.locators import LOCATOR_CHAINS, Candidate, LocatorChain
+
+DEFAULT_PATH: str = ".locator_cache.json"
+
+logger: logging.Logger = logging.getLogger("projektron.locators")
+
+
+def _describe(candidate: Candidate) -> str:
+    return f"{candidate[0]}={candidate[1]}"
+
+
+@dataclass(frozen=True)
+class Fallback:
+    """
+    A lookup that needed a later candidate of its chain.
+
+    :Attributes:
+        - **chain** (*str*): The name of the chain.
+        - **failed** (*Tuple[str, ...]*): The candidates that did not match.
+        - **used** (*str*): The candidate that matched.
+    """
+
+    chain: str
+    failed: Tuple[str, ...]
+    used: str
+
+
+class LocatorResolver:
+    """
+    Look up elements through chains of candidate locators, the last
+    successful candidate first.
+
+    :Attributes:
+        - **chains** (*Dict[str, LocatorChain]*): The chains by the XPath of
+          their locator.
+        - **path** (*str, optional*): The JSON file remembering the last
+          successful candidates, None to keep them in memory only.
+        - **poll** (*float*): Seconds between two passes over a chain.
+        - **fallbacks** (*List[Fallback]*): The fallbacks that happened.
+    """
+
+    def __init__(
+        self,
+        chains: Optional[Dict[str, LocatorChain]] = None,
+        path: Optional[str] = DEFAULT_PATH,
+        poll: float = 0.1,
+    ) -> None:
+        """
+        Initialize the LocatorResolver, reading the remembered candidates.
+
+        :param chains: The chains by the XPath of their locator, the chains
+            of :mod:`utils.locators` by default.
+        :param path: The JSON file remembering the last successful candidates.
+        :param poll: Seconds between two passes over a chain.
+        """
+        self.chains: Dict[str, LocatorChain] = LOCATOR_CHAINS if chains is None else chains
+        self.path: Optional[str] = path
+        self.poll: float = poll
+        self.fallbacks: List[Fallback] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._last: Dict[str, Candidate] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as file:
+                    self._last = {name: tuple(pair) for name, pair in json.load(file).items()}
+            except (OSError, ValueError) as error:
+                logger.warning("locator cache unreadable", extra={"path": path,
+                                                                  "error": str(error)})
+
+    def chain(self, locator: Union[str, Enum]) -> Optional[LocatorChain]:
+        """
+        Return the chain of a locator.
+
+        :param locator: The XPath of the locator, or its enum member.
+        :return: The chain, None if the locator has none.
+        """
+        return self.chains.get(getattr(locator, "value", locator))
+
+    def ranked(self, chain: LocatorChain) -> List[Candidate]:
+        """
+        Return the candidates of a chain in the order they are tried.
+
+        :param chain: The chain.
+        :return: The last successful candidate, then the others in chain order.
+        """
+        with self._lock:
+            last: Optional[Candidate] = self._last.get(chain.name)
+        if last not in chain.candidates:
+            return list(chain.candidates)
+        return [last, *(candidate for candidate in chain.candidates if candidate != last)]
+
+    def locate(self, driver: WebDriver, chain: LocatorChain) -> Optional[WebElement]:
+        """
+        Try every candidate of a chain once.
+
+        :param driver: The driver.
+        :param chain: The chain.
+        :return: The element of the first matching candidate, None if none matches.
+        """
+        ranked: List[Candidate] = self.ranked(chain)
+        for index, candidate in enumerate(ranked):
+            try:
+                found: List[WebElement] = driver.find_elements(*candidate)
+            except InvalidSelectorException:
+                found = []
+            if found:
+                self._succeeded(chain, ranked[:index], candidate)
+                return found[0]
+        return None
+
+    def find(self, driver: WebDriver, chain: LocatorChain, timeout: float = 0) -> WebElement:
+        """
+        Look up the element of a chain, waiting until a candidate matches.
+
+        :param driver: The driver.
+        :param chain: The chain.
+        :param timeout: Seconds to wait at most, 0 for a single pass.
+        :return: The element.
+        :raises NoSuchElementException: If no candidate matches in a single pass.
+        :raises TimeoutException: If no candidate matched within the timeout.
+        """
+        if timeout > 0:
+            return WebDriverWait(driver, timeout, poll_frequency=self.poll).until(
+                lambda current: self.locate(current, chain),
+                f"No candidate of {chain.name} matched within {timeout} seconds",
+            )
+        element: Optional[WebElement] = self.locate(driver, chain)
+        if element is None:
+            raise NoSuchElementException(f"No candidate of {chain.name} matches")
+        return element
+
+    def _succeeded(self, chain: LocatorChain, failed: List[Candidate], used: Candidate) -> None:
+        """
+        Remember the candidate that matched and report a fallback.
+        """
+        with self._lock:
+            changed: bool = self._last.get(chain.name) != used
+            self._last[chain.name] = used
+            if failed:
+                fallback = Fallback(chain.name, tuple(map(_describe, failed)), _describe(used))
+                self.fallbacks.append(fallback)
+        if failed:
+            logger.warning(
+                "locator fallback",
+                extra={"chain": chain.name, "failed": list(fallback.failed),
+                       "used": fallback.used},
+            )
+        if changed:
+            self.save()
+
+    def save(self) -> None:
+        """
+        Write the last successful candidates to the JSON file, if any.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            remembered: Dict[str, List[str]] = {
+                name: list(candidate) for name, candidate in sorted(self._last.items())
+            }
+            temporary: str = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(remembered, file, indent=2)
+            os.replace(temporary, self.path)
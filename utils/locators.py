@@ -12,8 +12,18 @@ Usage:
 Classes:
     - :class:`MainPageLocators`: Locator class for web elements
     on the main page of the web application.
+    - :class:`TaskRowLocators`: Locator class for web elements
+    inside one row of the task list, relative to the row.
     - :class:`LoginPageLocators`: Locator class for web elements
     on the login page of the web application.
+    - :class:`LocatorChain`: Ordered candidate locators of one element.
+
+Attributes:
+    - ``LOCATOR_CHAINS``: The candidate chains of the single elements the
+      page objects look up, by the XPath of their locator. The candidates
+      are ordered id, name pattern and label or caption text, as far as the
+      element has them; where the locator itself is known to work, e.g. for
+      the duration fields, it goes first.
 
 Attributes for MainPageLocators:
 
@@ -22,10 +32,13 @@ Attributes for MainPageLocators:
     - ``BREAK_MINUTE``: Locator for the input field for break minutes.
     - ``BREAK_HOUR``: Locator for the input field for break hours.
     - ``DAY_BOOKING_TAB``: Locator for the booking tab.
+    - ``DAY_STATE``: Locator for all duration fields of the day in one query, in document order.
     - ``POP_UP_YES_BUTTON``: Locator for the popup confirmation button.
     - ``SAVE_BUTTON``: Locator for the save button.
     - ``TASKS_BUDGET``: Locator for the tasks budget element.
     - ``TASKS_DURATION``: Locator for the tasks duration element.
+    - ``TASKS_TABLE``: Locator for the task list table.
+    - ``TASKS_ROWS``: Locator for the rows of the task list table.
     - ``TASKS_DURATION_INPUT_HOURS``: Locator for the input field for task duration hours.
     - ``TASKS_DURATION_INPUT_MINUTES``: Locator for the input field for task duration minutes.
     - ``TASKS_DESCRIPTION_INPUT``: Locator for the textarea for task description.
@@ -34,6 +47,17 @@ Attributes for MainPageLocators:
     - ``UNRECORDED_EFFORTS_MINUTE``: Locator for the input field for unrecorded efforts minutes.
     - ``UNRECORDED_EFFORTS_HOUR``: Locator for the input field for unrecorded efforts hours.
 
+Attributes for TaskRowLocators:
+
+    - ``NAME``: Locator for the task name cell.
+    - ``PROJECT``: Locator for the project cell.
+    - ``REFERENCE_INPUT``: Locator for the input field for the reference.
+    - ``TITLE_INPUT``: Locator for the input field for the title.
+    - ``DURATION_INPUTS``: Locator for the input fields for duration hours and minutes.
+    - ``DESCRIPTION_INPUT``: Locator for the textarea for the description.
+    - ``BUDGET``: Locator for the budget cell.
+    - ``DURATION``: Locator for the booked duration cell.
+
 Attributes for LoginPageLocators:
 
     - ``EMAIL``: Locator for the email input field.
@@ -41,7 +65,12 @@ Attributes for LoginPageLocators:
     - ``SUBMIT``: Locator for the submit button.
 """
 
+from dataclasses import dataclass
 from enum import Enum
+from typing import Dict, Tuple
+from selenium.webdriver.common.by import By
+
+Candidate = Tuple[str, str]
 
 
 class MainPageLocators(str, Enum):
@@ -55,6 +84,8 @@ class MainPageLocators(str, Enum):
         - **BREAK_HOUR**: Locator for the input field for break hours.
         - **BREAK_MINUTE**: Locator for the input field for break minutes.
         - **DAY_BOOKING_TAB**: Locator for the booking tab.
+        - **DAY_STATE**: Locator for the hour and minute fields of attendance,
+          break, recorded and unrecorded efforts and of every task line.
         - **LOGIN**: Locator for the login link.
         - **LOGO**: Locator for the logo element.
         - **POP_UP_YES_BUTTON**: Locator for the popup confirmation button.
@@ -65,6 +96,8 @@ class MainPageLocators(str, Enum):
         - **TASKS_BUDGET**: Locator for the tasks budget element.
         - **TASKS_DESCRIPTION_INPUT**: Locator for the textarea for task description.
         - **TASKS_DURATION**: Locator for the tasks duration element.
+        - **TASKS_TABLE**: Locator for the task list table.
+        - **TASKS_ROWS**: Locator for the rows of the task list table.
         - **TASKS_DURATION_INPUT_HOURS**: Locator for the input field for task duration hours.
         - **TASKS_DURATION_INPUT_MINUTES**: Locator for the input field for task duration minutes.
         - **UNRECORDED_EFFORTS_HOUR**: Locator for the input field for unrecorded efforts hours.
@@ -93,6 +126,19 @@ class MainPageLocators(str, Enum):
 
     DAY_BOOKING_TAB: str = "//a[@id='PageTab_Link_jq_dayeffortrecording']"
 
+    DAY_STATE: str = (
+        "//table[@id='daytimerecording,Content,daytimerecordingAttendance_table']\
+/tbody/tr[1]//input[contains(@name, 'attandenceDuration_')]\
+ | //table[@id='daytimerecording,Content,daytimerecordingAttendance_table']\
+/tbody/tr[2]//input[contains(@name, 'attandenceDuration_')]\
+ | //table[@id='daytimerecording,Content,daytimerecordingAttendance_table']\
+/tbody/tr[3]//input[contains(@name, 'attandenceDuration_')]\
+ | //table[@id='daytimerecording,Content,daytimerecordingAttendance_table']\
+/tbody/tr[4]//input[contains(@name, 'attandenceDuration_')]\
+ | //table[@id='daytimerecording,Content,daytimerecordingTaskList_table']\
+/tbody/tr/td[9]//input[contains(@name, 'effortExpense_')]"
+    )
+
     POP_UP_YES_BUTTON: str = (
         "//input[@class='button notificationPermissionConfirm defaultbutton' and \
 @type='submit' and @value='Yes']"
@@ -107,6 +153,14 @@ class MainPageLocators(str, Enum):
         "//table[@id='daytimerecording,Content,daytimerecordingTaskList_table']/tbody/tr/td[13]"
     )
 
+    TASKS_TABLE: str = (
+        "//table[@id='daytimerecording,Content,daytimerecordingTaskList_table']"
+    )
+
+    TASKS_ROWS: str = (
+        "//table[@id='daytimerecording,Content,daytimerecordingTaskList_table']/tbody/tr"
+    )
+
     TASKS_DURATION_INPUT_HOURS: str = (
         "//table[@id='daytimerecording,Content,daytimerecordingTaskList_table']\
 /tbody/tr/td[9]//input[1]"
@@ -141,6 +195,33 @@ class MainPageLocators(str, Enum):
     )
 
 
+class TaskRowLocators(str, Enum):
+    """
+    Locator class for web elements inside one row of the task list.
+
+    The locators are relative to the ``<tr>`` element of the row.
+
+    :Attributes:
+        - **NAME**: Locator for the task name cell.
+        - **PROJECT**: Locator for the project cell.
+        - **REFERENCE_INPUT**: Locator for the input field for the reference.
+        - **TITLE_INPUT**: Locator for the input field for the title.
+        - **DURATION_INPUTS**: Locator for the input fields for duration hours and minutes.
+        - **DESCRIPTION_INPUT**: Locator for the textarea for the description.
+        - **BUDGET**: Locator for the budget cell.
+        - **DURATION**: Locator for the booked duration cell.
+    """
+
+    NAME: str = "./td[3]"
+    PROJECT: str = "./td[4]"
+    REFERENCE_INPUT: str = "./td[5]//input"
+    TITLE_INPUT: str = "./td[6]//input"
+    DURATION_INPUTS: str = "./td[9]//input"
+    DESCRIPTION_INPUT: str = "./td[10]//textarea"
+    BUDGET: str = "./td[12]"
+    DURATION: str = "./td[13]"
+
+
 class LoginPageLocators(Enum):
     """
     Locator class for web elements on the login page of the web application.
@@ -155,3 +236,89 @@ class LoginPageLocators(Enum):
     EMAIL: str = "//input[@id='label_user']"
     PASSWORD: str = "//input[@id='label_pwd']"
     SUBMIT: str = "//input[@id='loginbutton']"
+
+
+@dataclass(frozen=True)
+class LocatorChain:
+    """
+    Ordered candidate locators of one logical element, tried in turn when
+    the markup changed and the first ones no longer match.
+
+    :Attributes:
+        - **name** (*str*): The locator the chain stands for, e.g.
+          ``LoginPageLocators.EMAIL``.
+        - **candidates** (*Tuple[Candidate, ...]*): The ``(By, value)``
+          pairs, the most specific first. Every candidate is anchored to an
+          id, name, class or label, never to a position alone, as the
+          resolver keeps trying the candidate that matched last.
+    """
+
+    name: str
+    candidates: Tuple[Candidate, ...]
+
+
+def _chain(locator: Enum, *candidates: Candidate) -> Tuple[str, LocatorChain]:
+    return locator.value, LocatorChain(f"{type(locator).__name__}.{locator.name}", candidates)
+
+
+def _duration_chain(
+    locator: MainPageLocators, label: str, row: int, unit: str
+) -> Tuple[str, LocatorChain]:
+    return _chain(
+        locator,
+        (By.XPATH, locator.value),
+        (By.XPATH, f"//input[contains(@name, 'attandenceDuration_{unit}_{row}')]"),
+        (By.XPATH, f"//td[normalize-space()='{label}']/..//input[contains(@name, '_{unit}')]"),
+    )
+
+
+LOCATOR_CHAINS: Dict[str, LocatorChain] = dict(
+    [
+        _chain(
+            LoginPageLocators.EMAIL,
+            (By.ID, "label_user"),
+            (By.XPATH, "//input[@name='user']"),
+            (By.XPATH, "//label[normalize-space()='User name']/../..//input"),
+        ),
+        _chain(
+            LoginPageLocators.PASSWORD,
+            (By.ID, "label_pwd"),
+            (By.XPATH, "//input[@name='pwd' or @type='password']"),
+            (By.XPATH, "//label[normalize-space()='Password']/../..//input"),
+        ),
+        _chain(
+            LoginPageLocators.SUBMIT,
+            (By.ID, "loginbutton"),
+            (By.XPATH, "//input[@type='submit' and @value='Login']"),
+        ),
+        _chain(
+            MainPageLocators.DAY_BOOKING_TAB,
+            (By.ID, "PageTab_Link_jq_dayeffortrecording"),
+            (By.XPATH, "//a[contains(@id, 'dayeffortrecording')]"),
+            (By.XPATH, "//a[normalize-space()='Day booking']"),
+        ),
+        _chain(
+            MainPageLocators.POP_UP_YES_BUTTON,
+            (By.XPATH, MainPageLocators.POP_UP_YES_BUTTON.value),
+            (By.XPATH, "//input[contains(@class, 'notificationPermissionConfirm')]"),
+            (By.XPATH, "//div[contains(@class, 'notificationPermission')]//input[@value='Yes']"),
+        ),
+        _chain(
+            MainPageLocators.SAVE_BUTTON,
+            (By.XPATH, MainPageLocators.SAVE_BUTTON.value),
+            (
+                By.XPATH,
+                "//form[@id='daytimerecording']//input[@value='Save']"
+                " | //form[@id='daytimerecording']//button[normalize-space()='Save']",
+            ),
+        ),
+        _duration_chain(MainPageLocators.ATTANDENCE_HOUR, "Attendance", 1, "hour"),
+        _duration_chain(MainPageLocators.ATTANDENCE_MINUTE, "Attendance", 1, "minute"),
+        _duration_chain(MainPageLocators.BREAK_HOUR, "Break", 2, "hour"),
+        _duration_chain(MainPageLocators.BREAK_MINUTE, "Break", 2, "minute"),
+        _duration_chain(MainPageLocators.UNRECORDED_EFFORTS_HOUR, "Unrecorded efforts", 4, "hour"),
+        _duration_chain(
+            MainPageLocators.UNRECORDED_EFFORTS_MINUTE, "Unrecorded efforts", 4, "minute"
+        ),
+    ]
+)
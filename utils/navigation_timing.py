@@ -0,0 +1,213 @@
+"""
+Module: navigation_timing
+
+This module collects the browser's Navigation and Resource Timing entries for
+every page load and tab switch, so Projektron server latency can be told
+apart from the overhead of the automation itself.
+
+Usage:
+    Pass a :class:`NavigationReport` to the page objects; ``BasePage.open`` and
+    ``MainPage.click_on_booking_tab`` then add one :class:`NavigationTiming`
+    per navigation. Write the report with :meth:`NavigationReport.write`.
+
+    For every navigation the report holds the browser side figures (DNS, TCP
+    connect, time to first byte, DOMContentLoaded, load and the slowest
+    resources) next to the wall time the Python call took. The difference,
+    ``overhead_ms``, is spent in the automation and the WebDriver protocol.
+
+Classes:
+    - :class:`NavigationTiming`: Timing figures of one navigation.
+    - :class:`NavigationReport`: All navigations of a run.
+"""
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.structured_log import RUN_ID
+
+TIMING_SCRIPT: str = """
+const since = arguments[0];
+const limit = arguments[1];
+const navigation = performance.getEntriesByType('navigation')[0];
+if (navigation && navigation.loadEventEnd === 0) {
+    return {complete: false};
+}
+const resources = performance.getEntriesByType('resource')
+    .filter(entry => entry.startTime >= since)
+    .sort((a, b) => b.duration - a.duration)
+    .slice(0, limit)
+    .map(entry => ({
+        name: entry.name,
+        type: entry.initiatorType,
+        duration_ms: entry.duration,
+        transfer_bytes: entry.transferSize
+    }));
+return {
+    complete: true,
+    time_origin: performance.timeOrigin,
+    now: performance.now(),
+    navigation: navigation ? navigation.toJSON() : null,
+    resources: resources
+};
+"""
+
+
+@dataclass
+class NavigationTiming:  # pylint: disable=too-many-instance-attributes
+    """
+    Timing figures of one navigation, all durations in milliseconds.
+
+    Same-document tab switches have no new navigation entry, only their
+    resources and wall time are reported.
+
+    :Attributes:
+        - **label** (*str*): The action that navigated, e.g. ``open``.
+        - **url** (*str*): The URL after the navigation.
+        - **wall_ms** (*float*): Wall time of the Python call, without
+          waiting for the timing entries.
+        - **dns_ms** (*float*): Domain lookup time.
+        - **connect_ms** (*float*): TCP and TLS connect time.
+        - **ttfb_ms** (*float*): Time from navigation start to the first byte.
+        - **dom_content_loaded_ms** (*float*): Time to DOMContentLoaded.
+        - **load_ms** (*float*): Time to the load event.
+        - **slowest_resources** (*List[Dict]*): The slowest resources fetched.
+    """
+
+    label: str
+    url: str
+    wall_ms: float
+    dns_ms: float = 0.0
+    connect_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    dom_content_loaded_ms: float = 0.0
+    load_ms: float = 0.0
+    slowest_resources: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def overhead_ms(self) -> float:
+        """
+        Wall time not explained by the browser loading the page.
+        """
+        return max(0.0, self.wall_ms - self.load_ms)
+
+
+class NavigationReport:
+    """
+    All navigations of a run.
+
+    The report may be shared by the pages of several tabs and threads; the
+    entries already read are tracked per driver and tab.
+
+    :Attributes:
+        - **run_id** (*str*): Identifier of the run.
+        - **entries** (*List[NavigationTiming]*): The captured navigations.
+        - **resource_limit** (*int*): Number of slowest resources kept.
+        - **timeout** (*int*): Seconds to wait for the load event.
+    """
+
+    def __init__(
+        self, run_id: Optional[str] = None, resource_limit: int = 5, timeout: int = 10
+    ) -> None:
+        """
+        Initialize the NavigationReport.
+
+        :param run_id: Identifier of the run, the run id of the logs by default.
+        :param resource_limit: Number of slowest resources kept per navigation.
+        :param timeout: Seconds to wait for the load event.
+        """
+        self.run_id: str = run_id or RUN_ID
+        self.entries: List[NavigationTiming] = []
+        self.resource_limit: int = resource_limit
+        self.timeout: int = timeout
+        self._lock: threading.Lock = threading.Lock()
+        self._documents: Dict[Tuple[str, Optional[str]], Tuple[Optional[float], float]] = {}
+
+    def capture(
+        self, driver: Any, label: str, start: float, window_handle: Optional[str] = None
+    ) -> Optional[NavigationTiming]:
+        """
+        Read the timing entries of the navigation that just happened.
+
+        :param driver: The Selenium WebDriver instance.
+        :param label: The action that navigated.
+        :param start: ``time.perf_counter()`` taken before the action.
+        :param window_handle: The tab that navigated, None for the tab the
+            driver started with.
+        :return: The captured timing, None when the load event did not fire in time.
+        """
+        wall_ms: float = (time.perf_counter() - start) * 1000
+        key: Tuple[str, Optional[str]] = (driver.session_id, window_handle)
+        with self._lock:
+            time_origin, since = self._documents.get(key, (None, 0.0))
+        try:
+            data: Dict[str, Any] = WebDriverWait(driver, self.timeout).until(
+                lambda current: self._loaded(current, since)
+            )
+        except (TimeoutException, WebDriverException):
+            return None
+        navigation: Optional[Dict[str, float]] = data.get("navigation")
+        timing = NavigationTiming(
+            label=label,
+            url=driver.current_url,
+            wall_ms=wall_ms,
+            slowest_resources=data.get("resources", []),
+        )
+        if navigation and data.get("time_origin") != time_origin:
+            timing.dns_ms = navigation["domainLookupEnd"] - navigation["domainLookupStart"]
+            timing.connect_ms = navigation["connectEnd"] - navigation["connectStart"]
+            timing.ttfb_ms = navigation["responseStart"] - navigation["startTime"]
+            timing.dom_content_loaded_ms = (
+                navigation["domContentLoadedEventEnd"] - navigation["startTime"]
+            )
+            timing.load_ms = navigation["loadEventEnd"] - navigation["startTime"]
+        with self._lock:
+            self._documents[key] = (data.get("time_origin"), data.get("now", 0.0))
+            self.entries.append(timing)
+        return timing
+
+    def _loaded(self, driver: Any, since: float) -> Any:
+        """
+        Read the timing entries, False to keep polling until the load event fired.
+        """
+        data: Dict[str, Any] = driver.execute_script(TIMING_SCRIPT, since, self.resource_limit)
+        return data if data.get("complete") else False
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return the totals of the run.
+
+        :return: Total wall, browser load and overhead milliseconds.
+        :rtype: Dict[str, float]
+        """
+        return {
+            "navigations": len(self.entries),
+            "wall_ms": sum(entry.wall_ms for entry in self.entries),
+            "load_ms": sum(entry.load_ms for entry in self.entries),
+            "ttfb_ms": sum(entry.ttfb_ms for entry in self.entries),
+            "overhead_ms": sum(entry.overhead_ms for entry in self.entries),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the report as a JSON serializable dictionary.
+        """
+        return {
+            "run_id": self.run_id,
+            "summary": self.summary(),
+            "navigations": [
+                {**asdict(entry), "overhead_ms": entry.overhead_ms} for entry in self.entries
+            ],
+        }
+
+    def write(self, path: str) -> None:
+        """
+        Write the report as JSON.
+
+        :param path: The path of the report file.
+        """
+        with open(path, "w", encoding="utf-8") as report:
+            json.dump(self.to_dict(), report, indent=2)
@@ -0,0 +1,116 @@
+"""
+Module: process_stats
+
+This module reads the memory and CPU usage of a process and its children
+from ``/proc``, to account for the browser and driver processes of a session.
+
+Usage:
+    On systems without ``/proc`` (Windows, macOS) every figure is 0, except
+    for the current process whose CPU time is always known; check
+    :data:`SUPPORTED` before relying on a figure.
+
+Functions:
+    - :func:`process_tree`: Return a process id and all its descendants.
+    - :func:`start_time`: Start time of a process, to tell a reused id apart.
+    - :func:`rss_bytes`: Resident memory of a process tree.
+    - :func:`cpu_seconds`: CPU time of a process tree.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional
+
+PROC: str = "/proc"
+SUPPORTED: bool = os.path.isdir(PROC)
+
+
+def _stat_fields(pid: int) -> List[str]:
+    """
+    Return the fields of /proc/<pid>/stat after the command name.
+    """
+    with open(os.path.join(PROC, str(pid), "stat"), encoding="utf-8") as stat:
+        return stat.read().rsplit(")", 1)[1].split()
+
+
+def process_tree(pid: int) -> List[int]:
+    """
+    Return a process id and the ids of all its descendants.
+
+    :param pid: The root process id.
+    :return: The process ids of the tree, root first.
+    :rtype: List[int]
+    """
+    if not os.path.isdir(PROC):
+        return [pid]
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir(PROC):
+        if not entry.isdigit():
+            continue
+        try:
+            parent = int(_stat_fields(int(entry))[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+    tree: List[int] = [pid]
+    for current in tree:
+        tree.extend(children.get(current, []))
+    return tree
+
+
+def start_time(pid: int) -> Optional[int]:
+    """
+    Return the start time of a process, in clock ticks after boot.
+
+    A process id is reused once its process has exited; the same id with
+    the same start time is the same process.
+
+    :param pid: The process id.
+    :return: The start time, None when the process does not exist or is unknown.
+    :rtype: int, optional
+    """
+    try:
+        return int(_stat_fields(pid)[19])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def rss_bytes(pid: int, include_children: bool = True) -> int:
+    """
+    Return the resident memory of a process, and of its children by default.
+
+    :param pid: The process id.
+    :param include_children: Whether to add the memory of all descendants.
+    :return: The resident set size in bytes, 0 when unknown.
+    :rtype: int
+    """
+    total: int = 0
+    page_size: int = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+    for member in process_tree(pid) if include_children else [pid]:
+        try:
+            with open(os.path.join(PROC, str(member), "statm"), encoding="utf-8") as statm:
+                total += int(statm.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+def cpu_seconds(pid: int, include_children: bool = True) -> float:
+    """
+    Return the CPU time (user and system) of a process and its children.
+
+    :param pid: The process id.
+    :param include_children: Whether to add the CPU time of all descendants.
+    :return: The CPU time in seconds, 0 when unknown.
+    :rtype: float
+    """
+    if pid == os.getpid() and not include_children:
+        return time.process_time()
+    ticks: float = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    total: float = 0.0
+    for member in process_tree(pid) if include_children else [pid]:
+        try:
+            fields = _stat_fields(member)
+            total += (int(fields[11]) + int(fields[12])) / ticks
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
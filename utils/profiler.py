@@ -0,0 +1,300 @@
+"""
+Module: profiler
+
+This module profiles a booking run and splits the time spent in every page
+object method into Python CPU time, WebDriver round trips and idle waiting
+in ``WebDriverWait``.
+
+Usage:
+    Run the flow inside a :class:`FlowProfiler`, then write the cProfile dump
+    and print the summary::
+
+        with FlowProfiler() as profiler:
+            login_page.login(user, password)
+            main_page.book(job)
+        profiler.dump("projektron.prof")
+        print(utils.tables.markdown_table([row.as_row() for row in profiler.rows()]))
+
+    While the profiler runs, the methods of the page classes, the
+    ``execute`` method of Selenium's remote WebDriver (every command sent to
+    the browser driver, for Chrome as for remote nodes) and
+    ``WebDriverWait.until`` / ``until_not`` are wrapped with timers. Time is
+    attributed to the innermost page method on the stack of the calling
+    thread:
+
+    - **driver**: round trips of WebDriver commands, including the commands
+      a ``WebDriverWait`` polls with.
+    - **wait**: time inside ``WebDriverWait`` other than its round trips,
+      i.e. the sleeps between polls.
+    - **cpu**: the rest, our Python code and Selenium's own overhead.
+
+    Time outside any page method is reported as ``(outside pages)``. The
+    cProfile dump covers the same run and opens with ``pstats`` or
+    ``snakeviz``. Drivers not built on Selenium's remote WebDriver, such as
+    :class:`utils.fake_driver.FakeWebDriver`, show no round trips.
+
+    cProfile only profiles the thread that enables it, so the thread calling
+    :meth:`FlowProfiler.start` is profiled throughout, and every other
+    thread, e.g. a grid slot, while it runs a page method; the dump merges
+    them. Code of other threads outside page methods is not in the dump.
+
+Classes:
+    - :class:`MethodTime`: Time spent in one page method.
+    - :class:`FlowProfiler`: Profile the booking flow per page method.
+"""
+
+import cProfile
+import functools
+import inspect
+import pstats
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from pages.main_page import MainPage
+
+OUTSIDE: str = "(outside pages)"
+
+
+@dataclass
+class MethodTime:
+    """
+    Time spent in one page method, over all its calls.
+
+    :Attributes:
+        - **method** (*str*): The qualified name of the method.
+        - **calls** (*int*): The number of calls.
+        - **total** (*float*): Seconds from call to return, including the
+          page methods it called.
+        - **cpu** (*float*): Seconds in Python code of the method itself.
+        - **driver** (*float*): Seconds in WebDriver round trips of the method itself.
+        - **wait** (*float*): Seconds idle in ``WebDriverWait`` in the method itself.
+    """
+
+    method: str
+    calls: int = 0
+    total: float = 0.0
+    cpu: float = 0.0
+    driver: float = 0.0
+    wait: float = 0.0
+
+    @property
+    def own(self) -> float:
+        """
+        Seconds spent in the method itself, without the page methods it called.
+        """
+        return self.cpu + self.driver + self.wait
+
+    def as_row(self) -> Dict[str, str]:
+        """
+        Return the times as strings in milliseconds for a table.
+        """
+        return {
+            "method": self.method,
+            "calls": str(self.calls),
+            "total_ms": f"{self.total * 1000:.1f}",
+            "cpu_ms": f"{self.cpu * 1000:.1f}",
+            "driver_ms": f"{self.driver * 1000:.1f}",
+            "wait_ms": f"{self.wait * 1000:.1f}",
+        }
+
+
+class _Frame:  # pylint: disable=too-few-public-methods
+    """
+    A running page method call.
+    """
+
+    __slots__ = ("method", "children", "driver", "wait")
+
+    def __init__(self, method: str) -> None:
+        self.method: str = method
+        self.children: float = 0.0
+        self.driver: float = 0.0
+        self.wait: float = 0.0
+
+
+class FlowProfiler:  # pylint: disable=too-many-instance-attributes
+    """
+    Profile the booking flow and attribute its time to the page methods.
+
+    :Attributes:
+        - **classes** (*Tuple[type, ...]*): The page classes whose methods are timed.
+        - **profile** (*cProfile.Profile*): The profile of the thread
+          running the profiler.
+        - **times** (*Dict[str, MethodTime]*): The time per method.
+    """
+
+    def __init__(self, classes: Tuple[Type[Any], ...] = (BasePage, LoginPage, MainPage)) -> None:
+        """
+        Initialize the FlowProfiler.
+
+        :param classes: The page classes whose methods are timed.
+        """
+        self.classes: Tuple[Type[Any], ...] = classes
+        self.profile: cProfile.Profile = cProfile.Profile()
+        self.times: Dict[str, MethodTime] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._local: threading.local = threading.local()
+        self._patched: List[Tuple[Type[Any], str, Any]] = []
+        self._started: float = 0.0
+        self._owner: Optional[int] = None
+        self._thread_profiles: List[cProfile.Profile] = []
+
+    def _stack(self) -> List[_Frame]:
+        stack: Optional[List[_Frame]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = [_Frame(OUTSIDE)]
+        return stack
+
+    def _thread_profile(self) -> Optional[cProfile.Profile]:
+        """
+        Return the profile of a thread other than the one running the profiler.
+        """
+        if threading.get_ident() == self._owner:
+            return None
+        profile: Optional[cProfile.Profile] = getattr(self._local, "profile", None)
+        if profile is None:
+            profile = self._local.profile = cProfile.Profile()
+            with self._lock:
+                self._thread_profiles.append(profile)
+        return profile
+
+    def _add(self, frame: _Frame, total: float, calls: int = 1) -> None:
+        with self._lock:
+            times: MethodTime = self.times.setdefault(frame.method, MethodTime(frame.method))
+            times.calls += calls
+            times.total += total
+            times.driver += frame.driver
+            times.wait += frame.wait
+            times.cpu += max(0.0, total - frame.children - frame.driver - frame.wait)
+
+    def _page_method(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        name: str = function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            stack: List[_Frame] = self._stack()
+            profile: Optional[cProfile.Profile] = (
+                self._thread_profile() if len(stack) == 1 else None
+            )
+            frame: _Frame = _Frame(name)
+            stack.append(frame)
+            if profile is not None:
+                profile.enable()
+            start: float = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed: float = time.perf_counter() - start
+                if profile is not None:
+                    profile.disable()
+                stack.pop()
+                stack[-1].children += elapsed
+                self._add(frame, elapsed)
+
+        return wrapper
+
+    def _round_trip(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start: float = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._stack()[-1].driver += time.perf_counter() - start
+
+        return wrapper
+
+    def _wait(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            frame: _Frame = self._stack()[-1]
+            busy: float = frame.driver + frame.children
+            start: float = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed: float = time.perf_counter() - start
+                frame.wait += max(0.0, elapsed - (frame.driver + frame.children - busy))
+
+        return wrapper
+
+    def _patch(self, owner: Type[Any], name: str, wrap: Callable[[Any], Any]) -> None:
+        original: Any = vars(owner)[name]
+        self._patched.append((owner, name, original))
+        setattr(owner, name, wrap(original))
+
+    def start(self) -> None:
+        """
+        Wrap the page methods, WebDriver commands and waits, and start profiling.
+        """
+        for cls in self.classes:
+            for name, member in list(vars(cls).items()):
+                if (
+                    not name.startswith("__")
+                    and inspect.isfunction(member)
+                    and not inspect.isgeneratorfunction(member)
+                ):
+                    self._patch(cls, name, self._page_method)
+        self._patch(WebDriver, "execute", self._round_trip)
+        self._patch(WebDriverWait, "until", self._wait)
+        self._patch(WebDriverWait, "until_not", self._wait)
+        self._owner = threading.get_ident()
+        self._started = time.perf_counter()
+        self.profile.enable()
+
+    def stop(self) -> None:
+        """
+        Stop profiling and restore the wrapped methods.
+        """
+        self.profile.disable()
+        while self._patched:
+            owner, name, original = self._patched.pop()
+            setattr(owner, name, original)
+        outside: _Frame = self._stack()[0]
+        self._add(outside, time.perf_counter() - self._started, calls=0)
+        self._local.stack = None
+        self._owner = None
+
+    def __enter__(self) -> "FlowProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def dump(self, path: str) -> None:
+        """
+        Write the cProfile statistics of the run, all threads merged.
+
+        :param path: The file, e.g. ``projektron.prof``.
+        """
+        stats = pstats.Stats(self.profile)
+        with self._lock:
+            for profile in self._thread_profiles:
+                stats.add(profile)
+        stats.dump_stats(path)
+
+    def rows(self) -> List[MethodTime]:
+        """
+        Return the time per method, the most expensive first.
+
+        :return: The methods sorted by their own time, then a ``total`` line.
+        """
+        with self._lock:
+            methods: List[MethodTime] = sorted(
+                self.times.values(), key=lambda times: times.own, reverse=True
+            )
+        total = MethodTime(
+            "total",
+            calls=sum(times.calls for times in methods),
+            total=sum(times.own for times in methods),
+            cpu=sum(times.cpu for times in methods),
+            driver=sum(times.driver for times in methods),
+            wait=sum(times.wait for times in methods),
+        )
+        return [*methods, total]
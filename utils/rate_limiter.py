@@ -0,0 +1,256 @@
+"""
+Module: rate_limiter
+
+This module limits the rate of navigations and form submits sent to the
+Projektron server by all automation running on a host, and lowers it while
+the server answers slowly.
+
+Usage:
+    Give the page objects a :class:`RateLimiter`; ``BasePage`` then takes a
+    token before every navigation and form submit and reports how long the
+    server took to answer::
+
+        limiter = RateLimiter(rate=2.0, burst=4)
+        main_page = MainPage(driver, rate_limiter=limiter)
+
+    The token bucket lives in a SQLite file in the temporary directory, so
+    every thread and process using the same file shares one budget. A request
+    reserves its token at once and sleeps until the bucket has refilled to
+    it, so waiting callers are served in order.
+
+    The rate adapts additively increasing, multiplicatively decreasing: every
+    response slower than ``target_seconds`` (on a moving average) halves the
+    rate, at most once per ``target_seconds``, down to ``min_rate``; every
+    faster one adds a tenth of the configured rate back. Response times are
+    the server's time to first byte when navigation timing is recorded, the
+    wall time of the call otherwise.
+
+    A bucket nobody used for ``expire_seconds`` is reset when a limiter
+    opens it: the rate, latency and counters of an earlier run do not carry
+    over, while runs overlapping in time keep sharing their backoff.
+
+Classes:
+    - :class:`RateStatus`: The shared state of a rate limiter.
+    - :class:`RateLimiter`: Token bucket shared through a SQLite file.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_PATH: str = os.path.join(tempfile.gettempdir(), "projektron_rate_limit.sqlite")
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    rate REAL NOT NULL,
+    latency REAL,
+    decreased REAL NOT NULL DEFAULT 0,
+    throttled REAL NOT NULL DEFAULT 0,
+    requests INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+@dataclass(frozen=True)
+class RateStatus:
+    """
+    The shared state of a rate limiter.
+
+    :Attributes:
+        - **rate** (*float*): The current rate in requests per second.
+        - **tokens** (*float*): The tokens in the bucket, negative while
+          callers wait for reserved tokens.
+        - **latency** (*float, optional*): Moving average of the response
+          times in seconds, None before the first response.
+        - **throttled_seconds** (*float*): Time all callers slept in total.
+        - **requests** (*int*): Tokens taken in total.
+    """
+
+    rate: float
+    tokens: float
+    latency: Optional[float]
+    throttled_seconds: float
+    requests: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the status as a dictionary, e.g. for a log record.
+        """
+        return asdict(self)
+
+
+class RateLimiter:  # pylint: disable=too-many-instance-attributes
+    """
+    Token bucket shared by every thread and process using the same file.
+
+    :Attributes:
+        - **path** (*str*): The SQLite file holding the bucket.
+        - **name** (*str*): The bucket, e.g. one per Projektron instance.
+        - **max_rate** (*float*): The configured rate in requests per second.
+        - **min_rate** (*float*): The rate is never lowered below this.
+        - **burst** (*float*): The tokens the bucket holds at most.
+        - **target_seconds** (*float*): Response time above which the rate
+          is lowered.
+        - **weight** (*float*): Weight of the latest response in the average.
+        - **throttled_seconds** (*float*): Time callers of this instance slept.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        rate: float = 2.0,
+        burst: float = 4.0,
+        path: str = DEFAULT_PATH,
+        name: str = "projektron",
+        min_rate: float = 0.2,
+        target_seconds: float = 3.0,
+        weight: float = 0.3,
+        expire_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the RateLimiter, creating the bucket if needed.
+
+        :param rate: The highest rate in requests per second.
+        :param burst: The tokens the bucket holds at most.
+        :param path: The SQLite file holding the bucket.
+        :param name: The bucket.
+        :param min_rate: The rate is never lowered below this.
+        :param target_seconds: Response time above which the rate is lowered.
+        :param weight: Weight of the latest response in the average.
+        :param expire_seconds: Idle time after which the state of the bucket
+            is reset when a limiter opens it.
+        :param clock: Returns the wall clock time, shared by all processes.
+        :param sleep: Sleeps for a number of seconds.
+        :raises ValueError: If the rates or the burst are not positive.
+        """
+        if rate <= 0 or burst < 1 or not 0 < min_rate <= rate:
+            raise ValueError(f"Invalid rate {rate}, minimum rate {min_rate} or burst {burst}")
+        self.path: str = path
+        self.name: str = name
+        self.max_rate: float = rate
+        self.min_rate: float = min_rate
+        self.burst: float = burst
+        self.target_seconds: float = target_seconds
+        self.weight: float = weight
+        self.throttled_seconds: float = 0.0
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], None] = sleep
+        self._lock: threading.Lock = threading.Lock()
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.connection.executescript(SCHEMA)
+        now: float = clock()
+        self.connection.execute(
+            "INSERT OR IGNORE INTO buckets (name, tokens, updated, rate) VALUES (?, ?, ?, ?)",
+            (name, burst, now, rate),
+        )
+        self.connection.execute(
+            "UPDATE buckets SET tokens = ?, updated = ?, rate = ?, latency = NULL, "
+            "decreased = 0, throttled = 0, requests = 0 WHERE name = ? AND updated < ?",
+            (burst, now, rate, name, now - expire_seconds),
+        )
+        self.connection.execute(
+            "UPDATE buckets SET rate = MIN(rate, ?) WHERE name = ?", (rate, name)
+        )
+
+    def _update(self, change: Callable[[sqlite3.Row, float], Dict[str, Any]]) -> None:
+        """
+        Apply a change to the bucket in one write transaction.
+        """
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.connection.execute(
+                    "SELECT tokens, updated, rate, latency, decreased, throttled, requests "
+                    "FROM buckets WHERE name = ?",
+                    (self.name,),
+                ).fetchone()
+                values: Dict[str, Any] = change(row, self._clock())
+                self.connection.execute(
+                    f"UPDATE buckets SET {', '.join(f'{key} = ?' for key in values)} "
+                    "WHERE name = ?",
+                    (*values.values(), self.name),
+                )
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until the bucket has refilled to it.
+
+        :return: The seconds slept.
+        :rtype: float
+        """
+        wait: float = 0.0
+
+        def take(row: Any, now: float) -> Dict[str, Any]:
+            nonlocal wait
+            tokens, updated, rate = row[0], row[1], row[2]
+            tokens = min(self.burst, tokens + max(0.0, now - updated) * rate) - 1
+            wait = -tokens / rate if tokens < 0 else 0.0
+            return {"tokens": tokens, "updated": now, "requests": row[6] + 1}
+
+        self._update(take)
+        if wait > 0:
+            self._sleep(wait)
+            with self._lock:
+                self.throttled_seconds += wait
+            self._update(lambda row, now: {"throttled": row[5] + wait})
+        return wait
+
+    def observe(self, seconds: float) -> None:
+        """
+        Adapt the shared rate to the response time of a request.
+
+        :param seconds: How long the server took to answer.
+        """
+        def adapt(row: Any, now: float) -> Dict[str, Any]:
+            tokens, updated, rate, latency, decreased = row[:5]
+            latency = seconds if latency is None else (
+                self.weight * seconds + (1 - self.weight) * latency
+            )
+            values: Dict[str, Any] = {
+                "tokens": min(self.burst, tokens + max(0.0, now - updated) * rate),
+                "updated": now,
+                "latency": latency,
+            }
+            if latency <= self.target_seconds:
+                values["rate"] = min(self.max_rate, rate + self.max_rate / 10)
+            elif now - decreased >= self.target_seconds:
+                values.update(rate=max(self.min_rate, rate / 2), decreased=now)
+            return values
+
+        self._update(adapt)
+
+    def status(self) -> RateStatus:
+        """
+        Return the shared state of the bucket.
+
+        :return: The current rate, tokens, latency and throttle time.
+        :rtype: RateStatus
+        """
+        with self._lock:
+            tokens, updated, rate, latency, throttled, requests = self.connection.execute(
+                "SELECT tokens, updated, rate, latency, throttled, requests FROM buckets "
+                "WHERE name = ?",
+                (self.name,),
+            ).fetchone()
+        tokens = min(self.burst, tokens + max(0.0, self._clock() - updated) * rate)
+        return RateStatus(rate, tokens, latency, throttled, requests)
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self.connection.close()
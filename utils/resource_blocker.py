@@ -0,0 +1,265 @@
+"""
+Module: resource_blocker
+
+This module keeps the browser from downloading assets the automation never
+looks at (images, fonts, icons, notification scripts) on Projektron pages.
+
+Usage:
+    Build a :class:`ResourceBlocklist` (or use :data:`DEFAULT_BLOCKLIST`) and
+    apply it with :func:`apply_blocklist` right after the driver is created.
+    Blocking is opt-in: ``main.py`` only applies it with ``block_resources=1``,
+    and ``PROJEKTRON_BLOCKLIST=off`` turns it off again while debugging.
+
+    The blocklist is installed with Chrome's ``Network.setBlockedURLs`` in
+    the tab the driver is on, and covers every page that tab loads. Tabs
+    opened later, such as those of :func:`utils.tab_booking.book_in_tabs`,
+    are new DevTools targets and load unblocked. The command only matches
+    URL patterns:
+
+    - Resource types are approximated by file extensions, see
+      :data:`RESOURCE_TYPE_PATTERNS`; an image served without one is loaded.
+    - There are no allow rules. Block patterns overlapping an allowed
+      pattern are left out, but a broad pattern such as ``*.png`` still
+      blocks a matching URL below an allowed path.
+
+    :meth:`ResourceBlocklist.is_blocked` answers what the browser actually
+    blocks under these limits. Intercepting every request with the ``Fetch``
+    domain would lift them, but needs a DevTools event connection Selenium's
+    ``execute_cdp_cmd`` does not offer. Drivers without DevTools, such as
+    ``webdriver.Remote`` on a grid, cannot block at all and a warning is
+    logged.
+
+    :func:`compare_blocklist` loads a page with and without the blocklist and
+    reports the load time and the bytes transferred of both runs.
+
+Classes:
+    - :class:`ResourceBlocklist`: URL patterns and resource types to block.
+    - :class:`PageLoadMetrics`: Load time and transfer size of a page load.
+
+Functions:
+    - :func:`blocklist_enabled`: Whether blocking is enabled by the environment.
+    - :func:`apply_blocklist`: Install a blocklist in the browser.
+    - :func:`remove_blocklist`: Remove any installed blocklist.
+    - :func:`measure_page_load`: Load a page and measure it.
+    - :func:`compare_blocklist`: Measure a page with and without a blocklist.
+"""
+
+import logging
+import os
+import statistics
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Dict, List, Tuple
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger: logging.Logger = logging.getLogger("projektron.resources")
+
+RESOURCE_TYPE_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "Image": ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.webp", "*.bmp"),
+    "Font": ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"),
+    "Media": ("*.mp3", "*.mp4", "*.ogg", "*.webm", "*.wav"),
+    "Stylesheet": ("*.css",),
+}
+
+PAGE_LOAD_SCRIPT: str = """
+const navigation = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    load_ms: navigation ? navigation.loadEventEnd - navigation.startTime : 0,
+    transferred_bytes: (navigation ? navigation.transferSize : 0)
+        + resources.reduce((total, entry) => total + entry.transferSize, 0),
+    resource_count: resources.length
+};
+"""
+
+
+@dataclass(frozen=True)
+class ResourceBlocklist:
+    """
+    A set of URL patterns and resource types the browser must not load.
+
+    Patterns use ``*`` wildcards as Chrome does. Resource types and allowed
+    patterns are translated to URL patterns, see the module documentation.
+
+    :Attributes:
+        - **url_patterns** (*Tuple[str, ...]*): URL patterns to block.
+        - **resource_types** (*Tuple[str, ...]*): Resource types to block by
+          their file extensions, see :data:`RESOURCE_TYPE_PATTERNS`.
+        - **allowed_patterns** (*Tuple[str, ...]*): URL patterns whose
+          overlapping block patterns are not installed.
+    """
+
+    url_patterns: Tuple[str, ...] = (
+        "*/favicon*",
+        "*/icons/*",
+        "*notification*.js",
+        "*/push/*",
+    )
+    resource_types: Tuple[str, ...] = ("Image", "Font", "Media")
+    allowed_patterns: Tuple[str, ...] = ("*daytimerecording*", "*dayeffortrecording*")
+
+    def _type_patterns(self) -> List[str]:
+        return [
+            pattern
+            for resource_type in self.resource_types
+            for pattern in RESOURCE_TYPE_PATTERNS.get(resource_type, ())
+        ]
+
+    def is_blocked(self, url: str) -> bool:
+        """
+        Whether the browser blocks a request once the blocklist is installed.
+
+        :param url: The requested URL.
+        :type url: str
+        :return: True when the URL matches a pattern of :meth:`browser_patterns`.
+        :rtype: bool
+        """
+        return any(fnmatchcase(url, pattern) for pattern in self.browser_patterns())
+
+    def browser_patterns(self) -> List[str]:
+        """
+        Return the URL patterns to install in the browser.
+
+        Chrome's URL blocking has no allow rules, so patterns overlapping an
+        allowed pattern are left out.
+
+        :return: The URL patterns to block.
+        :rtype: List[str]
+        """
+        return [
+            pattern
+            for pattern in [*self.url_patterns, *self._type_patterns()]
+            if not any(
+                fnmatchcase(pattern, allowed) or fnmatchcase(allowed, pattern)
+                for allowed in self.allowed_patterns
+            )
+        ]
+
+
+DEFAULT_BLOCKLIST: ResourceBlocklist = ResourceBlocklist()
+
+
+@dataclass(frozen=True)
+class PageLoadMetrics:
+    """
+    Load time and transfer size of a page load.
+
+    :Attributes:
+        - **load_ms** (*float*): Time from navigation start to the load event.
+        - **transferred_bytes** (*int*): Bytes transferred for the page and its resources.
+        - **resource_count** (*int*): Number of resources loaded.
+    """
+
+    load_ms: float
+    transferred_bytes: int
+    resource_count: int
+
+
+def blocklist_enabled() -> bool:
+    """
+    Whether resource blocking is enabled, ``PROJEKTRON_BLOCKLIST=off`` disables it.
+
+    :return: False when blocking is turned off in the environment.
+    :rtype: bool
+    """
+    return os.environ.get("PROJEKTRON_BLOCKLIST", "on").lower() not in ("off", "0", "false")
+
+
+def apply_blocklist(
+    driver: WebDriver, blocklist: ResourceBlocklist = DEFAULT_BLOCKLIST
+) -> bool:
+    """
+    Install a blocklist in the browser.
+
+    Only Chromium based drivers support network interception, other drivers
+    are left untouched with a warning.
+
+    :param driver: The Selenium WebDriver instance.
+    :param blocklist: The blocklist to install.
+    :return: True when the blocklist was installed.
+    :rtype: bool
+    """
+    if not blocklist_enabled():
+        return False
+    if not hasattr(driver, "execute_cdp_cmd"):
+        logger.warning("resource blocking unsupported",
+                       extra={"driver": type(driver).__name__})
+        return False
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocklist.browser_patterns()})
+    return True
+
+
+def remove_blocklist(driver: WebDriver) -> None:
+    """
+    Remove any blocklist installed in the browser.
+
+    :param driver: The Selenium WebDriver instance.
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+
+
+def measure_page_load(driver: WebDriver, url: str) -> PageLoadMetrics:
+    """
+    Load a page and measure it with the Navigation and Resource Timing APIs.
+
+    :param driver: The Selenium WebDriver instance.
+    :param url: The URL to load.
+    :return: The metrics of the page load.
+    :rtype: PageLoadMetrics
+    """
+    driver.get(url)
+    metrics: Dict = driver.execute_script(PAGE_LOAD_SCRIPT) or {}
+    return PageLoadMetrics(
+        load_ms=float(metrics.get("load_ms", 0)),
+        transferred_bytes=int(metrics.get("transferred_bytes", 0)),
+        resource_count=int(metrics.get("resource_count", 0)),
+    )
+
+
+def compare_blocklist(
+    driver: WebDriver,
+    url: str,
+    blocklist: ResourceBlocklist = DEFAULT_BLOCKLIST,
+    runs: int = 3,
+) -> Dict[str, PageLoadMetrics]:
+    """
+    Load a page with and without a blocklist and return the median metrics.
+
+    The browser cache is disabled while measuring so every run downloads the
+    same resources. Any blocklist is removed afterwards; apply it again to
+    keep blocking.
+
+    :param driver: The Selenium WebDriver instance.
+    :param url: The URL to load.
+    :param blocklist: The blocklist to compare against no blocking.
+    :param runs: Number of page loads per variant.
+    :return: The median metrics under the keys ``unblocked`` and ``blocked``,
+        empty with a warning for drivers without network interception.
+    :rtype: Dict[str, PageLoadMetrics]
+    """
+    results: Dict[str, PageLoadMetrics] = {}
+    if not hasattr(driver, "execute_cdp_cmd"):
+        logger.warning("resource blocking unsupported",
+                       extra={"driver": type(driver).__name__})
+        return results
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+    try:
+        for variant, patterns in (("unblocked", []), ("blocked", blocklist.browser_patterns())):
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            samples = [measure_page_load(driver, url) for _ in range(runs)]
+            results[variant] = PageLoadMetrics(
+                load_ms=statistics.median(sample.load_ms for sample in samples),
+                transferred_bytes=int(
+                    statistics.median(sample.transferred_bytes for sample in samples)
+                ),
+                resource_count=int(
+                    statistics.median(sample.resource_count for sample in samples)
+                ),
+            )
+    finally:
+        remove_blocklist(driver)
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+    return results
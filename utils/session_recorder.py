@@ -0,0 +1,300 @@
+"""
+Module: session_recorder
+
+This module records the WebDriver commands issued through the page objects
+into a compact log file and replays them later without a browser or network.
+
+Usage:
+    Wrap a live driver with :func:`record_session` to capture every command and
+    its response, then build a driver from the log with :func:`replay_driver`
+    and hand it to ``LoginPage`` / ``MainPage`` as usual.
+
+    The log is a gzip compressed JSON lines file. Large string parameters (the
+    JavaScript atoms Selenium sends for ``get_attribute``) are stored as a
+    digest and secrets can be redacted before they reach the disk.
+
+Classes:
+    - :class:`ReplayMismatchError`: Raised when a replayed command differs from the log.
+    - :class:`RecordingCommandExecutor`: Command executor logging every command.
+    - :class:`ReplayCommandExecutor`: Command executor answering from a log.
+
+Functions:
+    - :func:`record_session`: Start recording the commands of a driver.
+    - :func:`replay_driver`: Create a WebDriver fed from a recorded log.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from selenium import webdriver
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+REDACTED: str = "<redacted>"
+LARGE_STRING_LIMIT: int = 256
+
+
+class ReplayMismatchError(Exception):
+    """Custom exception for a replayed command not matching the log."""
+
+
+def _compact(value: Any, secrets: Iterable[str] = ()) -> Any:
+    """
+    Return a JSON friendly copy of a command parameter value.
+
+    Session ids are dropped, long strings are replaced by their digest and
+    every secret is replaced by a placeholder.
+
+    :param value: The parameter value to compact.
+    :param secrets: Strings that must never be written to the log.
+    :return: The compacted value.
+    """
+    if isinstance(value, dict):
+        compacted: Dict[str, Any] = {
+            key: _compact(item, secrets)
+            for key, item in value.items()
+            if key != "sessionId"
+        }
+        # send_keys also sends the text split into single keys
+        if compacted.get("text") == REDACTED and "value" in compacted:
+            compacted["value"] = REDACTED
+        return compacted
+    if isinstance(value, (list, tuple)):
+        return [_compact(item, secrets) for item in value]
+    if isinstance(value, str):
+        if value in secrets:
+            return REDACTED
+        if len(value) > LARGE_STRING_LIMIT:
+            return {"sha1": hashlib.sha1(value.encode("utf-8")).hexdigest()}
+    return value
+
+
+def _redact(value: Any, secrets: Iterable[str] = ()) -> Any:
+    """
+    Return a copy of a response value with every secret replaced.
+
+    :param value: The response value to redact.
+    :param secrets: Strings that must never be written to the log.
+    :return: The redacted value.
+    """
+    if isinstance(value, dict):
+        return {key: _redact(item, secrets) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_redact(item, secrets) for item in value]
+    if isinstance(value, str) and value in secrets:
+        return REDACTED
+    return value
+
+
+def _matches(recorded: Any, actual: Any) -> bool:
+    """
+    Compare a recorded parameter value with a replayed one.
+
+    Redacted values match anything, so secrets are not needed to replay a log.
+
+    :param recorded: The compacted value read from the log.
+    :param actual: The compacted value issued during replay.
+    :return: True when both values are considered equal.
+    """
+    if recorded == REDACTED:
+        return True
+    if isinstance(recorded, dict) and isinstance(actual, dict):
+        return recorded.keys() == actual.keys() and all(
+            _matches(recorded[key], actual[key]) for key in recorded
+        )
+    if isinstance(recorded, list) and isinstance(actual, list):
+        return len(recorded) == len(actual) and all(
+            _matches(left, right) for left, right in zip(recorded, actual)
+        )
+    return recorded == actual
+
+
+class RecordingCommandExecutor:
+    """
+    Command executor forwarding to another executor and logging every command.
+
+    :Attributes:
+        - **inner**: The wrapped command executor.
+        - **log_path** (*str*): The path of the gzip compressed log file.
+        - **secrets** (*List[str]*): Strings redacted from the log.
+    """
+
+    def __init__(self, inner: Any, log_path: str, secrets: Iterable[str] = ()) -> None:
+        """
+        Initialize the RecordingCommandExecutor.
+
+        :param inner: The command executor to forward commands to.
+        :param log_path: The path of the log file to write.
+        :param secrets: Strings that must be redacted from the log.
+        """
+        self.inner: Any = inner
+        self.log_path: str = log_path
+        self.secrets: List[str] = [secret for secret in secrets if secret]
+        self._lock: threading.Lock = threading.Lock()
+        self._log = gzip.open(log_path, "wt", encoding="utf-8")
+
+    def execute(self, command: str, params: Optional[Dict[str, Any]]) -> Any:
+        """
+        Execute a command through the wrapped executor and log it.
+
+        :param command: The WebDriver command name.
+        :param params: The command parameters.
+        :return: The raw response of the wrapped executor.
+        """
+        compact_params = _compact(params or {}, self.secrets)
+        start: float = time.perf_counter()
+        response = self.inner.execute(command, params)
+        elapsed_ms: float = (time.perf_counter() - start) * 1000
+        record: Dict[str, Any] = {
+            "cmd": command,
+            "params": compact_params,
+            "response": _redact(response, self.secrets),
+            "ms": round(elapsed_ms, 3),
+        }
+        with self._lock:
+            self._log.write(json.dumps(record, separators=(",", ":")) + "\n")
+        return response
+
+    def close(self) -> None:
+        """
+        Flush and close the log file.
+        """
+        with self._lock:
+            self._log.close()
+
+
+class SessionRecorder:
+    """
+    Handle returned by :func:`record_session`, usable as a context manager.
+
+    :Attributes:
+        - **driver** (*WebDriver*): The recorded driver.
+        - **executor** (:class:`RecordingCommandExecutor`): The recording executor.
+    """
+
+    def __init__(self, driver: WebDriver, executor: RecordingCommandExecutor) -> None:
+        """
+        Initialize the SessionRecorder.
+
+        :param driver: The recorded driver.
+        :param executor: The recording executor installed on the driver.
+        """
+        self.driver: WebDriver = driver
+        self.executor: RecordingCommandExecutor = executor
+
+    def stop(self) -> None:
+        """
+        Restore the original command executor and close the log.
+        """
+        if self.driver.command_executor is self.executor:
+            self.driver.command_executor = self.executor.inner
+        self.executor.close()
+
+    def __enter__(self) -> "SessionRecorder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def record_session(
+    driver: WebDriver, log_path: str, secrets: Iterable[str] = ()
+) -> SessionRecorder:
+    """
+    Start recording every command issued through a driver.
+
+    :param driver: The live driver to record.
+    :param log_path: The path of the log file to write.
+    :param secrets: Strings such as passwords that must be redacted.
+    :return: The recorder, call :meth:`SessionRecorder.stop` when done.
+    """
+    executor = RecordingCommandExecutor(driver.command_executor, log_path, secrets)
+    driver.command_executor = executor
+    return SessionRecorder(driver, executor)
+
+
+def read_session_log(log_path: str) -> List[Dict[str, Any]]:
+    """
+    Read all records of a session log.
+
+    :param log_path: The path of the log file.
+    :return: The list of recorded commands.
+    """
+    with gzip.open(log_path, "rt", encoding="utf-8") as log:
+        return [json.loads(line) for line in log if line.strip()]
+
+
+class ReplayCommandExecutor:
+    """
+    Command executor answering every command from a recorded log.
+
+    :Attributes:
+        - **records** (*List[dict]*): The recorded commands still to replay.
+        - **strict** (*bool*): Whether parameters must match the log.
+    """
+
+    def __init__(self, log_path: str, strict: bool = True) -> None:
+        """
+        Initialize the ReplayCommandExecutor.
+
+        :param log_path: The path of the log file to replay.
+        :param strict: Raise on parameter mismatches when True, only check
+            command names otherwise.
+        """
+        self.records: List[Dict[str, Any]] = read_session_log(log_path)
+        self.strict: bool = strict
+        self.position: int = 0
+
+    def execute(self, command: str, params: Optional[Dict[str, Any]]) -> Any:
+        """
+        Return the recorded response of the next command.
+
+        :param command: The WebDriver command name.
+        :param params: The command parameters.
+        :raises ReplayMismatchError: If the command differs from the log.
+        :return: The recorded response.
+        """
+        if command == Command.NEW_SESSION and (
+            self.position >= len(self.records)
+            or self.records[self.position]["cmd"] != Command.NEW_SESSION
+        ):
+            return {"value": {"sessionId": "replay", "capabilities": {}}}
+        if self.position >= len(self.records):
+            raise ReplayMismatchError(f"{command} issued after the end of the log")
+        record: Dict[str, Any] = self.records[self.position]
+        if record["cmd"] != command:
+            raise ReplayMismatchError(
+                f"command {self.position}: expected {record['cmd']}, got {command}"
+            )
+        if self.strict and not _matches(record["params"], _compact(params or {})):
+            raise ReplayMismatchError(
+                f"command {self.position}: parameters of {command} differ from the log"
+            )
+        self.position += 1
+        return json.loads(json.dumps(record["response"]))
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        Whether every recorded command has been replayed.
+
+        :return: True when the log is fully consumed.
+        """
+        return self.position >= len(self.records)
+
+
+def replay_driver(log_path: str, strict: bool = True) -> WebDriver:
+    """
+    Create a WebDriver answering every command from a recorded log.
+
+    :param log_path: The path of the log file to replay.
+    :param strict: Whether parameters must match the log.
+    :return: A WebDriver usable by the page objects.
+    """
+    return webdriver.Remote(
+        command_executor=ReplayCommandExecutor(log_path, strict=strict),
+        options=webdriver.ChromeOptions(),
+    )
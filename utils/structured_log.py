@@ -0,0 +1,203 @@
+"""
+Module: structured_log
+
+This module sets up JSON logging for the automation: every record carries the
+run id and the account, day and plan step it happened in, and every page
+object action is logged with its duration.
+
+Usage:
+    Call :func:`setup_logging` once, then tag the work with
+    :func:`log_context`::
+
+        listener = setup_logging(level="INFO", path="run.log")
+        with log_context(account="jdoe", day="2024-06-03"):
+            main_page.open_day(day)
+        listener.stop()
+
+    Records are put on a queue as they are; turning them into JSON and
+    writing them happens on the background thread of a
+    :class:`logging.handlers.QueueListener`, so logging costs the booking
+    flow little more than a queue put. The context is read when the record
+    is created, in the thread that logs it.
+
+    Page classes decorated with :func:`log_actions` log every public method
+    call as an ``action`` record with ``duration_ms`` and ``outcome``;
+    actions called from within another action are logged at DEBUG level.
+
+Classes:
+    - :class:`JsonFormatter`: Format records as one JSON object per line.
+    - :class:`ContextQueueHandler`: Queue handler attaching the log context.
+
+Functions:
+    - :func:`log_context`: Add fields to the records logged within a block.
+    - :func:`setup_logging`: Route the root logger through a background queue.
+    - :func:`log_action`: Log the duration of a function call.
+    - :func:`log_actions`: Log the duration of every public method of a class.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import queue
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+RUN_ID: str = uuid.uuid4().hex[:12]
+
+_CONTEXT: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+_DEPTH: ContextVar[int] = ContextVar("log_action_depth", default=0)
+
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "context"}
+
+_Callable = TypeVar("_Callable", bound=Callable[..., Any])
+_Class = TypeVar("_Class", bound=type)
+
+logger: logging.Logger = logging.getLogger("projektron.actions")
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """
+    Add fields, e.g. ``account``, ``day`` or ``step``, to every record
+    logged within the block, in this thread or task only.
+
+    :param fields: The fields to add, None values are left out.
+    :return: A context manager.
+    """
+    token = _CONTEXT.set(
+        {**_CONTEXT.get(), **{key: value for key, value in fields.items() if value is not None}}
+    )
+    try:
+        yield
+    finally:
+        _CONTEXT.reset(token)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+
+    The object holds the time, level, logger, message, run id, the log
+    context and the ``extra`` fields of the record.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S")
+            + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "run_id": RUN_ID,
+        }
+        entry.update(getattr(record, "context", {}))
+        entry.update(
+            (key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Queue handler attaching the log context to a record and leaving all
+    formatting to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.context = _CONTEXT.get()
+        return record
+
+
+def setup_logging(
+    level: str = "INFO", path: Optional[str] = None
+) -> QueueListener:
+    """
+    Route the root logger through a queue to a JSON handler on a background thread.
+
+    :param level: The lowest level logged.
+    :param path: The file appended to, standard error when omitted.
+    :return: The started listener, stop it to flush the records.
+    :rtype: QueueListener
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    target: logging.Handler = (
+        logging.FileHandler(path, encoding="utf-8") if path else logging.StreamHandler(sys.stderr)
+    )
+    target.setFormatter(JsonFormatter())
+    root: logging.Logger = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(ContextQueueHandler(log_queue))
+    root.setLevel(level.upper())
+    listener = QueueListener(log_queue, target)
+    listener.start()
+    return listener
+
+
+def log_action(function: _Callable) -> _Callable:
+    """
+    Log the duration and outcome of every call of a function.
+
+    Nothing is measured when the ``projektron.actions`` logger is disabled.
+
+    :param function: The function or method.
+    :return: The wrapped function.
+    """
+    name: str = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        depth: int = _DEPTH.get()
+        level: int = logging.INFO if depth == 0 else logging.DEBUG
+        if not logger.isEnabledFor(level):
+            return function(*args, **kwargs)
+        token = _DEPTH.set(depth + 1)
+        outcome: str = "ok"
+        start: float = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except BaseException as error:
+            outcome = type(error).__name__
+            raise
+        finally:
+            _DEPTH.reset(token)
+            logger.log(
+                level,
+                "action",
+                extra={
+                    "action": name,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                    "outcome": outcome,
+                },
+            )
+
+    return wrapper  # type: ignore[return-value]
+
+
+def log_actions(cls: _Class) -> _Class:
+    """
+    Log the duration of every public method a class defines.
+
+    Generator methods are left alone, as their work happens after they return.
+
+    :param cls: The class.
+    :return: The class, its methods wrapped with :func:`log_action`.
+    """
+    for name, member in list(vars(cls).items()):
+        if (
+            not name.startswith("_")
+            and inspect.isfunction(member)
+            and not inspect.isgeneratorfunction(member)
+        ):
+            setattr(cls, name, log_action(member))
+    return cls
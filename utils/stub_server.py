@@ -0,0 +1,147 @@
+"""
+Module: stub_server
+
+This module runs a local stand-in for the Projektron daytimerecording server,
+serving the HTML fixtures, so load tests never touch the real instance.
+
+Usage:
+    Start it with :func:`start_stub_server`, point the page objects at its
+    ``base_url`` and call :meth:`StubProjektronServer.stop` when done::
+
+        server = start_stub_server(latency=0.05)
+        LoginPage(driver, base_url=server.base_url).open()
+        server.stop()
+
+Routes:
+    - ``GET /``: The login page.
+    - ``POST /daytimerecording``: The login form, answers the booking page.
+    - ``GET /daytimerecording``: The booking page.
+    - ``POST /daytimerecording/save``: The save button, answers the booking page.
+
+Classes:
+    - :class:`StubProjektronServer`: Threaded HTTP server serving the fixtures.
+
+Functions:
+    - :func:`start_stub_server`: Start a server on a free local port.
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+from utils.fake_driver import FIXTURE_DIR
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Request handler answering with the HTML fixtures.
+    """
+
+    server: "StubProjektronServer"
+
+    def _answer(self, fixture: str) -> None:
+        time.sleep(self.server.latency)
+        body: bytes = self.server.fixtures[fixture].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Serve the login and booking pages.
+        """
+        self.server.count("GET " + self.path)
+        if self.path in ("", "/"):
+            self._answer("login.html")
+        elif self.path.startswith("/daytimerecording"):
+            self._answer("daytimerecording.html")
+        else:
+            self.send_error(404)
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """
+        Accept the login and save forms.
+        """
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.server.count("POST " + self.path)
+        if self.path.startswith("/daytimerecording"):
+            self._answer("daytimerecording.html")
+        else:
+            self.send_error(404)
+
+    def log_message(self, format: str, *args) -> None:  # pylint: disable=redefined-builtin
+        """
+        Keep the load test output free of access logs.
+        """
+
+
+class StubProjektronServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server serving the HTML fixtures.
+
+    :Attributes:
+        - **latency** (*float*): Seconds waited before every response.
+        - **fixtures** (*Dict[str, str]*): The fixture documents by file name.
+        - **requests** (*Dict[str, int]*): Number of requests by method and path.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], latency: float = 0.0) -> None:
+        """
+        Initialize the StubProjektronServer.
+
+        :param address: The host and port to listen on, port 0 picks a free one.
+        :param latency: Seconds waited before every response.
+        """
+        super().__init__(address, _StubHandler)
+        self.latency: float = latency
+        self.requests: Dict[str, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self.fixtures: Dict[str, str] = {}
+        for name in ("login.html", "daytimerecording.html"):
+            with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as fixture:
+                self.fixtures[name] = fixture.read().replace("{{base_url}}", self.base_url)
+
+    @property
+    def base_url(self) -> str:
+        """
+        The URL to give the page objects as base URL.
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, request: str) -> None:
+        """
+        Count a handled request.
+
+        :param request: The method and path of the request.
+        """
+        with self._lock:
+            self.requests[request] = self.requests.get(request, 0) + 1
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the socket.
+        """
+        self.shutdown()
+        self.server_close()
+
+
+def start_stub_server(latency: float = 0.0, port: int = 0) -> StubProjektronServer:
+    """
+    Start a stand-in server on a local port in a background thread.
+
+    :param latency: Seconds waited before every response.
+    :param port: The port to listen on, a free port by default.
+    :return: The running server.
+    :rtype: StubProjektronServer
+    """
+    server = StubProjektronServer(("127.0.0.1", port), latency=latency)
+    threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    ).start()
+    return server
@@ -0,0 +1,95 @@
+"""
+Module: tab_booking
+
+This module books several days in tabs of one logged in browser, so the
+pages of the next days load while the current one is being filled in.
+
+Usage:
+    Compile the jobs into plans and run them on the page of the logged in
+    browser::
+
+        plans = [plan_booking(job) for job in jobs]
+        contexts = book_in_tabs(MainPage(driver), plans, tabs=4)
+
+    Up to ``tabs`` days are loading or waiting in their own tab at a time.
+    The oldest tab is then activated, its plan run, and the next day opened
+    before the tab is closed, so the browser always has pages loading while
+    the automation types. Opening a tab costs three WebDriver commands and
+    does not wait for the page. Tabs share the login and cost far less
+    memory than a browser per day.
+
+    Only the page loads overlap: the WebDriver session runs one command at
+    a time, so the reads and writes of different days are not interleaved,
+    each plan runs to its end before the next tab is activated. Tabs opened
+    by ``window.open`` are new DevTools targets, so the blocklist of
+    :func:`utils.resource_blocker.apply_blocklist` does not cover them.
+
+    Days that are already booked or saved by their job are closed. Tabs of
+    unsaved days stay open for manual validation; their context holds the
+    page under ``"tab"``.
+
+Functions:
+    - :func:`book_in_tabs`: Run booking plans in tabs of one browser.
+"""
+
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from pages.main_page import MainPage
+from utils.booking_planner import BookingJob, BookingPlan, execute_plan
+from utils.structured_log import log_context
+
+Context = Dict[str, Any]
+
+
+def book_in_tabs(
+    main_page: MainPage,
+    plans: List[BookingPlan],
+    tabs: int = 4,
+    context_factory: Optional[Callable[[BookingJob], Optional[Context]]] = None,
+) -> List[Context]:
+    """
+    Run booking plans in tabs of one browser, loading the next days in the
+    background.
+
+    :param main_page: The page of the logged in browser.
+    :param plans: The plans, one per day.
+    :param tabs: Days loading or waiting in a tab at most.
+    :param context_factory: Returns the initial plan context of a job, e.g.
+        with the task cache.
+    :return: The context filled by every plan, in the order of the plans.
+    :raises ValueError: If fewer than one tab is allowed.
+    """
+    if tabs < 1:
+        raise ValueError(f"At least one tab is needed, got {tabs}")
+    home: str = main_page.driver.current_window_handle
+    contexts: List[Context] = [{} for _ in plans]
+    waiting: Deque[Tuple[int, MainPage]] = deque()
+    upcoming: Iterator[int] = iter(range(len(plans)))
+
+    def refill(current: MainPage) -> None:
+        for index in islice(upcoming, tabs - len(waiting)):
+            waiting.append((index, current.open_day_in_tab(plans[index].job.day)))
+
+    try:
+        refill(main_page)
+        while waiting:
+            index, page = waiting.popleft()
+            job: BookingJob = plans[index].job
+            with log_context(day=job.day, tab=page.window_handle):
+                page.activate()
+                page.wait_until_loaded()
+                context: Context = execute_plan(
+                    plans[index], page, context_factory(job) if context_factory else None
+                )
+            contexts[index] = context
+            refill(page)
+            if context.get("done") or job.save:
+                page.close_tab()
+            else:
+                context["tab"] = page
+    finally:
+        for _, page in waiting:
+            page.close_tab()
+        main_page.driver.switch_to.window(home)
+    return contexts
@@ -0,0 +1,55 @@
+"""
+Module: tables
+
+This module formats rows of strings sharing the same keys as tables, for the
+reports of the scripts of this repository.
+
+Usage:
+    Turn the results into rows of strings, e.g. with their ``as_row``
+    method, then print or write them::
+
+        rows = [summary.as_row() for summary in summarize_tasks(points)]
+        print(markdown_table(rows))
+        write_csv(rows, "june_tasks.csv")
+
+Functions:
+    - :func:`markdown_table`: Format rows as a Markdown table.
+    - :func:`write_csv`: Write rows as CSV.
+"""
+
+import csv
+from typing import Dict, List
+
+
+def markdown_table(rows: List[Dict[str, str]]) -> str:
+    """
+    Format rows sharing the same keys as a Markdown table.
+
+    :param rows: The rows.
+    :return: The table, empty without rows.
+    :rtype: str
+    """
+    if not rows:
+        return ""
+    keys: List[str] = list(rows[0])
+    lines: List[str] = [
+        "| " + " | ".join(keys) + " |",
+        "|" + "|".join("---" for _ in keys) + "|",
+    ]
+    lines.extend(
+        "| " + " | ".join(row[key].replace("|", "\\|") for key in keys) + " |" for row in rows
+    )
+    return "\n".join(lines)
+
+
+def write_csv(rows: List[Dict[str, str]], path: str) -> None:
+    """
+    Write rows sharing the same keys as CSV.
+
+    :param rows: The rows.
+    :param path: The CSV file.
+    """
+    with open(path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
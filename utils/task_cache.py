@@ -0,0 +1,428 @@
+"""
+Module: task_cache
+
+This module keeps a local SQLite store of the task list ``MainPage`` reads,
+keyed by account and day, and a history of what was booked, so planning
+questions can be answered without the browser.
+
+Usage:
+    Refresh the cache from the booking view, then ask it::
+
+        cache = TaskCache(".task_cache.sqlite")
+        cache.refresh(main_page, account="jdoe", day=date.today())
+        line = cache.first_available_line("jdoe", date.today(), unrecorded)
+
+    :meth:`TaskCache.refresh` compares a fingerprint of the whole task table
+    first (two WebDriver commands); when it changed, it compares one
+    fingerprint per row and only reads the fields of the rows that changed.
+    The fingerprints cover the visible text of the rows (task, project,
+    budget, booked duration); references and titles typed by the automation
+    are kept in the booking history instead, see :meth:`TaskCache.record_booking`.
+
+    The cache can be inspected from the command line::
+
+        $ python -m utils.task_cache days account=jdoe
+        $ python -m utils.task_cache show account=jdoe day=2024-06-03
+        $ python -m utils.task_cache available account=jdoe day=2024-06-03 unrecorded=03:15h
+        $ python -m utils.task_cache references account=jdoe limit=5
+
+    ``db=<path>`` selects another cache file than :data:`DEFAULT_PATH`.
+
+    Several threads or processes may share a file, each through its own
+    :class:`TaskCache`; a write waits up to :data:`DEFAULT_TIMEOUT` seconds
+    for the others' to finish before failing with ``database is locked``.
+
+Classes:
+    - :class:`TaskSnapshot`: The cached state of one task line.
+    - :class:`TaskCache`: The SQLite store.
+"""
+
+import hashlib
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Tuple, Union
+from pages.main_page import MainPage
+from pages.task_row import TaskRow
+from utils.arguments import parse_arguments
+from utils.locators import MainPageLocators
+from utils.time_parser import Duration
+
+DEFAULT_PATH: str = ".task_cache.sqlite"
+DEFAULT_TIMEOUT: float = 60.0
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS days (
+    account TEXT NOT NULL,
+    day TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (account, day)
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    account TEXT NOT NULL,
+    day TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    project TEXT NOT NULL,
+    reference TEXT NOT NULL,
+    title TEXT NOT NULL,
+    budget_minutes INTEGER NOT NULL,
+    duration_minutes INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    PRIMARY KEY (account, day, line)
+);
+CREATE TABLE IF NOT EXISTS bookings (
+    account TEXT NOT NULL,
+    day TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    reference TEXT NOT NULL,
+    title TEXT NOT NULL,
+    minutes INTEGER NOT NULL,
+    booked_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bookings_by_account ON bookings (account, booked_at);
+"""
+
+
+def _fingerprint(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class TaskSnapshot:
+    """
+    The cached state of one task line.
+
+    :Attributes:
+        - **line** (*int*): The line number in the task list.
+        - **name** (*str*): The task name.
+        - **project** (*str*): The project name.
+        - **reference** (*str*): The reference field.
+        - **title** (*str*): The title field.
+        - **budget** (*Duration*): The budget of the task.
+        - **duration** (*Duration*): The duration already booked on the task.
+    """
+
+    line: int
+    name: str
+    project: str
+    reference: str
+    title: str
+    budget: Duration
+    duration: Duration
+
+    @classmethod
+    def from_row(cls, row: TaskRow) -> "TaskSnapshot":
+        """
+        Read a snapshot from a task row handle.
+
+        :param row: The handle of the row.
+        :return: The snapshot.
+        """
+        return cls(
+            line=row.index,
+            name=row.get_name(),
+            project=row.get_project(),
+            reference=row.get_reference(),
+            title=row.get_title(),
+            budget=row.get_budget(),
+            duration=row.get_duration(),
+        )
+
+    @property
+    def budget_left(self) -> Duration:
+        """
+        The budget not booked yet.
+        """
+        return self.budget - self.duration
+
+
+class TaskCache:
+    """
+    The SQLite store of task lines and bookings.
+
+    :Attributes:
+        - **path** (*str*): The database file, ``:memory:`` for a throwaway cache.
+        - **connection** (*sqlite3.Connection*): The open database connection.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """
+        Open or create the cache.
+
+        :param path: The database file.
+        :param timeout: Seconds to wait for a write of another connection.
+        """
+        self.path: str = path
+        self.connection: sqlite3.Connection = sqlite3.connect(path, timeout=timeout)
+        self.connection.executescript(SCHEMA)
+
+    def refresh(self, main_page: MainPage, account: str, day: date) -> int:
+        """
+        Bring the cached task list of a day up to date with the page.
+
+        :param main_page: The main page showing the booking view of the day.
+        :param account: The account the task list belongs to.
+        :param day: The day shown.
+        :return: The number of task lines read from the page.
+        :rtype: int
+        """
+        table_fingerprint: str = _fingerprint(
+            main_page.find_element_by_xpath(MainPageLocators.TASKS_TABLE).text
+        )
+        key: Tuple[str, str] = (account, day.isoformat())
+        known = self.connection.execute(
+            "SELECT fingerprint FROM days WHERE account = ? AND day = ?", key
+        ).fetchone()
+        if known and known[0] == table_fingerprint:
+            return 0
+        cached: Dict[int, str] = dict(
+            self.connection.execute(
+                "SELECT line, fingerprint FROM tasks WHERE account = ? AND day = ?", key
+            ).fetchall()
+        )
+        read: int = 0
+        lines: int = 0
+        with self.connection:
+            for row in main_page.iter_task_rows():
+                lines += 1
+                row_fingerprint: str = _fingerprint(row.element.text)
+                if cached.get(row.index) == row_fingerprint:
+                    continue
+                self._store(key, TaskSnapshot.from_row(row), row_fingerprint)
+                read += 1
+            self.connection.execute(
+                "DELETE FROM tasks WHERE account = ? AND day = ? AND line >= ?", (*key, lines)
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO days VALUES (?, ?, ?, ?)",
+                (*key, table_fingerprint, time.time()),
+            )
+        return read
+
+    def _store(self, key: Tuple[str, str], snapshot: TaskSnapshot, fingerprint: str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                *key,
+                snapshot.line,
+                snapshot.name,
+                snapshot.project,
+                snapshot.reference,
+                snapshot.title,
+                snapshot.budget.total_minutes,
+                snapshot.duration.total_minutes,
+                fingerprint,
+            ),
+        )
+
+    def is_cached(self, account: str, day: date) -> bool:
+        """
+        Whether the task list of a day was refreshed before.
+
+        :param account: The account.
+        :param day: The day.
+        :rtype: bool
+        """
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM days WHERE account = ? AND day = ?", (account, day.isoformat())
+            ).fetchone()
+            is not None
+        )
+
+    def tasks(self, account: str, day: date) -> List[TaskSnapshot]:
+        """
+        Return the cached task lines of a day.
+
+        :param account: The account.
+        :param day: The day.
+        :return: The task lines in line order.
+        :rtype: List[TaskSnapshot]
+        """
+        rows = self.connection.execute(
+            "SELECT line, name, project, reference, title, budget_minutes, duration_minutes"
+            " FROM tasks WHERE account = ? AND day = ? ORDER BY line",
+            (account, day.isoformat()),
+        ).fetchall()
+        return [
+            TaskSnapshot(
+                line=line,
+                name=name,
+                project=project,
+                reference=reference,
+                title=title,
+                budget=Duration.from_minutes(budget),
+                duration=Duration.from_minutes(duration),
+            )
+            for line, name, project, reference, title, budget, duration in rows
+        ]
+
+    def task(self, account: str, day: date, line: int) -> Optional[TaskSnapshot]:
+        """
+        Return one cached task line of a day.
+
+        :param account: The account.
+        :param day: The day.
+        :param line: The line number.
+        :return: The task line, None if it is not cached.
+        :rtype: TaskSnapshot, optional
+        """
+        for task in self.tasks(account, day):
+            if task.line == line:
+                return task
+        return None
+
+    def rows_with_budget(
+        self, account: str, day: date, needed: Duration = Duration()
+    ) -> List[TaskSnapshot]:
+        """
+        Return the cached task lines with more budget left than needed.
+
+        :param account: The account.
+        :param day: The day.
+        :param needed: The duration to book.
+        :return: The task lines in line order.
+        :rtype: List[TaskSnapshot]
+        """
+        return [task for task in self.tasks(account, day) if task.budget_left > needed]
+
+    def first_available_line(self, account: str, day: date, needed: Duration) -> int:
+        """
+        Return the first task line with budget left, as
+        :meth:`MainPage.get_first_available_task` does on the page.
+
+        :param account: The account.
+        :param day: The day.
+        :param needed: The duration to book.
+        :return: The line number, -1 if no budget is available.
+        :rtype: int
+        """
+        available: List[TaskSnapshot] = self.rows_with_budget(account, day, needed)
+        return available[0].line if available else -1
+
+    def record_booking(
+        self, account: str, day: date, snapshot: TaskSnapshot, booked: Duration
+    ) -> None:
+        """
+        Add a booking to the history.
+
+        :param account: The account.
+        :param day: The booked day.
+        :param snapshot: The booked task line, with the typed reference and title.
+        :param booked: The booked duration.
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO bookings VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    account,
+                    day.isoformat(),
+                    snapshot.line,
+                    snapshot.name,
+                    snapshot.reference,
+                    snapshot.title,
+                    booked.total_minutes,
+                    time.time(),
+                ),
+            )
+
+    def recent_references(self, account: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """
+        Return the references and titles booked most recently.
+
+        :param account: The account.
+        :param limit: The number of distinct pairs returned.
+        :return: The (reference, title) pairs, most recent first.
+        :rtype: List[Tuple[str, str]]
+        """
+        return [
+            (reference, title)
+            for reference, title, _ in self.connection.execute(
+                "SELECT reference, title, MAX(booked_at) AS last FROM bookings"
+                " WHERE account = ? AND reference != '' GROUP BY reference, title"
+                " ORDER BY last DESC LIMIT ?",
+                (account, limit),
+            ).fetchall()
+        ]
+
+    def days(self, account: str) -> List[Tuple[str, int]]:
+        """
+        Return the cached days of an account.
+
+        :param account: The account.
+        :return: The ISO days and their number of task lines, latest first.
+        :rtype: List[Tuple[str, int]]
+        """
+        return self.connection.execute(
+            "SELECT days.day, COUNT(tasks.line) FROM days LEFT JOIN tasks"
+            " ON tasks.account = days.account AND tasks.day = days.day"
+            " WHERE days.account = ? GROUP BY days.day ORDER BY days.day DESC",
+            (account,),
+        ).fetchall()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self.connection.close()
+
+
+def _print_tasks(tasks: List[TaskSnapshot]) -> None:
+    for task in tasks:
+        print(
+            f"{task.line:>3}  {task.name:<30.30}  {task.project:<20.20}"
+            f"  {task.budget.format(days=True):>10}  {task.duration.format(days=True):>10}"
+            f"  {task.budget_left.format(days=True):>10}  {task.reference}"
+        )
+
+
+def main(argv: List[str]) -> int:
+    """
+    Inspect the cache from the command line.
+
+    :param argv: The command (``days``, ``show``, ``available`` or
+        ``references``) followed by ``key=value`` arguments: ``account``,
+        ``day``, ``unrecorded``, ``limit`` and ``db``.
+    :return: The exit status.
+    :rtype: int
+    """
+    if not argv or argv[0] not in ("days", "show", "available", "references"):
+        print(__doc__)
+        return 2
+    try:
+        arguments: Dict[str, Union[int, str]] = parse_arguments(
+            {"account": "", "day": date.today().isoformat(), "unrecorded": "", "limit": 10,
+             "db": DEFAULT_PATH},
+            argv[1:],
+        )
+        day: date = date.fromisoformat(str(arguments["day"]))
+        unrecorded: Duration = Duration.parse(str(arguments["unrecorded"]))
+        limit: int = int(arguments["limit"])
+    except ValueError as error:
+        print(f"usage error: {error}")
+        return 2
+    account: str = str(arguments["account"])
+    cache = TaskCache(str(arguments["db"]))
+    try:
+        if argv[0] == "days":
+            for cached_day, lines in cache.days(account):
+                print(f"{cached_day}  {lines} task lines")
+        elif argv[0] == "show":
+            _print_tasks(cache.tasks(account, day))
+        elif argv[0] == "available":
+            _print_tasks(cache.rows_with_budget(account, day, unrecorded))
+        else:
+            for reference, title in cache.recent_references(account, limit):
+                print(f"{reference}  {title}")
+    finally:
+        cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,10 +1,14 @@
 """
 Module: time_parser
 
-This module provides functions for parsing time strings and converting them into seconds.
+This module provides functions for parsing time strings and converting them into seconds,
+and the :class:`Duration` value type used to move durations through the page objects.
 """
 
-from typing import Dict
+import re
+from functools import lru_cache
+from numbers import Real
+from typing import Any, Dict, Tuple, Union
 from dataclasses import dataclass
 
 
@@ -28,23 +32,61 @@ class TimeConstant:
     seconds_in_minute: int = 60
 
 
-def parse_days(time_string: str) -> Dict[str, int]:
+_DURATION_PATTERN = re.compile(
+    r"^\s*(?:(?P<sign>-)?\s*(?=\d)(?:(?P<days>\d+)\s*d)?\s*"
+    r"(?:(?P<hours>\d+)\s*:\s*(?P<minutes>[0-5]?\d))?\s*h?)?\s*$"
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_minutes(text: str, day_minutes: int) -> int:
+    """
+    Parse a duration text into signed minutes.
+
+    Columns repeat the same few values, so results are cached per text and
+    day length.
+
+    :raises ValueError: If the text is not a duration.
+    """
+    match = _DURATION_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Not a duration: {text!r}")
+    days, hours, minutes = match.group("days", "hours", "minutes")
+    total: int = (
+        (int(days) * day_minutes if days else 0)
+        + (int(hours) * 60 if hours else 0)
+        + (int(minutes) if minutes else 0)
+    )
+    return -total if match.group("sign") else total
+
+
+def _fields(time_string: str) -> Dict[str, int]:
+    """
+    Split a Projektron duration into its days, hours and minutes, zero when left out.
+
+    :raises ValueError: If the text is not a duration.
+    """
+    match = _DURATION_PATTERN.match(time_string)
+    if not match:
+        raise ValueError(f"Not a duration: {time_string!r}")
+    return {name: int(match.group(name) or 0) for name in ("days", "hours", "minutes")}
+
+
+def parse_days(
+    time_string: str, working_hours: float = TimeConstant.working_hours
+) -> Dict[str, int]:
     """
     Parse a time string and return the corresponding time interval in days and seconds.
 
     Args:
         string: time string in the format "xd xx:xxh" or "xx:xx"
+        working_hours: the length of a working day in hours
 
     Returns:
         dict: The time of days in days and seconds.
     """
-    days: int = 0
-    seconds: int = 0
-    if "d" in time_string:
-        days = int(time_string.split("d")[0])
-        seconds = (
-            days * TimeConstant.working_hours * TimeConstant.seconds_in_hour
-        )
+    days: int = _fields(time_string)["days"]
+    seconds: int = days * Duration.day_minutes(working_hours) * TimeConstant.seconds_in_minute
     return {"days": days, "equivalent_seconds": seconds}
 
 
@@ -58,7 +100,7 @@ def parse_hours(time_string: str) -> Dict[str, int]:
     Returns:
         dict: The time of hours in minutes and seconds.
     """
-    hours: int = int(time_string[:-1].split()[-1].split(":")[0])
+    hours: int = _fields(time_string)["hours"]
     seconds: int = hours * TimeConstant.seconds_in_hour
     return {"hours": hours, "equivalent_seconds": seconds}
 
@@ -73,7 +115,7 @@ def parse_minutes(time_string: str) -> Dict[str, int]:
     Returns:
         dict: The time of minutes in minutes and seconds.
     """
-    minutes: int = int(time_string[:-1].split()[-1].split(":")[1])
+    minutes: int = _fields(time_string)["minutes"]
     seconds: int = minutes * TimeConstant.seconds_in_minute
     return {"minutes": minutes, "equivalent_seconds": seconds}
 
@@ -87,9 +129,192 @@ def parse_time_string(time_string: str) -> int:
     Return:
         int corresponding of the time interval in second
     """
-    seconds: int = (
-        parse_days(time_string)["equivalent_seconds"]
-        + parse_hours(time_string)["equivalent_seconds"]
-        + parse_minutes(time_string)["equivalent_seconds"]
-    )
-    return seconds
+    return Duration.parse(time_string).total_seconds
+
+
+class Duration:
+    """
+    An immutable duration with minute precision.
+
+    Days are working days of :attr:`TimeConstant.working_hours` hours;
+    another length is passed to every call handling days, e.g.
+    ``Duration.parse("1d", working_hours=7.5)``. The page objects pass their
+    ``working_hours``.
+
+    Durations add, subtract, multiply by numbers and compare with each other.
+
+    Attributes:
+    -----------
+    total_minutes : int
+        The duration in minutes.
+    """
+
+    __slots__ = ("_minutes",)
+    _minutes: int
+
+    def __init__(
+        self,
+        hours: int = 0,
+        minutes: int = 0,
+        days: int = 0,
+        working_hours: float = TimeConstant.working_hours,
+    ) -> None:
+        """
+        Initialize the Duration.
+
+        :param hours: The number of hours.
+        :param minutes: The number of minutes.
+        :param days: The number of working days.
+        :param working_hours: The length of a day in hours.
+        """
+        object.__setattr__(
+            self,
+            "_minutes",
+            int((days * self.day_minutes(working_hours) if days else 0) + hours * 60 + minutes),
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Duration is immutable")
+
+    @staticmethod
+    def day_minutes(working_hours: float = TimeConstant.working_hours) -> int:
+        """
+        Return the length of a working day in minutes.
+
+        :param working_hours: The length of a day in hours.
+        """
+        return round(working_hours * 60)
+
+    @classmethod
+    def from_minutes(cls, minutes: int) -> "Duration":
+        """
+        Create a duration from minutes.
+
+        :param minutes: The duration in minutes.
+        """
+        duration: "Duration" = object.__new__(cls)
+        object.__setattr__(duration, "_minutes", int(minutes))
+        return duration
+
+    @classmethod
+    def parse(
+        cls, text: Union[str, "Duration"], working_hours: float = TimeConstant.working_hours
+    ) -> "Duration":
+        """
+        Parse a Projektron duration such as ``"2d 01:30h"``, ``"03:15h"``,
+        ``"03:15"`` or ``"1d"``. A blank string, as an empty cell shows,
+        parses to a zero duration.
+
+        :param text: The duration text, or a duration returned as is.
+        :param working_hours: The length of a day in hours.
+        :return: The duration.
+        :raises ValueError: If the text is not a duration.
+        """
+        if isinstance(text, Duration):
+            return text
+        return cls.from_minutes(_parse_minutes(text, cls.day_minutes(working_hours)))
+
+    @property
+    def total_minutes(self) -> int:
+        """
+        The duration in minutes.
+        """
+        return self._minutes
+
+    @property
+    def total_seconds(self) -> int:
+        """
+        The duration in seconds.
+        """
+        return self._minutes * TimeConstant.seconds_in_minute
+
+    def split(self) -> Tuple[int, int]:
+        """
+        Return the hours and minutes to type into a pair of input fields.
+
+        :return: The whole hours and the remaining minutes.
+        :raises ValueError: If the duration is negative, the fields take none.
+        """
+        if self._minutes < 0:
+            raise ValueError(f"Cannot type a negative duration: {self.format()}")
+        return divmod(self._minutes, 60)
+
+    def format(
+        self, days: bool = False, working_hours: float = TimeConstant.working_hours
+    ) -> str:
+        """
+        Format the duration as Projektron shows it.
+
+        :param days: Whether to split off working days, as in ``"1d 02:00h"``.
+        :param working_hours: The length of a day in hours.
+        :return: The formatted duration, e.g. ``"03:15h"``.
+        """
+        sign: str = "-" if self._minutes < 0 else ""
+        rest: int = abs(self._minutes)
+        prefix: str = ""
+        if days and rest >= self.day_minutes(working_hours):
+            whole_days, rest = divmod(rest, self.day_minutes(working_hours))
+            prefix = f"{whole_days}d "
+        return f"{sign}{prefix}{rest // 60:02d}:{rest % 60:02d}h"
+
+    def __str__(self) -> str:
+        return self.format()
+
+    def __repr__(self) -> str:
+        return f"Duration({self.format()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return self._minutes == other.total_minutes
+
+    def __lt__(self, other: "Duration") -> bool:
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return self._minutes < other.total_minutes
+
+    def __le__(self, other: "Duration") -> bool:
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return self._minutes <= other.total_minutes
+
+    def __gt__(self, other: "Duration") -> bool:
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return self._minutes > other.total_minutes
+
+    def __ge__(self, other: "Duration") -> bool:
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return self._minutes >= other.total_minutes
+
+    def __hash__(self) -> int:
+        return hash(self._minutes)
+
+    def __bool__(self) -> bool:
+        return self._minutes != 0
+
+    def __add__(self, other: "Duration") -> "Duration":
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return Duration.from_minutes(self._minutes + other.total_minutes)
+
+    def __radd__(self, other: Any) -> "Duration":
+        if other == 0:
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other: "Duration") -> "Duration":
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return Duration.from_minutes(self._minutes - other.total_minutes)
+
+    def __mul__(self, factor: float) -> "Duration":
+        if not isinstance(factor, Real):
+            return NotImplemented
+        return Duration.from_minutes(round(self._minutes * factor))
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Duration":
+        return Duration.from_minutes(-self._minutes)